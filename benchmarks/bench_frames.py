@@ -0,0 +1,88 @@
+"""
+Compare DataFrame construction: schema-driven builder vs. plain inference.
+
+"legacy" is what every endpoint used to do: ``pd.DataFrame(rows)``, then
+``pd.to_datetime`` with format sniffing and ``set_index``. "schema" is
+:func:`finbrain.endpoints._frames.build_frame` with the endpoint's declared
+schema. Both timings and the resulting frame's memory footprint are shown.
+
+Usage
+-----
+    python benchmarks/bench_frames.py
+    python benchmarks/bench_frames.py --rows 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+
+from finbrain.endpoints import _frames
+
+
+def synthetic_rows(n: int, seed: int = 0) -> Dict[str, Tuple[List[dict], Any, str]]:
+    rng = random.Random(seed)
+    syms = [f"T{i:04d}" for i in range(5000)]
+    days = [f"2025-01-{d:02d}" for d in range(1, 29)]
+
+    insider = [
+        {"symbol": rng.choice(syms), "date": rng.choice(days), "insider": f"Person {i % 700}",
+         "relationship": rng.choice(["Director", "CEO", "CFO", "10% Owner"]),
+         "transactionType": rng.choice(["Buy", "Sale", "Option Exercise"]),
+         "shares": rng.randint(100, 100000), "pricePerShare": round(rng.uniform(5, 500), 2),
+         "totalValue": rng.randint(1000, 10_000_000), "sharesOwned": rng.randint(0, 10**7)}
+        for i in range(n)
+    ]
+    trades = [
+        {"date": rng.choice(days), "politician": f"Member {i % 400}",
+         "transactionType": rng.choice(["Purchase", "Sale", "Sale (Partial)"]),
+         "amount": rng.choice(["$1,001 - $15,000", "$15,001 - $50,000", "$50,001 - $100,000"]),
+         "owner": rng.choice(["SELF", "SP", "JT", None]),
+         "amountRaw": None, "amountFlag": None, "disclosureDate": rng.choice(days)}
+        for i in range(n)
+    ]
+    ratings = [
+        {"symbol": rng.choice(syms), "date": rng.choice(days),
+         "institution": f"Broker {i % 120}", "action": rng.choice(["Upgrade", "Downgrade", "Reiterate"]),
+         "rating": rng.choice(["Buy", "Hold", "Sell"]), "targetPrice": round(rng.uniform(5, 900), 2)}
+        for i in range(n)
+    ]
+    return {
+        "insider transactions": (insider, _frames.INSIDER_TRANSACTIONS, "date"),
+        "congress trades": (trades, _frames.CONGRESS_TRADES, "date"),
+        "analyst ratings": (ratings, _frames.ANALYST_RATINGS, "date"),
+    }
+
+
+def legacy(rows: List[dict], index: str) -> pd.DataFrame:
+    df = pd.DataFrame(rows)
+    df[index] = pd.to_datetime(df[index])
+    df.set_index(index, inplace=True)
+    return df
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000, help="rows per payload")
+    parser.add_argument("-n", "--number", type=int, default=5,
+                        help="builds per timing sample")
+    args = parser.parse_args(argv)
+
+    print(f"{'payload':<24}{'builder':<10}{'ms':>10}{'MiB':>10}")
+    for label, (rows, schema, index) in synthetic_rows(args.rows).items():
+        for name, build in (
+            ("legacy", lambda: legacy(rows, index)),
+            ("schema", lambda: _frames.build_frame(rows, schema)),
+        ):
+            best = min(timeit.repeat(build, number=args.number, repeat=3)) / args.number
+            mib = build().memory_usage(deep=True).sum() / 2**20
+            print(f"{label:<24}{name:<10}{best * 1000:>10.1f}{mib:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
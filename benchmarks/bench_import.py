@@ -0,0 +1,72 @@
+"""
+Measure the cold import time of ``finbrain``.
+
+Each sample runs ``import <module>`` in a fresh interpreter, so nothing is
+shared between runs, and reports the median wall time. Heavy optional
+libraries (pandas, numpy, plotly) must *not* be pulled in by a bare import;
+the script fails if they are, or if the median exceeds ``--max-ms``.
+
+Usage
+-----
+    python benchmarks/bench_import.py                 # 15 samples
+    python benchmarks/bench_import.py -n 30 --max-ms 400
+    python benchmarks/bench_import.py --module finbrain.aio
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY = ("pandas", "numpy", "plotly")
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def sample(module: str) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--module", default="finbrain")
+    parser.add_argument("-n", "--samples", type=int, default=15)
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="fail if the median import time exceeds this")
+    args = parser.parse_args(argv)
+
+    sample(args.module)  # warm the filesystem / bytecode caches
+    runs = [sample(args.module) for _ in range(args.samples)]
+    times = sorted(r["ms"] for r in runs)
+    loaded = sorted({m for r in runs for m in r["loaded"]})
+    median = statistics.median(times)
+
+    print(f"import {args.module}: median {median:.1f} ms "
+          f"(min {times[0]:.1f}, max {times[-1]:.1f}, n={len(times)})")
+    status = 0
+    if loaded:
+        print(f"FAIL: bare import loaded {', '.join(loaded)}")
+        status = 1
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"FAIL: median exceeds {args.max_ms:.0f} ms")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
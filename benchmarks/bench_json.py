@@ -0,0 +1,101 @@
+"""
+Compare JSON backends on screener-sized response bodies.
+
+By default the payloads are synthetic but shaped like real v2 screener
+responses (same envelope and field names, realistic row counts). Pass one or
+more ``--fixture`` files to benchmark recorded responses instead, e.g. a body
+saved with ``curl -H "Authorization: Bearer $FINBRAIN_API_KEY"
+https://api.finbrain.tech/v2/screener/news?market=S%26P%20500 > news.json``.
+
+Usage
+-----
+    python benchmarks/bench_json.py
+    python benchmarks/bench_json.py --fixture news.json --fixture insider.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+from typing import Dict, List
+
+from finbrain._json import BACKENDS, resolve_json_loads
+
+
+def _envelope(rows: List[dict]) -> bytes:
+    body = {
+        "success": True,
+        "data": {"data": rows, "summary": {"count": len(rows)}},
+        "meta": {"timestamp": "2025-01-17T12:00:00.000Z"},
+    }
+    return json.dumps(body).encode()
+
+
+def synthetic_payloads(seed: int = 0) -> Dict[str, bytes]:
+    rng = random.Random(seed)
+    syms = [f"T{i:04d}" for i in range(5000)]
+
+    sentiment = [
+        {"symbol": s, "name": f"{s} Corp.", "date": "2025-01-17",
+         "score": round(rng.uniform(-1, 1), 3)}
+        for s in syms[:500]
+    ]
+    news = [
+        {"symbol": rng.choice(syms), "headline": "Company beats estimates " * 3,
+         "source": "Newswire", "url": f"https://example.com/{i}",
+         "date": "2025-01-17T08:30:00Z", "sentiment": round(rng.uniform(-1, 1), 3)}
+        for i in range(20000)
+    ]
+    insider = [
+        {"symbol": rng.choice(syms), "date": "2025-01-16", "insider": "Jane Doe",
+         "relationship": "Director", "transaction": rng.choice(["Buy", "Sale"]),
+         "shares": rng.randint(100, 100000), "cost": round(rng.uniform(5, 500), 2),
+         "USDValue": rng.randint(1000, 10_000_000), "SECForm4Date": "2025-01-17"}
+        for _ in range(10000)
+    ]
+    return {
+        "screener/sentiment (500 rows)": _envelope(sentiment),
+        "screener/insider-trading (10k rows)": _envelope(insider),
+        "recent/news (20k rows)": _envelope(news),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fixture", action="append", type=Path, default=[],
+                        help="recorded response body to benchmark (repeatable)")
+    parser.add_argument("-n", "--number", type=int, default=5,
+                        help="decodes per timing sample")
+    args = parser.parse_args(argv)
+
+    if args.fixture:
+        payloads = {str(p): p.read_bytes() for p in args.fixture}
+    else:
+        payloads = synthetic_payloads()
+
+    loaders = {}
+    for name in BACKENDS:
+        try:
+            loaders[name] = resolve_json_loads(name)
+        except ImportError:
+            print(f"(skipping {name}: not installed)")
+
+    for label, body in payloads.items():
+        print(f"\n{label}: {len(body) / 1024:.0f} KiB")
+        timings = {
+            name: min(timeit.repeat(lambda: loads(body), number=args.number, repeat=5))
+            / args.number
+            for name, loads in loaders.items()
+        }
+        for name, seconds in timings.items():
+            speedup = timings["json"] / seconds
+            print(f"  {name:<8} {seconds * 1000:8.2f} ms/decode  ({speedup:.1f}x vs json)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,7 @@ Run this example:
 import asyncio
 import os
 from finbrain.aio import AsyncFinBrainClient
+from finbrain.exceptions import FinBrainError
 
 
 async def fetch_data():
@@ -29,22 +30,23 @@ async def fetch_data():
         print(f"✓ Retrieved {len(predictions)} prediction rows")
         print(predictions.head())
 
-        # Example 3: Concurrent requests using asyncio.gather
+        # Example 3: Concurrent requests with a concurrency cap
         print("\nFetching multiple tickers concurrently...")
         tickers = ["AAPL", "MSFT", "GOOGL"]
 
-        tasks = [
-            fb.predictions.ticker(ticker, as_dataframe=True) for ticker in tickers
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for ticker, result in zip(tickers, results):
-            if isinstance(result, Exception):
+        # Results stream in as they complete; at most 8 requests in flight
+        async for ticker, result in fb.gather_tickers(
+            "predictions", tickers, concurrency=8, as_dataframe=True
+        ):
+            if isinstance(result, FinBrainError):
                 print(f"✗ {ticker}: {result}")
             else:
                 print(f"✓ {ticker}: {len(result)} rows")
 
+        # Or collect everything at once: failures end up on batch.errors
+        batch = await fb.predictions.ticker_many(tickers, concurrency=8)
+        print(f"✓ {len(batch)} succeeded, {len(batch.errors)} failed")
+
 
 async def fetch_sentiment():
     """Fetch sentiment data for a specific stock."""
@@ -10,5 +10,6 @@ except PackageNotFoundError:  # fresh git clone, no install
     __version__ = "0.0.0.dev0"
 
 from .client import FinBrainClient
+from .endpoints._utils import BatchResult
 
-__all__ = ["FinBrainClient", "__version__"]
+__all__ = ["FinBrainClient", "BatchResult", "__version__"]
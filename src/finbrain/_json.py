@@ -0,0 +1,123 @@
+"""
+finbrain._json
+~~~~~~~~~~~~~~
+
+Pluggable JSON decoding for response bodies.
+
+Both clients decode ``resp.content`` bytes through a single ``loads``
+callable chosen here. ``"auto"`` picks the fastest backend that is
+installed, orjson, then msgspec, then the standard library, without
+changing what parses: a body the fast backend rejects (``NaN`` /
+``Infinity`` literals, integers beyond 64 bits) is handed to the standard
+library, and a backend that would round such integers to floats is
+skipped. Every backend raises :class:`ValueError` on malformed input, so
+callers can map decode failures uniformly.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Union
+
+__all__ = ["JSONLoads", "resolve_json_loads"]
+
+JSONLoads = Callable[[bytes], Any]
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _orjson() -> JSONLoads:
+    import orjson
+
+    # orjson.JSONDecodeError subclasses ValueError already
+    return orjson.loads
+
+
+def _msgspec() -> JSONLoads:
+    import msgspec
+
+    decode = msgspec.json.Decoder().decode
+    error = msgspec.DecodeError
+
+    def loads(content: bytes) -> Any:
+        try:
+            return decode(content)
+        except error as exc:  # not a ValueError subclass
+            raise ValueError(str(exc)) from exc
+
+    return loads
+
+
+def _stdlib() -> JSONLoads:
+    return json.loads
+
+
+_FACTORIES = {"orjson": _orjson, "msgspec": _msgspec, "json": _stdlib}
+
+# 2**64 + 1: rejected by some orjson versions, silently rounded by older ones
+_BIG_INT = 18446744073709551617
+
+
+def _with_fallback(fast: JSONLoads) -> JSONLoads:
+    def loads(content: bytes) -> Any:
+        try:
+            return fast(content)
+        except ValueError:
+            # the stdlib accepts a little more; truly malformed bodies raise here too
+            return json.loads(content)
+
+    return loads
+
+
+def _auto() -> JSONLoads:
+    for name in BACKENDS[:-1]:
+        try:
+            fast = _FACTORIES[name]()
+        except ImportError:
+            continue
+        try:
+            if fast(str(_BIG_INT).encode()) != _BIG_INT:
+                continue
+        except ValueError:
+            pass
+        return _with_fallback(fast)
+    return json.loads
+
+
+def resolve_json_loads(backend: Union[str, JSONLoads] = "auto") -> JSONLoads:
+    """
+    Return a ``loads(bytes) -> object`` callable.
+
+    Parameters
+    ----------
+    backend :
+        ``"auto"`` (first installed of orjson, msgspec, stdlib, falling back
+        to the stdlib for bodies the fast backend rejects), one of
+        ``"orjson"``, ``"msgspec"``, ``"json"``, or any callable taking the
+        raw body bytes. Named backends are used as-is, so ``"orjson"`` and
+        ``"msgspec"`` reject ``NaN`` / ``Infinity`` literals. A custom
+        callable should raise :class:`ValueError` on malformed input.
+
+    Raises
+    ------
+    ImportError
+        If a named backend is not installed.
+    ValueError
+        If *backend* is not a known name.
+    """
+    if callable(backend):
+        return backend
+    if backend == "auto":
+        return _auto()
+    if backend not in _FACTORIES:
+        raise ValueError(
+            f"Unknown JSON backend {backend!r}; expected 'auto', "
+            + ", ".join(repr(b) for b in BACKENDS)
+            + " or a callable"
+        )
+    try:
+        return _FACTORIES[backend]()
+    except ImportError as exc:
+        raise ImportError(
+            f"JSON backend {backend!r} is not installed (pip install {backend})"
+        ) from exc
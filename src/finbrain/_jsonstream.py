@@ -0,0 +1,205 @@
+"""
+finbrain._jsonstream
+~~~~~~~~~~~~~~~~~~~~
+
+Incremental decoding of large v2 responses.
+
+Screener and "recent" endpoints return one big row array inside the
+envelope, e.g. ``{"success": true, "data": {"data": [...], "summary": {...}},
+"meta": {...}}``. :class:`RowStream` is a push parser: feed it raw body
+chunks as they arrive and it hands back each row as soon as the row's closing
+brace has been received, so only one chunk plus one partial row is ever
+buffered. Everything outside the row array is kept and parsed on
+:meth:`RowStream.close`, which returns the envelope with the array emptied
+(``meta``, ``summary`` and friends stay available).
+
+No third-party dependency: rows are decoded with
+:meth:`json.JSONDecoder.raw_decode`, and the envelope around them is walked by
+a small tokenizer that only tracks strings, nesting and object keys.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+__all__ = ["ROW_PATHS", "RowStream", "iter_rows"]
+
+# Where the row array lives, tried in document order:
+# ``{"data": {"data": [...]}}`` (screener / recent) or ``{"data": [...]}``.
+ROW_PATHS: Tuple[Tuple[str, ...], ...] = (("data", "data"), ("data",))
+
+_WS = " \t\r\n"
+_DELIMS = _WS + ",]"
+_ARRAY = "[]"  # path component for "inside an array"
+
+
+class RowStream:
+    """
+    Push parser yielding the elements of a row array inside a JSON document.
+
+    Parameters
+    ----------
+    paths :
+        Object-key paths at which the row array may sit. The first array
+        found at any of them is streamed; other arrays are left in the
+        envelope.
+    """
+
+    def __init__(self, paths: Sequence[Tuple[str, ...]] = ROW_PATHS) -> None:
+        self._paths = {tuple(p) for p in paths}
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._mode = "prefix"  # → "rows" → "tail"
+        self._buf = ""
+        self._pos = 0
+        # prefix tokenizer state
+        self._prefix: List[str] = []
+        self._stack: List[List[Any]] = []  # [kind, key, expect_key]
+        self._in_string = False
+        self._escape = False
+        self._key_chars: Optional[List[str]] = None
+        self._tail: List[str] = []
+
+    @property
+    def found(self) -> bool:
+        """``True`` once the row array has been located."""
+        return self._mode != "prefix"
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Consume *chunk* and return the rows it completed (possibly none)."""
+        text = self._utf8.decode(chunk)
+        if self._mode == "prefix":
+            text = self._scan_prefix(text)
+        if self._mode == "rows":
+            self._buf = self._buf[self._pos:] + text
+            self._pos = 0
+            return self._drain(final=False)
+        if self._mode == "tail":
+            self._tail.append(text)
+        return []
+
+    def close(self) -> Tuple[List[Any], Any]:
+        """
+        Finish the document.
+
+        Returns
+        -------
+        (rows, envelope)
+            Any rows still buffered, and the parsed document with the row
+            array replaced by ``[]``.
+
+        Raises
+        ------
+        ValueError
+            If the body is truncated or not valid JSON.
+        """
+        rest = self._utf8.decode(b"", final=True)
+        rows: List[Any] = []
+        if self._mode == "prefix":
+            rest = self._scan_prefix(rest)
+        if self._mode == "rows":
+            self._buf = self._buf[self._pos:] + rest
+            self._pos = 0
+            rows = self._drain(final=True)
+            if self._mode != "tail":
+                raise ValueError("Unterminated row array in response body")
+        elif self._mode == "tail":
+            self._tail.append(rest)
+        doc = "".join(self._prefix)
+        if self.found:
+            doc += "]" + "".join(self._tail)
+        return rows, json.loads(doc)
+
+    # ---------- private helpers ----------
+    def _path(self) -> Tuple[str, ...]:
+        return tuple(
+            _ARRAY if kind == "array" else key for kind, key, _ in self._stack
+        )
+
+    def _scan_prefix(self, text: str) -> str:
+        """Walk envelope text until the row array opens; return what follows."""
+        for i, ch in enumerate(text):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._key_chars is not None:
+                        self._stack[-1][1] = json.loads(
+                            '"' + "".join(self._key_chars) + '"'
+                        )
+                        self._stack[-1][2] = False
+                        self._key_chars = None
+                    continue
+                if self._key_chars is not None:
+                    self._key_chars.append(ch)
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                top = self._stack[-1] if self._stack else None
+                if top is not None and top[0] == "object" and top[2]:
+                    self._key_chars = []
+            elif ch == "{":
+                self._stack.append(["object", None, True])
+            elif ch == "[":
+                if self._path() in self._paths:
+                    self._prefix.append(text[: i + 1])
+                    self._mode = "rows"
+                    return text[i + 1:]
+                self._stack.append(["array", None, False])
+            elif ch in "}]":
+                if self._stack:
+                    self._stack.pop()
+            elif ch == ",":
+                if self._stack and self._stack[-1][0] == "object":
+                    self._stack[-1][2] = True
+        self._prefix.append(text)
+        return ""
+
+    def _drain(self, *, final: bool) -> List[Any]:
+        rows: List[Any] = []
+        buf, pos, n = self._buf, self._pos, len(self._buf)
+        while True:
+            while pos < n and (buf[pos] in _WS or buf[pos] == ","):
+                pos += 1
+            if pos >= n:
+                break
+            if buf[pos] == "]":
+                self._mode = "tail"
+                self._tail.append(buf[pos + 1:])
+                self._buf, self._pos = "", 0
+                return rows
+            try:
+                row, end = self._decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break  # row not complete yet
+            if not final and (end >= n or buf[end] not in _DELIMS):
+                break  # a number at the buffer edge might still be growing
+            rows.append(row)
+            pos = end
+        self._pos = pos
+        return rows
+
+
+def iter_rows(
+    chunks: Iterable[bytes], paths: Sequence[Tuple[str, ...]] = ROW_PATHS
+) -> Iterator[Any]:
+    """
+    Yield rows from an iterable of body chunks.
+
+    The generator's return value (``StopIteration.value``) is the envelope
+    with the row array emptied, see :meth:`RowStream.close`.
+    """
+    stream = RowStream(paths)
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    rows, envelope = stream.close()
+    yield from rows
+    return envelope
@@ -0,0 +1,114 @@
+"""
+Single-flight coalescing of identical in-flight requests.
+
+When several callers ask for the same ``GET`` at once — typically right
+after a cache entry expires — only the first one (the *leader*) performs
+the call; the others wait for it and receive the same result or exception.
+Keys are dropped as soon as the call finishes, so nothing is cached beyond
+the lifetime of the request.
+
+:class:`SingleFlight` serves threads (:class:`~finbrain.FinBrainClient`),
+:class:`AsyncSingleFlight` coroutines on one event loop
+(:class:`~finbrain.aio.AsyncFinBrainClient`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+__all__ = ["AsyncSingleFlight", "SingleFlight", "flight_key"]
+
+FlightKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def flight_key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> FlightKey:
+    """Identity of a request: method, URL and stringified, sorted params."""
+    norm = tuple(sorted(
+        (str(k), str(v)) for k, v in (params or {}).items() if v is not None
+    ))
+    return method.upper(), url, norm
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Thread-level coalescing: one call per key at a time."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Any, _Call] = {}
+
+    def do(self, key: Any, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run *fn* unless a call for *key* is already in flight.
+
+        Returns ``(result, shared)``; *shared* is ``True`` for callers that
+        waited on another thread's call instead of running *fn*.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """
+    Coroutine-level coalescing on a single event loop.
+
+    The shared call runs as its own task, and every caller awaits it through
+    :func:`asyncio.shield`, so a cancelled caller never cancels the request
+    the others are waiting on.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[Any, "asyncio.Task[Any]"] = {}
+
+    async def do(self, key: Any, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Async counterpart of :meth:`SingleFlight.do`."""
+        task = self._tasks.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._tasks[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        return await asyncio.shield(task), shared
+
+    def _done(self, key: Any, task: "asyncio.Task[Any]") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here in case every caller went away
+
+    def __len__(self) -> int:
+        return len(self._tasks)
@@ -1,12 +1,36 @@
 from __future__ import annotations
 
 import os
+import json
+import random
 import asyncio
-from typing import Any, Dict, Optional
+import time
+from typing import (
+    TYPE_CHECKING, Any, AsyncGenerator, AsyncIterator, Callable, Dict, Iterable, List,
+    Optional, Tuple,
+)
 import httpx
 from urllib.parse import urljoin
 
+from .._singleflight import AsyncSingleFlight, flight_key
+from .._json import JSONLoads, resolve_json_loads
+from .._jsonstream import RowStream
 from ..exceptions import http_error_to_exception, InvalidResponse
+from ..hooks import Hooks, RequestTrace, as_hooks
+from ..ratelimit import (
+    RateLimiter,
+    as_rate_limiter,
+    backoff_delay,
+    parse_quota_headers,
+    parse_retry_after,
+)
+from ..transfer import (
+    AcceptEncoding,
+    Transfer,
+    TransferStats,
+    httpx_encodings,
+    resolve_accept_encoding,
+)
 from .. import __version__
 
 from .endpoints.available import AsyncAvailableAPI
@@ -26,12 +50,21 @@ from .endpoints.corporate_lobbying import AsyncCorporateLobbyingAPI
 from .endpoints.reddit_mentions import AsyncRedditMentionsAPI
 from .endpoints.government_contracts import AsyncGovernmentContractsAPI
 from .endpoints.patent_filings import AsyncPatentFilingsAPI
+from .endpoints._utils import iter_many
 
+if TYPE_CHECKING:
+    from ..cache import ResponseCache
 
-# Which status codes merit a retry (transient server / gateway errors)
-_RETRYABLE_STATUS = {500, 502, 503, 504}
-# How long to wait between retries   (2, 4, 8 … seconds)
-_BACKOFF_BASE = 2
+
+# Which status codes merit a retry (rate limiting + transient server / gateway errors)
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Decorrelated-jitter back-off bounds in seconds (first retry waits 1–3 s)
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+# A Retry-After longer than this is surfaced as an error instead of slept on
+_MAX_RETRY_AFTER = 60.0
+# Read size for streamed bodies
+_STREAM_CHUNK = 64 * 1024
 
 
 class AsyncFinBrainClient:
@@ -59,7 +92,59 @@ class AsyncFinBrainClient:
         base_url: str | None = None,
         timeout: float = 10,
         retries: int = 3,
+        cache: "ResponseCache | None" = None,
+        rate_limit: RateLimiter | float | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        json_loads: str | JSONLoads = "auto",
+        coalesce: bool = True,
+        accept_encoding: AcceptEncoding = "auto",
+        hooks: Any = None,
     ):
+        """
+        Parameters
+        ----------
+        api_key, base_url, timeout, retries :
+            Same as :class:`finbrain.FinBrainClient`.
+        cache :
+            Optional :class:`~finbrain.cache.ResponseCache`, which may be
+            shared with sync clients. Lookups are local SQLite reads and run
+            inline on the event loop. Expired entries with validators are
+            revalidated with ``If-None-Match`` / ``If-Modified-Since``.
+        rate_limit :
+            Optional :class:`~finbrain.ratelimit.RateLimiter` (or a plain
+            requests-per-second number) awaited before every request. The
+            same limiter can be shared by many tasks and by sync clients.
+        max_connections :
+            Upper bound on open connections (``None`` for no limit). Keep it
+            at or above the ``concurrency`` used for batch fetches.
+        max_keepalive_connections :
+            Idle connections kept in the pool for reuse.
+        keepalive_expiry :
+            Seconds an idle connection may stay in the pool.
+        http2 :
+            Negotiate HTTP/2, multiplexing concurrent requests over a single
+            connection. Requires the ``h2`` package
+            (``pip install finbrain-python[http2]``).
+        json_loads :
+            JSON decoder for response bodies; same as
+            :class:`finbrain.FinBrainClient`.
+        coalesce :
+            Share one in-flight ``GET`` between coroutines that issue the
+            identical request concurrently; see
+            :class:`finbrain.FinBrainClient`.
+        accept_encoding :
+            ``Accept-Encoding`` to send, checked against the codings httpx
+            can decode here (``"auto"``, a header string or list, or
+            ``None``); see :class:`finbrain.FinBrainClient`. Byte counts go
+            to :attr:`transfer_stats` and :attr:`last_transfer`.
+        hooks :
+            :class:`~finbrain.hooks.Hooks` or observer(s), as for
+            :class:`finbrain.FinBrainClient`. Callbacks run inline on the
+            event loop; connect time and TTFB come from httpx tracing.
+        """
         self.api_key = api_key or os.getenv("FINBRAIN_API_KEY")
         if not self.api_key:
             raise ValueError("FinBrain API key missing")
@@ -68,7 +153,21 @@ class AsyncFinBrainClient:
         self._client: Optional[httpx.AsyncClient] = None
         self.timeout = timeout
         self.retries = retries
+        self.cache = cache
+        self.rate_limit = as_rate_limiter(rate_limit) or RateLimiter()
+        self.json_loads = resolve_json_loads(json_loads)
+        self._flights: AsyncSingleFlight | None = AsyncSingleFlight() if coalesce else None
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
         self.last_meta: dict | None = None
+        self.accept_encoding = resolve_accept_encoding(accept_encoding, httpx_encodings())
+        self.transfer_stats = TransferStats()
+        self.hooks: Hooks = as_hooks(hooks)
+        self.last_transfer: Transfer | None = None
 
         # wire endpoint helpers
         self.available = AsyncAvailableAPI(self)
@@ -97,6 +196,8 @@ class AsyncFinBrainClient:
                 "Authorization": f"Bearer {self.api_key}",
             },
             timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
         )
         return self
 
@@ -112,6 +213,51 @@ class AsyncFinBrainClient:
             await self._client.aclose()
             self._client = None
 
+    # ---------- batch helpers ----------
+    def gather_tickers(
+        self,
+        endpoint: Any,
+        symbols: Iterable[str],
+        *,
+        concurrency: int = 8,
+        **kwargs: Any,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Fetch many symbols from one endpoint, streaming results as they land.
+
+        Parameters
+        ----------
+        endpoint :
+            Endpoint attribute name (``"predictions"``, ``"news"``, …), an
+            endpoint object such as ``client.sentiments``, or any coroutine
+            function taking a symbol as its first argument.
+        symbols :
+            Ticker symbols; upper-cased and de-duplicated.
+        concurrency :
+            Maximum number of requests in flight (``asyncio.Semaphore``).
+        **kwargs :
+            Forwarded to the endpoint's per-ticker method.
+
+        Returns
+        -------
+        AsyncIterator[tuple[str, Any]]
+            ``(symbol, value)`` pairs in completion order; *value* is the
+            result or the ``FinBrainError`` raised for that symbol.
+
+        Example
+        -------
+        >>> async for sym, res in fb.gather_tickers("predictions", universe,
+        ...                                         concurrency=20):
+        ...     if isinstance(res, FinBrainError):
+        ...         continue
+        """
+        if isinstance(endpoint, str):
+            endpoint = getattr(self, endpoint)
+        if not callable(endpoint):
+            # endpoint namespace → its per-ticker method (options: put_call)
+            endpoint = getattr(endpoint, "ticker", None) or getattr(endpoint, "put_call")
+        return iter_many(endpoint, symbols, concurrency=concurrency, **kwargs)
+
     # ---------- private helpers ----------
     async def _request(
         self,
@@ -125,6 +271,13 @@ class AsyncFinBrainClient:
         ``{"success": true, "data": ..., "meta": {...}}``.
         This method auto-unwraps the envelope, returning just ``data``.
 
+        When a :class:`~finbrain.cache.ResponseCache` is configured, ``GET``
+        responses are looked up there first and stored after a successful
+        fetch; stale entries with validators are revalidated conditionally.
+
+        Identical concurrent ``GET`` requests share one fetch unless the
+        client was created with ``coalesce=False``.
+
         Raises
         ------
         FinBrainError
@@ -140,38 +293,388 @@ class AsyncFinBrainClient:
             )
 
         url = urljoin(self.base_url, path)
+        if self._flights is None or method.upper() != "GET":
+            _, body = await self._fetch(method, url, path, params)
+            return self._unwrap(body)
+
+        (content, body), shared = await self._flights.do(
+            flight_key(method, url, params),
+            lambda: self._fetch(method, url, path, params),
+        )
+        if shared:
+            # never hand the leader's (mutable) objects to another caller
+            body = self._decode(content)
+        return self._unwrap(body)
+
+    async def _fetch(
+        self,
+        method: str,
+        url: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+    ) -> Tuple[bytes, Any]:
+        """Raw and decoded body, from the cache or the network."""
+        cache = self.cache if method.upper() == "GET" else None
+        cache_key = ""
+        entry = None
+        if cache is not None:
+            cache_key = cache.key(method, url, params)
+            entry = cache.lookup(cache_key)
+            if entry is not None and entry.fresh:
+                return entry.body, self._decode(entry.body)
+
+        # an expired entry with validators is revalidated, not re-downloaded
+        headers = entry.conditional_headers() if entry is not None else None
+        trace = RequestTrace(method, path)
+        resp = await self._send(method, url, params, headers=headers, trace=trace)
+        body_bytes = len(resp.content)
+        wire_bytes = self._record_transfer(path, resp, body_bytes)
+        if resp.status_code == 304 and cache is not None and entry is not None:
+            self._emit("on_response", trace, status=304, wire_bytes=wire_bytes, body_bytes=0)
+            cache.refresh(cache_key, path)
+            return entry.body, self._decode(entry.body)
+
+        started = time.perf_counter()
+        try:
+            body = self._decode(resp.content)
+        except InvalidResponse as exc:
+            self._emit(
+                "on_error", trace, status=resp.status_code, error=exc,
+                wire_bytes=wire_bytes, body_bytes=body_bytes,
+            )
+            raise
+        self._emit(
+            "on_response", trace, status=resp.status_code, wire_bytes=wire_bytes,
+            body_bytes=body_bytes, decode=time.perf_counter() - started,
+        )
+        if cache is not None:
+            cache.set(
+                cache_key,
+                path,
+                resp.content,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+        return resp.content, body
+
+    async def _request_stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Any]:
+        """Like :meth:`_request`, but return an async iterator over the rows.
+
+        See :meth:`finbrain.FinBrainClient._request_stream`.
+        """
+        if self._client is None:
+            raise RuntimeError(
+                "AsyncFinBrainClient not initialized. Use 'async with' context manager."
+            )
+
+        url = urljoin(self.base_url, path)
+        if self.cache is not None and method.upper() == "GET":
+            cached = self.cache.get(self.cache.key(method, url, params))
+            if cached is not None:
+                return self._stream_rows(_aiter_once(cached))
+
+        trace = RequestTrace(method, path)
+        resp = await self._send(method, url, params, stream=True, trace=trace)
+        body = _AsyncStreamedBody(self, trace, resp)
+        return _AsyncStreamedRows(self._stream_rows(body.chunks()), body)
+
+    async def _request_records(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        rows_key: str,
+        convert: Callable[[Dict[str, Any]], Any],
+    ) -> Any:
+        """Like :meth:`_request`, but pass each ``data[rows_key]`` row through *convert*.
+
+        See :meth:`finbrain.FinBrainClient._request_records`.
+        """
+        if self._client is None:
+            raise RuntimeError(
+                "AsyncFinBrainClient not initialized. Use 'async with' context manager."
+            )
+
+        url = urljoin(self.base_url, path)
+        cached = None
+        if self.cache is not None and method.upper() == "GET":
+            cached = self.cache.get(self.cache.key(method, url, params))
+        body: _AsyncStreamedBody | None = None
+        if cached is not None:
+            chunks = _aiter_once(cached)
+        else:
+            trace = RequestTrace(method, path)
+            resp = await self._send(method, url, params, stream=True, trace=trace)
+            body = _AsyncStreamedBody(self, trace, resp)
+            chunks = body.chunks()
+
+        stream = RowStream([("data", rows_key)])
+        rows: List[Any] = []
+        try:
+            async for chunk in chunks:
+                rows.extend(map(convert, stream.feed(chunk)))
+            tail, envelope = stream.close()
+        except ValueError as exc:
+            raise InvalidResponse("Response body is not valid JSON") from exc
+        finally:
+            if body is not None:
+                await body.aclose()
+        rows.extend(map(convert, tail))
+        data = self._unwrap(envelope)
+        if isinstance(data, dict):
+            # rows found elsewhere (no array at data.<rows_key>) are converted here
+            rows.extend(map(convert, data.get(rows_key) or []))
+            data[rows_key] = rows
+        return data
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        trace: RequestTrace,
+    ) -> httpx.Response:
+        """Send with rate limiting and retries; return the first 2xx (or 304) response.
 
+        Hooks fire as in :meth:`finbrain.FinBrainClient._send`.
+        """
+        assert self._client is not None
+        delay = _BACKOFF_BASE
         for attempt in range(self.retries + 1):
+            await self.rate_limit.acquire_async()
+            trace.begin(attempt + 1)
+            self._emit("on_request", trace)
             try:
-                resp = await self._client.request(method, url, params=params)
+                request = self._client.build_request(
+                    method, url, params=params, headers=self._headers(headers)
+                )
+                if self.hooks:
+                    request.extensions["trace"] = trace.httpx_trace
+                resp = await self._client.send(request, stream=stream)
             except httpx.RequestError as exc:
                 # Network problem → retry if budget allows, else wrap into FinBrainError
+                trace.finish()
                 if attempt == self.retries:
-                    raise InvalidResponse(f"Network error: {exc}") from exc
-                await asyncio.sleep(_BACKOFF_BASE**attempt)
+                    error = InvalidResponse(f"Network error: {exc}")
+                    self._emit("on_error", trace, error=error)
+                    raise error from exc
+                delay = backoff_delay(delay, _BACKOFF_BASE, _BACKOFF_CAP)
+                self._emit("on_retry", trace, error=exc, delay=delay)
+                await asyncio.sleep(delay)
                 continue
+            trace.finish()
+
+            # Let later requests (and other tasks) pace themselves on the quota
+            self.rate_limit.observe(*parse_quota_headers(resp.headers))
 
             # ── Happy path ────────────────────────────────────
-            if resp.is_success:  # 2xx / 3xx
-                try:
-                    body = resp.json()
-                except ValueError as exc:
-                    raise InvalidResponse("Response body is not valid JSON") from exc
-
-                # Unwrap v2 envelope
-                if isinstance(body, dict) and "success" in body:
-                    self.last_meta = body.get("meta")
-                    return body.get("data")
-                return body
+            if resp.is_success or resp.status_code == 304:  # 2xx / Not Modified
+                return resp
 
             # ── Error path ───────────────────────────────────
+            if stream:
+                await resp.aread()
+                await resp.aclose()
             if resp.status_code in _RETRYABLE_STATUS and attempt < self.retries:
-                # Transient server/gateway error – exponential back-off then retry
-                await asyncio.sleep(_BACKOFF_BASE**attempt)
+                # Rate limited / transient error – honour Retry-After, else jittered back-off
+                delay = backoff_delay(delay, _BACKOFF_BASE, _BACKOFF_CAP)
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                if retry_after is not None:
+                    if retry_after > _MAX_RETRY_AFTER:
+                        raise self._give_up(trace, resp)
+                    self.rate_limit.pause(retry_after)
+                    delay = retry_after + random.uniform(0, _BACKOFF_BASE)
+                self._emit("on_retry", trace, status=resp.status_code, delay=delay)
+                await asyncio.sleep(delay)
                 continue
 
             # No more retries → raise the mapped FinBrainError
-            raise _httpx_error_to_exception(resp)
+            raise self._give_up(trace, resp)
+        raise AssertionError("unreachable")
+
+    def _give_up(self, trace: RequestTrace, resp: httpx.Response) -> Exception:
+        """Map *resp* to its exception and report it to ``on_error``."""
+        error = _httpx_error_to_exception(resp)
+        self._emit("on_error", trace, status=resp.status_code, error=error)
+        return error
+
+    def _emit(self, event: str, trace: RequestTrace, **fields: Any) -> None:
+        if self.hooks.wants(event):
+            self.hooks.emit(event, trace.event(**fields))
+
+    def _headers(self, extra: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        """Per-request headers: ``Accept-Encoding`` plus *extra*."""
+        if self.accept_encoding is None:
+            return extra
+        return {"Accept-Encoding": self.accept_encoding, **(extra or {})}
+
+    def _record_transfer(self, path: str, resp: httpx.Response, body_bytes: int) -> int:
+        # bodies a transport hands over pre-read never count as downloaded
+        wire_bytes = resp.num_bytes_downloaded or int(
+            resp.headers.get("Content-Length") or body_bytes
+        )
+        transfer = Transfer(
+            path, resp.headers.get("Content-Encoding", "identity"), wire_bytes, body_bytes
+        )
+        self.transfer_stats.record(transfer)
+        self.last_transfer = transfer
+        return wire_bytes
+
+    async def _stream_rows(self, chunks: AsyncIterator[bytes]) -> AsyncGenerator[Any, None]:
+        """Decode *chunks* incrementally, yielding rows and setting ``last_meta``."""
+        stream = RowStream()
+        try:
+            async for chunk in chunks:
+                for row in stream.feed(chunk):
+                    yield row
+            rows, envelope = stream.close()
+        except ValueError as exc:
+            raise InvalidResponse("Response body is not valid JSON") from exc
+        for row in rows:
+            yield row
+        data = self._unwrap(envelope)
+        if not stream.found:
+            # no row array where expected; fall back to whatever list is there
+            if isinstance(data, dict):
+                data = data.get("data")
+            if isinstance(data, list):
+                for row in data:
+                    yield row
+
+    def _decode(self, content: bytes) -> Any:
+        """Parse a raw response body, mapping decode failures to ``InvalidResponse``."""
+        try:
+            return self.json_loads(content)
+        except ValueError as exc:
+            raise InvalidResponse("Response body is not valid JSON") from exc
+
+    def _unwrap(self, body: Any) -> Any:
+        """Unwrap the v2 envelope, remembering ``meta`` on :attr:`last_meta`."""
+        if isinstance(body, dict) and "success" in body:
+            self.last_meta = body.get("meta")
+            return body.get("data")
+        return body
+
+
+class _AsyncStreamedBody:
+    """Chunks of a streamed response, finished exactly once.
+
+    See :class:`finbrain.client._StreamedBody`; the response itself is
+    closed by :meth:`aclose`, or by a task scheduled from :meth:`abandon`
+    when an unread iterator is garbage-collected.
+    """
+
+    def __init__(
+        self, client: AsyncFinBrainClient, trace: RequestTrace, resp: httpx.Response
+    ) -> None:
+        self._client = client
+        self._trace = trace
+        self._resp = resp
+        self._body_bytes = 0
+        self._finished = False
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._resp.aiter_bytes(_STREAM_CHUNK):
+                self._body_bytes += len(chunk)
+                yield chunk
+        except httpx.HTTPError as exc:
+            error = InvalidResponse(f"Network error: {exc}")
+            self.finish(error)
+            raise error from exc
+        finally:
+            await self.aclose()
+
+    def finish(self, error: InvalidResponse | None = None) -> None:
+        """Record the transfer and report it to the hooks (once)."""
+        if self._finished:
+            return
+        self._finished = True
+        client, trace, resp = self._client, self._trace, self._resp
+        wire_bytes = client._record_transfer(trace.path, resp, self._body_bytes)
+        trace.finish()
+        client._emit(
+            "on_error" if error is not None else "on_response", trace,
+            status=resp.status_code, error=error,
+            wire_bytes=wire_bytes, body_bytes=self._body_bytes,
+        )
+
+    async def aclose(self) -> None:
+        try:
+            self.finish()
+        finally:
+            await self._resp.aclose()
+
+    def abandon(self) -> None:
+        """Finish without awaiting; the response is closed on the running loop."""
+        self.finish()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._resp.aclose())
+        _CLOSING.add(task)
+        task.add_done_callback(_CLOSING.discard)
+
+
+class _AsyncStreamedRows:
+    """Async row iterator that releases its response however iteration ends.
+
+    The async counterpart of :class:`finbrain.client._StreamedRows`: use
+    :meth:`aclose` or ``async with`` to stop early.
+    """
+
+    def __init__(self, rows: AsyncGenerator[Any, None], body: _AsyncStreamedBody) -> None:
+        self._rows = rows
+        self._body = body
+        self._closed = False
+
+    def __aiter__(self) -> "_AsyncStreamedRows":
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return await self._rows.__anext__()
+        except BaseException:
+            await self.aclose()
+            raise
+
+    async def aclose(self) -> None:
+        """Stop reading and release the response; safe to call repeatedly."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            await self._rows.aclose()
+        finally:
+            await self._body.aclose()
+
+    async def __aenter__(self) -> "_AsyncStreamedRows":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    def __del__(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._body.abandon()
+
+
+# responses being closed on behalf of abandoned iterators (tasks need a strong ref)
+_CLOSING: set = set()
+
+
+async def _aiter_once(body: bytes) -> AsyncIterator[bytes]:
+    yield body
 
 
 def _httpx_error_to_exception(resp: httpx.Response):
@@ -188,7 +691,6 @@ def _httpx_error_to_exception(resp: httpx.Response):
             self.text = httpx_resp.text
 
         def json(self):
-            import json
 
             return json.loads(self.text)
 
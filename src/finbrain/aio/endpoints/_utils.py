@@ -1,12 +1,188 @@
 """
 Shared utility functions for async endpoint modules.
 
-These helpers are identical to the synchronous ones, so they are re-exported
-from :mod:`finbrain.endpoints._utils` to keep a single source of truth.
+The pure helpers are identical to the synchronous ones, so they are
+re-exported from :mod:`finbrain.endpoints._utils` to keep a single source of
+truth. Only the concurrency helpers differ: they bound in-flight requests
+with an :class:`asyncio.Semaphore` instead of a thread pool.
 """
 
 from __future__ import annotations
 
-from ...endpoints._utils import to_datestr
+import asyncio
+import datetime as _dt
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Tuple
 
-__all__ = ["to_datestr"]
+from ...endpoints._frames import resolve_output
+from ...endpoints._utils import (
+    RANGE_LIMIT,
+    SCREENER_SOURCES,
+    BatchResult,
+    ColumnBuilder,
+    DateSpan,
+    OrderBy,
+    Where,
+    Window,
+    window_full,
+    concat_frames,
+    date_windows,
+    join_screeners,
+    merge_range,
+    normalize_symbols,
+    screener_calls,
+    select_rows,
+    split_span,
+    to_datestr,
+)
+from ...exceptions import FinBrainError
+
+__all__ = [
+    "RANGE_LIMIT",
+    "SCREENER_SOURCES",
+    "BatchResult",
+    "ColumnBuilder",
+    "OrderBy",
+    "Where",
+    "concat_frames",
+    "date_windows",
+    "gather_many",
+    "gather_range",
+    "iter_many",
+    "join_screeners",
+    "normalize_symbols",
+    "screener_calls",
+    "select_rows",
+    "to_datestr",
+]
+
+
+async def iter_many(
+    fetch: Callable[..., Awaitable[Any]],
+    symbols: Iterable[str],
+    *,
+    concurrency: int = 8,
+    **kwargs: Any,
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Run ``fetch(symbol, **kwargs)`` for every symbol, yielding as each finishes.
+
+    At most *concurrency* requests are in flight at once. Each item is a
+    ``(symbol, value)`` pair where *value* is either the result or the
+    :class:`~finbrain.exceptions.FinBrainError` raised for that symbol, so a
+    slow or failing ticker never holds back the others. Any other exception
+    propagates. Leaving the ``async for`` early cancels outstanding requests.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(sym: str) -> Tuple[str, Any]:
+        async with sem:
+            try:
+                return sym, await fetch(sym, **kwargs)
+            except FinBrainError as exc:
+                return sym, exc
+
+    tasks = [asyncio.ensure_future(_one(sym)) for sym in normalize_symbols(symbols)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def gather_many(
+    fetch: Callable[..., Awaitable[Any]],
+    symbols: Iterable[str],
+    *,
+    concurrency: int = 8,
+    as_dataframe: bool = False,
+    **kwargs: Any,
+) -> Any:
+    """
+    Collect :func:`iter_many` into a :class:`BatchResult` (input order kept).
+
+    Returns
+    -------
+    BatchResult | pandas.DataFrame
+        One frame built with :func:`concat_frames` when the per-symbol
+        results are DataFrames (``as_dataframe=True`` or
+        ``output="pandas"``), otherwise a :class:`BatchResult`.
+    """
+    frames = resolve_output(kwargs.get("output"), as_dataframe) == "pandas"
+    syms = normalize_symbols(symbols)
+    done: dict[str, Any] = {}
+    async for sym, value in iter_many(
+        fetch, syms, concurrency=concurrency, as_dataframe=as_dataframe, **kwargs
+    ):
+        done[sym] = value
+
+    batch = BatchResult()
+    for sym in syms:
+        value = done[sym]
+        if isinstance(value, FinBrainError):
+            batch.errors[sym] = value
+        else:
+            batch[sym] = value
+    return concat_frames(batch) if frames else batch
+
+
+async def gather_range(
+    fetch: Callable[..., Awaitable[Any]],
+    symbol: str,
+    rows_key: str,
+    date_from: _dt.date | str,
+    date_to: _dt.date | str | None = None,
+    *,
+    date_field: str = "date",
+    window: Window = "90D",
+    concurrency: int = 8,
+    limit: int | None = None,
+) -> Dict[str, Any]:
+    """
+    Async counterpart of :func:`finbrain.endpoints._utils.fetch_range`.
+
+    Windows are fetched with at most *concurrency* requests in flight; a
+    failed window cancels the rest and raises. A single day that still
+    returns *limit* rows raises
+    :class:`~finbrain.exceptions.IncompleteRange`.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    sem = asyncio.Semaphore(concurrency)
+    per_window = RANGE_LIMIT if limit is None else limit
+
+    async def _one(span: DateSpan) -> Any:
+        async with sem:
+            return await fetch(
+                symbol,
+                date_from=span[0].isoformat(),
+                date_to=span[1].isoformat(),
+                limit=per_window,
+            )
+
+    pending: Dict["asyncio.Future[Any]", DateSpan] = {
+        asyncio.ensure_future(_one(span)): span
+        for span in date_windows(date_from, date_to, window)
+    }
+    responses: List[Any] = []
+    full_days: List[_dt.date] = []
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                span = pending.pop(task)
+                data = task.result()
+                full = window_full(data, rows_key, per_window)
+                if full and span[0] < span[1]:
+                    for half in split_span(span):
+                        pending[asyncio.ensure_future(_one(half))] = half
+                    continue
+                if full:
+                    full_days.append(span[0])
+                responses.append(data)
+    finally:
+        for task in pending:
+            task.cancel()
+    return merge_range(responses, rows_key, date_field, full_days)
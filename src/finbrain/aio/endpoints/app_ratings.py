@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import datetime as _dt
-import pandas as pd
-from typing import TYPE_CHECKING, Dict, Any, List
-from ._utils import to_datestr
+from typing import TYPE_CHECKING, Dict, Any, List, Iterable
+from ...endpoints._frames import APP_RATINGS, Output, build_output, resolve_output
+from ._utils import BatchResult, Window, gather_many, gather_range, to_datestr
 
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import AsyncFinBrainClient
 
 
@@ -40,8 +43,11 @@ class AsyncAppRatingsAPI:
         date_to: _dt.date | str | None = None,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> Dict[str, Any] | pd.DataFrame:
+        output: Output | None = None,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
         """Fetch mobile-app ratings for a symbol (async)."""
+        output = resolve_output(output, as_dataframe)
+
         params: Dict[str, str] = {}
 
         if date_from:
@@ -54,13 +60,52 @@ class AsyncAppRatingsAPI:
         path = f"app-ratings/{symbol.upper()}"
         data = await self._c._request("GET", path, params=params)
 
-        if as_dataframe:
-            rows: List[Dict[str, Any]] = data.get("data", [])
-            flat = _flatten_app_ratings(rows)
-            df = pd.DataFrame(flat)
-            if not df.empty and "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"])
-                df.set_index("date", inplace=True)
-            return df
+        if output != "raw":
+            return build_output(_flatten_app_ratings(data.get("data", [])), APP_RATINGS, output)
+
+        return data
+
+    async def ticker_many(
+        self,
+        symbols: Iterable[str],
+        *,
+        concurrency: int = 8,
+        as_dataframe: bool = False,
+        **kwargs: Any,
+    ) -> BatchResult | pd.DataFrame:
+        """Mobile-app ratings for many symbols at once (async, bounded concurrency)."""
+        return await gather_many(
+            self.ticker,
+            symbols,
+            concurrency=concurrency,
+            as_dataframe=as_dataframe,
+            **kwargs,
+        )
 
+    async def fetch_range(
+        self,
+        symbol: str,
+        date_from: _dt.date | str,
+        date_to: _dt.date | str | None = None,
+        *,
+        window: Window = "90D",
+        concurrency: int = 8,
+        limit: int | None = None,
+        as_dataframe: bool = False,
+        output: Output | None = None,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
+        """Mobile-app ratings over a long date range, fetched as parallel windows (async)."""
+        output = resolve_output(output, as_dataframe)
+        data = await gather_range(
+            self.ticker,
+            symbol,
+            "data",
+            date_from,
+            date_to,
+            window=window,
+            concurrency=concurrency,
+            limit=limit,
+        )
+        if output != "raw":
+            return build_output(_flatten_app_ratings(data.get("data", [])), APP_RATINGS, output)
         return data
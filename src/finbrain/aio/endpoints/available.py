@@ -1,8 +1,8 @@
 from __future__ import annotations
-import pandas as pd
 from typing import TYPE_CHECKING, List, Dict, Any
 
 if TYPE_CHECKING:
+    import pandas as pd
     from ..client import AsyncFinBrainClient
 
 
@@ -24,7 +24,11 @@ class AsyncAvailableAPI:
             data if isinstance(data, list) else data.get("markets", [])
         )
 
-        return pd.DataFrame(markets_list) if as_dataframe else markets_list
+        if as_dataframe:
+            import pandas as pd
+
+            return pd.DataFrame(markets_list)
+        return markets_list
 
     async def tickers(
         self,
@@ -56,7 +60,11 @@ class AsyncAvailableAPI:
         else:
             rows = data
 
-        return pd.DataFrame(rows) if as_dataframe else rows
+        if as_dataframe:
+            import pandas as pd
+
+            return pd.DataFrame(rows)
+        return rows
 
     async def regions(
         self,
@@ -70,4 +78,8 @@ class AsyncAvailableAPI:
             data if isinstance(data, list) else data.get("regions", [])
         )
 
-        return pd.DataFrame(regions_list) if as_dataframe else regions_list
+        if as_dataframe:
+            import pandas as pd
+
+            return pd.DataFrame(regions_list)
+        return regions_list
@@ -1,11 +1,15 @@
 from __future__ import annotations
-import pandas as pd
 import datetime as _dt
-from typing import TYPE_CHECKING, Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, Iterable
 
-from ._utils import to_datestr
+from ...records import GovernmentContract
+from ...endpoints._frames import GOVERNMENT_CONTRACTS, Output, build_output, resolve_output
+from ._utils import BatchResult, Window, gather_many, gather_range, to_datestr
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import AsyncFinBrainClient
 
 
@@ -23,8 +27,19 @@ class AsyncGovernmentContractsAPI:
         date_to: _dt.date | str | None = None,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> Dict[str, Any] | pd.DataFrame:
-        """Fetch government contract awards for a symbol (async)."""
+        output: Output | None = None,
+        as_records: bool = False,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
+        """
+        Fetch government contract awards for a symbol (async).
+
+        ``as_records=True`` swaps the ``contracts`` dicts for compact
+        :class:`~finbrain.records.GovernmentContract` objects.
+        """
+        output = resolve_output(output, as_dataframe)
+        if as_records and output != "raw":
+            raise ValueError("as_records and as_dataframe/output are mutually exclusive")
+
         params: Dict[str, str] = {}
         if date_from:
             params["startDate"] = to_datestr(date_from)
@@ -35,14 +50,60 @@ class AsyncGovernmentContractsAPI:
 
         path = f"government-contracts/{symbol.upper()}"
 
+        if as_records:
+            return await self._c._request_records(
+                "GET", path, params, "contracts", GovernmentContract.converter(symbol.upper())
+            )
+
         data: Dict[str, Any] = await self._c._request("GET", path, params=params)
 
-        if as_dataframe:
-            rows: List[Dict[str, Any]] = data.get("contracts", [])
-            df = pd.DataFrame(rows)
-            if not df.empty and "startDate" in df.columns:
-                df["startDate"] = pd.to_datetime(df["startDate"])
-                df.set_index("startDate", inplace=True)
-            return df
+        if output != "raw":
+            return build_output(data.get("contracts", []), GOVERNMENT_CONTRACTS, output)
+
+        return data
 
+    async def ticker_many(
+        self,
+        symbols: Iterable[str],
+        *,
+        concurrency: int = 8,
+        as_dataframe: bool = False,
+        **kwargs: Any,
+    ) -> BatchResult | pd.DataFrame:
+        """Government contract awards for many symbols at once (async, bounded concurrency)."""
+        return await gather_many(
+            self.ticker,
+            symbols,
+            concurrency=concurrency,
+            as_dataframe=as_dataframe,
+            **kwargs,
+        )
+
+    async def fetch_range(
+        self,
+        symbol: str,
+        date_from: _dt.date | str,
+        date_to: _dt.date | str | None = None,
+        *,
+        window: Window = "90D",
+        concurrency: int = 8,
+        limit: int | None = None,
+        as_dataframe: bool = False,
+        output: Output | None = None,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
+        """Government contract awards over a long date range, fetched as parallel windows (async)."""
+        output = resolve_output(output, as_dataframe)
+        data = await gather_range(
+            self.ticker,
+            symbol,
+            "contracts",
+            date_from,
+            date_to,
+            date_field="startDate",
+            window=window,
+            concurrency=concurrency,
+            limit=limit,
+        )
+        if output != "raw":
+            return build_output(data.get("contracts", []), GOVERNMENT_CONTRACTS, output)
         return data
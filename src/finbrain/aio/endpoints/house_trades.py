@@ -1,11 +1,15 @@
 from __future__ import annotations
-import pandas as pd
 import datetime as _dt
-from typing import TYPE_CHECKING, Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Iterable
 
-from ._utils import to_datestr
+from ...records import CongressTrade
+from ...endpoints._frames import CONGRESS_TRADES, Output, build_output, resolve_output
+from ._utils import BatchResult, Window, gather_many, gather_range, to_datestr
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import AsyncFinBrainClient
 
 
@@ -23,7 +27,9 @@ class AsyncHouseTradesAPI:
         date_to: _dt.date | str | None = None,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> Dict[str, Any] | pd.DataFrame:
+        output: Output | None = None,
+        as_records: bool = False,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
         """
         Fetch House-member trades for a symbol (async).
 
@@ -47,7 +53,14 @@ class AsyncHouseTradesAPI:
 
         ``date_from``/``date_to`` bound the transaction date, not the
         disclosure date.
+
+        ``as_records=True`` swaps the ``trades`` dicts for compact
+        :class:`~finbrain.records.CongressTrade` objects.
         """
+        output = resolve_output(output, as_dataframe)
+        if as_records and output != "raw":
+            raise ValueError("as_records and as_dataframe/output are mutually exclusive")
+
         params: Dict[str, str] = {}
         if date_from:
             params["startDate"] = to_datestr(date_from)
@@ -58,14 +71,59 @@ class AsyncHouseTradesAPI:
 
         path = f"congress/house/{symbol.upper()}"
 
+        if as_records:
+            return await self._c._request_records(
+                "GET", path, params, "trades", CongressTrade.converter(symbol.upper())
+            )
+
         data: Dict[str, Any] = await self._c._request("GET", path, params=params)
 
-        if as_dataframe:
-            rows = data.get("trades", [])
-            df = pd.DataFrame(rows)
-            if not df.empty and "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"])
-                df.set_index("date", inplace=True)
-            return df
+        if output != "raw":
+            return build_output(data.get("trades", []), CONGRESS_TRADES, output)
+
+        return data
 
+    async def ticker_many(
+        self,
+        symbols: Iterable[str],
+        *,
+        concurrency: int = 8,
+        as_dataframe: bool = False,
+        **kwargs: Any,
+    ) -> BatchResult | pd.DataFrame:
+        """House-member trades for many symbols at once (async, bounded concurrency)."""
+        return await gather_many(
+            self.ticker,
+            symbols,
+            concurrency=concurrency,
+            as_dataframe=as_dataframe,
+            **kwargs,
+        )
+
+    async def fetch_range(
+        self,
+        symbol: str,
+        date_from: _dt.date | str,
+        date_to: _dt.date | str | None = None,
+        *,
+        window: Window = "90D",
+        concurrency: int = 8,
+        limit: int | None = None,
+        as_dataframe: bool = False,
+        output: Output | None = None,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
+        """House-member trades over a long date range, fetched as parallel windows (async)."""
+        output = resolve_output(output, as_dataframe)
+        data = await gather_range(
+            self.ticker,
+            symbol,
+            "trades",
+            date_from,
+            date_to,
+            window=window,
+            concurrency=concurrency,
+            limit=limit,
+        )
+        if output != "raw":
+            return build_output(data.get("trades", []), CONGRESS_TRADES, output)
         return data
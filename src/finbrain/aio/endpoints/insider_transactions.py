@@ -1,11 +1,15 @@
 from __future__ import annotations
-import pandas as pd
 import datetime as _dt
-from typing import TYPE_CHECKING, Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Iterable
 
-from ._utils import to_datestr
+from ...records import InsiderTransaction
+from ...endpoints._frames import INSIDER_TRANSACTIONS, Output, build_output, resolve_output
+from ._utils import BatchResult, Window, gather_many, gather_range, to_datestr
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import AsyncFinBrainClient
 
 
@@ -23,8 +27,19 @@ class AsyncInsiderTransactionsAPI:
         date_to: _dt.date | str | None = None,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> Dict[str, Any] | pd.DataFrame:
-        """Insider transactions for a symbol (async)."""
+        output: Output | None = None,
+        as_records: bool = False,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
+        """
+        Insider transactions for a symbol (async).
+
+        ``as_records=True`` swaps the ``transactions`` dicts for compact
+        :class:`~finbrain.records.InsiderTransaction` objects.
+        """
+        output = resolve_output(output, as_dataframe)
+        if as_records and output != "raw":
+            raise ValueError("as_records and as_dataframe/output are mutually exclusive")
+
         params: Dict[str, str] = {}
         if date_from:
             params["startDate"] = to_datestr(date_from)
@@ -34,14 +49,60 @@ class AsyncInsiderTransactionsAPI:
             params["limit"] = str(limit)
 
         path = f"insider-trading/{symbol.upper()}"
+        if as_records:
+            return await self._c._request_records(
+                "GET", path, params, "transactions",
+                InsiderTransaction.converter(symbol.upper()),
+            )
+
         data: Dict[str, Any] = await self._c._request("GET", path, params=params)
 
-        if as_dataframe:
-            rows = data.get("transactions", [])
-            df = pd.DataFrame(rows)
-            if not df.empty and "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"])
-                df.set_index("date", inplace=True)
-            return df
+        if output != "raw":
+            return build_output(data.get("transactions", []), INSIDER_TRANSACTIONS, output)
+
+        return data
 
+    async def ticker_many(
+        self,
+        symbols: Iterable[str],
+        *,
+        concurrency: int = 8,
+        as_dataframe: bool = False,
+        **kwargs: Any,
+    ) -> BatchResult | pd.DataFrame:
+        """Insider transactions for many symbols at once (async, bounded concurrency)."""
+        return await gather_many(
+            self.ticker,
+            symbols,
+            concurrency=concurrency,
+            as_dataframe=as_dataframe,
+            **kwargs,
+        )
+
+    async def fetch_range(
+        self,
+        symbol: str,
+        date_from: _dt.date | str,
+        date_to: _dt.date | str | None = None,
+        *,
+        window: Window = "90D",
+        concurrency: int = 8,
+        limit: int | None = None,
+        as_dataframe: bool = False,
+        output: Output | None = None,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
+        """Insider transactions over a long date range, fetched as parallel windows (async)."""
+        output = resolve_output(output, as_dataframe)
+        data = await gather_range(
+            self.ticker,
+            symbol,
+            "transactions",
+            date_from,
+            date_to,
+            window=window,
+            concurrency=concurrency,
+            limit=limit,
+        )
+        if output != "raw":
+            return build_output(data.get("transactions", []), INSIDER_TRANSACTIONS, output)
         return data
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-import pandas as pd
-from typing import TYPE_CHECKING, Literal, Dict, Any
+from typing import TYPE_CHECKING, Literal, Dict, Any, Iterable
+
+from ...endpoints._frames import PREDICTIONS, Output, build_output, resolve_output
+from ._utils import BatchResult, gather_many
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import AsyncFinBrainClient
 
 
@@ -23,22 +28,37 @@ class AsyncPredictionsAPI:
         *,
         prediction_type: _PType = "daily",
         as_dataframe: bool = False,
-    ) -> Dict[str, Any] | pd.DataFrame:
+        output: Output | None = None,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
         """Single-ticker predictions (async)."""
+        output = resolve_output(output, as_dataframe)
+
         _validate(prediction_type)
         path = f"predictions/{prediction_type}/{symbol.upper()}"
         data: Dict[str, Any] = await self._c._request("GET", path)
 
-        if as_dataframe:
-            rows = data.get("predictions", [])
-            df = pd.DataFrame(rows)
-            if not df.empty and "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"])
-                df.set_index("date", inplace=True)
-            return df
+        if output != "raw":
+            return build_output(data.get("predictions", []), PREDICTIONS, output)
 
         return data
 
+    async def ticker_many(
+        self,
+        symbols: Iterable[str],
+        *,
+        concurrency: int = 8,
+        as_dataframe: bool = False,
+        **kwargs: Any,
+    ) -> BatchResult | pd.DataFrame:
+        """Price predictions for many symbols at once (async, bounded concurrency)."""
+        return await gather_many(
+            self.ticker,
+            symbols,
+            concurrency=concurrency,
+            as_dataframe=as_dataframe,
+            **kwargs,
+        )
+
 
 def _validate(value: str) -> None:
     if value not in _ALLOWED:
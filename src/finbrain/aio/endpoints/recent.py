@@ -1,8 +1,13 @@
 from __future__ import annotations
-import pandas as pd
-from typing import TYPE_CHECKING, Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, AsyncIterator, List
+
+from ...endpoints._frames import RECENT, Output, build_output, resolve_output
+from ._utils import ColumnBuilder
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import AsyncFinBrainClient
 
 
@@ -35,6 +40,15 @@ class AsyncRecentAPI:
             return data["data"]
         return data
 
+    async def _stream(self, path: str, params: Dict[str, str], output: str) -> Any:
+        rows = await self._c._request_stream("GET", path, params=params or None)
+        if output == "raw":
+            return rows
+        builder = ColumnBuilder()
+        async for row in rows:
+            builder.append(row)
+        return build_output(builder.columns, RECENT, output)
+
     async def news(
         self,
         *,
@@ -42,14 +56,19 @@ class AsyncRecentAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Get most recent news articles across all tracked stocks (async)."""
+        output = resolve_output(output, as_dataframe)
         params = self._build_params(limit=limit, market=market, region=region)
+        if stream:
+            return await self._stream("recent/news", params, output)
         data = await self._c._request("GET", "recent/news", params=params or None)
         rows = self._unwrap(data)
 
-        if as_dataframe and isinstance(rows, list):
-            return pd.DataFrame(rows)
+        if output != "raw" and isinstance(rows, list):
+            return build_output(rows, RECENT, output)
         return rows
 
     async def analyst_ratings(
@@ -59,14 +78,19 @@ class AsyncRecentAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Get most recent analyst ratings across all tickers (async)."""
+        output = resolve_output(output, as_dataframe)
         params = self._build_params(limit=limit, market=market, region=region)
+        if stream:
+            return await self._stream("recent/analyst-ratings", params, output)
         data = await self._c._request(
             "GET", "recent/analyst-ratings", params=params or None
         )
         rows = self._unwrap(data)
 
-        if as_dataframe and isinstance(rows, list):
-            return pd.DataFrame(rows)
+        if output != "raw" and isinstance(rows, list):
+            return build_output(rows, RECENT, output)
         return rows
@@ -1,13 +1,32 @@
 from __future__ import annotations
-import pandas as pd
-from typing import TYPE_CHECKING, Dict, Any, List
+import asyncio
+from typing import TYPE_CHECKING, Dict, Any, AsyncIterator, Iterable, List, Mapping
+
+from ...endpoints._frames import SCREENER, Output, build_output, resolve_output
+from ._utils import (
+    SCREENER_SOURCES,
+    ColumnBuilder,
+    OrderBy,
+    Where,
+    join_screeners,
+    screener_calls,
+    select_rows,
+)
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import AsyncFinBrainClient
 
 
 class AsyncScreenerAPI:
-    """Async screener endpoints (v2) — cross-ticker screening."""
+    """
+    Async screener endpoints (v2) — cross-ticker screening.
+
+    ``stream=True`` returns an async iterator of rows; see
+    :class:`finbrain.endpoints.screener.ScreenerAPI`.
+    """
 
     def __init__(self, client: "AsyncFinBrainClient") -> None:
         self._c = client
@@ -38,13 +57,9 @@ class AsyncScreenerAPI:
             )
 
     @staticmethod
-    def _to_df(data: Any) -> pd.DataFrame:
-        if isinstance(data, list):
-            df = pd.DataFrame(data)
-            if not df.empty and "symbol" in df.columns:
-                df.set_index("symbol", inplace=True)
-            return df
-        return pd.DataFrame()
+    def _to_df(data: List[Dict[str, Any]] | Dict[str, List[Any]], output: str = "pandas") -> Any:
+        """Symbol-keyed table (pandas, Arrow or Polars) from rows or columns."""
+        return build_output(data if isinstance(data, (list, dict)) else [], SCREENER, output)
 
     @staticmethod
     def _unwrap(data: Any) -> Any:
@@ -53,10 +68,28 @@ class AsyncScreenerAPI:
             return data["data"]
         return data
 
-    async def _get(self, path: str, params: Dict[str, str], as_dataframe: bool) -> Any:
+    async def _get(
+        self,
+        path: str,
+        params: Dict[str, str],
+        as_dataframe: bool,
+        stream: bool = False,
+        output: str | None = None,
+    ) -> Any:
+        output = resolve_output(output, as_dataframe)
+        if stream:
+            rows = await self._c._request_stream("GET", path, params=params or None)
+            if output != "raw":
+                builder = ColumnBuilder()
+                async for row in rows:
+                    builder.append(row)
+                return self._to_df(builder.columns, output)
+            return rows
         data = await self._c._request("GET", path, params=params or None)
         rows = self._unwrap(data)
-        return self._to_df(rows) if as_dataframe else rows
+        if output != "raw":
+            return self._to_df(rows if isinstance(rows, list) else [], output)
+        return rows
 
     # ── sentiment ─────────────────────────────────────────────
 
@@ -67,11 +100,13 @@ class AsyncScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen sentiment across tickers. Requires ``market`` or ``region``."""
         self._require_market_or_region(market, region)
         params = self._build_params(limit=limit, market=market, region=region)
-        return await self._get("screener/sentiment", params, as_dataframe)
+        return await self._get("screener/sentiment", params, as_dataframe, stream, output)
 
     # ── analyst ratings ───────────────────────────────────────
 
@@ -82,10 +117,12 @@ class AsyncScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen analyst ratings across tickers."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return await self._get("screener/analyst-ratings", params, as_dataframe)
+        return await self._get("screener/analyst-ratings", params, as_dataframe, stream, output)
 
     # ── insider trading ───────────────────────────────────────
 
@@ -94,10 +131,12 @@ class AsyncScreenerAPI:
         *,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen insider trades across all tickers."""
         params = self._build_params(limit=limit)
-        return await self._get("screener/insider-trading", params, as_dataframe)
+        return await self._get("screener/insider-trading", params, as_dataframe, stream, output)
 
     # ── congress house ────────────────────────────────────────
 
@@ -106,7 +145,9 @@ class AsyncScreenerAPI:
         *,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """
         Screen House trades across all tickers.
 
@@ -118,7 +159,7 @@ class AsyncScreenerAPI:
         were backfilled upstream.
         """
         params = self._build_params(limit=limit)
-        return await self._get("screener/congress/house", params, as_dataframe)
+        return await self._get("screener/congress/house", params, as_dataframe, stream, output)
 
     # ── congress senate ───────────────────────────────────────
 
@@ -127,7 +168,9 @@ class AsyncScreenerAPI:
         *,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """
         Screen Senate trades across all tickers.
 
@@ -139,7 +182,7 @@ class AsyncScreenerAPI:
         nullable, though rare — historical rows were backfilled upstream.
         """
         params = self._build_params(limit=limit)
-        return await self._get("screener/congress/senate", params, as_dataframe)
+        return await self._get("screener/congress/senate", params, as_dataframe, stream, output)
 
     # ── news ──────────────────────────────────────────────────
 
@@ -150,10 +193,12 @@ class AsyncScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen news across tickers."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return await self._get("screener/news", params, as_dataframe)
+        return await self._get("screener/news", params, as_dataframe, stream, output)
 
     # ── put-call ratio ────────────────────────────────────────
 
@@ -164,10 +209,12 @@ class AsyncScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen put/call ratio across tickers."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return await self._get("screener/put-call-ratio", params, as_dataframe)
+        return await self._get("screener/put-call-ratio", params, as_dataframe, stream, output)
 
     # ── linkedin ──────────────────────────────────────────────
 
@@ -178,11 +225,13 @@ class AsyncScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen LinkedIn data. Requires ``market`` or ``region``."""
         self._require_market_or_region(market, region)
         params = self._build_params(limit=limit, market=market, region=region)
-        return await self._get("screener/linkedin", params, as_dataframe)
+        return await self._get("screener/linkedin", params, as_dataframe, stream, output)
 
     # ── app ratings ───────────────────────────────────────────
 
@@ -193,11 +242,13 @@ class AsyncScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen app ratings. Requires ``market`` or ``region``."""
         self._require_market_or_region(market, region)
         params = self._build_params(limit=limit, market=market, region=region)
-        return await self._get("screener/app-ratings", params, as_dataframe)
+        return await self._get("screener/app-ratings", params, as_dataframe, stream, output)
 
     # ── predictions daily ─────────────────────────────────────
 
@@ -208,10 +259,12 @@ class AsyncScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen daily (10-day) predictions across tickers."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return await self._get("screener/predictions/daily", params, as_dataframe)
+        return await self._get("screener/predictions/daily", params, as_dataframe, stream, output)
 
     # ── predictions monthly ───────────────────────────────────
 
@@ -222,10 +275,12 @@ class AsyncScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen monthly (12-month) predictions across tickers."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return await self._get("screener/predictions/monthly", params, as_dataframe)
+        return await self._get("screener/predictions/monthly", params, as_dataframe, stream, output)
 
     # ── reddit mentions ────────────────────────────────────────
 
@@ -236,10 +291,12 @@ class AsyncScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen Reddit mention counts across tickers (async)."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return await self._get("screener/reddit-mentions", params, as_dataframe)
+        return await self._get("screener/reddit-mentions", params, as_dataframe, stream, output)
 
     # ── government contracts ──────────────────────────────────
 
@@ -248,10 +305,12 @@ class AsyncScreenerAPI:
         *,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen government contracts across all tickers (async)."""
         params = self._build_params(limit=limit)
-        return await self._get("screener/government-contracts", params, as_dataframe)
+        return await self._get("screener/government-contracts", params, as_dataframe, stream, output)
 
     # ── patent filings ────────────────────────────────────────
 
@@ -260,7 +319,46 @@ class AsyncScreenerAPI:
         *,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | AsyncIterator[Dict[str, Any]]:
         """Screen USPTO patent filings across all tickers (async)."""
         params = self._build_params(limit=limit)
-        return await self._get("screener/patent-filings", params, as_dataframe)
+        return await self._get("screener/patent-filings", params, as_dataframe, stream, output)
+
+    # ── multi-screener query ──────────────────────────────────
+
+    async def query(
+        self,
+        sources: Iterable[str] | Mapping[str, Mapping[str, Any]],
+        *,
+        where: Where | None = None,
+        order_by: OrderBy | None = None,
+        top: int | None = None,
+        how: str = "inner",
+        market: str | None = None,
+        region: str | None = None,
+        limit: int | None = None,
+        concurrency: int = 8,
+    ) -> pd.DataFrame:
+        """
+        Fetch several screeners at once, join them on ``symbol`` and filter.
+
+        Same as :meth:`finbrain.endpoints.screener.ScreenerAPI.query`, with
+        at most *concurrency* screeners in flight.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        methods = {name: getattr(self, name) for name in SCREENER_SOURCES}
+        calls = screener_calls(
+            sources, methods, market=market, region=region, limit=limit
+        )
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(name: str) -> Any:
+            async with sem:
+                return await methods[name](as_dataframe=True, **calls[name])
+
+        results = await asyncio.gather(*(_one(name) for name in calls))
+        frames = dict(zip(calls, results))
+        return select_rows(join_screeners(frames, how), where, order_by, top)
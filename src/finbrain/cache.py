@@ -0,0 +1,300 @@
+"""
+finbrain.cache
+~~~~~~~~~~~~~~
+
+Opt-in persistent response cache shared by :class:`~finbrain.FinBrainClient`
+and :class:`~finbrain.aio.AsyncFinBrainClient`.
+
+Successful ``GET`` bodies are stored as raw bytes in a single SQLite file,
+keyed on method, URL and normalised query parameters. Each entry expires
+after a TTL chosen by the longest matching path prefix, and the least
+recently used entries are evicted once the size cap is exceeded.
+
+Entries whose response carried an ``ETag`` or ``Last-Modified`` header are
+kept for a while after they expire. The clients then revalidate them with a
+conditional request (``If-None-Match`` / ``If-Modified-Since``); a
+``304 Not Modified`` reply re-arms the stored body without downloading it
+again.
+
+Example
+-------
+>>> from finbrain import FinBrainClient
+>>> from finbrain.cache import ResponseCache
+>>> cache = ResponseCache(
+...     ttl=3600,
+...     ttl_by_prefix={"predictions/daily/": 6 * 3600, "congress/house/": 86400},
+... )
+>>> fb = FinBrainClient(api_key="YOUR_KEY", cache=cache)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
+
+__all__ = ["CachedResponse", "ResponseCache", "default_cache_path"]
+
+# Bump whenever the table layout changes; older cache files are rebuilt.
+_SCHEMA_VERSION = 2
+
+
+class CachedResponse(NamedTuple):
+    """A stored body with its validators, as returned by :meth:`ResponseCache.lookup`."""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    fresh: bool
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """``If-None-Match`` / ``If-Modified-Since`` headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def default_cache_path() -> Path:
+    """Return ``$XDG_CACHE_HOME/finbrain/responses.sqlite3`` (or ``~/.cache/…``)."""
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(root) / "finbrain" / "responses.sqlite3"
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of raw response bodies with per-prefix TTLs.
+
+    Parameters
+    ----------
+    path :
+        Location of the SQLite file. Defaults to :func:`default_cache_path`.
+        The file can be shared by several processes; SQLite serialises writes.
+    ttl :
+        Default time-to-live in seconds for paths that match no prefix.
+    ttl_by_prefix :
+        Mapping of API path prefix (e.g. ``"predictions/daily/"``) to TTL in
+        seconds. The longest matching prefix wins. A TTL of ``0`` disables
+        caching for that prefix.
+    max_bytes :
+        Size cap for stored bodies. Least recently used entries are evicted
+        once the total exceeds it. ``None`` disables the cap.
+    max_entries :
+        Optional cap on the number of stored entries, enforced the same way.
+    revalidate_for :
+        How long (seconds) an expired entry that has an ``ETag`` or
+        ``Last-Modified`` validator is kept so it can be revalidated with a
+        conditional request. ``0`` disables conditional requests.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        *,
+        ttl: float = 3600,
+        ttl_by_prefix: Optional[Mapping[str, float]] = None,
+        max_bytes: int | None = 256 * 1024 * 1024,
+        max_entries: int | None = None,
+        revalidate_for: float = 7 * 86400,
+    ) -> None:
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.ttl = float(ttl)
+        # longest prefix first, so the first match is the most specific one
+        self.ttl_by_prefix: Tuple[Tuple[str, float], ...] = tuple(
+            sorted(
+                ((p.lstrip("/"), float(t)) for p, t in (ttl_by_prefix or {}).items()),
+                key=lambda item: len(item[0]),
+                reverse=True,
+            )
+        )
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.revalidate_for = float(revalidate_for)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=30,
+            isolation_level=None,  # autocommit; every statement is atomic
+            check_same_thread=False,  # guarded by self._lock instead
+        )
+        self._init_schema()
+
+    # ---------- public API ----------
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Build the cache key for a request.
+
+        Parameters are sorted and stringified, and ``None`` values dropped, so
+        ``{"limit": 10}`` and ``{"limit": "10"}`` share an entry.
+        """
+        norm = sorted(
+            (str(k), str(v)) for k, v in (params or {}).items() if v is not None
+        )
+        raw = "\n".join([method.upper(), url] + [f"{k}={v}" for k, v in norm])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, path: str) -> float:
+        """TTL in seconds for an API *path*, resolved by longest prefix."""
+        path = path.lstrip("/")
+        for prefix, ttl in self.ttl_by_prefix:
+            if path.startswith(prefix):
+                return ttl
+        return self.ttl
+
+    def get(self, key: str) -> bytes | None:
+        """Return the cached body for *key*, or ``None`` if missing or expired."""
+        entry = self.lookup(key)
+        return entry.body if entry is not None and entry.fresh else None
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        """
+        Return the entry for *key*, fresh or awaiting revalidation.
+
+        Expired entries are only returned while they are kept for
+        revalidation (see *revalidate_for*); ``None`` otherwise.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, expires, stale_until"
+                " FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            body, etag, last_modified, expires, stale_until = row
+            if stale_until <= now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, key)
+            )
+        return CachedResponse(bytes(body), etag, last_modified, expires > now)
+
+    def set(
+        self,
+        key: str,
+        path: str,
+        body: bytes,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store *body* (and its validators) under *key* with *path*'s TTL."""
+        ttl = self.ttl_for(path)
+        if ttl <= 0:
+            return
+        now = time.time()
+        expires = now + ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, path, body, size, etag, last_modified, expires, stale_until,"
+                " accessed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, path, sqlite3.Binary(body), len(body), etag, last_modified,
+                    expires, self._stale_until(expires, etag, last_modified), now,
+                ),
+            )
+            self._evict(now)
+
+    def refresh(self, key: str, path: str) -> None:
+        """Restart *key*'s TTL after a ``304 Not Modified``, keeping its body."""
+        now = time.time()
+        expires = now + self.ttl_for(path)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET expires = ?, accessed = ?,"
+                " stale_until = MAX(stale_until, ? + ?) WHERE key = ?",
+                (expires, now, expires, self.revalidate_for, key),
+            )
+
+    def delete(self, key: str) -> None:
+        """Drop a single entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return int(count)
+
+    # ---------- private helpers ----------
+    def _stale_until(
+        self, expires: float, etag: str | None, last_modified: str | None
+    ) -> float:
+        if etag or last_modified:
+            return expires + self.revalidate_for
+        return expires
+
+    def _init_schema(self) -> None:
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            (version,) = self._conn.execute("PRAGMA user_version").fetchone()
+            if version != _SCHEMA_VERSION:
+                # The cache is disposable: rebuild rather than migrate.
+                self._conn.execute("DROP TABLE IF EXISTS responses")
+                self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key      TEXT PRIMARY KEY,"
+                " path     TEXT NOT NULL,"
+                " body     BLOB NOT NULL,"
+                " size     INTEGER NOT NULL,"
+                " etag     TEXT,"
+                " last_modified TEXT,"
+                " expires  REAL NOT NULL,"
+                " stale_until REAL NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+            )
+
+    def _evict(self, now: float) -> None:
+        """Purge dead rows, then LRU rows until both caps hold (lock held)."""
+        self._conn.execute("DELETE FROM responses WHERE stale_until <= ?", (now,))
+        if self.max_entries is not None:
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY accessed DESC"
+                " LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+        if self.max_bytes is not None:
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                freed = 0
+                victims = []
+                for key, size in self._conn.execute(
+                    "SELECT key, size FROM responses ORDER BY accessed ASC"
+                ):
+                    victims.append((key,))
+                    freed += size
+                    if freed >= excess:
+                        break
+                self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
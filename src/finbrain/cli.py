@@ -0,0 +1,492 @@
+"""
+finbrain.cli
+~~~~~~~~~~~~
+
+``finbrain`` console script for bulk exports.
+
+``pull``
+    Per-ticker endpoint histories for many symbols, fetched concurrently
+    under a client-side rate limit and streamed to NDJSON, CSV or a
+    :class:`~finbrain.store.ParquetStore` directory. A checkpoint file
+    records finished symbols so an interrupted run resumes where it stopped.
+``screen``
+    One screener call, streamed straight to the output file.
+``sync``
+    :class:`~finbrain.sync.SyncEngine` run over many symbols.
+
+Symbols come from ``--symbol``, a ``--symbols-file`` (one per line, ``#``
+comments allowed) or every ticker of a ``--market`` / ``--region``.
+
+Example
+-------
+.. code-block:: console
+
+    $ export FINBRAIN_API_KEY=...
+    $ finbrain pull insider-trading --market "S&P 500" --out insider.ndjson \\
+          --concurrency 16 --rps 20
+    $ finbrain screen analyst-ratings --market "S&P 500" --out ratings.csv
+    $ finbrain sync congress/house --symbols-file watchlist.txt --dir ~/finbrain-data
+"""
+
+from __future__ import annotations
+
+import csv
+import inspect
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Annotated, Any, Dict, Iterable, List, Optional, Set, TextIO
+
+import typer
+
+from .client import FinBrainClient
+from .endpoints._utils import SCREENER_SOURCES, normalize_symbols
+from .endpoints.screener import ScreenerAPI
+from .exceptions import FinBrainError
+from .sync import SYNC_ENDPOINTS, SyncEngine, resolve_endpoint
+
+__all__ = ["app"]
+
+app = typer.Typer(
+    name="finbrain",
+    help="Bulk downloads from the FinBrain API.",
+    no_args_is_help=True,
+    add_completion=False,
+)
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+# ─────────── shared options ─────────────────────────────────────────────
+ApiKey = Annotated[
+    Optional[str],
+    typer.Option("--api-key", envvar="FINBRAIN_API_KEY", show_envvar=True,
+                 help="API key (defaults to $FINBRAIN_API_KEY)."),
+]
+Symbols = Annotated[
+    Optional[List[str]],
+    typer.Option("--symbol", "-s", help="Ticker to fetch; repeatable."),
+]
+SymbolsFile = Annotated[
+    Optional[Path],
+    typer.Option("--symbols-file", "-f", exists=True, dir_okay=False,
+                 help="File with one ticker per line."),
+]
+Market = Annotated[Optional[str], typer.Option("--market", help="Market filter, e.g. 'S&P 500'.")]
+Region = Annotated[Optional[str], typer.Option("--region", help="Region filter, e.g. 'US'.")]
+Concurrency = Annotated[
+    int, typer.Option("--concurrency", "-c", min=1, help="Parallel requests.")
+]
+Rps = Annotated[
+    Optional[float],
+    typer.Option("--rps", min=0.01, help="Client-side cap in requests per second."),
+]
+Out = Annotated[Path, typer.Option("--out", "-o", help="Output file (or directory for parquet).")]
+Format = Annotated[
+    Optional[str],
+    typer.Option("--format", help="ndjson, csv or parquet (default: from --out suffix)."),
+]
+Quiet = Annotated[bool, typer.Option("--quiet", "-q", help="No progress bar.")]
+
+
+def _err(message: str) -> None:
+    typer.echo(message, err=True)
+
+
+def _client(api_key: Optional[str], concurrency: int, rps: Optional[float]) -> FinBrainClient:
+    try:
+        return FinBrainClient(
+            api_key=api_key,
+            rate_limit=rps,
+            pool_maxsize=max(concurrency, 10),
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--api-key") from None
+
+
+def _endpoint(name: str) -> str:
+    try:
+        return resolve_endpoint(name)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="ENDPOINT") from None
+
+
+def _symbols(
+    fb: FinBrainClient,
+    symbols: Optional[List[str]],
+    symbols_file: Optional[Path],
+    market: Optional[str],
+    region: Optional[str],
+) -> List[str]:
+    found: List[str] = []
+    for item in symbols or []:
+        found.extend(s for s in item.split(",") if s.strip())
+    if symbols_file is not None:
+        for line in symbols_file.read_text(encoding="utf-8").splitlines():
+            line = line.split("#", 1)[0]
+            found.extend(s for s in line.replace(",", " ").split() if s)
+    if not found and (market or region):
+        rows = fb.available.tickers("daily", market=market, region=region)
+        found = [r["symbol"] for r in rows if isinstance(r, dict) and r.get("symbol")]
+    result = normalize_symbols(s.strip() for s in found)
+    if not result:
+        raise typer.BadParameter(
+            "no symbols: pass --symbol, --symbols-file, --market or --region"
+        )
+    return result
+
+
+def _format(out: Path, fmt: Optional[str]) -> str:
+    if fmt is None:
+        suffix = out.suffix.lower()
+        fmt = {".csv": "csv", ".parquet": "parquet", "": "parquet"}.get(suffix, "ndjson")
+    fmt = fmt.lower()
+    if fmt not in FORMATS:
+        raise typer.BadParameter(f"expected one of {', '.join(FORMATS)}", param_hint="--format")
+    return fmt
+
+
+def _progress(total: int, description: str, quiet: bool) -> Any:
+    from rich.console import Console
+    from rich.progress import (
+        BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeRemainingColumn,
+    )
+
+    progress = Progress(
+        TextColumn("[bold]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeRemainingColumn(),
+        console=Console(stderr=True),
+        disable=quiet,
+    )
+    progress.add_task(description, total=total)
+    return progress
+
+
+# ─────────── output sinks ───────────────────────────────────────────────
+class _Checkpoint:
+    """Append-only list of finished symbols next to the output."""
+
+    def __init__(self, path: Path, restart: bool) -> None:
+        self.path = path
+        if restart and path.exists():
+            path.unlink()
+        self.done = set()
+        if path.exists():
+            self.done = set(path.read_text(encoding="utf-8").split())
+        self._fh: Optional[TextIO] = None
+
+    def mark(self, symbol: str) -> None:
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "a", encoding="utf-8")
+        self._fh.write(symbol + "\n")
+        self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+
+
+class _LineSink:
+    """
+    NDJSON or CSV file, appended to when resuming.
+
+    The CSV header is the union of every row's fields. When a row brings a
+    field the header lacks, the file written so far is rewritten once with
+    the wider header (earlier rows get empty cells), so no column is lost.
+
+    A symbol's rows are written before it is checkpointed, so a run cut off
+    in between leaves rows the resumed run would write again. Resuming with
+    *done* first drops every row whose symbol is not in it.
+    """
+
+    def __init__(
+        self, path: Path, fmt: str, append: bool, done: Optional[Set[str]] = None
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fresh = not (append and path.exists() and path.stat().st_size)
+        self._path = path
+        if not fresh and done is not None:
+            self._drop_unfinished(fmt, done)
+        self._fh = open(path, "w" if fresh else "a", encoding="utf-8", newline="")
+        self._fmt = fmt
+        self._writer: Optional[csv.DictWriter] = None
+        if fmt == "csv" and not fresh:
+            with open(path, encoding="utf-8", newline="") as fh:
+                header = next(csv.reader(fh), [])
+            self._writer = self._csv_writer(header)
+
+    def _drop_unfinished(self, fmt: str, done: Set[str]) -> None:
+        """Rewrite the file without rows of symbols outside *done*."""
+        with open(self._path, encoding="utf-8", newline="") as fh:
+            text = fh.read()
+        # an unterminated last line was cut off mid-write
+        lines = io.StringIO(text, newline="").readlines()
+        if lines and not lines[-1].endswith("\n"):
+            lines.pop()
+        if fmt == "ndjson":
+            body = "".join(line for line in lines if _ndjson_symbol(line) in done)
+        else:
+            records = list(csv.reader(lines))
+            header = records[0] if records else []
+            col = header.index("symbol") if "symbol" in header else -1
+            rows = [r for r in records[1:] if 0 <= col < len(r) and r[col] in done]
+            buf = io.StringIO(newline="")
+            csv.writer(buf).writerows([header, *rows] if header else [])
+            body = buf.getvalue()
+        if body == text:
+            return
+        tmp = self._path.with_name(f".{self._path.name}.tmp")
+        with open(tmp, "w", encoding="utf-8", newline="") as fh:
+            fh.write(body)
+        os.replace(tmp, self._path)
+
+    def _csv_writer(self, fields: List[str]) -> csv.DictWriter:
+        return csv.DictWriter(self._fh, fieldnames=fields, restval="")
+
+    def _widen(self, old: List[str], fields: List[str]) -> None:
+        """Rewrite the CSV written so far under the wider header *fields*."""
+        self._fh.close()
+        tmp = self._path.with_name(f".{self._path.name}.tmp")
+        with open(self._path, encoding="utf-8", newline="") as src, \
+                open(tmp, "w", encoding="utf-8", newline="") as dst:
+            reader = csv.reader(src)
+            next(reader, None)
+            writer = csv.writer(dst)
+            writer.writerow(fields)
+            pad = [""] * (len(fields) - len(old))
+            for line in reader:
+                writer.writerow(line + pad)
+        os.replace(tmp, self._path)
+        self._fh = open(self._path, "a", encoding="utf-8", newline="")
+        self._writer = self._csv_writer(fields)
+
+    def write(self, rows: Iterable[Dict[str, Any]], symbol: Optional[str] = None) -> int:
+        count = 0
+        for row in rows:
+            if symbol is not None:
+                row = {"symbol": symbol, **row}
+            if self._fmt == "ndjson":
+                self._fh.write(json.dumps(row, separators=(",", ":"), default=str) + "\n")
+            else:
+                if self._writer is None:
+                    self._writer = self._csv_writer(list(row))
+                    self._writer.writeheader()
+                else:
+                    known = list(self._writer.fieldnames)
+                    extra = [k for k in row if k not in known]
+                    if extra:
+                        self._widen(known, known + extra)
+                self._writer.writerow(row)
+            count += 1
+        self._fh.flush()
+        return count
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+def _ndjson_symbol(line: str) -> Any:
+    try:
+        return json.loads(line).get("symbol")
+    except (ValueError, AttributeError):
+        return None
+
+
+class _StoreSink:
+    """:class:`~finbrain.store.ParquetStore` directory, one partition per symbol/year."""
+
+    def __init__(
+        self, path: Path, endpoint: str, market: Optional[str], restart: bool
+    ) -> None:
+        from .store import ParquetStore
+
+        self._store = ParquetStore(path)
+        self._endpoint = endpoint
+        self._market = market
+        if restart:
+            self._store.clear(endpoint)
+
+    def write(self, rows: List[Dict[str, Any]], symbol: Optional[str] = None) -> int:
+        return self._store.write(self._endpoint, symbol or "", rows, market=self._market)
+
+    def close(self) -> None:
+        pass
+
+
+# ─────────── commands ───────────────────────────────────────────────────
+@app.command()
+def pull(
+    endpoint: Annotated[str, typer.Argument(
+        help="Endpoint name or API path: " + ", ".join(SYNC_ENDPOINTS) + "."
+    )],
+    out: Out,
+    symbols: Symbols = None,
+    symbols_file: SymbolsFile = None,
+    market: Market = None,
+    region: Region = None,
+    date_from: Annotated[Optional[str], typer.Option("--date-from", help="YYYY-MM-DD")] = None,
+    date_to: Annotated[Optional[str], typer.Option("--date-to", help="YYYY-MM-DD")] = None,
+    limit: Annotated[Optional[int], typer.Option("--limit", min=1)] = None,
+    fmt: Format = None,
+    concurrency: Concurrency = 8,
+    rps: Rps = None,
+    checkpoint: Annotated[Optional[Path], typer.Option(
+        "--checkpoint", help="Finished-symbol list (default: <out>.checkpoint)."
+    )] = None,
+    restart: Annotated[bool, typer.Option(
+        "--restart", help="Ignore an existing checkpoint and clear the output."
+    )] = False,
+    quiet: Quiet = False,
+    api_key: ApiKey = None,
+) -> None:
+    """Download one endpoint for many tickers."""
+    name = _endpoint(endpoint)
+    fmt = _format(out, fmt)
+    with _client(api_key, concurrency, rps) as fb:
+        todo = _symbols(fb, symbols, symbols_file, market, region)
+
+        ckpt = _Checkpoint(checkpoint or out.with_name(out.name + ".checkpoint"), restart)
+        pending = [s for s in todo if s not in ckpt.done]
+        if len(pending) < len(todo):
+            _err(f"resuming: {len(todo) - len(pending)} of {len(todo)} symbols already done")
+
+        spec = SYNC_ENDPOINTS[name]
+        fetch: Any = fb
+        for part in spec.method.split("."):
+            fetch = getattr(fetch, part)
+        kwargs = {k: v for k, v in
+                  (("date_from", date_from), ("date_to", date_to), ("limit", limit)) if v}
+
+        sink: Any
+        if fmt == "parquet":
+            sink = _StoreSink(out, name, market, restart)
+        else:
+            # without done symbols (or on --restart) the file is truncated
+            sink = _LineSink(out, fmt, append=bool(ckpt.done), done=ckpt.done)
+
+        errors: Dict[str, FinBrainError] = {}
+        total = 0
+        try:
+            with _progress(len(pending), name, quiet) as bar, \
+                    ThreadPoolExecutor(max_workers=concurrency) as pool:
+                futures = {pool.submit(fetch, sym, **kwargs): sym for sym in pending}
+                for fut in as_completed(futures):
+                    sym = futures[fut]
+                    try:
+                        data = fut.result()
+                    except FinBrainError as exc:
+                        errors[sym] = exc
+                    else:
+                        rows = data.get(spec.rows, []) if isinstance(data, dict) else []
+                        total += sink.write(rows, sym)
+                        ckpt.mark(sym)
+                    bar.advance(bar.task_ids[0])
+        finally:
+            ckpt.close()
+            sink.close()
+
+    _err(f"{total} rows from {len(pending) - len(errors)} symbols -> {out}")
+    for sym, error in sorted(errors.items()):
+        _err(f"failed {sym}: {error}")
+    if errors:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def screen(
+    screener: Annotated[str, typer.Argument(
+        help="Screener name, e.g. analyst-ratings, congress/house, predictions/daily."
+    )],
+    out: Out,
+    market: Market = None,
+    region: Region = None,
+    limit: Annotated[Optional[int], typer.Option("--limit", min=1)] = None,
+    fmt: Format = None,
+    api_key: ApiKey = None,
+) -> None:
+    """Stream one cross-ticker screener result to a file."""
+    method_name = screener.strip("/").replace("/", "_").replace("-", "_")
+    method_name = {"insider": "insider_trading", "sentiments": "sentiment"}.get(
+        method_name, method_name
+    )
+    if method_name not in SCREENER_SOURCES:
+        raise typer.BadParameter(f"unknown screener {screener!r}", param_hint="SCREENER")
+    fmt = _format(out, fmt)
+    accepted = inspect.signature(getattr(ScreenerAPI, method_name)).parameters
+    kwargs: Dict[str, Any] = {"limit": limit}
+    for option, value in (("market", market), ("region", region)):
+        if value is None:
+            continue
+        if option not in accepted:
+            raise typer.BadParameter(
+                f"the {screener} screener does not filter by {option}",
+                param_hint=f"--{option}",
+            )
+        kwargs[option] = value
+
+    with _client(api_key, 1, None) as fb:
+        method = getattr(fb.screener, method_name)
+        try:
+            if fmt == "parquet":
+                import pyarrow.parquet as pq
+
+                from .store import _plain_table
+
+                table = method(output="arrow", stream=True, **kwargs)
+                out.parent.mkdir(parents=True, exist_ok=True)
+                pq.write_table(_plain_table(table), out)
+                count = table.num_rows
+            else:
+                sink = _LineSink(out, fmt, append=False)
+                try:
+                    count = sink.write(method(stream=True, **kwargs))
+                finally:
+                    sink.close()
+        except (FinBrainError, ValueError) as exc:
+            _err(f"error: {exc}")
+            raise typer.Exit(code=1) from None
+    _err(f"{count} rows -> {out}")
+
+
+@app.command()
+def sync(
+    endpoint: Annotated[str, typer.Argument(help="Endpoint name or API path.")],
+    directory: Annotated[Path, typer.Option("--dir", "-d", help="Sync directory.")],
+    symbols: Symbols = None,
+    symbols_file: SymbolsFile = None,
+    market: Market = None,
+    region: Region = None,
+    overlap_days: Annotated[int, typer.Option("--overlap-days", min=0)] = 3,
+    full: Annotated[bool, typer.Option("--full", help="Ignore high-water marks.")] = False,
+    concurrency: Concurrency = 8,
+    rps: Rps = None,
+    api_key: ApiKey = None,
+) -> None:
+    """Incrementally update a SyncEngine directory."""
+    name = _endpoint(endpoint)
+    with _client(api_key, concurrency, rps) as fb:
+        todo = _symbols(fb, symbols, symbols_file, market, region)
+        engine = SyncEngine(fb, directory, overlap_days=overlap_days)
+        report = engine.sync(name, todo, full=full, max_workers=concurrency)
+
+    for sym in todo:
+        if sym in report:
+            res = report[sym]
+            typer.echo(f"{sym}\t+{len(res.added)}\t-{len(res.removed)}\t"
+                       f"{res.total}\t{res.high_water or ''}")
+    for sym, error in sorted(report.errors.items()):
+        _err(f"failed {sym}: {error}")
+    if report.errors:
+        raise typer.Exit(code=1)
+
+
+def main() -> None:  # pragma: no cover - console-script shim
+    app()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,13 +1,34 @@
 from __future__ import annotations
 
 import os
+import random
 import time
-from typing import Any, Dict, Optional
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple,
+)
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin
 
-from .plotting import _PlotNamespace
+from ._singleflight import SingleFlight, flight_key
+from ._json import JSONLoads, resolve_json_loads
+from ._jsonstream import RowStream
 from .exceptions import http_error_to_exception, InvalidResponse
+from .hooks import Hooks, RequestTrace, as_hooks
+from .ratelimit import (
+    RateLimiter,
+    as_rate_limiter,
+    backoff_delay,
+    parse_quota_headers,
+    parse_retry_after,
+)
+from .transfer import (
+    AcceptEncoding,
+    Transfer,
+    TransferStats,
+    resolve_accept_encoding,
+    urllib3_encodings,
+)
 from . import __version__
 
 from .endpoints.available import AvailableAPI
@@ -28,11 +49,20 @@ from .endpoints.reddit_mentions import RedditMentionsAPI
 from .endpoints.government_contracts import GovernmentContractsAPI
 from .endpoints.patent_filings import PatentFilingsAPI
 
+if TYPE_CHECKING:
+    from .cache import ResponseCache
+    from .plotting import _PlotNamespace
 
-# Which status codes merit a retry (transient server / gateway errors)
-_RETRYABLE_STATUS = {500, 502, 503, 504}
-# How long to wait between retries   (2, 4, 8 … seconds)
-_BACKOFF_BASE = 2
+
+# Which status codes merit a retry (rate limiting + transient server / gateway errors)
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Decorrelated-jitter back-off bounds in seconds (first retry waits 1–3 s)
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+# A Retry-After longer than this is surfaced as an error instead of slept on
+_MAX_RETRY_AFTER = 60.0
+# Read size for streamed bodies
+_STREAM_CHUNK = 64 * 1024
 
 
 class FinBrainClient:
@@ -48,7 +78,70 @@ class FinBrainClient:
         base_url: str | None = None,
         timeout: float = 10,
         retries: int = 3,
+        cache: "ResponseCache | None" = None,
+        rate_limit: RateLimiter | float | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 32,
+        json_loads: str | JSONLoads = "auto",
+        coalesce: bool = True,
+        accept_encoding: AcceptEncoding = "auto",
+        hooks: Any = None,
     ):
+        """
+        Parameters
+        ----------
+        api_key :
+            FinBrain API key; falls back to the ``FINBRAIN_API_KEY`` env var.
+        base_url :
+            Override the API root (defaults to :attr:`DEFAULT_BASE_URL`).
+        timeout :
+            Per-request timeout in seconds.
+        retries :
+            How many times transient failures are retried.
+        cache :
+            Optional :class:`~finbrain.cache.ResponseCache`. When given,
+            successful ``GET`` responses are served from disk until their TTL
+            expires instead of going over the wire. Expired entries that came
+            with an ``ETag`` / ``Last-Modified`` header are revalidated with a
+            conditional request, and a ``304`` reuses the stored body.
+        rate_limit :
+            Optional :class:`~finbrain.ratelimit.RateLimiter` (or a plain
+            requests-per-second number) consulted before every request,
+            including retries. Share one limiter between clients and threads
+            to keep their combined traffic under the account quota. Without
+            one, a private limiter still honours the server's
+            ``Retry-After`` and ``X-RateLimit-*`` signals.
+        pool_connections :
+            Number of per-host connection pools urllib3 keeps.
+        pool_maxsize :
+            Connections kept alive per host. Size it to the number of threads
+            sharing the client (e.g. ``ticker_many(max_workers=...)``) so busy
+            workers reuse sockets instead of opening and discarding them.
+        json_loads :
+            Decoder applied to raw response bytes: ``"auto"`` (orjson, then
+            msgspec, then the standard library, whichever is installed first;
+            bodies the fast backend rejects are retried with the standard
+            library), ``"orjson"``, ``"msgspec"``, ``"json"``, or any callable
+            taking ``bytes``. Cached bodies are decoded the same way.
+        coalesce :
+            Single-flight identical requests: while a ``GET`` for a given
+            method, URL and params is in flight, other threads asking for the
+            same thing wait for it instead of sending their own. Each caller
+            still decodes its own copy of the body.
+        accept_encoding :
+            ``Accept-Encoding`` to send. ``"auto"`` advertises every coding
+            urllib3 can decode here, best first (``zstd`` and ``br`` need the
+            ``compression`` extra); pass a header string or list to choose,
+            or ``None`` for the library default. Bytes on the wire versus
+            decoded are tallied on :attr:`transfer_stats` and
+            :attr:`last_transfer`.
+        hooks :
+            A :class:`~finbrain.hooks.Hooks` registry, or one or more
+            observers with ``on_request`` / ``on_response`` / ``on_retry`` /
+            ``on_error`` methods (e.g. :class:`~finbrain.hooks.PrometheusHooks`).
+            Each network attempt reports its path, status, timings, bytes and
+            decode time. More callbacks can be added later via :attr:`hooks`.
+        """
         self.api_key = api_key or os.getenv("FINBRAIN_API_KEY")
         if not self.api_key:
             raise ValueError("FinBrain API key missing")
@@ -57,13 +150,31 @@ class FinBrainClient:
         self.session = requests.Session()
         self.session.headers["User-Agent"] = f"finbrain-python/{__version__}"
         self.session.headers["Authorization"] = f"Bearer {self.api_key}"
+        self.accept_encoding = resolve_accept_encoding(accept_encoding, urllib3_encodings())
+        if self.accept_encoding is not None:
+            self.session.headers["Accept-Encoding"] = self.accept_encoding
+        # retries are handled in _request, so the adapter never retries itself
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         self.timeout = timeout
         self.retries = retries
+        self.cache = cache
+        self.rate_limit = as_rate_limiter(rate_limit) or RateLimiter()
+        self.json_loads = resolve_json_loads(json_loads)
+        self._flights: SingleFlight | None = SingleFlight() if coalesce else None
         self.last_meta: dict | None = None
+        self.transfer_stats = TransferStats()
+        self.hooks: Hooks = as_hooks(hooks)
+        self.last_transfer: Transfer | None = None
 
-        # expose plotting under .plot
-        self.plot = _PlotNamespace(self)
+        # plotting (plotly, pandas, numpy) is imported on first access to .plot
+        self._plot: "_PlotNamespace | None" = None
 
         # wire endpoint helpers
         self.available = AvailableAPI(self)
@@ -84,6 +195,15 @@ class FinBrainClient:
         self.government_contracts = GovernmentContractsAPI(self)
         self.patent_filings = PatentFilingsAPI(self)
 
+    @property
+    def plot(self) -> "_PlotNamespace":
+        """Plotting helpers; plotly and pandas are imported on first use."""
+        if self._plot is None:
+            from .plotting import _PlotNamespace
+
+            self._plot = _PlotNamespace(self)
+        return self._plot
+
     # ---------- lifecycle ----------
     def __enter__(self) -> "FinBrainClient":
         """Context manager entry."""
@@ -110,6 +230,13 @@ class FinBrainClient:
         ``{"success": true, "data": ..., "meta": {...}}``.
         This method auto-unwraps the envelope, returning just ``data``.
 
+        When a :class:`~finbrain.cache.ResponseCache` is configured, ``GET``
+        responses are looked up there first and stored after a successful
+        fetch; stale entries with validators are revalidated conditionally.
+
+        Identical concurrent ``GET`` requests share one fetch unless the
+        client was created with ``coalesce=False``.
+
         Raises
         ------
         FinBrainError
@@ -118,37 +245,364 @@ class FinBrainClient:
             If the body is not valid JSON.
         """
         url = urljoin(self.base_url, path)
+        if self._flights is None or method.upper() != "GET":
+            _, body = self._fetch(method, url, path, params)
+            return self._unwrap(body)
+
+        (content, body), shared = self._flights.do(
+            flight_key(method, url, params),
+            lambda: self._fetch(method, url, path, params),
+        )
+        if shared:
+            # never hand the leader's (mutable) objects to another caller
+            body = self._decode(content)
+        return self._unwrap(body)
+
+    def _fetch(
+        self,
+        method: str,
+        url: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+    ) -> Tuple[bytes, Any]:
+        """Raw and decoded body, from the cache or the network."""
+        cache = self.cache if method.upper() == "GET" else None
+        cache_key = ""
+        entry = None
+        if cache is not None:
+            cache_key = cache.key(method, url, params)
+            entry = cache.lookup(cache_key)
+            if entry is not None and entry.fresh:
+                return entry.body, self._decode(entry.body)
+
+        # an expired entry with validators is revalidated, not re-downloaded
+        headers = entry.conditional_headers() if entry is not None else None
+        trace = RequestTrace(method, path)
+        resp = self._send(method, url, params, headers=headers, trace=trace)
+        wire_bytes, body_bytes = _wire_bytes(resp), len(resp.content)
+        self._record_transfer(path, resp, wire_bytes, body_bytes)
+        if resp.status_code == 304 and cache is not None and entry is not None:
+            self._emit("on_response", trace, status=304, wire_bytes=wire_bytes, body_bytes=0)
+            cache.refresh(cache_key, path)
+            return entry.body, self._decode(entry.body)
+
+        started = time.perf_counter()
+        try:
+            body = self._decode(resp.content)
+        except InvalidResponse as exc:
+            self._emit(
+                "on_error", trace, status=resp.status_code, error=exc,
+                wire_bytes=wire_bytes, body_bytes=body_bytes,
+            )
+            raise
+        self._emit(
+            "on_response", trace, status=resp.status_code, wire_bytes=wire_bytes,
+            body_bytes=body_bytes, decode=time.perf_counter() - started,
+        )
+        if cache is not None:
+            cache.set(
+                cache_key,
+                path,
+                resp.content,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+        return resp.content, body
+
+    def _request_stream(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """Like :meth:`_request`, but yield the rows of the response one by one.
 
+        The request is sent (and HTTP errors raised) immediately; the body is
+        then read in chunks and decoded incrementally as the iterator is
+        consumed, so a 20,000-row payload is never held in memory at once.
+        :attr:`last_meta` is set once the iterator is exhausted. Closing the
+        iterator early (or dropping it) releases the response. Cached
+        responses are served, but streamed bodies are not written to the
+        cache.
+        """
+        url = urljoin(self.base_url, path)
+        if self.cache is not None and method.upper() == "GET":
+            cached = self.cache.get(self.cache.key(method, url, params))
+            if cached is not None:
+                return self._stream_rows([cached])
+
+        trace = RequestTrace(method, path)
+        resp = self._send(method, url, params, stream=True, trace=trace)
+        body = _StreamedBody(self, trace, resp)
+        return _StreamedRows(self._stream_rows(body.chunks()), body)
+
+    def _request_records(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        rows_key: str,
+        convert: Callable[[Dict[str, Any]], Any],
+    ) -> Any:
+        """Like :meth:`_request`, but pass each ``data[rows_key]`` row through *convert*.
+
+        The body is decoded incrementally and every row is converted as soon
+        as it is parsed, so the full list of row dicts never exists. Like
+        :meth:`_request_stream`, the request is not coalesced and the body is
+        not written to the cache.
+        """
+        url = urljoin(self.base_url, path)
+        cached = None
+        if self.cache is not None and method.upper() == "GET":
+            cached = self.cache.get(self.cache.key(method, url, params))
+        body: _StreamedBody | None = None
+        if cached is not None:
+            chunks: Iterable[bytes] = [cached]
+        else:
+            trace = RequestTrace(method, path)
+            resp = self._send(method, url, params, stream=True, trace=trace)
+            body = _StreamedBody(self, trace, resp)
+            chunks = body.chunks()
+
+        stream = RowStream([("data", rows_key)])
+        rows: List[Any] = []
+        try:
+            for chunk in chunks:
+                rows.extend(map(convert, stream.feed(chunk)))
+            tail, envelope = stream.close()
+        except ValueError as exc:
+            raise InvalidResponse("Response body is not valid JSON") from exc
+        finally:
+            if body is not None:
+                body.finish()
+        rows.extend(map(convert, tail))
+        data = self._unwrap(envelope)
+        if isinstance(data, dict):
+            # rows found elsewhere (no array at data.<rows_key>) are converted here
+            rows.extend(map(convert, data.get(rows_key) or []))
+            data[rows_key] = rows
+        return data
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        trace: RequestTrace,
+    ) -> requests.Response:
+        """Send with rate limiting and retries; return the first 2xx/3xx response.
+
+        Every attempt emits ``on_request`` and, unless it succeeds (the caller
+        reports that once the body is read), ``on_retry`` or ``on_error``.
+        """
+        delay = _BACKOFF_BASE
         for attempt in range(self.retries + 1):
+            self.rate_limit.acquire()
+            trace.begin(attempt + 1)
+            self._emit("on_request", trace)
             try:
                 resp = self.session.request(
-                    method, url, params=params, timeout=self.timeout
+                    method,
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=stream,
                 )
             except requests.RequestException as exc:
                 # Network problem → retry if budget allows, else wrap into FinBrainError
+                trace.finish()
                 if attempt == self.retries:
-                    raise InvalidResponse(f"Network error: {exc}") from exc
-                time.sleep(_BACKOFF_BASE**attempt)
+                    error = InvalidResponse(f"Network error: {exc}")
+                    self._emit("on_error", trace, error=error)
+                    raise error from exc
+                delay = backoff_delay(delay, _BACKOFF_BASE, _BACKOFF_CAP)
+                self._emit("on_retry", trace, error=exc, delay=delay)
+                time.sleep(delay)
                 continue
 
+            # requests stamps `elapsed` once the headers are parsed
+            trace.ttfb = resp.elapsed.total_seconds()
+            trace.finish()
+            # Let later requests (and other threads) pace themselves on the quota
+            self.rate_limit.observe(*parse_quota_headers(resp.headers))
+
             # ── Happy path ────────────────────────────────────
             if resp.ok:  # 2xx / 3xx
-                try:
-                    body = resp.json()
-                except ValueError as exc:
-                    raise InvalidResponse("Response body is not valid JSON") from exc
-
-                # Unwrap v2 envelope
-                if isinstance(body, dict) and "success" in body:
-                    self.last_meta = body.get("meta")
-                    return body.get("data")
-                return body
+                return resp
 
             # ── Error path ───────────────────────────────────
             if resp.status_code in _RETRYABLE_STATUS and attempt < self.retries:
-                # Transient server/gateway error – exponential back-off then retry
-                time.sleep(_BACKOFF_BASE**attempt)
+                # Rate limited / transient error – honour Retry-After, else jittered back-off
+                delay = backoff_delay(delay, _BACKOFF_BASE, _BACKOFF_CAP)
+                retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+                if retry_after is not None:
+                    if retry_after > _MAX_RETRY_AFTER:
+                        raise self._give_up(trace, resp)
+                    self.rate_limit.pause(retry_after)
+                    delay = retry_after + random.uniform(0, _BACKOFF_BASE)
+                resp.close()
+                self._emit("on_retry", trace, status=resp.status_code, delay=delay)
+                time.sleep(delay)
                 continue
 
             # No more retries → raise the mapped FinBrainError
-            raise http_error_to_exception(resp)
+            raise self._give_up(trace, resp)
+        raise AssertionError("unreachable")
+
+    def _give_up(self, trace: RequestTrace, resp: requests.Response) -> Exception:
+        """Map *resp* to its exception, close it and report it to ``on_error``.
+
+        The error is built first: on a streamed request that is what reads the body.
+        """
+        error = http_error_to_exception(resp)
+        resp.close()
+        self._emit("on_error", trace, status=resp.status_code, error=error)
+        return error
+
+    def _emit(self, event: str, trace: RequestTrace, **fields: Any) -> None:
+        if self.hooks.wants(event):
+            self.hooks.emit(event, trace.event(**fields))
+
+    def _record_transfer(
+        self, path: str, resp: requests.Response, wire_bytes: int, body_bytes: int
+    ) -> None:
+        transfer = Transfer(
+            path, resp.headers.get("Content-Encoding", "identity"), wire_bytes, body_bytes
+        )
+        self.transfer_stats.record(transfer)
+        self.last_transfer = transfer
+
+    def _stream_rows(self, chunks: Iterable[bytes]) -> Generator[Any, None, None]:
+        """Decode *chunks* incrementally, yielding rows and setting ``last_meta``."""
+        stream = RowStream()
+        try:
+            for chunk in chunks:
+                yield from stream.feed(chunk)
+            rows, envelope = stream.close()
+        except ValueError as exc:
+            raise InvalidResponse("Response body is not valid JSON") from exc
+        yield from rows
+        data = self._unwrap(envelope)
+        if not stream.found:
+            # no row array where expected; fall back to whatever list is there
+            if isinstance(data, dict):
+                data = data.get("data")
+            if isinstance(data, list):
+                yield from data
+
+    def _decode(self, content: bytes) -> Any:
+        """Parse a raw response body, mapping decode failures to ``InvalidResponse``."""
+        try:
+            return self.json_loads(content)
+        except ValueError as exc:
+            raise InvalidResponse("Response body is not valid JSON") from exc
+
+    def _unwrap(self, body: Any) -> Any:
+        """Unwrap the v2 envelope, remembering ``meta`` on :attr:`last_meta`."""
+        if isinstance(body, dict) and "success" in body:
+            self.last_meta = body.get("meta")
+            return body.get("data")
+        return body
+
+
+class _StreamedBody:
+    """Chunks of a streamed response, finished exactly once.
+
+    Finishing records the transfer, reports ``on_response`` (or ``on_error``
+    when reading failed) and returns the connection to the pool. It happens
+    when the body is exhausted or fails, or when :meth:`finish` is called
+    for a body that was abandoned part-way or never read at all.
+    """
+
+    def __init__(
+        self, client: FinBrainClient, trace: RequestTrace, resp: requests.Response
+    ) -> None:
+        self._client = client
+        self._trace = trace
+        self._resp = resp
+        self._body_bytes = 0
+        self._finished = False
+
+    def chunks(self) -> Iterator[bytes]:
+        try:
+            for chunk in self._resp.iter_content(_STREAM_CHUNK):
+                self._body_bytes += len(chunk)
+                yield chunk
+        except requests.RequestException as exc:
+            error = InvalidResponse(f"Network error: {exc}")
+            self.finish(error)
+            raise error from exc
+        finally:
+            self.finish()
+
+    def finish(self, error: InvalidResponse | None = None) -> None:
+        if self._finished:
+            return
+        self._finished = True
+        client, trace, resp = self._client, self._trace, self._resp
+        try:
+            wire_bytes = _wire_bytes(resp, self._body_bytes)
+            client._record_transfer(trace.path, resp, wire_bytes, self._body_bytes)
+            trace.finish()
+            client._emit(
+                "on_error" if error is not None else "on_response", trace,
+                status=resp.status_code, error=error,
+                wire_bytes=wire_bytes, body_bytes=self._body_bytes,
+            )
+        finally:
+            resp.close()
+
+
+class _StreamedRows:
+    """Row iterator that releases its response however iteration ends.
+
+    Running out, raising, :meth:`close`, leaving a ``with`` block or being
+    garbage-collected unconsumed all close the decoder and finish *body*,
+    so hooks and gauges never see a request left in flight.
+    """
+
+    def __init__(self, rows: Generator[Any, None, None], body: _StreamedBody) -> None:
+        self._rows = rows
+        self._body = body
+        self._closed = False
+
+    def __iter__(self) -> "_StreamedRows":
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            return next(self._rows)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Stop reading and release the response; safe to call repeatedly."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._rows.close()
+        finally:
+            self._body.finish()
+
+    def __enter__(self) -> "_StreamedRows":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+def _wire_bytes(resp: requests.Response, default: int | None = None) -> int:
+    """Bytes urllib3 pulled off the socket for *resp* (before decompression)."""
+    try:
+        return int(resp.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        return len(resp.content) if default is None else default
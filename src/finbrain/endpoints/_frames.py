@@ -0,0 +1,482 @@
+"""
+Schema-driven DataFrame construction shared by the sync and async endpoints.
+
+Every ``as_dataframe=True`` branch goes through :func:`build_frame` with the
+endpoint's :class:`FrameSchema`. Rows are pivoted into per-column lists in a
+single pass, and each declared column is converted once with an explicit
+dtype, so pandas never has to infer object columns or sniff date formats:
+
+* ``dates`` are parsed with a fixed ``%Y-%m-%d`` format (falling back to
+  ISO 8601 for timestamp values) into ``datetime64[ns]``;
+* ``numeric`` columns go through :func:`pandas.to_numeric`; values that are
+  not numbers become ``NaN``;
+* ``categorical`` columns (transaction types, owners, rating actions, ...)
+  become :class:`pandas.Categorical`, which stores each distinct label once.
+
+Columns the schema does not mention are passed through unchanged, so new API
+fields still show up.
+
+The same schemas drive the other tabular outputs selected with
+``output="arrow"`` / ``output="polars"``: :func:`build_arrow` and
+:func:`build_polars` convert the pivoted column lists straight into Arrow
+arrays or Polars series (dates become ``date32`` / ``Date``, categoricals
+become dictionary / ``Categorical`` columns) without building a pandas frame
+first. The index column is simply the first column there.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Literal, Mapping, Tuple, cast
+
+from ._utils import ColumnBuilder
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = [
+    "OUTPUTS",
+    "FrameSchema",
+    "Output",
+    "build_arrow",
+    "build_frame",
+    "build_output",
+    "build_polars",
+    "resolve_output",
+]
+
+DATE_FORMAT = "%Y-%m-%d"
+
+Output = Literal["raw", "pandas", "arrow", "polars"]
+OUTPUTS: Tuple[str, ...] = ("raw", "pandas", "arrow", "polars")
+
+
+class FrameSchema:
+    """
+    Declared column types for one endpoint's rows.
+
+    Parameters
+    ----------
+    index :
+        Column to move into the index (after conversion), or ``None``.
+    dates :
+        Columns parsed to ``datetime64``.
+    numeric :
+        Columns coerced to numbers.
+    categorical :
+        Low-cardinality label columns stored as ``category``.
+    rename :
+        ``{api_field: column}`` applied before anything else.
+    """
+
+    def __init__(
+        self,
+        *,
+        index: str | None = None,
+        dates: Iterable[str] = (),
+        numeric: Iterable[str] = (),
+        categorical: Iterable[str] = (),
+        rename: Mapping[str, str] | None = None,
+    ) -> None:
+        self.index = index
+        self.dates: Tuple[str, ...] = tuple(dates)
+        self.numeric: Tuple[str, ...] = tuple(numeric)
+        self.categorical: Tuple[str, ...] = tuple(categorical)
+        self.rename: Dict[str, str] = dict(rename or {})
+
+    def __repr__(self) -> str:
+        return (
+            f"FrameSchema(index={self.index!r}, dates={self.dates!r}, "
+            f"numeric={self.numeric!r}, categorical={self.categorical!r})"
+        )
+
+    def with_index(self, index: str | None) -> "FrameSchema":
+        """Copy of this schema with a different index column."""
+        return FrameSchema(
+            index=index,
+            dates=self.dates,
+            numeric=self.numeric,
+            categorical=self.categorical,
+            rename=self.rename,
+        )
+
+    @classmethod
+    def union(cls, *schemas: "FrameSchema", index: str | None = None) -> "FrameSchema":
+        """
+        Merge the numeric and categorical columns of several schemas.
+
+        Dates and renames are not carried over; the result is meant for
+        endpoints that mix row kinds without a date index (screener, recent).
+        """
+        def merged(attr: str) -> List[str]:
+            return list(dict.fromkeys(c for s in schemas for c in getattr(s, attr)))
+
+        return cls(index=index, numeric=merged("numeric"), categorical=merged("categorical"))
+
+
+def _pivot(rows: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Rows to ``{column: values}``; one list comprehension per column."""
+    if not isinstance(rows, list):
+        return ColumnBuilder().extend(rows).columns
+    if not rows:
+        return {}
+    keys = list(rows[0])
+    # same key count everywhere and no KeyError ⇒ every row has the same keys
+    if len(set(map(len, rows))) == 1:
+        try:
+            return {key: [row[key] for row in rows] for key in keys}
+        except KeyError:
+            pass
+    return ColumnBuilder().extend(rows).columns
+
+
+def _plain_dates(values: List[Any]) -> bool:
+    """True if every non-empty value is a ``YYYY-MM-DD``-length string."""
+    # numpy parses plain dates in C but silently truncates anything longer
+    # (timestamps), so those must take the slower parsers instead
+    try:
+        return set(map(len, filter(None, values))) == {10}
+    except TypeError:  # non-string values
+        return False
+
+
+def _to_datetime(values: List[Any]) -> Any:
+    import numpy as np
+    import pandas as pd
+
+    if _plain_dates(values):
+        try:
+            return pd.DatetimeIndex(np.array(values, dtype="datetime64[D]")).as_unit("ns")
+        except ValueError:
+            pass
+    try:
+        parsed = pd.to_datetime(values, format=DATE_FORMAT)
+    except (TypeError, ValueError):
+        parsed = pd.to_datetime(values, format="ISO8601")
+    return parsed.as_unit("ns")
+
+
+def _to_numeric(values: List[Any]) -> Any:
+    import numpy as np
+    import pandas as pd
+
+    arr = np.asarray(values)
+    if arr.dtype.kind in "iuf":
+        return arr
+    return pd.to_numeric(arr, errors="coerce")
+
+
+def _to_categorical(values: List[Any]) -> Any:
+    import numpy as np
+    import pandas as pd
+
+    # label → code through a plain dict; pd.Categorical(list) hashes an
+    # object array and is several times slower on API-sized columns
+    try:
+        distinct = set(values)
+    except TypeError:  # unhashable values (lists): not a label column after all
+        return values
+    distinct.discard(None)
+    try:
+        labels = sorted(distinct)
+    except TypeError:  # mixed label types; let pandas order them
+        return pd.Categorical(values)
+    lookup: Dict[Any, int] = {label: code for code, label in enumerate(labels)}
+    lookup[None] = -1
+    codes = np.fromiter(map(lookup.__getitem__, values), dtype=np.int32, count=len(values))
+    return pd.Categorical.from_codes(codes, categories=labels, validate=False)
+
+
+def build_frame(
+    data: Iterable[Dict[str, Any]] | Dict[str, List[Any]],
+    schema: FrameSchema | None = None,
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from row dicts or a ``{column: values}`` mapping.
+
+    Parameters
+    ----------
+    data :
+        Rows as returned by the API, or columns already pivoted by
+        :class:`~finbrain.endpoints._utils.ColumnBuilder` (streamed responses).
+    schema :
+        Column types to apply; ``None`` lets pandas infer everything.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Empty (no columns, no index) when there are no rows.
+    """
+    import pandas as pd
+
+    columns = data if isinstance(data, dict) else _pivot(data)
+    if not columns or not any(len(v) for v in columns.values()):
+        return pd.DataFrame()
+    if schema is None:
+        return pd.DataFrame(columns)
+
+    if schema.rename:
+        columns = {schema.rename.get(k, k): v for k, v in columns.items()}
+
+    out: Dict[str, Any] = {}
+    dates, numeric, categorical = schema.dates, schema.numeric, schema.categorical
+    for name, values in columns.items():
+        if name in dates:
+            out[name] = _to_datetime(values)
+        elif name in numeric:
+            out[name] = _to_numeric(values)
+        elif name in categorical:
+            out[name] = _to_categorical(values)
+        else:
+            out[name] = values
+    df = pd.DataFrame(out, copy=False)
+    if schema.index is not None and schema.index in df.columns:
+        df.set_index(schema.index, inplace=True)
+    return df
+
+
+# ─────────────────────────────────────────────────────────────
+# Per-endpoint schemas
+# ─────────────────────────────────────────────────────────────
+
+PREDICTIONS = FrameSchema(
+    index="date", dates=("date",), numeric=("mid", "lower", "upper"),
+)
+
+SENTIMENTS = FrameSchema(
+    index="date", dates=("date",), numeric=("sentiment",),
+    rename={"score": "sentiment"},
+)
+
+PUT_CALL = FrameSchema(
+    index="date", dates=("date",),
+    numeric=("ratio", "callVolume", "putVolume", "totalVolume", "price"),
+)
+
+LINKEDIN = FrameSchema(
+    index="date", dates=("date",),
+    numeric=("employeeCount", "followerCount", "jobCount"),
+)
+
+APP_RATINGS = FrameSchema(
+    index="date", dates=("date",),
+    numeric=(
+        "ios_score", "ios_ratingsCount",
+        "android_score", "android_ratingsCount", "android_installCount",
+    ),
+)
+
+REDDIT_MENTIONS = FrameSchema(
+    index="date", dates=("date",), numeric=("mentions",), categorical=("subreddit",),
+)
+
+CORPORATE_LOBBYING = FrameSchema(
+    index="date", dates=("date",),
+    numeric=("income", "expenses", "filingYear"),
+    categorical=("quarter", "registrantName", "clientName"),
+)
+
+CONGRESS_TRADES = FrameSchema(
+    index="date", dates=("date",),
+    categorical=("transactionType", "amount", "owner", "amountFlag"),
+)
+
+INSIDER_TRANSACTIONS = FrameSchema(
+    index="date", dates=("date",),
+    numeric=("shares", "pricePerShare", "totalValue", "sharesOwned"),
+    categorical=("relationship", "transactionType"),
+)
+
+NEWS = FrameSchema(
+    index="date", dates=("date",), numeric=("sentiment",), categorical=("source",),
+)
+
+ANALYST_RATINGS = FrameSchema(
+    index="date", dates=("date",), numeric=("targetPrice",),
+    categorical=("institution", "action", "rating"),
+)
+
+GOVERNMENT_CONTRACTS = FrameSchema(
+    index="startDate", dates=("startDate",), numeric=("awardAmount",),
+    categorical=(
+        "awardType", "awardingAgency", "awardingSubAgency", "contractAwardType",
+        "naicsCode", "naicsDescription",
+    ),
+)
+
+PATENT_FILINGS = FrameSchema(
+    index="patentDate", dates=("patentDate",),
+    numeric=("numClaims", "numCitedBy", "filingToGrantDays", "numInventors"),
+    categorical=("type", "kind", "assigneeType", "primaryCpcSection"),
+)
+
+# Screener rows are one per ticker and carry the per-endpoint fields plus
+# ``symbol``/``name``; they stay indexed by symbol with ``date`` left as text.
+_SCREENER_EXTRA = FrameSchema(
+    numeric=("score", "expectedShortTerm", "expectedMidTerm", "expectedLongTerm"),
+    categorical=("market", "region", "sector"),
+)
+SCREENER = FrameSchema.union(
+    PREDICTIONS, PUT_CALL, LINKEDIN, APP_RATINGS, REDDIT_MENTIONS,
+    CONGRESS_TRADES, INSIDER_TRANSACTIONS, NEWS, ANALYST_RATINGS,
+    GOVERNMENT_CONTRACTS, PATENT_FILINGS, _SCREENER_EXTRA,
+    index="symbol",
+)
+
+RECENT = FrameSchema.union(NEWS, ANALYST_RATINGS, _SCREENER_EXTRA)
+
+
+# ─────────────────────────────────────────────────────────────
+# Arrow / Polars outputs
+# ─────────────────────────────────────────────────────────────
+
+
+def resolve_output(output: str | None, as_dataframe: bool = False) -> Output:
+    """
+    Normalise the ``output`` / ``as_dataframe`` pair of an endpoint call.
+
+    ``as_dataframe=True`` is shorthand for ``output="pandas"``; without
+    either, the raw JSON is returned.
+
+    Raises
+    ------
+    ValueError
+        If *output* is unknown or contradicts ``as_dataframe=True``.
+    """
+    if output is None:
+        return "pandas" if as_dataframe else "raw"
+    if output not in OUTPUTS:
+        raise ValueError(
+            f"Unknown output {output!r}; expected one of "
+            + ", ".join(repr(o) for o in OUTPUTS)
+        )
+    if as_dataframe and output != "pandas":
+        raise ValueError(f"as_dataframe=True conflicts with output={output!r}")
+    return cast(Output, output)
+
+
+def _import(module: str, extra: str) -> Any:
+    import importlib
+
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"output={extra!r} requires {module.split('.')[0]} "
+            f"(pip install finbrain-python[{extra}])"
+        ) from exc
+
+
+def _ordered(columns: Dict[str, List[Any]], schema: FrameSchema | None) -> Dict[str, List[Any]]:
+    """Apply renames and move the index column to the front."""
+    if schema is None:
+        return columns
+    if schema.rename:
+        columns = {schema.rename.get(k, k): v for k, v in columns.items()}
+    if schema.index is not None and schema.index in columns:
+        columns = {schema.index: columns[schema.index], **columns}
+    return columns
+
+
+def _arrow_array(pa: Any, values: List[Any]) -> Any:
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):  # mixed types: keep as text
+        return pa.array([None if v is None else str(v) for v in values])
+
+
+def build_arrow(
+    data: Iterable[Dict[str, Any]] | Dict[str, List[Any]],
+    schema: FrameSchema | None = None,
+) -> Any:
+    """
+    Build a :class:`pyarrow.Table` from row dicts or a column mapping.
+
+    Plain ``YYYY-MM-DD`` dates become ``date32`` and timestamps
+    ``timestamp[us]``; numeric columns keep integer types where possible
+    (nulls stay nulls); categorical columns are dictionary-encoded. Numeric
+    columns that arrive as NumPy arrays are wrapped without copying.
+    """
+    pa = _import("pyarrow", "arrow")
+    pc = _import("pyarrow.compute", "arrow")
+    import numpy as np
+
+    columns = data if isinstance(data, dict) else _pivot(data)
+    columns = _ordered(columns, schema)
+    dates = schema.dates if schema else ()
+    numeric = schema.numeric if schema else ()
+    categorical = schema.categorical if schema else ()
+
+    arrays: Dict[str, Any] = {}
+    for name, values in columns.items():
+        if name in dates:
+            if _plain_dates(values):
+                try:
+                    arrays[name] = pa.array(np.array(values, dtype="datetime64[D]"))
+                    continue
+                except ValueError:
+                    pass
+            text = pa.array(values, type=pa.string())
+            try:
+                arrays[name] = pc.cast(text, pa.timestamp("us"))
+            except pa.ArrowInvalid:  # zone-suffixed (``...Z``) timestamps
+                arrays[name] = pc.cast(text, pa.timestamp("us", "UTC"))
+        elif name in numeric:
+            arr = _arrow_array(pa, values)
+            if not (pa.types.is_integer(arr.type) or pa.types.is_floating(arr.type)
+                    or pa.types.is_null(arr.type)):
+                arr = pa.array(_to_numeric(values), from_pandas=True)
+            arrays[name] = arr
+        elif name in categorical:
+            arr = _arrow_array(pa, values)
+            arrays[name] = arr.dictionary_encode() if pa.types.is_string(arr.type) else arr
+        else:
+            arrays[name] = _arrow_array(pa, values)
+    return pa.table(arrays)
+
+
+def build_polars(
+    data: Iterable[Dict[str, Any]] | Dict[str, List[Any]],
+    schema: FrameSchema | None = None,
+) -> Any:
+    """
+    Build a :class:`polars.DataFrame` from row dicts or a column mapping.
+
+    Uses Polars' own constructors (pyarrow is not needed): dates become
+    ``Date`` (timestamps ``Datetime``), numeric strings are cast with nulls
+    for non-numbers, and categorical columns become ``Categorical``.
+    """
+    pl = _import("polars", "polars")
+
+    columns = data if isinstance(data, dict) else _pivot(data)
+    columns = _ordered(columns, schema)
+    dates = schema.dates if schema else ()
+    numeric = schema.numeric if schema else ()
+    categorical = schema.categorical if schema else ()
+
+    series: List[Any] = []
+    for name, values in columns.items():
+        col = pl.Series(name, values, strict=False)
+        if name in dates and col.dtype == pl.String:
+            if _plain_dates(values):
+                col = col.str.to_date(DATE_FORMAT, strict=False)
+            else:
+                col = col.str.to_datetime(strict=False)
+        elif name in numeric and not col.dtype.is_numeric():
+            col = col.cast(pl.Float64, strict=False)
+        elif name in categorical and col.dtype == pl.String:
+            col = col.cast(pl.Categorical)
+        series.append(col)
+    return pl.DataFrame(series)
+
+
+def build_output(
+    data: Iterable[Dict[str, Any]] | Dict[str, List[Any]],
+    schema: FrameSchema | None,
+    output: str,
+) -> Any:
+    """Dispatch to :func:`build_frame`, :func:`build_arrow` or :func:`build_polars`."""
+    if output == "arrow":
+        return build_arrow(data, schema)
+    if output == "polars":
+        return build_polars(data, schema)
+    return build_frame(data, schema)
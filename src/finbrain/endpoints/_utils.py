@@ -7,6 +7,14 @@ implementations to avoid code duplication.
 
 from __future__ import annotations
 import datetime as _dt
+import inspect
+import json
+import re
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+
+from ..exceptions import FinBrainError, IncompleteRange
 
 
 def to_datestr(value: _dt.date | str) -> str:
@@ -41,3 +49,481 @@ def to_datestr(value: _dt.date | str) -> str:
     if isinstance(value, _dt.datetime):
         return value.date().isoformat()
     return value.isoformat() if isinstance(value, _dt.date) else value
+
+
+def normalize_symbols(symbols: Iterable[str]) -> List[str]:
+    """
+    Upper-case *symbols* and drop duplicates, keeping first-seen order.
+
+    A bare string is treated as a single symbol rather than as an iterable
+    of characters.
+    """
+    if isinstance(symbols, str):
+        symbols = [symbols]
+    return list(dict.fromkeys(s.upper() for s in symbols))
+
+
+class BatchResult(dict):
+    """
+    ``{symbol: result}`` mapping returned by the ``*_many`` helpers.
+
+    Symbols whose request failed are absent from the mapping and listed on
+    :attr:`errors` instead, so one bad ticker never aborts a whole batch.
+    """
+
+    def __init__(
+        self,
+        results: Dict[str, Any] | None = None,
+        errors: Dict[str, FinBrainError] | None = None,
+    ) -> None:
+        super().__init__(results or {})
+        self.errors: Dict[str, FinBrainError] = dict(errors or {})
+
+    def __repr__(self) -> str:
+        return f"BatchResult({dict.__repr__(self)}, errors={self.errors!r})"
+
+
+def concat_frames(batch: BatchResult) -> Any:
+    """
+    Concatenate per-symbol DataFrames with a leading ``symbol`` index level.
+
+    The batch's failures are kept on ``df.attrs["errors"]``.
+    """
+    import pandas as pd
+
+    frames = {sym: df for sym, df in batch.items() if df is not None}
+    if frames:
+        df = pd.concat(frames, names=["symbol"])
+    else:
+        df = pd.DataFrame()
+    df.attrs["errors"] = dict(batch.errors)
+    return df
+
+
+class ColumnBuilder:
+    """
+    Accumulate row dicts straight into per-column lists.
+
+    Used for streamed responses: each decoded row is appended and dropped, so
+    only the column lists grow, never a list of row dicts alongside them.
+    Keys missing from a row (or first seen in a later row) are filled with
+    ``None``.
+    """
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, List[Any]] = {}
+        self.length = 0
+
+    def append(self, row: Dict[str, Any]) -> None:
+        columns = self.columns
+        for key, value in row.items():
+            col = columns.get(key)
+            if col is None:
+                col = columns[key] = [None] * self.length
+            col.append(value)
+        self.length += 1
+        if len(row) != len(columns):
+            for col in columns.values():
+                if len(col) < self.length:
+                    col.append(None)
+
+    def extend(self, rows: Iterable[Dict[str, Any]]) -> "ColumnBuilder":
+        for row in rows:
+            self.append(row)
+        return self
+
+
+def map_symbols(
+    func: Callable[[str], Any],
+    symbols: Iterable[str],
+    *,
+    max_workers: int = 8,
+) -> BatchResult:
+    """
+    Call ``func(symbol)`` for every symbol on a thread pool.
+
+    Symbols go through :func:`normalize_symbols` first.
+    :class:`~finbrain.exceptions.FinBrainError` raised for a symbol is
+    recorded on :attr:`BatchResult.errors`; anything else propagates.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    syms = normalize_symbols(symbols)
+    batch = BatchResult()
+    if syms:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(syms))) as pool:
+            futures = {sym: pool.submit(func, sym) for sym in syms}
+            for sym, fut in futures.items():
+                try:
+                    batch[sym] = fut.result()
+                except FinBrainError as exc:
+                    batch.errors[sym] = exc
+    return batch
+
+
+def fetch_many(
+    fetch: Callable[..., Any],
+    symbols: Iterable[str],
+    *,
+    max_workers: int = 8,
+    as_dataframe: bool = False,
+    **kwargs: Any,
+) -> Any:
+    """
+    Call ``fetch(symbol, as_dataframe=..., **kwargs)`` for every symbol.
+
+    Requests fan out over a thread pool (see :func:`map_symbols`); all
+    workers share the parent client's ``requests.Session`` and therefore its
+    connection pool.
+
+    Returns
+    -------
+    BatchResult | pandas.DataFrame
+        One frame built with :func:`concat_frames` when the per-symbol
+        results are DataFrames (``as_dataframe=True`` or
+        ``output="pandas"``), otherwise a :class:`BatchResult`.
+    """
+    from ._frames import resolve_output
+
+    frames = resolve_output(kwargs.get("output"), as_dataframe) == "pandas"
+
+    def _one(sym: str) -> Any:
+        return fetch(sym, as_dataframe=as_dataframe, **kwargs)
+
+    batch = map_symbols(_one, symbols, max_workers=max_workers)
+    return concat_frames(batch) if frames else batch
+
+
+# ─────────── date-range chunking ────────────────────────────────────────
+Window = Union[str, int, _dt.timedelta]
+DateSpan = Tuple[_dt.date, _dt.date]
+
+# Per-window ``limit`` sent by fetch_range when the caller gives none: the
+# API's largest page. Without it the server's smaller default cap would cut
+# busy windows short and the split-on-full check could never see it.
+RANGE_LIMIT = 500
+
+_WINDOW_RE = re.compile(r"^\s*(\d+)\s*([DWMY])\s*$", re.IGNORECASE)
+
+
+def _as_date(value: _dt.date | str) -> _dt.date:
+    return _dt.date.fromisoformat(to_datestr(value)[:10])
+
+
+def _add_months(day: _dt.date, months: int) -> _dt.date:
+    index = day.year * 12 + day.month - 1 + months
+    year, month = divmod(index, 12)
+    month += 1
+    # clamp the 29th-31st to the last day of shorter months
+    for dom in (day.day, 30, 29, 28):
+        try:
+            return _dt.date(year, month, min(day.day, dom))
+        except ValueError:
+            continue
+    raise AssertionError("unreachable")
+
+
+def date_windows(
+    date_from: _dt.date | str,
+    date_to: _dt.date | str | None = None,
+    window: Window = "90D",
+) -> List[DateSpan]:
+    """
+    Split ``[date_from, date_to]`` into consecutive, non-overlapping windows.
+
+    *window* is a number of days, a :class:`~datetime.timedelta`, or a string
+    such as ``"90D"``, ``"2W"``, ``"6M"`` or ``"1Y"`` (months and years are
+    calendar steps). Both ends of every window are inclusive; *date_to*
+    defaults to today.
+    """
+    start = _as_date(date_from)
+    end = _as_date(date_to) if date_to is not None else _dt.date.today()
+    if start > end:
+        raise ValueError(f"date_from {start} is after date_to {end}")
+
+    step: Callable[[_dt.date], _dt.date]
+    if isinstance(window, _dt.timedelta) or isinstance(window, int):
+        days = window.days if isinstance(window, _dt.timedelta) else window
+        if days < 1:
+            raise ValueError("window must be at least one day")
+        step = lambda d: d + _dt.timedelta(days=days)  # noqa: E731
+    else:
+        match = _WINDOW_RE.match(window)
+        if match is None or int(match.group(1)) < 1:
+            raise ValueError(f"invalid window {window!r}; use e.g. '90D', '2W', '6M', '1Y'")
+        n, unit = int(match.group(1)), match.group(2).upper()
+        if unit in "DW":
+            delta = _dt.timedelta(days=n * (7 if unit == "W" else 1))
+            step = lambda d: d + delta  # noqa: E731
+        else:
+            months = n * (12 if unit == "Y" else 1)
+            step = lambda d: _add_months(d, months)  # noqa: E731
+
+    spans = []
+    while start <= end:
+        nxt = step(start)
+        spans.append((start, min(nxt - _dt.timedelta(days=1), end)))
+        start = nxt
+    return spans
+
+
+def split_span(span: DateSpan) -> List[DateSpan]:
+    """Halve a window (used when a window came back full at ``limit``)."""
+    start, end = span
+    mid = start + (end - start) // 2
+    return [(start, mid), (mid + _dt.timedelta(days=1), end)]
+
+
+def row_key(row: Dict[str, Any]) -> str:
+    """Identity of a row: its canonical JSON encoding."""
+    return json.dumps(row, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def dedupe_rows(windows: Iterable[Iterable[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Concatenate per-window row lists, dropping rows repeated across windows.
+
+    A row returned by two windows (e.g. a boundary day both of them
+    include) is kept once. Identical rows *within* one window are distinct
+    records, such as two equal trades on the same day, and are all kept:
+    each row appears as many times as in the window that returned it most
+    often. First-seen order is preserved.
+    """
+    kept: Counter[str] = Counter()
+    out: List[Dict[str, Any]] = []
+    for rows in windows:
+        here: Counter[str] = Counter()
+        for row in rows:
+            key = row_key(row)
+            here[key] += 1
+            if here[key] > kept[key]:
+                kept[key] += 1
+                out.append(row)
+    return out
+
+
+def merge_windows(
+    responses: List[Any], rows_key: str, date_field: str
+) -> Dict[str, Any]:
+    """
+    Combine per-window responses into one, shaped like a single response.
+
+    Top-level fields (``symbol``, ``name`` …) come from the first response;
+    rows repeated across windows are dropped (see :func:`dedupe_rows`) and
+    the rest sorted by *date_field*, oldest first.
+    """
+    dicts = [r for r in responses if isinstance(r, dict)]
+    merged: Dict[str, Any] = dict(dicts[0]) if dicts else {}
+    rows = dedupe_rows(r.get(rows_key) or [] for r in dicts)
+    rows.sort(key=lambda r: (r.get(date_field) is None, str(r.get(date_field) or "")))
+    merged[rows_key] = rows
+    return merged
+
+
+def window_full(data: Any, rows_key: str, limit: int) -> bool:
+    """True when a window returned *limit* rows and may be cut short."""
+    return isinstance(data, dict) and len(data.get(rows_key) or []) >= limit
+
+
+def merge_range(
+    responses: List[Any], rows_key: str, date_field: str, full_days: Iterable[_dt.date]
+) -> Dict[str, Any]:
+    """
+    :func:`merge_windows`, raising if any single-day window came back full.
+
+    Raises
+    ------
+    IncompleteRange
+        Listing the *full_days*, with the merged response on ``.result``.
+    """
+    merged = merge_windows(responses, rows_key, date_field)
+    days = sorted(day.isoformat() for day in full_days)
+    if days:
+        raise IncompleteRange(
+            f"{len(days)} day(s) returned the full limit of rows and may be cut "
+            f"short: {', '.join(days)}",
+            result=merged,
+            days=days,
+        )
+    return merged
+
+
+def fetch_range(
+    fetch: Callable[..., Any],
+    symbol: str,
+    rows_key: str,
+    date_from: _dt.date | str,
+    date_to: _dt.date | str | None = None,
+    *,
+    date_field: str = "date",
+    window: Window = "90D",
+    max_workers: int = 8,
+    limit: int | None = None,
+) -> Dict[str, Any]:
+    """
+    Fetch a long date range as parallel windows and merge the results.
+
+    ``fetch(symbol, date_from=..., date_to=..., limit=...)`` is called once
+    per window from :func:`date_windows` on a thread pool. *limit* defaults
+    to :data:`RANGE_LIMIT` and is always sent. A window that returns *limit*
+    rows may have been cut short, so it is split in half and both halves are
+    fetched again (down to single days). A failed window raises; a range is
+    never returned with holes in it.
+
+    Raises
+    ------
+    IncompleteRange
+        If a single day still returns *limit* rows. The merged rows are on
+        the exception's ``result``.
+
+    Returns
+    -------
+    dict
+        The merged response (see :func:`merge_windows`).
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    spans = date_windows(date_from, date_to, window)
+    per_window = RANGE_LIMIT if limit is None else limit
+
+    def _one(span: DateSpan) -> Any:
+        return fetch(
+            symbol,
+            date_from=span[0].isoformat(),
+            date_to=span[1].isoformat(),
+            limit=per_window,
+        )
+
+    responses: List[Any] = []
+    full_days: List[_dt.date] = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(spans))) as pool:
+        pending = {pool.submit(_one, span): span for span in spans}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                span = pending.pop(fut)
+                data = fut.result()
+                full = window_full(data, rows_key, per_window)
+                if full and span[0] < span[1]:
+                    for half in split_span(span):
+                        pending[pool.submit(_one, half)] = half
+                    continue
+                if full:
+                    full_days.append(span[0])
+                responses.append(data)
+    return merge_range(responses, rows_key, date_field, full_days)
+
+
+# ─────────── screener joins ─────────────────────────────────────────────
+SCREENER_SOURCES = (
+    "sentiment", "analyst_ratings", "insider_trading", "congress_house",
+    "congress_senate", "news", "put_call_ratio", "linkedin", "app_ratings",
+    "predictions_daily", "predictions_monthly", "reddit_mentions",
+    "government_contracts", "patent_filings",
+)
+# descriptive columns every screener repeats; kept once, first source wins
+IDENTITY_COLUMNS = ("name", "market", "region", "sector")
+
+Where = Union[str, Callable[[Any], Any]]
+OrderBy = Union[str, Sequence[str]]
+
+
+def screener_calls(
+    sources: Iterable[str] | Mapping[str, Mapping[str, Any]],
+    methods: Mapping[str, Callable[..., Any]],
+    **shared: Any,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Resolve ``{source: kwargs}`` for :meth:`ScreenerAPI.query`.
+
+    *shared* options (``market``, ``region``, ``limit``) are passed to every
+    source whose screener accepts them; per-source kwargs from a mapping
+    override them. Unknown source names raise :class:`ValueError`.
+    """
+    specs = dict(sources) if isinstance(sources, Mapping) else dict.fromkeys(sources)
+    if not specs:
+        raise ValueError("sources must not be empty")
+    unknown = [name for name in specs if name not in SCREENER_SOURCES]
+    if unknown:
+        raise ValueError(
+            f"Unknown screener source(s) {', '.join(map(repr, unknown))}; "
+            f"expected any of {', '.join(SCREENER_SOURCES)}"
+        )
+    calls = {}
+    for name, own in specs.items():
+        accepted = inspect.signature(methods[name]).parameters
+        kwargs = {k: v for k, v in shared.items() if v is not None and k in accepted}
+        kwargs.update(own or {})
+        calls[name] = kwargs
+    return calls
+
+
+def latest_per_symbol(df: Any) -> Any:
+    """Keep one row per symbol: the newest by ``date`` when present, else the first."""
+    if not df.index.has_duplicates:
+        return df
+    if "date" in df.columns:
+        df = df.sort_values("date", ascending=False, na_position="last", kind="stable")
+    return df[~df.index.duplicated(keep="first")]
+
+
+def join_screeners(frames: Mapping[str, Any], how: str = "inner") -> Any:
+    """
+    Join symbol-indexed screener frames into one table.
+
+    Each frame is reduced with :func:`latest_per_symbol`. Columns that occur
+    in more than one source are prefixed with the source name
+    (``sentiment_date``, ``analyst_ratings_date``); :data:`IDENTITY_COLUMNS`
+    are kept once and lead the table. *how* is ``"inner"`` (symbols present
+    in every source) or ``"outer"`` (any source, gaps as missing values).
+    """
+    import pandas as pd
+
+    if how not in ("inner", "outer"):
+        raise ValueError("how must be 'inner' or 'outer'")
+    reduced = {name: latest_per_symbol(df) for name, df in frames.items()}
+    counts = Counter(
+        col for df in reduced.values() for col in df.columns if col not in IDENTITY_COLUMNS
+    )
+    parts, identity = [], []
+    for name, df in reduced.items():
+        ident = [c for c in IDENTITY_COLUMNS if c in df.columns]
+        identity.append(df[ident])
+        data = df.drop(columns=ident)
+        parts.append(data.rename(columns={c: f"{name}_{c}" for c in data.columns if counts[c] > 1}))
+
+    table = pd.concat(parts, axis=1, join=how)
+    ident = pd.concat(identity)
+    ident = ident[~ident.index.duplicated(keep="first")].reindex(table.index)
+    table = pd.concat([ident, table], axis=1)
+    table.index.name = "symbol"
+    return table
+
+
+def select_rows(
+    table: Any,
+    where: Where | None = None,
+    order_by: OrderBy | None = None,
+    top: int | None = None,
+) -> Any:
+    """
+    Filter, rank and cut a joined screener table, vectorized over all rows.
+
+    *where* is a :meth:`pandas.DataFrame.query` expression
+    (``"score > 0.3 and ratio < 0.7"``) or a callable returning a boolean
+    mask. *order_by* names one or more columns, ``-`` prefixed for
+    descending; missing values sort last. *top* keeps the first *top* rows.
+    """
+    if where is not None:
+        table = table.query(where) if isinstance(where, str) else table.loc[where(table)]
+    if order_by is not None:
+        keys = [order_by] if isinstance(order_by, str) else list(order_by)
+        table = table.sort_values(
+            [k.lstrip("-") for k in keys],
+            ascending=[not k.startswith("-") for k in keys],
+            na_position="last",
+            kind="stable",
+        )
+    if top is not None:
+        table = table.head(top)
+    return table
@@ -1,9 +1,9 @@
 # src/finbrain/endpoints/available.py
 from __future__ import annotations
-import pandas as pd
 from typing import TYPE_CHECKING, List, Dict, Any
 
 if TYPE_CHECKING:  # imported only by type-checkers (mypy, pyright…)
+    import pandas as pd
     from ..client import FinBrainClient
 
 
@@ -49,7 +49,11 @@ class AvailableAPI:
         else:
             rows = data.get("markets", data.get("availableMarkets", []))
 
-        return pd.DataFrame(rows) if as_dataframe else rows
+        if as_dataframe:
+            import pandas as pd
+
+            return pd.DataFrame(rows)
+        return rows
 
     # ------------------------------------------------------------
     def tickers(
@@ -101,7 +105,11 @@ class AvailableAPI:
         else:
             rows = data
 
-        return pd.DataFrame(rows) if as_dataframe else rows
+        if as_dataframe:
+            import pandas as pd
+
+            return pd.DataFrame(rows)
+        return rows
 
     # ------------------------------------------------------------
     def regions(
@@ -128,4 +136,8 @@ class AvailableAPI:
         else:
             rows = data.get("regions", [])
 
-        return pd.DataFrame(rows) if as_dataframe else rows
+        if as_dataframe:
+            import pandas as pd
+
+            return pd.DataFrame(rows)
+        return rows
@@ -1,11 +1,14 @@
 from __future__ import annotations
-import pandas as pd
 import datetime as _dt
-from typing import TYPE_CHECKING, Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, Iterable
 
-from ._utils import to_datestr
+from ._frames import CORPORATE_LOBBYING, Output, build_output, resolve_output
+from ._utils import BatchResult, Window, fetch_many, fetch_range, to_datestr
 
 if TYPE_CHECKING:  # imported only by type-checkers
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import FinBrainClient
 
 
@@ -29,7 +32,8 @@ class CorporateLobbyingAPI:
         date_to: _dt.date | str | None = None,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> Dict[str, Any] | pd.DataFrame:
+        output: Output | None = None,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
         """
         Fetch corporate lobbying filings for *symbol*.
 
@@ -44,11 +48,17 @@ class CorporateLobbyingAPI:
         as_dataframe :
             If *True*, return a **pandas.DataFrame** indexed by ``date``;
             otherwise return the raw JSON dict.
+        output :
+            ``"raw"`` (default), ``"pandas"`` (same as *as_dataframe*),
+            ``"arrow"`` for a :class:`pyarrow.Table` or ``"polars"`` for a
+            :class:`polars.DataFrame`, built straight from the decoded rows.
 
         Returns
         -------
-        dict | pandas.DataFrame
+        dict | pandas.DataFrame | pyarrow.Table | polars.DataFrame
         """
+        output = resolve_output(output, as_dataframe)
+
         params: Dict[str, str] = {}
         if date_from:
             params["startDate"] = to_datestr(date_from)
@@ -61,12 +71,104 @@ class CorporateLobbyingAPI:
 
         data: Dict[str, Any] = self._c._request("GET", path, params=params)
 
-        if as_dataframe:
-            rows: List[Dict[str, Any]] = data.get("filings", [])
-            df = pd.DataFrame(rows)
-            if not df.empty and "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"])
-                df.set_index("date", inplace=True)
-            return df
+        if output != "raw":
+            return build_output(data.get("filings", []), CORPORATE_LOBBYING, output)
+
+        return data
+
+    # ------------------------------------------------------------------ #
+    def ticker_many(
+        self,
+        symbols: Iterable[str],
+        *,
+        max_workers: int = 8,
+        as_dataframe: bool = False,
+        **kwargs: Any,
+    ) -> BatchResult | pd.DataFrame:
+        """
+        Corporate lobbying filings for many symbols at once.
+
+        Parameters
+        ----------
+        symbols :
+            Ticker symbols; upper-cased and de-duplicated.
+        max_workers :
+            Number of worker threads sharing the client's HTTP session.
+        as_dataframe :
+            If *True*, return one **pandas.DataFrame** whose index gains a
+            leading ``symbol`` level; otherwise a ``{symbol: dict}`` mapping.
+        **kwargs :
+            Forwarded to :meth:`ticker` (``date_from``, ``date_to``, ``limit``).
+
+        Returns
+        -------
+        BatchResult | pandas.DataFrame
+            Symbols whose request failed are listed on ``.errors`` (or
+            ``df.attrs["errors"]``) instead of aborting the batch.
+        """
+        return fetch_many(
+            self.ticker,
+            symbols,
+            max_workers=max_workers,
+            as_dataframe=as_dataframe,
+            **kwargs,
+        )
+
+    # ------------------------------------------------------------------ #
+    def fetch_range(
+        self,
+        symbol: str,
+        date_from: _dt.date | str,
+        date_to: _dt.date | str | None = None,
+        *,
+        window: Window = "90D",
+        max_workers: int = 8,
+        limit: int | None = None,
+        as_dataframe: bool = False,
+        output: Output | None = None,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
+        """
+        Corporate lobbying filings for *symbol* over a long date range.
+
+        The range is split into *window*-sized pieces that are fetched in
+        parallel; the responses are merged, rows returned by two windows
+        kept once and the rows sorted by ``date``, oldest first.
 
+        Parameters
+        ----------
+        symbol :
+            Ticker symbol; converted to upper-case.
+        date_from, date_to :
+            Inclusive ISO dates (``YYYY-MM-DD``); *date_to* defaults to today.
+        window :
+            Window size: days (``int`` / ``timedelta``) or ``"90D"``, ``"2W"``,
+            ``"6M"``, ``"1Y"``.
+        max_workers :
+            Number of windows fetched concurrently.
+        limit :
+            Per-window row limit, sent on every request (default 500, the
+            API maximum). A window that comes back full is split in half and
+            fetched again, so rows are not silently dropped; a single day
+            that is still full raises
+            :class:`~finbrain.exceptions.IncompleteRange`.
+        as_dataframe, output :
+            As for :meth:`ticker`.
+
+        Returns
+        -------
+        dict | pandas.DataFrame | pyarrow.Table | polars.DataFrame
+        """
+        output = resolve_output(output, as_dataframe)
+        data = fetch_range(
+            self.ticker,
+            symbol,
+            "filings",
+            date_from,
+            date_to,
+            window=window,
+            max_workers=max_workers,
+            limit=limit,
+        )
+        if output != "raw":
+            return build_output(data.get("filings", []), CORPORATE_LOBBYING, output)
         return data
@@ -1,11 +1,15 @@
 from __future__ import annotations
-import pandas as pd
 import datetime as _dt
-from typing import TYPE_CHECKING, Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, Iterable
 
-from ._utils import to_datestr
+from ..records import CongressTrade
+from ._frames import CONGRESS_TRADES, Output, build_output, resolve_output
+from ._utils import BatchResult, Window, fetch_many, fetch_range, to_datestr
 
 if TYPE_CHECKING:  # imported only by type-checkers
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import FinBrainClient
 
 
@@ -30,7 +34,9 @@ class HouseTradesAPI:
         date_to: _dt.date | str | None = None,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> Dict[str, Any] | pd.DataFrame:
+        output: Output | None = None,
+        as_records: bool = False,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
         """
         Fetch House-member trades for *symbol*.
 
@@ -45,10 +51,18 @@ class HouseTradesAPI:
         as_dataframe :
             If *True*, return a **pandas.DataFrame** indexed by ``date``;
             otherwise return the raw JSON dict.
+        output :
+            ``"raw"`` (default), ``"pandas"`` (same as *as_dataframe*),
+            ``"arrow"`` for a :class:`pyarrow.Table` or ``"polars"`` for a
+            :class:`polars.DataFrame`, built straight from the decoded rows.
+        as_records :
+            If *True*, return the raw dict with ``trades`` converted to
+            :class:`~finbrain.records.CongressTrade` objects (compact,
+            ``__slots__``-based). Cannot be combined with *as_dataframe*.
 
         Returns
         -------
-        dict | pandas.DataFrame
+        dict | pandas.DataFrame | pyarrow.Table | polars.DataFrame
             The raw dict has a ``trades`` list whose rows carry ``date``
             (the transaction date), ``politician``, ``transactionType``,
             ``amount``, ``owner``, ``amountRaw``, ``amountFlag`` and
@@ -93,6 +107,10 @@ class HouseTradesAPI:
              "amountFlag": None, "disclosureDate": "2026-07-01"}
 
         """
+        output = resolve_output(output, as_dataframe)
+        if as_records and output != "raw":
+            raise ValueError("as_records and as_dataframe/output are mutually exclusive")
+
         params: Dict[str, str] = {}
         if date_from:
             params["startDate"] = to_datestr(date_from)
@@ -103,14 +121,111 @@ class HouseTradesAPI:
 
         path = f"congress/house/{symbol.upper()}"
 
+        if as_records:
+            return self._c._request_records(
+                "GET", path, params, "trades", CongressTrade.converter(symbol.upper())
+            )
+
         data: Dict[str, Any] = self._c._request("GET", path, params=params)
 
-        if as_dataframe:
-            rows: List[Dict[str, Any]] = data.get("trades", [])
-            df = pd.DataFrame(rows)
-            if not df.empty and "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"])
-                df.set_index("date", inplace=True)
-            return df
+        if output != "raw":
+            return build_output(data.get("trades", []), CONGRESS_TRADES, output)
+
+        return data
+
+    # ------------------------------------------------------------------ #
+    def ticker_many(
+        self,
+        symbols: Iterable[str],
+        *,
+        max_workers: int = 8,
+        as_dataframe: bool = False,
+        **kwargs: Any,
+    ) -> BatchResult | pd.DataFrame:
+        """
+        House-member trades for many symbols at once.
 
+        Parameters
+        ----------
+        symbols :
+            Ticker symbols; upper-cased and de-duplicated.
+        max_workers :
+            Number of worker threads sharing the client's HTTP session.
+        as_dataframe :
+            If *True*, return one **pandas.DataFrame** whose index gains a
+            leading ``symbol`` level; otherwise a ``{symbol: dict}`` mapping.
+        **kwargs :
+            Forwarded to :meth:`ticker` (``date_from``, ``date_to``, ``limit``).
+
+        Returns
+        -------
+        BatchResult | pandas.DataFrame
+            Symbols whose request failed are listed on ``.errors`` (or
+            ``df.attrs["errors"]``) instead of aborting the batch.
+        """
+        return fetch_many(
+            self.ticker,
+            symbols,
+            max_workers=max_workers,
+            as_dataframe=as_dataframe,
+            **kwargs,
+        )
+
+    # ------------------------------------------------------------------ #
+    def fetch_range(
+        self,
+        symbol: str,
+        date_from: _dt.date | str,
+        date_to: _dt.date | str | None = None,
+        *,
+        window: Window = "90D",
+        max_workers: int = 8,
+        limit: int | None = None,
+        as_dataframe: bool = False,
+        output: Output | None = None,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
+        """
+        House-member trades for *symbol* over a long date range.
+
+        The range is split into *window*-sized pieces that are fetched in
+        parallel; the responses are merged, rows returned by two windows
+        kept once and the rows sorted by ``date``, oldest first.
+
+        Parameters
+        ----------
+        symbol :
+            Ticker symbol; converted to upper-case.
+        date_from, date_to :
+            Inclusive ISO dates (``YYYY-MM-DD``); *date_to* defaults to today.
+        window :
+            Window size: days (``int`` / ``timedelta``) or ``"90D"``, ``"2W"``,
+            ``"6M"``, ``"1Y"``.
+        max_workers :
+            Number of windows fetched concurrently.
+        limit :
+            Per-window row limit, sent on every request (default 500, the
+            API maximum). A window that comes back full is split in half and
+            fetched again, so rows are not silently dropped; a single day
+            that is still full raises
+            :class:`~finbrain.exceptions.IncompleteRange`.
+        as_dataframe, output :
+            As for :meth:`ticker`.
+
+        Returns
+        -------
+        dict | pandas.DataFrame | pyarrow.Table | polars.DataFrame
+        """
+        output = resolve_output(output, as_dataframe)
+        data = fetch_range(
+            self.ticker,
+            symbol,
+            "trades",
+            date_from,
+            date_to,
+            window=window,
+            max_workers=max_workers,
+            limit=limit,
+        )
+        if output != "raw":
+            return build_output(data.get("trades", []), CONGRESS_TRADES, output)
         return data
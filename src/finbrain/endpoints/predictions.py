@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-import pandas as pd
-from typing import TYPE_CHECKING, Literal, Dict, Any, List
+from typing import TYPE_CHECKING, Literal, Dict, Any, Iterable
+
+from ._frames import PREDICTIONS, Output, build_output, resolve_output
+from ._utils import BatchResult, fetch_many
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import FinBrainClient
 
 
@@ -31,7 +36,8 @@ class PredictionsAPI:
         *,
         prediction_type: _PType = "daily",
         as_dataframe: bool = False,
-    ) -> Dict[str, Any] | pd.DataFrame:
+        output: Output | None = None,
+    ) -> Dict[str, Any] | pd.DataFrame | pa.Table | pl.DataFrame:
         """
         Single-ticker predictions.
 
@@ -44,25 +50,64 @@ class PredictionsAPI:
         as_dataframe :
             Return a **DataFrame** (index = ``date``, cols = ``mid, lower, upper``)
             instead of raw JSON.
+        output :
+            ``"raw"`` (default), ``"pandas"`` (same as *as_dataframe*),
+            ``"arrow"`` for a :class:`pyarrow.Table` or ``"polars"`` for a
+            :class:`polars.DataFrame`, built straight from the decoded rows.
 
         Returns
         -------
-        dict | pandas.DataFrame
+        dict | pandas.DataFrame | pyarrow.Table | polars.DataFrame
         """
+        output = resolve_output(output, as_dataframe)
+
         _validate(prediction_type)
         path = f"predictions/{prediction_type}/{symbol.upper()}"
         data: Dict[str, Any] = self._c._request("GET", path)
 
-        if as_dataframe:
-            rows: List[Dict[str, Any]] = data.get("predictions", [])
-            df = pd.DataFrame(rows)
-            if not df.empty and "date" in df.columns:
-                df["date"] = pd.to_datetime(df["date"])
-                df.set_index("date", inplace=True)
-            return df
+        if output != "raw":
+            return build_output(data.get("predictions", []), PREDICTIONS, output)
 
         return data
 
+    # ------------------------------------------------------------------ #
+    def ticker_many(
+        self,
+        symbols: Iterable[str],
+        *,
+        max_workers: int = 8,
+        as_dataframe: bool = False,
+        **kwargs: Any,
+    ) -> BatchResult | pd.DataFrame:
+        """
+        Price predictions for many symbols at once.
+
+        Parameters
+        ----------
+        symbols :
+            Ticker symbols; upper-cased and de-duplicated.
+        max_workers :
+            Number of worker threads sharing the client's HTTP session.
+        as_dataframe :
+            If *True*, return one **pandas.DataFrame** whose index gains a
+            leading ``symbol`` level; otherwise a ``{symbol: dict}`` mapping.
+        **kwargs :
+            Forwarded to :meth:`ticker` (``prediction_type``).
+
+        Returns
+        -------
+        BatchResult | pandas.DataFrame
+            Symbols whose request failed are listed on ``.errors`` (or
+            ``df.attrs["errors"]``) instead of aborting the batch.
+        """
+        return fetch_many(
+            self.ticker,
+            symbols,
+            max_workers=max_workers,
+            as_dataframe=as_dataframe,
+            **kwargs,
+        )
+
 
 # ---------------------------------------------------------------------- #
 def _validate(value: str) -> None:
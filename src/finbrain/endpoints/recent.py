@@ -1,8 +1,13 @@
 from __future__ import annotations
-import pandas as pd
-from typing import TYPE_CHECKING, Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List
+
+from ._frames import RECENT, Output, build_output, resolve_output
+from ._utils import ColumnBuilder
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import FinBrainClient
 
 
@@ -37,6 +42,12 @@ class RecentAPI:
             return data["data"]
         return data
 
+    def _stream(self, path: str, params: Dict[str, str], output: str) -> Any:
+        rows = self._c._request_stream("GET", path, params=params or None)
+        if output == "raw":
+            return rows
+        return build_output(ColumnBuilder().extend(rows).columns, RECENT, output)
+
     def news(
         self,
         *,
@@ -44,7 +55,9 @@ class RecentAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """
         Get most recent news articles across all tracked stocks.
 
@@ -58,17 +71,28 @@ class RecentAPI:
             Optional region filter.
         as_dataframe :
             If *True*, return a pandas DataFrame.
+        output :
+            ``"raw"``, ``"pandas"``, ``"arrow"`` or ``"polars"``. Combining
+            ``as_dataframe=True`` with anything but ``"pandas"`` raises
+            :class:`ValueError`.
+        stream :
+            If *True*, decode the response incrementally and return an
+            iterator of rows. Combined with a table output, rows are
+            appended straight into its columns.
 
         Returns
         -------
-        list[dict] | pandas.DataFrame
+        list[dict] | pandas.DataFrame | pyarrow.Table | polars.DataFrame | Iterator[dict]
         """
+        output = resolve_output(output, as_dataframe)
         params = self._build_params(limit=limit, market=market, region=region)
+        if stream:
+            return self._stream("recent/news", params, output)
         data = self._c._request("GET", "recent/news", params=params or None)
         rows = self._unwrap(data)
 
-        if as_dataframe and isinstance(rows, list):
-            return pd.DataFrame(rows)
+        if output != "raw" and isinstance(rows, list):
+            return build_output(rows, RECENT, output)
         return rows
 
     def analyst_ratings(
@@ -78,7 +102,9 @@ class RecentAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """
         Get most recent analyst ratings across all tickers.
 
@@ -92,15 +118,26 @@ class RecentAPI:
             Optional region filter.
         as_dataframe :
             If *True*, return a pandas DataFrame.
+        output :
+            ``"raw"``, ``"pandas"``, ``"arrow"`` or ``"polars"``. Combining
+            ``as_dataframe=True`` with anything but ``"pandas"`` raises
+            :class:`ValueError`.
+        stream :
+            If *True*, decode the response incrementally and return an
+            iterator of rows. Combined with a table output, rows are
+            appended straight into its columns.
 
         Returns
         -------
-        list[dict] | pandas.DataFrame
+        list[dict] | pandas.DataFrame | pyarrow.Table | polars.DataFrame | Iterator[dict]
         """
+        output = resolve_output(output, as_dataframe)
         params = self._build_params(limit=limit, market=market, region=region)
+        if stream:
+            return self._stream("recent/analyst-ratings", params, output)
         data = self._c._request("GET", "recent/analyst-ratings", params=params or None)
         rows = self._unwrap(data)
 
-        if as_dataframe and isinstance(rows, list):
-            return pd.DataFrame(rows)
+        if output != "raw" and isinstance(rows, list):
+            return build_output(rows, RECENT, output)
         return rows
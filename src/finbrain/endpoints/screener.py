@@ -1,8 +1,22 @@
 from __future__ import annotations
-import pandas as pd
-from typing import TYPE_CHECKING, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, Mapping
+
+from ._frames import SCREENER, Output, build_output, resolve_output
+from ._utils import (
+    ColumnBuilder,
+    SCREENER_SOURCES,
+    OrderBy,
+    Where,
+    join_screeners,
+    screener_calls,
+    select_rows,
+)
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
     from ..client import FinBrainClient
 
 
@@ -12,6 +26,20 @@ class ScreenerAPI:
 
     All screener methods return data for multiple tickers at once,
     with optional market/region filters.
+
+    Pass ``stream=True`` to decode whole-universe responses incrementally:
+    rows come back as an iterator (or, with ``as_dataframe=True``, are
+    appended straight into DataFrame columns) instead of the full payload
+    being parsed into a list first.
+
+    ``output="arrow"`` or ``output="polars"`` returns the same table as a
+    :class:`pyarrow.Table` / :class:`polars.DataFrame` (``symbol`` as the
+    first column) and combines with ``stream=True`` the same way. It
+    conflicts with ``as_dataframe=True``: the pair raises
+    :class:`ValueError`.
+
+    :meth:`query` fetches several screeners concurrently and joins them on
+    ``symbol`` for one vectorized filter / rank pass.
     """
 
     def __init__(self, client: "FinBrainClient") -> None:
@@ -43,13 +71,9 @@ class ScreenerAPI:
             )
 
     @staticmethod
-    def _to_df(data: Any) -> pd.DataFrame:
-        if isinstance(data, list):
-            df = pd.DataFrame(data)
-            if not df.empty and "symbol" in df.columns:
-                df.set_index("symbol", inplace=True)
-            return df
-        return pd.DataFrame()
+    def _to_df(data: List[Dict[str, Any]] | Dict[str, List[Any]], output: str = "pandas") -> Any:
+        """Symbol-keyed table (pandas, Arrow or Polars) from rows or columns."""
+        return build_output(data if isinstance(data, (list, dict)) else [], SCREENER, output)
 
     @staticmethod
     def _unwrap(data: Any) -> Any:
@@ -58,10 +82,25 @@ class ScreenerAPI:
             return data["data"]
         return data
 
-    def _get(self, path: str, params: Dict[str, str], as_dataframe: bool) -> Any:
+    def _get(
+        self,
+        path: str,
+        params: Dict[str, str],
+        as_dataframe: bool,
+        stream: bool = False,
+        output: str | None = None,
+    ) -> Any:
+        output = resolve_output(output, as_dataframe)
+        if stream:
+            rows = self._c._request_stream("GET", path, params=params or None)
+            if output != "raw":
+                return self._to_df(ColumnBuilder().extend(rows).columns, output)
+            return rows
         data = self._c._request("GET", path, params=params or None)
         rows = self._unwrap(data)
-        return self._to_df(rows) if as_dataframe else rows
+        if output != "raw":
+            return self._to_df(rows if isinstance(rows, list) else [], output)
+        return rows
 
     # ── sentiment ─────────────────────────────────────────────
 
@@ -72,11 +111,13 @@ class ScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen sentiment across tickers. Requires ``market`` or ``region``."""
         self._require_market_or_region(market, region)
         params = self._build_params(limit=limit, market=market, region=region)
-        return self._get("screener/sentiment", params, as_dataframe)
+        return self._get("screener/sentiment", params, as_dataframe, stream, output)
 
     # ── analyst ratings ───────────────────────────────────────
 
@@ -87,10 +128,12 @@ class ScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen analyst ratings across tickers."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return self._get("screener/analyst-ratings", params, as_dataframe)
+        return self._get("screener/analyst-ratings", params, as_dataframe, stream, output)
 
     # ── insider trading ───────────────────────────────────────
 
@@ -99,10 +142,12 @@ class ScreenerAPI:
         *,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen insider trades across all tickers."""
         params = self._build_params(limit=limit)
-        return self._get("screener/insider-trading", params, as_dataframe)
+        return self._get("screener/insider-trading", params, as_dataframe, stream, output)
 
     # ── congress house ────────────────────────────────────────
 
@@ -111,7 +156,9 @@ class ScreenerAPI:
         *,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """
         Screen House trades across all tickers.
 
@@ -123,7 +170,7 @@ class ScreenerAPI:
         were backfilled upstream.
         """
         params = self._build_params(limit=limit)
-        return self._get("screener/congress/house", params, as_dataframe)
+        return self._get("screener/congress/house", params, as_dataframe, stream, output)
 
     # ── congress senate ───────────────────────────────────────
 
@@ -132,7 +179,9 @@ class ScreenerAPI:
         *,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """
         Screen Senate trades across all tickers.
 
@@ -144,7 +193,7 @@ class ScreenerAPI:
         nullable, though rare — historical rows were backfilled upstream.
         """
         params = self._build_params(limit=limit)
-        return self._get("screener/congress/senate", params, as_dataframe)
+        return self._get("screener/congress/senate", params, as_dataframe, stream, output)
 
     # ── news ──────────────────────────────────────────────────
 
@@ -155,10 +204,12 @@ class ScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen news across tickers."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return self._get("screener/news", params, as_dataframe)
+        return self._get("screener/news", params, as_dataframe, stream, output)
 
     # ── put-call ratio ────────────────────────────────────────
 
@@ -169,10 +220,12 @@ class ScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen put/call ratio across tickers."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return self._get("screener/put-call-ratio", params, as_dataframe)
+        return self._get("screener/put-call-ratio", params, as_dataframe, stream, output)
 
     # ── linkedin ──────────────────────────────────────────────
 
@@ -183,11 +236,13 @@ class ScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen LinkedIn data. Requires ``market`` or ``region``."""
         self._require_market_or_region(market, region)
         params = self._build_params(limit=limit, market=market, region=region)
-        return self._get("screener/linkedin", params, as_dataframe)
+        return self._get("screener/linkedin", params, as_dataframe, stream, output)
 
     # ── app ratings ───────────────────────────────────────────
 
@@ -198,11 +253,13 @@ class ScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen app ratings. Requires ``market`` or ``region``."""
         self._require_market_or_region(market, region)
         params = self._build_params(limit=limit, market=market, region=region)
-        return self._get("screener/app-ratings", params, as_dataframe)
+        return self._get("screener/app-ratings", params, as_dataframe, stream, output)
 
     # ── predictions daily ─────────────────────────────────────
 
@@ -213,10 +270,12 @@ class ScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen daily (10-day) predictions across tickers."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return self._get("screener/predictions/daily", params, as_dataframe)
+        return self._get("screener/predictions/daily", params, as_dataframe, stream, output)
 
     # ── predictions monthly ───────────────────────────────────
 
@@ -227,10 +286,12 @@ class ScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen monthly (12-month) predictions across tickers."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return self._get("screener/predictions/monthly", params, as_dataframe)
+        return self._get("screener/predictions/monthly", params, as_dataframe, stream, output)
 
     # ── reddit mentions ────────────────────────────────────────
 
@@ -241,10 +302,12 @@ class ScreenerAPI:
         market: str | None = None,
         region: str | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen Reddit mention counts across tickers."""
         params = self._build_params(limit=limit, market=market, region=region)
-        return self._get("screener/reddit-mentions", params, as_dataframe)
+        return self._get("screener/reddit-mentions", params, as_dataframe, stream, output)
 
     # ── government contracts ──────────────────────────────────
 
@@ -253,10 +316,12 @@ class ScreenerAPI:
         *,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen government contracts across all tickers."""
         params = self._build_params(limit=limit)
-        return self._get("screener/government-contracts", params, as_dataframe)
+        return self._get("screener/government-contracts", params, as_dataframe, stream, output)
 
     # ── patent filings ────────────────────────────────────────
 
@@ -265,7 +330,80 @@ class ScreenerAPI:
         *,
         limit: int | None = None,
         as_dataframe: bool = False,
-    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        output: Output | None = None,
+        stream: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame | pa.Table | pl.DataFrame | Iterator[Dict[str, Any]]:
         """Screen USPTO patent filings across all tickers."""
         params = self._build_params(limit=limit)
-        return self._get("screener/patent-filings", params, as_dataframe)
+        return self._get("screener/patent-filings", params, as_dataframe, stream, output)
+
+    # ── multi-screener query ──────────────────────────────────
+
+    def query(
+        self,
+        sources: Iterable[str] | Mapping[str, Mapping[str, Any]],
+        *,
+        where: Where | None = None,
+        order_by: OrderBy | None = None,
+        top: int | None = None,
+        how: str = "inner",
+        market: str | None = None,
+        region: str | None = None,
+        limit: int | None = None,
+        max_workers: int = 8,
+    ) -> pd.DataFrame:
+        """
+        Fetch several screeners at once, join them on ``symbol`` and filter.
+
+        Parameters
+        ----------
+        sources :
+            Screener method names (``["sentiment", "put_call_ratio"]``), or a
+            mapping of name to extra kwargs for that screener
+            (``{"sentiment": {"market": "S&P 500"}, "analyst_ratings": {}}``).
+        where :
+            :meth:`pandas.DataFrame.query` expression or callable returning a
+            boolean mask, evaluated once over the joined table.
+        order_by :
+            Column name(s) to rank by; prefix with ``-`` for descending.
+        top :
+            Keep only the first *top* rows after ranking.
+        how :
+            ``"inner"`` keeps symbols present in every source, ``"outer"``
+            keeps all of them.
+        market, region, limit :
+            Passed to every source whose screener accepts them.
+        max_workers :
+            Number of screeners fetched in parallel.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Indexed by ``symbol``, one row per symbol (the newest when a
+            screener returns several). Columns found in more than one source
+            are prefixed with its name, e.g. ``sentiment_date``; ``name``,
+            ``market``, ``region`` and ``sector`` appear once.
+
+        Examples
+        --------
+        >>> fb.screener.query(
+        ...     ["sentiment", "put_call_ratio", "predictions_daily"],
+        ...     market="S&P 500",
+        ...     where="score > 0.3 and ratio < 0.7",
+        ...     order_by="-expectedShortTerm",
+        ...     top=20,
+        ... )
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        methods = {name: getattr(self, name) for name in SCREENER_SOURCES}
+        calls = screener_calls(
+            sources, methods, market=market, region=region, limit=limit
+        )
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+            futures = {
+                name: pool.submit(methods[name], as_dataframe=True, **kwargs)
+                for name, kwargs in calls.items()
+            }
+            frames = {name: fut.result() for name, fut in futures.items()}
+        return select_rows(join_screeners(frames, how), where, order_by, top)
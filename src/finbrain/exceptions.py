@@ -21,7 +21,7 @@ Docs-based mapping
 
 from __future__ import annotations
 
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
 __all__ = [
     "FinBrainError",
@@ -37,6 +37,7 @@ __all__ = [
     "GatewayTimeout",
     #
     "InvalidResponse",
+    "IncompleteRange",
     "http_error_to_exception",
 ]
 
@@ -123,6 +124,22 @@ class InvalidResponse(FinBrainError):
     """Response couldn't be parsed as JSON or is missing required fields."""
 
 
+class IncompleteRange(FinBrainError):
+    """
+    A date range could not be fetched without possibly losing rows.
+
+    Raised by ``fetch_range`` when a single-day window still returns
+    ``limit`` rows: it cannot be split further, so that day may be cut
+    short. The merged response is on :attr:`result` and the affected
+    ``YYYY-MM-DD`` days on :attr:`days`.
+    """
+
+    def __init__(self, message: str, *, result: Dict[str, Any], days: List[str]):
+        super().__init__(message, payload=result)
+        self.result = result
+        self.days = days
+
+
 # ─────────────────────────────────────────────────────────────
 # Helper: map HTTP response ➜ exception
 # ─────────────────────────────────────────────────────────────
@@ -0,0 +1,418 @@
+"""
+finbrain.hooks
+~~~~~~~~~~~~~~
+
+Per-request instrumentation for :class:`~finbrain.FinBrainClient` and
+:class:`~finbrain.aio.AsyncFinBrainClient`.
+
+Every attempt that goes over the network emits ``on_request`` and then
+exactly one of ``on_response`` (success, after the body is decoded),
+``on_retry`` (failed attempt that will be retried) or ``on_error``
+(the request is given up). Each callback receives a :class:`RequestEvent`
+with the endpoint path, attempt number, status, timings, byte counts and
+decode time. Cache hits and callers coalesced onto another caller's
+request emit nothing.
+
+Hooks run inline on the calling thread (or event loop), so keep them
+cheap. An exception raised by a hook is turned into a
+:class:`RuntimeWarning` and never fails the request.
+
+Example
+-------
+>>> from finbrain import FinBrainClient
+>>> from finbrain.hooks import Hooks
+>>> hooks = Hooks()
+>>> @hooks.on_response
+... def log(event):
+...     print(event.path, event.status, f"{event.total:.3f}s", event.body_bytes)
+>>> fb = FinBrainClient(api_key="YOUR_KEY", hooks=hooks)
+
+:class:`PrometheusHooks` and :class:`OpenTelemetryHooks` are ready-made
+observers (``pip install finbrain-python[prometheus]`` / ``[otel]``).
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+import time
+import warnings
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+__all__ = [
+    "EVENTS",
+    "Hooks",
+    "OpenTelemetryHooks",
+    "PrometheusHooks",
+    "RequestEvent",
+    "as_hooks",
+    "endpoint_label",
+]
+
+EVENTS = ("on_request", "on_response", "on_retry", "on_error")
+
+# A trailing path segment that looks like a ticker (AAPL, BRK.B, ^GSPC, 7203.T)
+_SYMBOL_SEGMENT = re.compile(r"^[A-Z0-9.^=\-]*[A-Z][A-Z0-9.^=\-]*$")
+
+_ids = itertools.count(1)
+
+
+class RequestEvent(NamedTuple):
+    """
+    What a hook receives. Timings are in seconds; ``None`` means unknown.
+
+    ``dns`` and ``connect`` are only filled in where the HTTP library
+    reports them (httpx connection tracing; ``connect`` then includes DNS
+    and TLS). ``ttfb`` is the time from sending to the response headers,
+    ``total`` from sending to the last body byte. ``request_id`` is shared
+    by every event of one logical request, across retries.
+    """
+
+    method: str
+    path: str
+    attempt: int
+    request_id: int = 0
+    status: Optional[int] = None
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    ttfb: Optional[float] = None
+    total: Optional[float] = None
+    wire_bytes: Optional[int] = None
+    body_bytes: Optional[int] = None
+    decode: Optional[float] = None
+    delay: Optional[float] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def endpoint(self) -> str:
+        """Low-cardinality label for :attr:`path`, see :func:`endpoint_label`."""
+        return endpoint_label(self.path)
+
+
+def endpoint_label(path: str) -> str:
+    """
+    Replace a trailing ticker in an API path with ``{symbol}``.
+
+    ``"insider-trading/AAPL"`` → ``"insider-trading/{symbol}"``, so metrics
+    are labelled per endpoint rather than per ticker.
+    """
+    head, _, last = path.strip("/").rpartition("/")
+    if head and _SYMBOL_SEGMENT.match(last):
+        return f"{head}/{{symbol}}"
+    return path.strip("/")
+
+
+Hook = Callable[[RequestEvent], Any]
+
+
+class Hooks:
+    """
+    Registry of event callbacks.
+
+    Callbacks are added with :meth:`add`, with the ``on_*`` decorators, or
+    by passing observers (any objects with some of the ``on_request`` …
+    ``on_error`` methods, such as :class:`PrometheusHooks`) to the
+    constructor or :meth:`register`.
+    """
+
+    def __init__(self, *observers: Any) -> None:
+        self._handlers: Dict[str, List[Hook]] = {name: [] for name in EVENTS}
+        for observer in observers:
+            self.register(observer)
+
+    def add(self, event: str, fn: Hook) -> Hook:
+        """Call *fn* on every *event* (one of :data:`EVENTS`)."""
+        if event not in self._handlers:
+            raise ValueError(f"Unknown hook event {event!r}; expected one of {EVENTS}")
+        self._handlers[event].append(fn)
+        return fn
+
+    def register(self, observer: Any) -> Any:
+        """Subscribe every ``on_*`` method *observer* defines."""
+        found = [name for name in EVENTS if callable(getattr(observer, name, None))]
+        if not found:
+            raise TypeError(f"{observer!r} has none of the hook methods {EVENTS}")
+        for name in found:
+            self.add(name, getattr(observer, name))
+        return observer
+
+    def on_request(self, fn: Hook) -> Hook:
+        return self.add("on_request", fn)
+
+    def on_response(self, fn: Hook) -> Hook:
+        return self.add("on_response", fn)
+
+    def on_retry(self, fn: Hook) -> Hook:
+        return self.add("on_retry", fn)
+
+    def on_error(self, fn: Hook) -> Hook:
+        return self.add("on_error", fn)
+
+    def wants(self, event: str) -> bool:
+        """Whether anything listens to *event* (lets callers skip building it)."""
+        return bool(self._handlers[event])
+
+    def emit(self, event: str, payload: RequestEvent) -> None:
+        for fn in self._handlers[event]:
+            try:
+                fn(payload)
+            except Exception as exc:  # a metrics bug must not fail the request
+                warnings.warn(
+                    f"finbrain {event} hook {fn!r} raised {exc!r}", RuntimeWarning, stacklevel=2
+                )
+
+    def __bool__(self) -> bool:
+        return any(self._handlers.values())
+
+
+def as_hooks(value: Any) -> Hooks:
+    """Coerce a client's ``hooks=`` argument: ``None``, :class:`Hooks`, or observer(s)."""
+    if value is None:
+        return Hooks()
+    if isinstance(value, Hooks):
+        return value
+    if isinstance(value, (list, tuple)):
+        return Hooks(*value)
+    return Hooks(value)
+
+
+class RequestTrace:
+    """Mutable per-request timing state threaded through a client's send loop."""
+
+    __slots__ = ("method", "path", "request_id", "attempt", "start", "dns", "connect",
+                 "ttfb", "total", "_marks")
+
+    def __init__(self, method: str, path: str) -> None:
+        self.method = method.upper()
+        self.path = path
+        self.request_id = next(_ids)
+        self.attempt = 0
+        self.start = 0.0
+        self.dns: float | None = None
+        self.connect: float | None = None
+        self.ttfb: float | None = None
+        self.total: float | None = None
+        self._marks: Dict[str, float] = {}
+
+    def begin(self, attempt: int) -> None:
+        self.attempt = attempt
+        self.start = time.perf_counter()
+        self.dns = self.connect = self.ttfb = self.total = None
+        self._marks.clear()
+
+    def finish(self) -> float:
+        """Stamp (and return) the total time of the current attempt."""
+        self.total = time.perf_counter() - self.start
+        return self.total
+
+    def event(self, **fields: Any) -> RequestEvent:
+        return RequestEvent(
+            self.method,
+            self.path,
+            self.attempt,
+            self.request_id,
+            dns=self.dns,
+            connect=self.connect,
+            ttfb=self.ttfb,
+            total=self.total,
+            **fields,
+        )
+
+    async def httpx_trace(self, name: str, info: Dict[str, Any]) -> None:
+        """httpcore ``trace`` extension: derive connect and TTFB timings."""
+        now = time.perf_counter()
+        if name == "connection.connect_tcp.started":
+            self._marks["connect"] = now
+        elif name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            if "connect" in self._marks:
+                self.connect = now - self._marks["connect"]
+        elif name.endswith(".receive_response_headers.complete"):
+            self.ttfb = now - self.start
+
+
+# ─────────── adapters ───────────────────────────────────────────────────
+def _require(module: str, extra: str) -> Any:
+    import importlib
+
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"{module.split('.')[0]} is required (pip install finbrain-python[{extra}])"
+        ) from exc
+
+
+def _reason(event: RequestEvent) -> str:
+    if event.status is not None:
+        return str(event.status)
+    return type(event.error).__name__ if event.error is not None else "unknown"
+
+
+class PrometheusHooks:
+    """
+    Export request metrics with ``prometheus_client``.
+
+    Metrics (labelled by ``endpoint`` from :func:`endpoint_label`):
+    ``<ns>_requests_total`` (+ ``method``, ``status``),
+    ``<ns>_request_duration_seconds``, ``<ns>_ttfb_seconds``,
+    ``<ns>_decode_seconds``, ``<ns>_response_bytes_total`` (``kind`` =
+    ``wire`` / ``body``), ``<ns>_retries_total`` and ``<ns>_errors_total``
+    (``reason`` = status code or exception class) and the
+    ``<ns>_requests_in_flight`` gauge.
+
+    Metrics register on *registry* (default: the global registry), so
+    create one instance per process and share it between clients.
+    """
+
+    def __init__(self, registry: Any = None, namespace: str = "finbrain") -> None:
+        prom = _require("prometheus_client", "prometheus")
+        kw = {} if registry is None else {"registry": registry}
+        ns = namespace
+        self.requests = prom.Counter(
+            f"{ns}_requests_total", "Completed FinBrain API requests",
+            ["endpoint", "method", "status"], **kw,
+        )
+        self.duration = prom.Histogram(
+            f"{ns}_request_duration_seconds", "Send to last body byte, per attempt",
+            ["endpoint"], **kw,
+        )
+        self.ttfb = prom.Histogram(
+            f"{ns}_ttfb_seconds", "Send to response headers", ["endpoint"], **kw,
+        )
+        self.decode = prom.Histogram(
+            f"{ns}_decode_seconds", "JSON decode time", ["endpoint"], **kw,
+        )
+        self.bytes = prom.Counter(
+            f"{ns}_response_bytes_total", "Response bytes (wire = compressed)",
+            ["endpoint", "kind"], **kw,
+        )
+        self.retries = prom.Counter(
+            f"{ns}_retries_total", "Retried attempts", ["endpoint", "reason"], **kw,
+        )
+        self.errors = prom.Counter(
+            f"{ns}_errors_total", "Requests given up", ["endpoint", "reason"], **kw,
+        )
+        self.in_flight = prom.Gauge(
+            f"{ns}_requests_in_flight", "Attempts on the wire", ["endpoint"], **kw,
+        )
+
+    def on_request(self, event: RequestEvent) -> None:
+        self.in_flight.labels(event.endpoint).inc()
+
+    def on_response(self, event: RequestEvent) -> None:
+        endpoint = event.endpoint
+        self.in_flight.labels(endpoint).dec()
+        self.requests.labels(endpoint, event.method, str(event.status)).inc()
+        if event.total is not None:
+            self.duration.labels(endpoint).observe(event.total)
+        if event.ttfb is not None:
+            self.ttfb.labels(endpoint).observe(event.ttfb)
+        if event.decode is not None:
+            self.decode.labels(endpoint).observe(event.decode)
+        if event.wire_bytes is not None:
+            self.bytes.labels(endpoint, "wire").inc(event.wire_bytes)
+        if event.body_bytes is not None:
+            self.bytes.labels(endpoint, "body").inc(event.body_bytes)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        self.in_flight.labels(event.endpoint).dec()
+        self.retries.labels(event.endpoint, _reason(event)).inc()
+
+    def on_error(self, event: RequestEvent) -> None:
+        endpoint = event.endpoint
+        self.in_flight.labels(endpoint).dec()
+        self.errors.labels(endpoint, _reason(event)).inc()
+        self.requests.labels(endpoint, event.method, _reason(event)).inc()
+
+
+class OpenTelemetryHooks:
+    """
+    Record OpenTelemetry metrics (and, optionally, client spans).
+
+    Uses the global meter / tracer providers unless others are passed.
+    Instruments follow the HTTP client semantic conventions where one
+    exists: ``http.client.request.duration`` and
+    ``http.client.response.body.size``, plus ``finbrain.client.decode.duration``
+    and ``finbrain.client.retries``. Attributes are ``http.request.method``,
+    ``url.template`` (:func:`finbrain.hooks.endpoint_label`),
+    ``http.response.status_code`` and ``error.type``.
+
+    With ``spans=True`` a ``CLIENT`` span is recorded per attempt, back-dated
+    to when the attempt started.
+    """
+
+    def __init__(
+        self, meter_provider: Any = None, tracer_provider: Any = None, *, spans: bool = True
+    ) -> None:
+        from . import __version__
+
+        metrics = _require("opentelemetry.metrics", "otel")
+        meter = metrics.get_meter("finbrain", __version__, meter_provider=meter_provider)
+        self.duration = meter.create_histogram(
+            "http.client.request.duration", unit="s", description="FinBrain API request duration"
+        )
+        self.body_size = meter.create_histogram(
+            "http.client.response.body.size", unit="By", description="Response body size (wire)"
+        )
+        self.decode = meter.create_histogram(
+            "finbrain.client.decode.duration", unit="s", description="JSON decode time"
+        )
+        self.retries = meter.create_counter(
+            "finbrain.client.retries", description="Retried FinBrain API attempts"
+        )
+        self._trace: Any = None
+        self.tracer: Any = None
+        if spans:
+            self._trace = _require("opentelemetry.trace", "otel")
+            self.tracer = self._trace.get_tracer(
+                "finbrain", __version__, tracer_provider=tracer_provider
+            )
+
+    @staticmethod
+    def _attributes(event: RequestEvent) -> Dict[str, Any]:
+        attrs: Dict[str, Any] = {
+            "http.request.method": event.method,
+            "url.template": event.endpoint,
+        }
+        if event.status is not None:
+            attrs["http.response.status_code"] = event.status
+        if event.error is not None or (event.status or 0) >= 400:
+            attrs["error.type"] = _reason(event)
+        return attrs
+
+    def _span(self, event: RequestEvent, attrs: Dict[str, Any]) -> None:
+        if self.tracer is None or event.total is None:
+            return
+        end = time.time_ns()
+        span = self.tracer.start_span(
+            f"{event.method} {event.endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=end - int(event.total * 1e9),
+            attributes={**attrs, "http.request.resend_count": event.attempt - 1},
+        )
+        if "error.type" in attrs:
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end(end_time=end)
+
+    def on_response(self, event: RequestEvent) -> None:
+        attrs = self._attributes(event)
+        if event.total is not None:
+            self.duration.record(event.total, attrs)
+        if event.wire_bytes is not None:
+            self.body_size.record(event.wire_bytes, attrs)
+        if event.decode is not None:
+            self.decode.record(event.decode, attrs)
+        self._span(event, attrs)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        attrs = self._attributes(event)
+        self.retries.add(1, attrs)
+        if event.total is not None:
+            self.duration.record(event.total, attrs)
+        self._span(event, attrs)
+
+    def on_error(self, event: RequestEvent) -> None:
+        attrs = self._attributes(event)
+        if event.total is not None:
+            self.duration.record(event.total, attrs)
+        self._span(event, attrs)
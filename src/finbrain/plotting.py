@@ -1,13 +1,211 @@
 # src/finbrain/plotting.py
 from __future__ import annotations
-from typing import Literal, Union, TYPE_CHECKING
+import base64
+import datetime as _dt
+from typing import Any, Iterable, Literal, NamedTuple, Union, TYPE_CHECKING
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+
+from .endpoints._utils import normalize_symbols
 
 if TYPE_CHECKING:  # imported only by static-type tools
     from .client import FinBrainClient
 
+Renderer = Literal["svg", "webgl"]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Splits the points between the first and last into ``n_out - 2`` buckets
+    and keeps, from each, the point forming the largest triangle with the
+    previously kept point and the average of the next bucket. The visual
+    shape of the line (peaks, troughs, gaps in slope) survives far better
+    than with every-n-th-point decimation.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+        Numeric, x-sorted coordinates without NaNs.
+    n_out : int
+        Number of points to keep (at least 3).
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted positions of the kept points; ``arange(len(x))`` when there
+        are no more than ``n_out`` points.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float) - float(x[0])  # keep products well-scaled
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0], kept[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[hi:nxt].mean(), y[hi:nxt].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(area.argmax())
+        kept[i + 1] = a
+    return kept
+
+
+class JSONFormat(NamedTuple):
+    """
+    Options for :func:`figure_to_json` (pass one as ``as_json=``).
+
+    ``precision`` rounds float arrays to that many decimal places (``None``
+    keeps them as they are). ``typed_arrays`` encodes numeric arrays as
+    base64 typed arrays (``{"dtype": "f4", "bdata": ...}``), narrowed to the
+    smallest dtype that holds the rounded values. ``template=False`` drops
+    ``layout.template``, which is identical for every figure; send it once
+    with ``plotly.io.templates[name].to_plotly_json()`` instead. ``engine``
+    is handed to :func:`plotly.io.json.to_json_plotly` (``"auto"`` picks
+    orjson when installed).
+    """
+
+    precision: int | None = 4
+    typed_arrays: bool = True
+    template: bool = False
+    engine: str = "auto"
+
+
+AsJSON = Union[bool, Literal["compact"], JSONFormat]
+
+# numpy dtype -> plotly.js typed-array code
+_TYPED_ARRAYS = {
+    "int8": "i1", "uint8": "u1", "int16": "i2", "uint16": "u2",
+    "int32": "i4", "uint32": "u4", "float32": "f4", "float64": "f8",
+}
+_DAY_NS = 86_400 * 10**9
+
+
+def figure_to_json(fig: go.Figure, fmt: JSONFormat = JSONFormat()) -> str:
+    """
+    Serialize ``fig`` to a compact Plotly JSON string.
+
+    Works on :meth:`~plotly.graph_objects.Figure.to_plotly_json` and
+    rewrites only data arrays, recognised by their type: numpy arrays and
+    base64 typed arrays (``{"dtype": ..., "bdata": ...}``). Plotly keeps
+    fixed-size settings such as ``domain`` or axis ``range`` as plain lists,
+    so those pass through untouched. Floats are rounded to
+    ``fmt.precision``, numeric arrays become narrowed typed arrays, and
+    dates are written at the coarsest exact resolution (``"2024-01-02"``
+    rather than ``"2024-01-02T00:00:00.000000"``). The result loads in
+    plotly.js and :func:`plotly.io.from_json` like the output of
+    :meth:`plotly.graph_objects.Figure.to_json`.
+    """
+    spec = fig.to_plotly_json()
+    layout = spec.get("layout", {})
+    template = layout.pop("template", None)
+    data = [_compact_props(trace, fmt) for trace in spec.get("data", [])]
+    layout = _compact_props(layout, fmt)
+    if fmt.template and template is not None:
+        layout["template"] = template
+    return pio.json.to_json_plotly({"data": data, "layout": layout}, engine=fmt.engine)
+
+
+def _compact_props(props: dict, fmt: JSONFormat) -> dict:
+    """Compact every data array in a ``to_plotly_json()`` property dict."""
+    return {key: _compact_value(value, fmt) for key, value in props.items()}
+
+
+def _compact_value(value: Any, fmt: JSONFormat) -> Any:
+    if isinstance(value, np.ndarray):
+        return _compact_array(value, fmt)
+    if isinstance(value, dict):
+        if "bdata" in value and "dtype" in value:
+            return _compact_array(value, fmt)
+        return _compact_props(value, fmt)
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], dict):
+        # lists of sub-objects: parcoords dimensions, layout annotations, ...
+        return [_compact_value(v, fmt) for v in value]
+    return value
+
+
+def _compact_array(value: Any, fmt: JSONFormat) -> Any:
+    """Round, narrow and encode one data array; unknown shapes pass through."""
+    if isinstance(value, dict):
+        if "shape" in value or "bdata" not in value:
+            return value
+        arr = np.frombuffer(base64.b64decode(value["bdata"]), dtype="<" + value["dtype"])
+    elif isinstance(value, (list, tuple, np.ndarray)) and len(value):
+        arr = np.asarray(value)
+        if arr.dtype == object and isinstance(
+            next((v for v in arr if v is not None), None), (_dt.date, np.datetime64)
+        ):
+            arr = pd.to_datetime(arr).to_numpy()
+    else:
+        return value
+    if arr.ndim != 1:
+        return value
+
+    if arr.dtype.kind == "M":
+        return _compact_dates(arr)
+    if arr.dtype.kind not in "fiu":
+        return value
+    if arr.dtype.kind == "f" and fmt.precision is not None:
+        arr = np.round(arr, fmt.precision)
+    if not fmt.typed_arrays:
+        return arr.tolist()
+    arr = _narrow(arr, fmt.precision)
+    code = _TYPED_ARRAYS.get(arr.dtype.name)
+    if code is None:
+        return arr.tolist()
+    raw = np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder("<"))
+    return {"dtype": code, "bdata": base64.b64encode(raw.tobytes()).decode("ascii")}
+
+
+def _narrow(arr: np.ndarray, precision: int | None) -> np.ndarray:
+    """Smallest plotly.js dtype that holds ``arr`` exactly (at ``precision``)."""
+    if arr.dtype.kind == "f":
+        finite = np.isfinite(arr)
+        if finite.all() and (arr == np.round(arr)).all() and len(arr):
+            arr = arr.astype(np.int64)
+        elif precision is not None:
+            narrow = arr.astype(np.float32)
+            tolerance = 0.5 * 10.0**-precision
+            if np.allclose(narrow, arr, rtol=0, atol=tolerance, equal_nan=True):
+                return narrow
+            return arr
+        else:
+            return arr
+    lo, hi = int(arr.min()), int(arr.max())
+    for dtype in (np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return arr.astype(dtype)
+    return arr.astype(np.float64)
+
+
+def _compact_dates(arr: np.ndarray) -> list:
+    """ISO date strings at the coarsest resolution that loses nothing."""
+    arr = arr.astype("datetime64[ns]")
+    nat = np.isnat(arr)
+    ns = arr.view("i8")[~nat]
+    if (ns % _DAY_NS == 0).all():
+        unit = "D"
+    elif (ns % 10**9 == 0).all():
+        unit = "s"
+    else:
+        unit = "ms"
+    text = np.datetime_as_string(arr, unit=unit).astype(object)
+    text[nat] = None
+    return text.tolist()
+
 
 class _PlotNamespace:
     """
@@ -28,7 +226,7 @@ class _PlotNamespace:
         store: str = "play",
         date_from: str | None = None,
         date_to: str | None = None,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
         **kwargs,
@@ -128,7 +326,7 @@ class _PlotNamespace:
         if show and not as_json:
             fig.show()
             return None
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     # ────────────────────────────────────────────────────────────────────────────
     #  LinkedIn plot  •  bars = employeeCount  •  line = followerCount
@@ -139,7 +337,7 @@ class _PlotNamespace:
         *,
         date_from: str | None = None,
         date_to: str | None = None,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
         **kwargs,
@@ -199,7 +397,7 @@ class _PlotNamespace:
         if show and not as_json:
             fig.show()
             return None
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     # --------------------------------------------------------------------- #
     # Sentiment  → green/red bar                                             #
@@ -210,7 +408,7 @@ class _PlotNamespace:
         *,
         date_from: str | None = None,
         date_to: str | None = None,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
         **kw,
@@ -229,9 +427,11 @@ class _PlotNamespace:
         date_from, date_to : str or None, optional
             Inclusive date range in ``YYYY-MM-DD`` format.  If omitted,
             FinBrain returns its full available range.
-        as_json : bool, default ``False``
+        as_json : bool, "compact" or JSONFormat, default ``False``
             • ``False`` → return a :class:`plotly.graph_objects.Figure`.
             • ``True``  → return ``figure.to_json()`` (``str``).
+            • ``"compact"`` / :class:`JSONFormat` → return
+              :func:`figure_to_json` output (``str``).
         show : bool, default ``True``
             If ``True`` *and* ``as_json=False``, immediately display the
             figure via :meth:`plotly.graph_objects.Figure.show`.  When
@@ -263,21 +463,9 @@ class _PlotNamespace:
             **kw,
         )
 
-        # 2) build colour array: green for ≥0, red for <0
-        colors = np.where(
-            df["sentiment"] >= 0, "rgba(0,190,0,0.8)", "rgba(190,0,0,0.8)"
-        )
-
-        # 3) bar chart (index on x-axis, sentiment on y-axis)
+        # bar chart (index on x-axis, sentiment on y-axis)
         fig = go.Figure(
-            data=[
-                go.Bar(
-                    x=df.index,
-                    y=df["sentiment"],
-                    marker_color=colors,
-                    hovertemplate="<b>%{x|%Y-%m-%d}</b><br>Sentiment: %{y:.3f}<extra></extra>",
-                )
-            ],
+            data=self._sentiment_traces(df),
             layout=dict(
                 template=template,
                 title=f"News Sentiment · {ticker}",
@@ -291,7 +479,7 @@ class _PlotNamespace:
             fig.show()
             return None  # <- silences the echo
 
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     # --------------------------------------------------------------------- #
     # Put/Call ratios  → stacked bars + ratio line                           #
@@ -303,9 +491,11 @@ class _PlotNamespace:
         kind: str = "put_call",
         date_from=None,
         date_to=None,
-        as_json=False,
+        as_json: AsJSON = False,
         show=True,
         template="plotly_dark",
+        max_points: int | None = None,
+        renderer: Renderer = "svg",
         **kw,
     ):
         """
@@ -330,6 +520,12 @@ class _PlotNamespace:
             :class:`ValueError`.
         date_from, date_to, as_json, show, template, **kwargs
             Same semantics as :pymeth:`~_PlotNamespace.sentiments`.
+        max_points : int or None, optional
+            Downsample the put/call ratio line to about this many points
+            with :func:`lttb`; the volume bars are always drawn in full.
+        renderer : {"svg", "webgl"}, default "svg"
+            ``"webgl"`` draws the ratio line with
+            :class:`plotly.graph_objects.Scattergl`.
 
         Returns
         -------
@@ -343,6 +539,7 @@ class _PlotNamespace:
         ...                 date_from="2025-01-01",
         ...                 date_to="2025-05-31")
         """
+        self._check_line_options(max_points, renderer)
         if kind == "put_call":
             df: pd.DataFrame = self._fb.options.put_call(
                 ticker,
@@ -351,7 +548,9 @@ class _PlotNamespace:
                 as_dataframe=True,
                 **kw,
             )
-            fig = self._plot_put_call(df, ticker, template)  # helper below
+            fig = self._plot_put_call(
+                df, ticker, template, max_points=max_points, renderer=renderer
+            )  # helper below
         else:
             raise ValueError(f"Unknown kind '{kind}'. Supported values: 'put_call'")
 
@@ -359,7 +558,7 @@ class _PlotNamespace:
             fig.show()
             return None  # <- silences the echo
 
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     # --------------------------------------------------------------------- #
     # Predictions  → price + CI band                                         #
@@ -369,7 +568,7 @@ class _PlotNamespace:
         ticker: str,
         *,
         prediction_type: Literal["daily", "monthly"] = "daily",
-        as_json=False,
+        as_json: AsJSON = False,
         show=True,
         template="plotly_dark",
         **kw,
@@ -413,31 +612,13 @@ class _PlotNamespace:
         )
 
         # add the three lines
-        fig.add_scatter(x=df.index, y=df["mid"], mode="lines", name="Predicted")
-        fig.add_scatter(
-            x=df.index,
-            y=df["upper"],
-            mode="lines",
-            name="Upper CI",
-            line=dict(width=0),
-            showlegend=False,
-        )
-        fig.add_scatter(
-            x=df.index,
-            y=df["lower"],
-            mode="lines",
-            name="Lower CI",
-            line=dict(width=0),
-            fill="tonexty",
-            fillcolor="rgba(2,210,255,0.2)",
-            showlegend=False,
-        )
+        fig.add_traces(self._prediction_traces(df))
 
         if show and not as_json:
             fig.show()
             return None  # <- silences the echo
 
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     # --------------------------------------------------------------------- #
     # Insider Transactions  → markers on price chart                        #
@@ -447,9 +628,11 @@ class _PlotNamespace:
         ticker: str,
         price_data: pd.DataFrame,
         *,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
+        max_points: int | None = None,
+        renderer: Renderer = "svg",
         **kwargs,
     ):
         """
@@ -466,12 +649,21 @@ class _PlotNamespace:
             **User-provided** price history with a DatetimeIndex and a column
             containing prices (e.g. ``"close"``, ``"Close"``, or ``"price"``).
             The index must be timezone-naive or UTC.
-        as_json : bool, default False
-            If ``True``, return JSON string instead of Figure object.
+        as_json : bool, "compact" or JSONFormat, default False
+            If ``True``, return JSON string instead of Figure object;
+            ``"compact"`` or a :class:`JSONFormat` uses :func:`figure_to_json`.
         show : bool, default True
             If ``True`` and ``as_json=False``, display the figure immediately.
         template : str, default "plotly_dark"
             Plotly template name.
+        max_points : int or None, optional
+            Downsample the price line to about this many points with
+            Largest-Triangle-Three-Buckets (see :func:`lttb`), always keeping
+            the points event markers are anchored to. ``None`` plots every row.
+        renderer : {"svg", "webgl"}, default "svg"
+            ``"webgl"`` draws the price line and markers with
+            :class:`plotly.graph_objects.Scattergl`, which stays responsive
+            with hundreds of thousands of points.
         **kwargs
             Additional arguments passed to
             :meth:`FinBrainClient.insider_transactions.ticker`.
@@ -496,6 +688,7 @@ class _PlotNamespace:
         ... }).set_index("date")
         >>> fb.plot.insider_transactions("AAPL", price_df)
         """
+        self._check_line_options(max_points, renderer)
         price_data, price_col = self._resolve_price_column(price_data)
 
         # Fetch insider transactions
@@ -510,12 +703,14 @@ class _PlotNamespace:
             ticker=ticker,
             template=template,
             transaction_type="Insider",
+            max_points=max_points,
+            renderer=renderer,
         )
 
         if show and not as_json:
             fig.show()
             return None
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     # --------------------------------------------------------------------- #
     # House Trades  → markers on price chart                                #
@@ -527,9 +722,11 @@ class _PlotNamespace:
         *,
         date_from: str | None = None,
         date_to: str | None = None,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
+        max_points: int | None = None,
+        renderer: Renderer = "svg",
         **kwargs,
     ):
         """
@@ -548,12 +745,21 @@ class _PlotNamespace:
             The index must be timezone-naive or UTC.
         date_from, date_to : str or None, optional
             Date range for transactions in ``YYYY-MM-DD`` format.
-        as_json : bool, default False
-            If ``True``, return JSON string instead of Figure object.
+        as_json : bool, "compact" or JSONFormat, default False
+            If ``True``, return JSON string instead of Figure object;
+            ``"compact"`` or a :class:`JSONFormat` uses :func:`figure_to_json`.
         show : bool, default True
             If ``True`` and ``as_json=False``, display the figure immediately.
         template : str, default "plotly_dark"
             Plotly template name.
+        max_points : int or None, optional
+            Downsample the price line to about this many points with
+            Largest-Triangle-Three-Buckets (see :func:`lttb`), always keeping
+            the points event markers are anchored to. ``None`` plots every row.
+        renderer : {"svg", "webgl"}, default "svg"
+            ``"webgl"`` draws the price line and markers with
+            :class:`plotly.graph_objects.Scattergl`, which stays responsive
+            with hundreds of thousands of points.
         **kwargs
             Additional arguments passed to
             :meth:`FinBrainClient.house_trades.ticker`.
@@ -579,6 +785,7 @@ class _PlotNamespace:
         >>> fb.plot.house_trades("AAPL", price_df,
         ...                      date_from="2024-01-01", date_to="2024-12-31")
         """
+        self._check_line_options(max_points, renderer)
         price_data, price_col = self._resolve_price_column(price_data)
 
         # Fetch house trades
@@ -597,12 +804,14 @@ class _PlotNamespace:
             ticker=ticker,
             template=template,
             transaction_type="House",
+            max_points=max_points,
+            renderer=renderer,
         )
 
         if show and not as_json:
             fig.show()
             return None
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     # --------------------------------------------------------------------- #
     # Senate Trades  → markers on price chart                               #
@@ -614,9 +823,11 @@ class _PlotNamespace:
         *,
         date_from: str | None = None,
         date_to: str | None = None,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
+        max_points: int | None = None,
+        renderer: Renderer = "svg",
         **kwargs,
     ):
         """
@@ -635,12 +846,21 @@ class _PlotNamespace:
             The index must be timezone-naive or UTC.
         date_from, date_to : str or None, optional
             Date range for transactions in ``YYYY-MM-DD`` format.
-        as_json : bool, default False
-            If ``True``, return JSON string instead of Figure object.
+        as_json : bool, "compact" or JSONFormat, default False
+            If ``True``, return JSON string instead of Figure object;
+            ``"compact"`` or a :class:`JSONFormat` uses :func:`figure_to_json`.
         show : bool, default True
             If ``True`` and ``as_json=False``, display the figure immediately.
         template : str, default "plotly_dark"
             Plotly template name.
+        max_points : int or None, optional
+            Downsample the price line to about this many points with
+            Largest-Triangle-Three-Buckets (see :func:`lttb`), always keeping
+            the points event markers are anchored to. ``None`` plots every row.
+        renderer : {"svg", "webgl"}, default "svg"
+            ``"webgl"`` draws the price line and markers with
+            :class:`plotly.graph_objects.Scattergl`, which stays responsive
+            with hundreds of thousands of points.
         **kwargs
             Additional arguments passed to
             :meth:`FinBrainClient.senate_trades.ticker`.
@@ -666,6 +886,7 @@ class _PlotNamespace:
         >>> fb.plot.senate_trades("META", price_df,
         ...                       date_from="2024-01-01", date_to="2024-12-31")
         """
+        self._check_line_options(max_points, renderer)
         price_data, price_col = self._resolve_price_column(price_data)
 
         # Fetch senate trades
@@ -684,12 +905,14 @@ class _PlotNamespace:
             ticker=ticker,
             template=template,
             transaction_type="Senate",
+            max_points=max_points,
+            renderer=renderer,
         )
 
         if show and not as_json:
             fig.show()
             return None
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     # --------------------------------------------------------------------- #
     # Corporate Lobbying  → bars on price chart                              #
@@ -701,9 +924,11 @@ class _PlotNamespace:
         *,
         date_from: str | None = None,
         date_to: str | None = None,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
+        max_points: int | None = None,
+        renderer: Renderer = "svg",
         **kwargs,
     ):
         """
@@ -722,12 +947,21 @@ class _PlotNamespace:
             The index must be timezone-naive or UTC.
         date_from, date_to : str or None, optional
             Date range for filings in ``YYYY-MM-DD`` format.
-        as_json : bool, default False
-            If ``True``, return JSON string instead of Figure object.
+        as_json : bool, "compact" or JSONFormat, default False
+            If ``True``, return JSON string instead of Figure object;
+            ``"compact"`` or a :class:`JSONFormat` uses :func:`figure_to_json`.
         show : bool, default True
             If ``True`` and ``as_json=False``, display the figure immediately.
         template : str, default "plotly_dark"
             Plotly template name.
+        max_points : int or None, optional
+            Downsample the price line to about this many points with
+            Largest-Triangle-Three-Buckets (see :func:`lttb`), always keeping
+            the points event markers are anchored to. ``None`` plots every row.
+        renderer : {"svg", "webgl"}, default "svg"
+            ``"webgl"`` draws the price line and markers with
+            :class:`plotly.graph_objects.Scattergl`, which stays responsive
+            with hundreds of thousands of points.
         **kwargs
             Additional arguments passed to
             :meth:`FinBrainClient.corporate_lobbying.ticker`.
@@ -742,6 +976,7 @@ class _PlotNamespace:
         ValueError
             If ``price_data`` is empty or missing required price column.
         """
+        self._check_line_options(max_points, renderer)
         price_data, price_col = self._resolve_price_column(price_data)
 
         # Fetch lobbying filings
@@ -766,13 +1001,11 @@ class _PlotNamespace:
         )
 
         # Plot price line on primary y-axis
-        fig.add_scatter(
-            name="Price",
-            x=price_data_normalized.index,
-            y=price_data_normalized[price_col],
-            mode="lines",
-            line=dict(width=2, color="#02d2ff"),
-            hovertemplate="<b>%{x|%Y-%m-%d}</b><br>Price: $%{y:.2f}<extra></extra>",
+        self._add_price_line(
+            fig,
+            price_data_normalized[price_col],
+            max_points=max_points,
+            renderer=renderer,
         )
 
         if not filings_df.empty:
@@ -822,7 +1055,7 @@ class _PlotNamespace:
         if show and not as_json:
             fig.show()
             return None
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     # --------------------------------------------------------------------- #
     # Reddit Mentions  → bars on price chart                                 #
@@ -834,9 +1067,11 @@ class _PlotNamespace:
         *,
         date_from: str | None = None,
         date_to: str | None = None,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
+        max_points: int | None = None,
+        renderer: Renderer = "svg",
         **kwargs,
     ):
         """
@@ -855,12 +1090,21 @@ class _PlotNamespace:
             The index must be timezone-naive or UTC.
         date_from, date_to : str or None, optional
             Date range for mentions in ``YYYY-MM-DD`` format.
-        as_json : bool, default False
-            If ``True``, return JSON string instead of Figure object.
+        as_json : bool, "compact" or JSONFormat, default False
+            If ``True``, return JSON string instead of Figure object;
+            ``"compact"`` or a :class:`JSONFormat` uses :func:`figure_to_json`.
         show : bool, default True
             If ``True`` and ``as_json=False``, display the figure immediately.
         template : str, default "plotly_dark"
             Plotly template name.
+        max_points : int or None, optional
+            Downsample the price line to about this many points with
+            Largest-Triangle-Three-Buckets (see :func:`lttb`), always keeping
+            the points event markers are anchored to. ``None`` plots every row.
+        renderer : {"svg", "webgl"}, default "svg"
+            ``"webgl"`` draws the price line and markers with
+            :class:`plotly.graph_objects.Scattergl`, which stays responsive
+            with hundreds of thousands of points.
         **kwargs
             Additional arguments passed to
             :meth:`FinBrainClient.reddit_mentions.ticker`.
@@ -875,6 +1119,7 @@ class _PlotNamespace:
         ValueError
             If ``price_data`` is empty or missing required price column.
         """
+        self._check_line_options(max_points, renderer)
         price_data, price_col = self._resolve_price_column(price_data)
 
         # Fetch Reddit mentions
@@ -899,13 +1144,12 @@ class _PlotNamespace:
         )
 
         # Plot price line on primary y-axis
-        fig.add_scatter(
-            name="Price",
-            x=price_data_normalized.index,
-            y=price_data_normalized[price_col],
-            mode="lines",
-            line=dict(width=2, color="#02d2ff"),
-            hovertemplate="<b>%{x|%Y-%m-%d %H:%M}</b><br>Price: $%{y:.2f}<extra></extra>",
+        self._add_price_line(
+            fig,
+            price_data_normalized[price_col],
+            max_points=max_points,
+            renderer=renderer,
+            hover_fmt="%Y-%m-%d %H:%M",
         )
 
         if not mentions_df.empty:
@@ -946,7 +1190,7 @@ class _PlotNamespace:
         if show and not as_json:
             fig.show()
             return None
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     # --------------------------------------------------------------------- #
     # Reddit Mentions Screener  → stacked horizontal bars (top N tickers)    #
@@ -958,7 +1202,7 @@ class _PlotNamespace:
         market: str | None = None,
         region: str | None = None,
         limit: int | None = None,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
         **kwargs,
@@ -977,8 +1221,9 @@ class _PlotNamespace:
             Filter by region (e.g. ``"US"``).
         limit : int or None, optional
             Maximum records to fetch from the screener API.
-        as_json : bool, default False
-            If ``True``, return JSON string instead of Figure object.
+        as_json : bool, "compact" or JSONFormat, default False
+            If ``True``, return JSON string instead of Figure object;
+            ``"compact"`` or a :class:`JSONFormat` uses :func:`figure_to_json`.
         show : bool, default True
             If ``True`` and ``as_json=False``, display the figure immediately.
         template : str, default "plotly_dark"
@@ -991,7 +1236,7 @@ class _PlotNamespace:
         -------
         plotly.graph_objects.Figure or str or None
         """
-        data = self._fb.screener.reddit_mentions(
+        data: Any = self._fb.screener.reddit_mentions(
             market=market,
             region=region,
             limit=limit,
@@ -1046,7 +1291,7 @@ class _PlotNamespace:
         if show and not as_json:
             fig.show()
             return None
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     # --------------------------------------------------------------------- #
     # Government Contracts  → bars on price chart                            #
@@ -1058,9 +1303,11 @@ class _PlotNamespace:
         *,
         date_from: str | None = None,
         date_to: str | None = None,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
+        max_points: int | None = None,
+        renderer: Renderer = "svg",
         **kwargs,
     ):
         """
@@ -1079,12 +1326,21 @@ class _PlotNamespace:
             The index must be timezone-naive or UTC.
         date_from, date_to : str or None, optional
             Date range for contracts in ``YYYY-MM-DD`` format.
-        as_json : bool, default False
-            If ``True``, return JSON string instead of Figure object.
+        as_json : bool, "compact" or JSONFormat, default False
+            If ``True``, return JSON string instead of Figure object;
+            ``"compact"`` or a :class:`JSONFormat` uses :func:`figure_to_json`.
         show : bool, default True
             If ``True`` and ``as_json=False``, display the figure immediately.
         template : str, default "plotly_dark"
             Plotly template name.
+        max_points : int or None, optional
+            Downsample the price line to about this many points with
+            Largest-Triangle-Three-Buckets (see :func:`lttb`), always keeping
+            the points event markers are anchored to. ``None`` plots every row.
+        renderer : {"svg", "webgl"}, default "svg"
+            ``"webgl"`` draws the price line and markers with
+            :class:`plotly.graph_objects.Scattergl`, which stays responsive
+            with hundreds of thousands of points.
         **kwargs
             Additional arguments passed to
             :meth:`FinBrainClient.government_contracts.ticker`.
@@ -1099,6 +1355,7 @@ class _PlotNamespace:
         ValueError
             If ``price_data`` is empty or missing required price column.
         """
+        self._check_line_options(max_points, renderer)
         price_data, price_col = self._resolve_price_column(price_data)
 
         # Fetch government contracts
@@ -1123,13 +1380,11 @@ class _PlotNamespace:
         )
 
         # Plot price line on primary y-axis
-        fig.add_scatter(
-            name="Price",
-            x=price_data_normalized.index,
-            y=price_data_normalized[price_col],
-            mode="lines",
-            line=dict(width=2, color="#02d2ff"),
-            hovertemplate="<b>%{x|%Y-%m-%d}</b><br>Price: $%{y:.2f}<extra></extra>",
+        self._add_price_line(
+            fig,
+            price_data_normalized[price_col],
+            max_points=max_points,
+            renderer=renderer,
         )
 
         if not contracts_df.empty:
@@ -1177,7 +1432,7 @@ class _PlotNamespace:
         if show and not as_json:
             fig.show()
             return None
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     def patent_filings(
         self,
@@ -1186,9 +1441,11 @@ class _PlotNamespace:
         *,
         date_from: str | None = None,
         date_to: str | None = None,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
+        max_points: int | None = None,
+        renderer: Renderer = "svg",
         **kwargs,
     ):
         """
@@ -1209,12 +1466,21 @@ class _PlotNamespace:
             The index must be timezone-naive or UTC.
         date_from, date_to : str or None, optional
             Date range for patents in ``YYYY-MM-DD`` format (filters grant date).
-        as_json : bool, default False
-            If ``True``, return JSON string instead of Figure object.
+        as_json : bool, "compact" or JSONFormat, default False
+            If ``True``, return JSON string instead of Figure object;
+            ``"compact"`` or a :class:`JSONFormat` uses :func:`figure_to_json`.
         show : bool, default True
             If ``True`` and ``as_json=False``, display the figure immediately.
         template : str, default "plotly_dark"
             Plotly template name.
+        max_points : int or None, optional
+            Downsample the price line to about this many points with
+            Largest-Triangle-Three-Buckets (see :func:`lttb`), always keeping
+            the points event markers are anchored to. ``None`` plots every row.
+        renderer : {"svg", "webgl"}, default "svg"
+            ``"webgl"`` draws the price line and markers with
+            :class:`plotly.graph_objects.Scattergl`, which stays responsive
+            with hundreds of thousands of points.
         **kwargs
             Additional arguments passed to
             :meth:`FinBrainClient.patent_filings.ticker`.
@@ -1229,6 +1495,7 @@ class _PlotNamespace:
         ValueError
             If ``price_data`` is empty or missing required price column.
         """
+        self._check_line_options(max_points, renderer)
         price_data, price_col = self._resolve_price_column(price_data)
 
         # Fetch patent filings
@@ -1253,13 +1520,11 @@ class _PlotNamespace:
         )
 
         # Plot price line on primary y-axis
-        fig.add_scatter(
-            name="Price",
-            x=price_data_normalized.index,
-            y=price_data_normalized[price_col],
-            mode="lines",
-            line=dict(width=2, color="#02d2ff"),
-            hovertemplate="<b>%{x|%Y-%m-%d}</b><br>Price: $%{y:.2f}<extra></extra>",
+        self._add_price_line(
+            fig,
+            price_data_normalized[price_col],
+            max_points=max_points,
+            renderer=renderer,
         )
 
         if not patents_df.empty:
@@ -1307,7 +1572,7 @@ class _PlotNamespace:
         if show and not as_json:
             fig.show()
             return None
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
 
     def analyst_ratings(
         self,
@@ -1316,9 +1581,11 @@ class _PlotNamespace:
         *,
         date_from: str | None = None,
         date_to: str | None = None,
-        as_json: bool = False,
+        as_json: AsJSON = False,
         show: bool = True,
         template: str = "plotly_dark",
+        max_points: int | None = None,
+        renderer: Renderer = "svg",
         **kwargs,
     ):
         """
@@ -1341,12 +1608,21 @@ class _PlotNamespace:
             The index must be timezone-naive or UTC.
         date_from, date_to : str or None, optional
             Date range for ratings in ``YYYY-MM-DD`` format.
-        as_json : bool, default False
-            If ``True``, return JSON string instead of Figure object.
+        as_json : bool, "compact" or JSONFormat, default False
+            If ``True``, return JSON string instead of Figure object;
+            ``"compact"`` or a :class:`JSONFormat` uses :func:`figure_to_json`.
         show : bool, default True
             If ``True`` and ``as_json=False``, display the figure immediately.
         template : str, default "plotly_dark"
             Plotly template name.
+        max_points : int or None, optional
+            Downsample the price line to about this many points with
+            Largest-Triangle-Three-Buckets (see :func:`lttb`), always keeping
+            the points event markers are anchored to. ``None`` plots every row.
+        renderer : {"svg", "webgl"}, default "svg"
+            ``"webgl"`` draws the price line and markers with
+            :class:`plotly.graph_objects.Scattergl`, which stays responsive
+            with hundreds of thousands of points.
         **kwargs
             Additional arguments passed to
             :meth:`FinBrainClient.analyst_ratings.ticker`.
@@ -1361,6 +1637,7 @@ class _PlotNamespace:
         ValueError
             If ``price_data`` is empty or missing required price column.
         """
+        self._check_line_options(max_points, renderer)
         price_data, price_col = self._resolve_price_column(price_data)
 
         # Fetch analyst ratings
@@ -1374,6 +1651,7 @@ class _PlotNamespace:
 
         # Normalize timezones
         price_data_normalized = self._to_naive_index(price_data)
+        ratings_normalized = self._to_naive_index(ratings_df)
 
         fig = go.Figure(
             layout=dict(
@@ -1386,30 +1664,24 @@ class _PlotNamespace:
         )
 
         # Plot price line on primary y-axis
-        fig.add_scatter(
-            name="Price",
-            x=price_data_normalized.index,
-            y=price_data_normalized[price_col],
-            mode="lines",
-            line=dict(width=2, color="#02d2ff"),
-            hovertemplate="<b>%{x|%Y-%m-%d}</b><br>Price: $%{y:.2f}<extra></extra>",
+        self._add_price_line(
+            fig,
+            price_data_normalized[price_col],
+            max_points=max_points,
+            renderer=renderer,
+            anchors=ratings_normalized.index,
         )
 
-        if not ratings_df.empty:
-            ratings_normalized = self._to_naive_index(ratings_df)
-
+        if not ratings_normalized.empty:
+            when = ratings_normalized.index
             targets = pd.to_numeric(
-                ratings_normalized.get("targetPrice"), errors="coerce"
-            )
-
-            def _price_at(when):
-                """Nearest available price for a rating date."""
-                if when in price_data_normalized.index:
-                    return price_data_normalized.loc[when, price_col]
-                idx = price_data_normalized.index.get_indexer([when], method="nearest")[0]
-                if 0 <= idx < len(price_data_normalized):
-                    return price_data_normalized.iloc[idx][price_col]
-                return None
+                ratings_normalized.get("targetPrice", pd.Series(np.nan, index=when)),
+                errors="coerce",
+            ).to_numpy(dtype=float)
+            has_target = ~np.isnan(targets)
+            # one batched nearest-date lookup for every rating
+            prices = self._anchor_prices(price_data_normalized[price_col], when)
+            y_vals = np.where(has_target, targets, prices)
 
             # action category → (legend label, colour)
             categories = {
@@ -1420,73 +1692,228 @@ class _PlotNamespace:
                 "other": ("Other", "#f9c80e"),
             }
 
-            def _categorize(action: str) -> str:
-                a = str(action).lower()
-                if "upgrade" in a:
-                    return "upgrade"
-                if "downgrade" in a:
-                    return "downgrade"
-                if "initiat" in a:
-                    return "initiate"
-                if any(k in a for k in ("maintain", "reiterat", "reaffirm", "hold")):
-                    return "maintain"
-                return "other"
-
-            # Bucket each rating row by action category
-            buckets: dict[str, dict[str, list]] = {
-                key: {"x": [], "y": [], "symbol": [], "hover": []}
-                for key in categories
-            }
-
-            for pos, (when, row) in enumerate(ratings_normalized.iterrows()):
-                target = targets.iloc[pos]
-                has_target = pd.notna(target)
-                y_val = target if has_target else _price_at(when)
-                if y_val is None:
-                    continue
+            actions = self._text_column(ratings_normalized, "action", "")
+            lowered = actions.str.lower()
+            category = np.select(
+                [
+                    lowered.str.contains("upgrade", regex=False),
+                    lowered.str.contains("downgrade", regex=False),
+                    lowered.str.contains("initiat", regex=False),
+                    lowered.str.contains("maintain|reiterat|reaffirm|hold"),
+                ],
+                ["upgrade", "downgrade", "initiate", "maintain"],
+                default="other",
+            )
 
-                cat = _categorize(row.get("action", ""))
-                bucket = buckets[cat]
-                bucket["x"].append(when)
-                bucket["y"].append(y_val)
-                # diamond = plotted at target, open circle = plotted at price
-                bucket["symbol"].append("diamond" if has_target else "circle-open")
-                target_str = f"${target:,.2f}" if has_target else "n/a"
-                bucket["hover"].append(
-                    f"Institution: {row.get('institution', 'N/A')}<br>"
-                    f"Action: {row.get('action', 'N/A')}<br>"
-                    f"Rating: {row.get('rating', 'N/A')}<br>"
-                    f"Target: {target_str}"
-                )
+            # diamond = plotted at target, open circle = plotted at price
+            symbols = np.where(has_target, "diamond", "circle-open")
+            target_str = pd.Series(targets).map("${:,.2f}".format).where(
+                has_target, "n/a"
+            )
+            hover = (
+                "Institution: "
+                + self._text_column(ratings_normalized, "institution")
+                + "<br>Action: "
+                + self._text_column(ratings_normalized, "action")
+                + "<br>Rating: "
+                + self._text_column(ratings_normalized, "rating")
+                + "<br>Target: "
+                + target_str.to_numpy()
+            ).to_numpy()
+
+            plotted = ~np.isnan(y_vals)
+            add_scatter = self._scatter_adder(fig, renderer)
 
             for key, (label, color) in categories.items():
-                bucket = buckets[key]
-                if not bucket["x"]:
+                mask = plotted & (category == key)
+                if not mask.any():
                     continue
-                fig.add_scatter(
+                add_scatter(
                     name=label,
-                    x=bucket["x"],
-                    y=bucket["y"],
+                    x=when[mask],
+                    y=y_vals[mask],
                     mode="markers",
                     marker=dict(
                         size=10,
                         color=color,
-                        symbol=bucket["symbol"],
+                        symbol=symbols[mask],
                         line=dict(width=1, color="#000000"),
                     ),
-                    hovertext=bucket["hover"],
+                    hovertext=hover[mask],
                     hovertemplate="<b>%{x|%Y-%m-%d}</b><br>%{hovertext}<extra></extra>",
                 )
 
         if show and not as_json:
             fig.show()
             return None
-        return fig.to_json() if as_json else fig
+        return self._to_json(fig, as_json) if as_json else fig
+
+    # --------------------------------------------------------------------- #
+    # Watchlist grid  → one small-multiples figure for many tickers          #
+    # --------------------------------------------------------------------- #
+    def grid(
+        self,
+        kind: Literal["sentiments", "predictions"],
+        symbols: Iterable[str],
+        *,
+        cols: int = 4,
+        max_workers: int = 8,
+        shared_yaxes: bool = False,
+        as_json: AsJSON = False,
+        show: bool = True,
+        template: str = "plotly_dark",
+        **kwargs,
+    ):
+        """
+        Plot many tickers as small multiples in a single figure.
+
+        All symbols are fetched concurrently with the endpoint's
+        ``ticker_many`` (one thread pool sharing the client's HTTP session),
+        then drawn into one :func:`plotly.subplots.make_subplots` grid with
+        linked date axes. Showing the result loads plotly.js once, instead of
+        once per ticker.
+
+        Parameters
+        ----------
+        kind : {'sentiments', 'predictions'}
+            Which chart to draw in every panel, as in :meth:`sentiments` /
+            :meth:`predictions`. Unknown values raise :class:`ValueError`.
+        symbols : iterable of str
+            Ticker symbols; upper-cased and de-duplicated, in panel order.
+        cols : int, default 4
+            Panels per row.
+        max_workers : int, default 8
+            Number of concurrent requests.
+        shared_yaxes : bool, default False
+            Put every panel on the same y-range (handy for sentiment scores).
+        as_json, show, template
+            Same semantics as :pymeth:`~_PlotNamespace.sentiments`.
+        **kwargs
+            Forwarded to ``ticker_many`` (``date_from`` / ``date_to`` for
+            sentiments, ``prediction_type`` for predictions).
+
+        Returns
+        -------
+        plotly.graph_objects.Figure or str or None
+            As described for :pymeth:`~_PlotNamespace.sentiments`. Symbols
+            whose request failed keep an empty panel titled with the error.
+
+        Examples
+        --------
+        >>> fb.plot.grid("sentiments", ["AAPL", "MSFT", "NVDA", "AMZN"],
+        ...              cols=2, date_from="2025-01-01")
+        """
+        if cols < 1:
+            raise ValueError("cols must be >= 1")
+        api: Any
+        if kind == "sentiments":
+            api, build = self._fb.sentiments, self._sentiment_traces
+        elif kind == "predictions":
+            api = self._fb.predictions
+
+            def build(df: pd.DataFrame) -> list:
+                return self._prediction_traces(df, color="#02d2ff")
+
+        else:
+            raise ValueError(
+                f"Unknown kind '{kind}'. Supported values: 'sentiments', 'predictions'"
+            )
+        syms = normalize_symbols(symbols)
+        if not syms:
+            raise ValueError("symbols must not be empty")
+
+        # one concurrent fetch for every panel
+        frame: pd.DataFrame = api.ticker_many(
+            syms, max_workers=max_workers, as_dataframe=True, **kwargs
+        )
+        errors = frame.attrs.get("errors", {})
+        fetched = (
+            set(frame.index.get_level_values("symbol")) if not frame.empty else set()
+        )
+
+        cols = min(cols, len(syms))
+        rows = -(-len(syms) // cols)
+        titles = [
+            sym if sym in fetched
+            else f"{sym} · {type(errors[sym]).__name__ if sym in errors else 'no data'}"
+            for sym in syms
+        ]
+        fig = make_subplots(
+            rows=rows,
+            cols=cols,
+            shared_xaxes="all",
+            shared_yaxes="all" if shared_yaxes else False,
+            subplot_titles=titles,
+            vertical_spacing=0.3 / rows,
+            horizontal_spacing=0.04,
+        )
+        for i, sym in enumerate(syms):
+            if sym not in fetched:
+                continue
+            row, col = divmod(i, cols)
+            for trace in build(frame.xs(sym, level="symbol")):
+                fig.add_trace(trace, row=row + 1, col=col + 1)
+
+        fig.update_layout(
+            template=template,
+            title=f"{kind.capitalize()} · {len(syms)} tickers",
+            height=120 + 200 * rows,
+            hovermode="x unified",
+            showlegend=False,
+        )
+
+        if show and not as_json:
+            fig.show()
+            return None
+        return self._to_json(fig, as_json) if as_json else fig
 
     # --------------------------------------------------------------------- #
     # Helper methods                                                         #
     # --------------------------------------------------------------------- #
 
+    @staticmethod
+    def _sentiment_traces(df: pd.DataFrame) -> list:
+        """Sentiment bars: green for a score ≥ 0, red below."""
+        colors = np.where(
+            df["sentiment"] >= 0, "rgba(0,190,0,0.8)", "rgba(190,0,0,0.8)"
+        )
+        return [
+            go.Bar(
+                x=df.index,
+                y=df["sentiment"],
+                marker_color=colors,
+                hovertemplate="<b>%{x|%Y-%m-%d}</b><br>Sentiment: %{y:.3f}<extra></extra>",
+            )
+        ]
+
+    @staticmethod
+    def _prediction_traces(df: pd.DataFrame, color: str | None = None) -> list:
+        """Predicted price line with its shaded confidence band."""
+        return [
+            go.Scatter(
+                x=df.index, y=df["mid"], mode="lines", name="Predicted",
+                line=dict(color=color) if color else None,
+            ),
+            go.Scatter(
+                x=df.index,
+                y=df["upper"],
+                mode="lines",
+                name="Upper CI",
+                line=dict(width=0),
+                showlegend=False,
+            ),
+            go.Scatter(
+                x=df.index,
+                y=df["lower"],
+                mode="lines",
+                name="Lower CI",
+                line=dict(width=0),
+                fill="tonexty",
+                fillcolor="rgba(2,210,255,0.2)",
+                showlegend=False,
+            ),
+        ]
+
     @staticmethod
     def _resolve_price_column(price_data: pd.DataFrame) -> tuple[pd.DataFrame, str]:
         """
@@ -1536,6 +1963,107 @@ class _PlotNamespace:
             out.index = out.index.tz_localize(None)
         return out
 
+    @staticmethod
+    def _anchor_prices(prices: pd.Series, dates: pd.Index) -> np.ndarray:
+        """
+        Nearest available price for every date in ``dates``.
+
+        Resolves all event dates with a single ``get_indexer`` call instead
+        of one lookup per marker, so placing thousands of markers costs about
+        the same as placing ten. Dates that cannot be matched map to NaN.
+        """
+        prices = _PlotNamespace._price_curve(prices)
+        pos = prices.index.get_indexer(dates, method="nearest")
+        values = pd.to_numeric(prices, errors="coerce").to_numpy(dtype=float)
+        found = (pos >= 0) & ~pd.isna(dates)
+        return np.where(found, values[pos], np.nan)
+
+    @staticmethod
+    def _to_json(fig: go.Figure, as_json: AsJSON) -> str:
+        """Serialize for ``as_json``: plotly's own JSON, or :func:`figure_to_json`."""
+        if as_json is True:
+            return fig.to_json()
+        if as_json == "compact":
+            return figure_to_json(fig)
+        if isinstance(as_json, JSONFormat):
+            return figure_to_json(fig, as_json)
+        raise ValueError(
+            f"as_json must be a bool, 'compact' or a JSONFormat, got {as_json!r}"
+        )
+
+    @staticmethod
+    def _price_curve(prices: pd.Series) -> pd.Series:
+        """``prices`` sorted by date with duplicate timestamps collapsed."""
+        return prices[~prices.index.duplicated(keep="last")].sort_index()
+
+    @staticmethod
+    def _check_line_options(max_points: int | None, renderer: str) -> None:
+        """Validate the ``max_points`` / ``renderer`` plotting options."""
+        if renderer not in ("svg", "webgl"):
+            raise ValueError(f"renderer must be 'svg' or 'webgl', got {renderer!r}")
+        if max_points is not None and max_points < 3:
+            raise ValueError("max_points must be at least 3")
+
+    @staticmethod
+    def _scatter_adder(fig: go.Figure, renderer: str):
+        """``fig.add_scattergl`` for the WebGL renderer, else ``fig.add_scatter``."""
+        return fig.add_scattergl if renderer == "webgl" else fig.add_scatter
+
+    @classmethod
+    def _downsample(
+        cls,
+        series: pd.Series,
+        max_points: int | None,
+        anchors: pd.Index | None = None,
+    ) -> pd.Series:
+        """
+        Reduce a dated ``series`` to about ``max_points`` rows with :func:`lttb`.
+
+        The series is date-sorted and NaNs are dropped first. The rows nearest
+        to each date in ``anchors`` are kept as well, so markers placed with
+        :meth:`_anchor_prices` still sit on the line. Series no longer than
+        ``max_points`` (or ``max_points=None``) are returned unchanged.
+        """
+        if max_points is None or len(series) <= max_points:
+            return series
+        series = cls._price_curve(series)
+        series = series[pd.to_numeric(series, errors="coerce").notna()]
+        x = (series.index - series.index[0]) / pd.Timedelta(seconds=1)
+        kept = lttb(np.asarray(x), series.to_numpy(dtype=float), max_points)
+        if anchors is not None and len(anchors):
+            pos = series.index.get_indexer(anchors, method="nearest")
+            kept = np.union1d(kept, pos[(pos >= 0) & ~pd.isna(anchors)])
+        return series.iloc[kept]
+
+    @classmethod
+    def _add_price_line(
+        cls,
+        fig: go.Figure,
+        prices: pd.Series,
+        *,
+        max_points: int | None = None,
+        renderer: str = "svg",
+        anchors: pd.Index | None = None,
+        hover_fmt: str = "%Y-%m-%d",
+    ) -> None:
+        """Draw the price line, downsampled with :meth:`_downsample`."""
+        prices = cls._downsample(prices, max_points, anchors)
+        cls._scatter_adder(fig, renderer)(
+            name="Price",
+            x=prices.index,
+            y=prices,
+            mode="lines",
+            line=dict(width=2, color="#02d2ff"),
+            hovertemplate=f"<b>%{{x|{hover_fmt}}}</b><br>Price: $%{{y:.2f}}<extra></extra>",
+        )
+
+    @staticmethod
+    def _text_column(df: pd.DataFrame, col: str, default: str = "N/A") -> pd.Series:
+        """``df[col]`` as strings with a positional index; ``default`` fills gaps."""
+        if col not in df.columns:
+            return pd.Series(default, index=range(len(df)), dtype=object)
+        return df[col].astype(object).fillna(default).astype(str).reset_index(drop=True)
+
     def _plot_transactions_on_price(
         self,
         price_data: pd.DataFrame,
@@ -1544,6 +2072,8 @@ class _PlotNamespace:
         ticker: str,
         template: str,
         transaction_type: str,
+        max_points: int | None = None,
+        renderer: Renderer = "svg",
     ) -> go.Figure:
         """
         Helper to plot transaction markers on a price chart.
@@ -1563,6 +2093,8 @@ class _PlotNamespace:
             Plotly template.
         transaction_type : str
             "Insider" or "House" for labeling.
+        max_points, renderer
+            Price-line downsampling and renderer; see :meth:`insider_transactions`.
 
         Returns
         -------
@@ -1583,14 +2115,13 @@ class _PlotNamespace:
             )
         )
 
-        # Plot price line
-        fig.add_scatter(
-            name="Price",
-            x=price_data_normalized.index,
-            y=price_data_normalized[price_col],
-            mode="lines",
-            line=dict(width=2, color="#02d2ff"),
-            hovertemplate="<b>%{x|%Y-%m-%d}</b><br>Price: $%{y:.2f}<extra></extra>",
+        # Plot price line, keeping every price a marker is anchored to
+        self._add_price_line(
+            fig,
+            price_data_normalized[price_col],
+            max_points=max_points,
+            renderer=renderer,
+            anchors=transactions_df_normalized.index,
         )
 
         if transactions_df_normalized.empty:
@@ -1606,75 +2137,35 @@ class _PlotNamespace:
         else:
             tx_col = "type"
 
-        # Separate buy and sell transactions
-        buys = transactions_df_normalized[
-            transactions_df_normalized[tx_col].str.contains(
-                "Buy|Purchase", case=False, na=False
-            )
-        ]
-        sells = transactions_df_normalized[
-            transactions_df_normalized[tx_col].str.contains(
-                "Sell|Sale", case=False, na=False
-            )
-        ]
-
-        # For each transaction, find the closest price date
-        def get_price_at_date(tx_date):
-            """Find closest available price for a transaction date."""
-            if tx_date in price_data_normalized.index:
-                return price_data_normalized.loc[tx_date, price_col]
-            # Find nearest date
-            idx = price_data_normalized.index.get_indexer([tx_date], method="nearest")[
-                0
-            ]
-            if idx >= 0 and idx < len(price_data_normalized):
-                return price_data_normalized.iloc[idx][price_col]
-            return None
-
-        # Plot buy markers
-        if not buys.empty:
-            buy_prices = [get_price_at_date(dt) for dt in buys.index]
-            # Filter out None values
-            valid_buys = [
-                (dt, p) for dt, p in zip(buys.index, buy_prices) if p is not None
-            ]
-            if valid_buys:
-                buy_dates, buy_vals = zip(*valid_buys)
-                fig.add_scatter(
-                    name="Buy",
-                    x=buy_dates,
-                    y=buy_vals,
-                    mode="markers",
-                    marker=dict(
-                        size=10, color="rgba(0,255,0,0.8)", symbol="triangle-up"
-                    ),
-                    hovertemplate="<b>%{x|%Y-%m-%d}</b><br>BUY<extra></extra>",
-                )
+        # Anchor every transaction to its nearest price in one pass
+        tx_prices = self._anchor_prices(
+            price_data_normalized[price_col], transactions_df_normalized.index
+        )
+        plotted = ~np.isnan(tx_prices)
+        tx_types = transactions_df_normalized[tx_col]
 
-        # Plot sell markers
-        if not sells.empty:
-            sell_prices = [get_price_at_date(dt) for dt in sells.index]
-            # Filter out None values
-            valid_sells = [
-                (dt, p) for dt, p in zip(sells.index, sell_prices) if p is not None
-            ]
-            if valid_sells:
-                sell_dates, sell_vals = zip(*valid_sells)
-                fig.add_scatter(
-                    name="Sell",
-                    x=sell_dates,
-                    y=sell_vals,
-                    mode="markers",
-                    marker=dict(
-                        size=10, color="rgba(255,0,0,0.8)", symbol="triangle-down"
-                    ),
-                    hovertemplate="<b>%{x|%Y-%m-%d}</b><br>SELL<extra></extra>",
-                )
+        add_scatter = self._scatter_adder(fig, renderer)
+        sides = (
+            ("Buy", "Buy|Purchase", "rgba(0,255,0,0.8)", "triangle-up"),
+            ("Sell", "Sell|Sale", "rgba(255,0,0,0.8)", "triangle-down"),
+        )
+        for name, pattern, color, symbol in sides:
+            mask = plotted & tx_types.str.contains(pattern, case=False, na=False).to_numpy()
+            if not mask.any():
+                continue
+            add_scatter(
+                name=name,
+                x=transactions_df_normalized.index[mask],
+                y=tx_prices[mask],
+                mode="markers",
+                marker=dict(size=10, color=color, symbol=symbol),
+                hovertemplate=f"<b>%{{x|%Y-%m-%d}}</b><br>{name.upper()}<extra></extra>",
+            )
 
         return fig
 
-    @staticmethod
-    def _plot_put_call(df, ticker, template):
+    @classmethod
+    def _plot_put_call(cls, df, ticker, template, *, max_points=None, renderer="svg"):
         fig = go.Figure(
             layout=dict(
                 template=template,
@@ -1696,10 +2187,11 @@ class _PlotNamespace:
             name="Puts", x=df.index, y=df["putVolume"], marker_color="rgba(190,0,0,0.6)"
         )
         # Put/Call ratio line (secondary axis)
-        fig.add_scatter(
+        ratio = cls._downsample(df["ratio"], max_points)
+        cls._scatter_adder(fig, renderer)(
             name="Put/Call Ratio",
-            x=df.index,
-            y=df["ratio"],
+            x=ratio.index,
+            y=ratio,
             mode="lines",
             line=dict(width=2, color="#F9C80E"),
             yaxis="y2",
@@ -0,0 +1,271 @@
+"""
+finbrain.ratelimit
+~~~~~~~~~~~~~~~~~~
+
+Client-side token-bucket rate limiting.
+
+A single :class:`RateLimiter` can be handed to any number of
+:class:`~finbrain.FinBrainClient` / :class:`~finbrain.aio.AsyncFinBrainClient`
+instances. Sync callers block in :meth:`RateLimiter.acquire`; async callers
+await :meth:`RateLimiter.acquire_async`, which sleeps without blocking the
+event loop. Both draw from the same bucket, so thread-pool fetchers and
+asyncio tasks can share one quota.
+
+The limiter also folds server feedback into its pacing: the clients report
+``X-RateLimit-Remaining`` / ``X-RateLimit-Reset`` after every response and
+``Retry-After`` on ``429``/``503``. Once the quota is nearly exhausted,
+every caller sharing the limiter slows down (or pauses until the window
+resets) instead of each discovering the limit on its own. A healthy quota
+leaves the configured rate alone.
+
+Example
+-------
+>>> from finbrain import FinBrainClient
+>>> from finbrain.ratelimit import RateLimiter
+>>> limiter = RateLimiter(rate=10, burst=20)   # 10 req/s, bursts of 20
+>>> fb = FinBrainClient(api_key="YOUR_KEY", rate_limit=limiter)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import math
+import random
+import threading
+import time
+from typing import Any, Mapping, Optional, Tuple, Union
+
+__all__ = [
+    "RateLimiter",
+    "as_rate_limiter",
+    "backoff_delay",
+    "parse_quota_headers",
+    "parse_retry_after",
+]
+
+# X-RateLimit-Reset values above this are absolute epoch seconds, not deltas
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class RateLimiter:
+    """
+    Thread- and task-safe token bucket.
+
+    Parameters
+    ----------
+    rate :
+        Sustained requests per second (tokens added per second). ``None``
+        applies no local cap; the limiter then only enforces the pacing the
+        server asks for via :meth:`observe` and :meth:`pause`.
+    burst :
+        Bucket capacity, i.e. how many requests may be sent back-to-back
+        after an idle period. Defaults to ``ceil(rate)`` (at least 1).
+    reserve :
+        Once the server reports this many requests or fewer left in its
+        window, the rest are spread evenly until the reset. Above it the
+        configured rate applies unchanged.
+
+    Notes
+    -----
+    Callers *reserve* a token under a short lock and then sleep outside it.
+    The token count may go negative, which queues callers in arrival order
+    without anyone holding the lock while waiting.
+    """
+
+    def __init__(
+        self, rate: float | None = None, burst: int | None = None, *, reserve: int = 10
+    ) -> None:
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be > 0")
+        if burst is None:
+            burst = max(1, math.ceil(rate)) if rate is not None else 1
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        if reserve < 0:
+            raise ValueError("reserve must be >= 0")
+        self.rate = float(rate) if rate is not None else None
+        self.burst = int(burst)
+        self.reserve = int(reserve)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        # server feedback: hard pause deadline, and a reduced rate until reset
+        self._blocked_until = 0.0
+        self._server_rate: float | None = None
+        self._server_until = 0.0
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(rate={self.rate!r}, burst={self.burst!r})"
+
+    # ---------- public API ----------
+    def acquire(self) -> float:
+        """Block the calling thread until a request may be sent.
+
+        Returns the number of seconds waited.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Await until a request may be sent. Returns the seconds waited."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return False
+            rate = self._effective_rate(now)
+            if rate is None:
+                return True
+            self._refill(now, rate)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back for *seconds* (e.g. a ``Retry-After``)."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    def observe(self, remaining: int | None, reset_after: float | None) -> None:
+        """
+        Fold the server's reported quota into pacing.
+
+        Parameters
+        ----------
+        remaining :
+            Requests left in the current window (``X-RateLimit-Remaining``).
+        reset_after :
+            Seconds until the window resets (from ``X-RateLimit-Reset``).
+
+        With nothing left, callers pause until the reset. With at most
+        *reserve* left, the remaining requests are spread evenly over the
+        rest of the window whenever that is slower than the configured
+        rate. A larger quota clears any earlier slowdown, so a daily
+        allowance is not turned into one request every few seconds.
+        """
+        if remaining is None or reset_after is None or reset_after <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            deadline = now + reset_after
+            if remaining <= 0:
+                self._blocked_until = max(self._blocked_until, deadline)
+                return
+            rate = self._effective_rate(now)
+            if rate is not None:
+                self._refill(now, rate)
+            self._tokens = min(self._tokens, float(remaining))
+            if remaining > self.reserve:
+                self._server_rate = None
+                return
+            self._server_rate = remaining / reset_after
+            self._server_until = deadline
+
+    # ---------- private helpers ----------
+    def _effective_rate(self, now: float) -> float | None:
+        if self._server_rate is not None and now < self._server_until:
+            if self.rate is None:
+                return self._server_rate
+            return min(self.rate, self._server_rate)
+        return self.rate
+
+    def _refill(self, now: float, rate: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * rate)
+            self._updated = now
+
+    def _reserve(self) -> float:
+        """Take one token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            rate = self._effective_rate(now)
+            if rate is None:
+                return wait
+            self._refill(now, rate)
+            self._tokens -= 1
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / rate)
+            return wait
+
+
+def as_rate_limiter(value: Union[RateLimiter, float, None]) -> RateLimiter | None:
+    """Accept a ready-made limiter, a requests-per-second number, or ``None``."""
+    if value is None or isinstance(value, RateLimiter):
+        return value
+    return RateLimiter(rate=float(value))
+
+
+# ─────────────────────────────────────────────────────────────
+# Retry helpers shared by the sync and async clients
+# ─────────────────────────────────────────────────────────────
+
+
+def backoff_delay(previous: float, base: float, cap: float) -> float:
+    """
+    Next sleep for "decorrelated jitter" back-off.
+
+    Each delay is drawn uniformly from ``[base, previous * 3]`` and capped,
+    so concurrent workers that failed together drift apart instead of
+    retrying in lockstep.
+    """
+    return min(cap, random.uniform(base, max(base, previous * 3)))
+
+
+def parse_retry_after(value: Optional[str]) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def parse_quota_headers(
+    headers: Mapping[str, Any],
+) -> Tuple[int | None, float | None]:
+    """
+    Read ``(remaining, reset_after)`` from ``X-RateLimit-*`` headers.
+
+    ``X-RateLimit-Reset`` may be an absolute epoch timestamp or a number of
+    seconds; either way the result is seconds from now. Missing or
+    malformed headers yield ``None``.
+    """
+    remaining: int | None = None
+    reset_after: float | None = None
+    try:
+        raw = headers.get("X-RateLimit-Remaining")
+        if raw is not None:
+            remaining = int(float(raw))
+    except (TypeError, ValueError):
+        remaining = None
+    try:
+        raw = headers.get("X-RateLimit-Reset")
+        if raw is not None:
+            reset = float(raw)
+            reset_after = reset - time.time() if reset > _EPOCH_THRESHOLD else reset
+    except (TypeError, ValueError):
+        reset_after = None
+    return remaining, reset_after
@@ -0,0 +1,383 @@
+"""
+finbrain.records
+~~~~~~~~~~~~~~~~
+
+Compact typed rows for the high-volume endpoints.
+
+Raw mode returns every row as a plain ``dict``, which costs several hundred
+bytes per row before counting the values. Passing ``as_records=True`` to
+:meth:`house_trades.ticker`, :meth:`senate_trades.ticker`,
+:meth:`insider_transactions.ticker`, :meth:`news.ticker`,
+:meth:`analyst_ratings.ticker`, :meth:`government_contracts.ticker` or
+:meth:`patent_filings.ticker` swaps the row list for instances of the
+classes below. They use ``__slots__`` (no per-instance ``__dict__``), so a
+row takes well under half the memory of the equivalent dict.
+
+The response body is streamed and each row is converted as soon as it is
+decoded, so the full list of row dicts never exists; peak memory is the
+list of records plus one chunk of the body. These requests are not shared
+between concurrent callers and are not written to the response cache,
+though an already-cached body is still used.
+
+Attributes use snake_case names (``trade.transaction_type``);
+:meth:`Record.to_dict` and :func:`records_to_frame` map them back to the API
+field names, so frames built from records have the same columns as
+``as_dataframe=True``. Fields the API adds later are kept on
+:attr:`Record.extra` rather than dropped.
+
+Example
+-------
+>>> data = fb.house_trades.ticker("NVDA", as_records=True)
+>>> trade = data["trades"][0]
+>>> trade.politician, trade.transaction_type, trade.amount
+('Jane Doe', 'Purchase', '$1,001 - $15,000')
+>>> df = records_to_frame(data["trades"])     # indexed by ``date``
+"""
+
+from __future__ import annotations
+
+import functools
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar
+
+__all__ = [
+    "Record",
+    "CongressTrade",
+    "InsiderTransaction",
+    "NewsArticle",
+    "AnalystRating",
+    "GovernmentContract",
+    "PatentFiling",
+    "records_to_frame",
+]
+
+R = TypeVar("R", bound="Record")
+
+
+class Record:
+    """
+    Base class for slot-based rows.
+
+    Subclasses declare ``_KEYS`` as ``(attribute, api_field)`` pairs and a
+    matching ``__slots__``; ``symbol`` and ``extra`` live on the base class.
+    """
+
+    __slots__ = ("symbol", "extra")
+
+    #: ``(attribute, api_field)`` pairs in API order
+    _KEYS: Tuple[Tuple[str, str], ...] = ()
+    #: name of the matching schema in :mod:`finbrain.endpoints._frames`,
+    #: used by :func:`records_to_frame` for dtypes and the index
+    _SCHEMA: Optional[str] = None
+    _KEYSET: FrozenSet[str] = frozenset()
+    _SLOTS: Tuple[str, ...] = ("symbol", "extra")
+
+    symbol: Optional[str]
+    extra: Optional[Dict[str, Any]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._KEYSET = frozenset(key for _, key in cls._KEYS)
+        cls._SLOTS = ("symbol", "extra") + tuple(attr for attr, _ in cls._KEYS)
+
+    def __init__(self, symbol: Optional[str] = None, **fields: Any) -> None:
+        self.symbol = symbol
+        for attr, _ in self._KEYS:
+            setattr(self, attr, fields.pop(attr, None))
+        self.extra = fields or None
+
+    # ---------- construction ----------
+    @classmethod
+    def from_dict(cls: Type[R], row: Dict[str, Any], symbol: Optional[str] = None) -> R:
+        """Build a record from one API row; unknown fields go to :attr:`extra`."""
+        obj = cls.__new__(cls)
+        get = row.get
+        for attr, key in cls._KEYS:
+            setattr(obj, attr, get(key))
+        obj.symbol = symbol if symbol is not None else get("symbol")
+        if cls._KEYSET.issuperset(row):
+            obj.extra = None
+        else:
+            obj.extra = {
+                k: v for k, v in row.items() if k not in cls._KEYSET and k != "symbol"
+            } or None
+        return obj
+
+    @classmethod
+    def from_rows(
+        cls: Type[R], rows: Iterable[Dict[str, Any]], symbol: Optional[str] = None
+    ) -> List[R]:
+        """Convert a list of API rows, tagging each with *symbol*."""
+        from_dict = cls.from_dict
+        return [from_dict(row, symbol) for row in rows]
+
+    @classmethod
+    def converter(cls: Type[R], symbol: Optional[str] = None) -> Callable[[Dict[str, Any]], R]:
+        """:meth:`from_dict` bound to *symbol*, for converting rows as they are decoded."""
+        return functools.partial(cls.from_dict, symbol=symbol)
+
+    # ---------- conversion ----------
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the row with API field names (plus ``symbol`` when known)."""
+        out: Dict[str, Any] = {}
+        if self.symbol is not None:
+            out["symbol"] = self.symbol
+        for attr, key in self._KEYS:
+            out[key] = getattr(self, attr)
+        if self.extra:
+            out.update(self.extra)
+        return out
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]  # mutable, like the dicts it replaces
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{a}={getattr(self, a)!r}" for a, _ in self._KEYS)
+        sym = f"symbol={self.symbol!r}, " if self.symbol is not None else ""
+        return f"{type(self).__name__}({sym}{fields})"
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, slot) for slot in self._SLOTS)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for slot, value in zip(self._SLOTS, state):
+            setattr(self, slot, value)
+
+
+# ─────────────────────────────────────────────────────────────
+# Endpoint row types
+# ─────────────────────────────────────────────────────────────
+
+
+class CongressTrade(Record):
+    """A House or Senate trade (``trades`` rows)."""
+
+    __slots__ = (
+        "date", "politician", "transaction_type", "amount", "owner",
+        "amount_raw", "amount_flag", "disclosure_date",
+    )
+    _KEYS = (
+        ("date", "date"),
+        ("politician", "politician"),
+        ("transaction_type", "transactionType"),
+        ("amount", "amount"),
+        ("owner", "owner"),
+        ("amount_raw", "amountRaw"),
+        ("amount_flag", "amountFlag"),
+        ("disclosure_date", "disclosureDate"),
+    )
+    _SCHEMA = "CONGRESS_TRADES"
+
+    date: str
+    politician: str
+    transaction_type: str
+    amount: str
+    owner: Optional[str]
+    amount_raw: Optional[str]
+    amount_flag: Optional[str]
+    disclosure_date: Optional[str]
+
+
+class InsiderTransaction(Record):
+    """A Form-4 insider transaction (``transactions`` rows)."""
+
+    __slots__ = (
+        "date", "insider", "relationship", "transaction_type", "shares",
+        "price_per_share", "total_value", "shares_owned",
+    )
+    _KEYS = (
+        ("date", "date"),
+        ("insider", "insider"),
+        ("relationship", "relationship"),
+        ("transaction_type", "transactionType"),
+        ("shares", "shares"),
+        ("price_per_share", "pricePerShare"),
+        ("total_value", "totalValue"),
+        ("shares_owned", "sharesOwned"),
+    )
+    _SCHEMA = "INSIDER_TRANSACTIONS"
+
+    date: str
+    insider: str
+    relationship: Optional[str]
+    transaction_type: str
+    shares: Optional[float]
+    price_per_share: Optional[float]
+    total_value: Optional[float]
+    shares_owned: Optional[float]
+
+
+class NewsArticle(Record):
+    """A news article with its sentiment score (``articles`` rows)."""
+
+    __slots__ = ("date", "headline", "source", "url", "sentiment")
+    _KEYS = (
+        ("date", "date"),
+        ("headline", "headline"),
+        ("source", "source"),
+        ("url", "url"),
+        ("sentiment", "sentiment"),
+    )
+    _SCHEMA = "NEWS"
+
+    date: str
+    headline: str
+    source: Optional[str]
+    url: Optional[str]
+    sentiment: Optional[float]
+
+
+class AnalystRating(Record):
+    """A broker rating action (``ratings`` rows)."""
+
+    __slots__ = (
+        "date", "institution", "action", "rating", "target_price",
+    )
+    _KEYS = (
+        ("date", "date"),
+        ("institution", "institution"),
+        ("action", "action"),
+        ("rating", "rating"),
+        ("target_price", "targetPrice"),
+    )
+    _SCHEMA = "ANALYST_RATINGS"
+
+    date: str
+    institution: str
+    action: Optional[str]
+    rating: Optional[str]
+    target_price: Optional[float]
+
+
+class GovernmentContract(Record):
+    """A federal contract award (``contracts`` rows)."""
+
+    __slots__ = (
+        "award_id", "award_amount", "award_type", "awarding_agency",
+        "awarding_sub_agency", "recipient_name", "start_date", "end_date",
+        "description", "naics_code", "naics_description", "contract_award_type",
+    )
+    _KEYS = (
+        ("award_id", "awardId"),
+        ("award_amount", "awardAmount"),
+        ("award_type", "awardType"),
+        ("awarding_agency", "awardingAgency"),
+        ("awarding_sub_agency", "awardingSubAgency"),
+        ("recipient_name", "recipientName"),
+        ("start_date", "startDate"),
+        ("end_date", "endDate"),
+        ("description", "description"),
+        ("naics_code", "naicsCode"),
+        ("naics_description", "naicsDescription"),
+        ("contract_award_type", "contractAwardType"),
+    )
+    _SCHEMA = "GOVERNMENT_CONTRACTS"
+
+    award_id: str
+    award_amount: Optional[float]
+    award_type: Optional[str]
+    awarding_agency: Optional[str]
+    awarding_sub_agency: Optional[str]
+    recipient_name: Optional[str]
+    start_date: Optional[str]
+    end_date: Optional[str]
+    description: Optional[str]
+    naics_code: Optional[str]
+    naics_description: Optional[str]
+    contract_award_type: Optional[str]
+
+
+class PatentFiling(Record):
+    """A granted USPTO patent (``patents`` rows)."""
+
+    __slots__ = (
+        "patent_id", "patent_date", "title", "type", "kind", "num_claims",
+        "num_cited_by", "assignee_organization", "assignee_type",
+        "application_filing_date", "filing_to_grant_days", "inventors",
+        "num_inventors", "cpc_sections", "cpc_subsections", "primary_cpc_section",
+    )
+    _KEYS = (
+        ("patent_id", "patentId"),
+        ("patent_date", "patentDate"),
+        ("title", "title"),
+        ("type", "type"),
+        ("kind", "kind"),
+        ("num_claims", "numClaims"),
+        ("num_cited_by", "numCitedBy"),
+        ("assignee_organization", "assigneeOrganization"),
+        ("assignee_type", "assigneeType"),
+        ("application_filing_date", "applicationFilingDate"),
+        ("filing_to_grant_days", "filingToGrantDays"),
+        ("inventors", "inventors"),
+        ("num_inventors", "numInventors"),
+        ("cpc_sections", "cpcSections"),
+        ("cpc_subsections", "cpcSubsections"),
+        ("primary_cpc_section", "primaryCpcSection"),
+    )
+    _SCHEMA = "PATENT_FILINGS"
+
+    patent_id: str
+    patent_date: str
+    title: Optional[str]
+    type: Optional[str]
+    kind: Optional[str]
+    num_claims: Optional[int]
+    num_cited_by: Optional[int]
+    assignee_organization: Optional[str]
+    assignee_type: Optional[str]
+    application_filing_date: Optional[str]
+    filing_to_grant_days: Optional[int]
+    inventors: Optional[List[str]]
+    num_inventors: Optional[int]
+    cpc_sections: Optional[List[str]]
+    cpc_subsections: Optional[List[str]]
+    primary_cpc_section: Optional[str]
+
+
+# ─────────────────────────────────────────────────────────────
+# DataFrame conversion
+# ─────────────────────────────────────────────────────────────
+
+
+def records_to_frame(records: Sequence[Record], *, index: Optional[str] = "auto") -> Any:
+    """
+    Build a pandas DataFrame from records, one column at a time.
+
+    Parameters
+    ----------
+    records :
+        Records of a single type, e.g. ``data["trades"]`` from an
+        ``as_records=True`` call (or several tickers' worth concatenated).
+    index :
+        Column to use as the index. ``"auto"`` uses the same index as
+        ``as_dataframe=True`` for that record type; ``None`` keeps a
+        RangeIndex. Column dtypes follow the endpoint's frame schema.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Columns use the API field names; a ``symbol`` column is included
+        when the records carry one, plus any :attr:`Record.extra` fields.
+    """
+    from .endpoints import _frames
+
+    if not records:
+        return _frames.build_frame([])
+    cls = type(records[0])
+    columns: Dict[str, List[Any]] = {}
+    if any(r.symbol is not None for r in records):
+        columns["symbol"] = [r.symbol for r in records]
+    for attr, key in cls._KEYS:
+        columns[key] = list(map(attrgetter(attr), records))
+    extra_keys = {k for r in records if r.extra for k in r.extra}
+    for key in sorted(extra_keys - columns.keys()):
+        columns[key] = [(r.extra or {}).get(key) for r in records]
+
+    schema = getattr(_frames, cls._SCHEMA) if cls._SCHEMA else _frames.FrameSchema()
+    if index != "auto":
+        schema = schema.with_index(index)
+    return _frames.build_frame(columns, schema)
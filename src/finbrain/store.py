@@ -0,0 +1,353 @@
+"""
+finbrain.store
+~~~~~~~~~~~~~~
+
+Local Parquet store for per-ticker endpoint histories.
+
+Rows are written as one Parquet file per Hive-style partition::
+
+    <root>/endpoint=house_trades/market=S%26P%20500/symbol=NVDA/year=2024/data.parquet
+
+:meth:`ParquetStore.read` prunes partitions from the directory names
+(endpoint, market, symbol and year) before opening a single file, then
+pushes the row-level date filter and column selection down into the
+Parquet reader, so loading one ticker's last year never touches the rest
+of the store. Requires ``pyarrow`` (``pip install finbrain-python[arrow]``).
+
+Example
+-------
+>>> from finbrain import FinBrainClient
+>>> from finbrain.store import ParquetStore
+>>> fb = FinBrainClient(api_key="YOUR_KEY")
+>>> store = ParquetStore("~/finbrain-parquet")
+>>> store.ingest(fb, "insider_transactions", ["AAPL", "MSFT"], market="S&P 500")
+>>> df = store.read("insider-trading", symbols=["AAPL"], date_from="2024-01-01")
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import os
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Sequence
+from urllib.parse import quote
+
+from .endpoints import _frames
+from .endpoints._utils import BatchResult, map_symbols, normalize_symbols, to_datestr
+from .sync import SYNC_ENDPOINTS, resolve_endpoint
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+    from .client import FinBrainClient
+
+__all__ = ["ParquetStore"]
+
+# pyarrow's placeholder for a null partition value
+_NULL = "__HIVE_DEFAULT_PARTITION__"
+_FILE = "data.parquet"
+
+
+class ParquetStore:
+    """
+    Hive-partitioned Parquet files under *root*, one endpoint per subtree.
+
+    Endpoints are the :data:`finbrain.sync.SYNC_ENDPOINTS` names; API paths
+    such as ``"insider-trading"`` are accepted as aliases.
+
+    Parameters
+    ----------
+    root :
+        Store directory. Created on first write.
+    """
+
+    def __init__(self, root: str | os.PathLike) -> None:
+        _frames._import("pyarrow", "arrow")
+        self.root = Path(root).expanduser()
+
+    # ---------- writing ----------
+    def write(
+        self,
+        endpoint: str,
+        symbol: str,
+        rows: List[Dict[str, Any]] | Dict[str, Any],
+        *,
+        market: str | None = None,
+    ) -> int:
+        """
+        Store *rows* for one ticker and return how many were written.
+
+        *rows* may be the list of row dicts or the endpoint's raw response.
+        They are authoritative from their earliest date onwards: stored rows
+        of the same symbol and market on or after that date are replaced,
+        older ones are kept. Feeding the output of an incremental
+        ``date_from`` request therefore appends, and a full history
+        rewrites.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        name = resolve_endpoint(endpoint)
+        spec = SYNC_ENDPOINTS[name]
+        if isinstance(rows, dict):
+            rows = rows.get(spec.rows, [])
+        if not isinstance(rows, list) or not rows:
+            return 0
+        symbol_dir = self._symbol_dir(name, market, symbol.upper())
+
+        by_year: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            value = row.get(spec.date)
+            year = value[:4] if isinstance(value, str) and value[:4].isdigit() else _NULL
+            by_year.setdefault(year, []).append(row)
+
+        dated = [y for y in by_year if y != _NULL]
+        start: str | None = min(
+            (row[spec.date][:10] for y in dated for row in by_year[y]), default=None
+        )
+        if symbol_dir.is_dir():
+            for part in symbol_dir.iterdir():
+                year = part.name.partition("=")[2]
+                if year == _NULL and _NULL not in by_year:
+                    continue
+                if year != _NULL and (start is None or year < start[:4]):
+                    continue
+                if year == (start or "")[:4]:
+                    continue  # merged below
+                shutil.rmtree(part)
+
+        for year, year_rows in by_year.items():
+            table = _plain_table(_frames.build_arrow(year_rows, spec.schema))
+            path = symbol_dir / f"year={year}" / _FILE
+            if start and year == start[:4] and path.exists():
+                old = pq.read_table(path)
+                field = old.schema.field(spec.date)
+                keep = pc.less(
+                    old[spec.date], pa.scalar(_dt.date.fromisoformat(start)).cast(field.type)
+                )
+                table = pa.concat_tables(
+                    [table, old.filter(keep)], promote_options="permissive"
+                )
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{_FILE}.tmp")
+            pq.write_table(table, tmp)
+            os.replace(tmp, path)
+        return len(rows)
+
+    def ingest(
+        self,
+        client: "FinBrainClient",
+        endpoint: str,
+        symbols: Iterable[str],
+        *,
+        market: str | None = None,
+        max_workers: int = 8,
+        **kwargs: Any,
+    ) -> BatchResult:
+        """
+        Fetch *symbols* through the client's endpoint class and :meth:`write` them.
+
+        ``**kwargs`` go to the endpoint method (``date_from``, ``limit``, ...).
+        Returns a :class:`~finbrain.BatchResult` of rows written per symbol.
+        """
+        name = resolve_endpoint(endpoint)
+        fetch: Any = client
+        for part in SYNC_ENDPOINTS[name].method.split("."):
+            fetch = getattr(fetch, part)
+
+        def _one(symbol: str) -> int:
+            return self.write(name, symbol, fetch(symbol, **kwargs), market=market)
+
+        return map_symbols(_one, symbols, max_workers=max_workers)
+
+    # ---------- reading ----------
+    def read(
+        self,
+        endpoint: str,
+        *,
+        symbols: Iterable[str] | None = None,
+        markets: Iterable[str] | None = None,
+        date_from: _dt.date | str | None = None,
+        date_to: _dt.date | str | None = None,
+        columns: Sequence[str] | None = None,
+        output: str = "pandas",
+    ) -> pd.DataFrame | pa.Table | pl.DataFrame:
+        """
+        Load stored rows, reading only the partitions that can match.
+
+        Parameters
+        ----------
+        endpoint :
+            Endpoint name or API path.
+        symbols, markets :
+            Restrict to these tickers / markets (``None`` = all).
+        date_from, date_to :
+            Inclusive bounds on the endpoint's date field. Years outside the
+            range are skipped by directory; the rest is filtered inside the
+            Parquet reader.
+        columns :
+            Subset of row columns to load. ``symbol``, ``market`` and the date
+            column are always included.
+        output :
+            ``"pandas"`` (default), ``"arrow"`` or ``"polars"``.
+
+        Returns
+        -------
+        pandas.DataFrame | pyarrow.Table | polars.DataFrame
+            Sorted by symbol then date. The pandas frame is indexed by the
+            date column and uses the endpoint's categorical dtypes.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        if output not in ("pandas", "arrow", "polars"):
+            raise ValueError("output must be 'pandas', 'arrow' or 'polars'")
+        name = resolve_endpoint(endpoint)
+        spec = SYNC_ENDPOINTS[name]
+        lo = to_datestr(date_from) if date_from is not None else None
+        hi = to_datestr(date_to) if date_to is not None else None
+
+        files = self._files(name, symbols, markets, lo, hi)
+        parts = pa.schema([("market", pa.string()), ("symbol", pa.string()),
+                           ("year", pa.string())])
+        if not files:
+            return _finish(pa.schema([]).empty_table(), spec, output)
+
+        schema = pa.unify_schemas(
+            [pq.read_schema(f) for f in files] + [parts], promote_options="permissive"
+        )
+        dataset = ds.dataset(
+            [str(f) for f in files],
+            schema=schema,
+            format="parquet",
+            partitioning=ds.partitioning(parts, flavor="hive"),
+            partition_base_dir=str(self.root / f"endpoint={name}"),
+        )
+
+        expr = None
+        date_type = schema.field(spec.date).type if spec.date in schema.names else None
+        for bound, op in ((lo, "__ge__"), (hi, "__le__")):
+            if bound is None or date_type is None:
+                continue
+            value = pa.scalar(_dt.date.fromisoformat(bound[:10]))
+            if pa.types.is_string(date_type):
+                value = pa.scalar(bound[:10])
+            elif op == "__le__" and not pa.types.is_date(date_type):
+                # timestamps: include the whole last day
+                value = pa.scalar(_dt.datetime.fromisoformat(bound[:10]) + _dt.timedelta(days=1))
+                op = "__lt__"
+            cond = getattr(ds.field(spec.date), op)(value.cast(date_type))
+            expr = cond if expr is None else expr & cond
+
+        if columns is not None:
+            wanted = ["symbol", "market", spec.date, *columns]
+            columns = [c for c in dict.fromkeys(wanted) if c in schema.names]
+        table = dataset.to_table(columns=columns, filter=expr)
+        if "year" in table.column_names and (columns is None or "year" not in columns):
+            table = table.drop_columns(["year"])
+        sort = [(c, "ascending") for c in ("symbol", spec.date) if c in table.column_names]
+        if sort:
+            table = table.sort_by(sort)
+        return _finish(table, spec, output)
+
+    def clear(self, endpoint: str) -> None:
+        """Delete every stored row of *endpoint*, across all markets."""
+        shutil.rmtree(self.root / f"endpoint={resolve_endpoint(endpoint)}", ignore_errors=True)
+
+    def symbols(self, endpoint: str) -> List[str]:
+        """Tickers stored for *endpoint*, across all markets."""
+        from urllib.parse import unquote
+
+        base = self.root / f"endpoint={resolve_endpoint(endpoint)}"
+        found = {
+            unquote(sym.name.partition("=")[2])
+            for market in _subdirs(base)
+            for sym in _subdirs(market)
+        }
+        return sorted(found)
+
+    # ---------- private helpers ----------
+    def _symbol_dir(self, endpoint: str, market: str | None, symbol: str) -> Path:
+        return (
+            self.root
+            / f"endpoint={endpoint}"
+            / f"market={_segment(market)}"
+            / f"symbol={_segment(symbol)}"
+        )
+
+    def _files(
+        self,
+        endpoint: str,
+        symbols: Iterable[str] | None,
+        markets: Iterable[str] | None,
+        lo: str | None,
+        hi: str | None,
+    ) -> List[Path]:
+        base = self.root / f"endpoint={endpoint}"
+        if markets is None:
+            market_dirs = _subdirs(base)
+        else:
+            market_dirs = [base / f"market={_segment(m)}" for m in markets]
+        files = []
+        for market_dir in market_dirs:
+            if symbols is None:
+                symbol_dirs = _subdirs(market_dir)
+            else:
+                symbol_dirs = [
+                    market_dir / f"symbol={_segment(s)}" for s in normalize_symbols(symbols)
+                ]
+            for symbol_dir in symbol_dirs:
+                for year_dir in _subdirs(symbol_dir):
+                    year = year_dir.name.partition("=")[2]
+                    if year != _NULL and (
+                        (lo is not None and year < lo[:4])
+                        or (hi is not None and year > hi[:4])
+                    ):
+                        continue
+                    if year == _NULL and (lo is not None or hi is not None):
+                        continue
+                    if (year_dir / _FILE).is_file():
+                        files.append(year_dir / _FILE)
+        return files
+
+
+def _segment(value: str | None) -> str:
+    return _NULL if value is None else quote(value, safe="")
+
+
+def _subdirs(path: Path) -> List[Path]:
+    if not path.is_dir():
+        return []
+    return sorted(p for p in path.iterdir() if p.is_dir() and "=" in p.name)
+
+
+def _plain_table(table: "pa.Table") -> "pa.Table":
+    """Decode dictionary columns so every partition file unifies to one schema."""
+    import pyarrow as pa
+
+    for i, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(field.type.value_type))
+    return table
+
+
+def _finish(table: "pa.Table", spec: Any, output: str) -> Any:
+    if output == "arrow":
+        return table
+    if output == "polars":
+        pl = _frames._import("polars", "polars")
+        return pl.from_arrow(table)
+
+    df = table.to_pandas(date_as_object=False)
+    for col in spec.schema.categorical:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    index = spec.schema.index
+    if index in df.columns:
+        df[index] = df[index].astype("datetime64[ns]")
+        df = df.set_index(index)
+    return df
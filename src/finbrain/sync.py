@@ -0,0 +1,460 @@
+"""
+finbrain.sync
+~~~~~~~~~~~~~
+
+Incremental download of per-ticker histories into a local directory.
+
+For every ``(endpoint, symbol)`` pair :class:`SyncEngine` remembers the
+newest row date it has seen (the *high-water mark*) in ``state.json``. The
+next run requests only ``date_from = mark - overlap_days``, replaces the
+local rows inside that window with the fresh ones and leaves older rows
+alone, so a nightly job transfers one day of data instead of the whole
+history. The overlap re-reads the last few days to pick up late filings
+and upstream corrections.
+
+Local rows are only dropped when the fresh window is known to be
+complete. A response that fills the page (``limit`` rows) may have been
+cut off, so the window is re-read with
+:func:`~finbrain.endpoints._utils.fetch_range`, which splits full windows.
+A full first download is paged back with ``date_to`` until a page comes
+back short. If even that cannot rule out a cut (one day holding ``limit``
+rows), local rows missing from the response are kept, and a full download
+records no high-water mark so the next run downloads everything again.
+
+Layout of the sync directory::
+
+    state.json                     high-water marks
+    house_trades/NVDA.json         merged rows, newest first
+    news/AAPL.json
+
+Example
+-------
+>>> from finbrain import FinBrainClient
+>>> from finbrain.sync import SyncEngine
+>>> fb = FinBrainClient(api_key="YOUR_KEY")
+>>> engine = SyncEngine(fb, "~/finbrain-data", overlap_days=3)
+>>> report = engine.sync("house_trades", ["NVDA", "AAPL"])
+>>> report["NVDA"].added          # rows that were not in the local copy
+>>> df = engine.load("house_trades", "NVDA", as_dataframe=True)
+"""
+
+from __future__ import annotations
+
+import datetime as _dt
+import functools
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Tuple
+
+from .endpoints import _frames
+from .endpoints._utils import (
+    RANGE_LIMIT,
+    BatchResult,
+    dedupe_rows,
+    fetch_range,
+    map_symbols,
+    row_key,
+)
+from .exceptions import IncompleteRange
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from .client import FinBrainClient
+
+__all__ = ["SYNC_ENDPOINTS", "SyncEngine", "SyncResult", "resolve_endpoint"]
+
+# Bump whenever the state file layout changes.
+_STATE_VERSION = 1
+
+
+class _Spec(NamedTuple):
+    method: str  # bound-method path on the client, e.g. "house_trades.ticker"
+    path: str  # API path prefix, e.g. "congress/house"
+    rows: str  # key holding the row list in the response
+    date: str  # row field the API's startDate filter applies to
+    schema: _frames.FrameSchema
+
+
+SYNC_ENDPOINTS: Dict[str, _Spec] = {
+    "sentiments": _Spec("sentiments.ticker", "sentiment", "data", "date", _frames.SENTIMENTS),
+    "options": _Spec("options.put_call", "put-call-ratio", "data", "date", _frames.PUT_CALL),
+    "linkedin_data": _Spec(
+        "linkedin_data.ticker", "linkedin", "data", "date", _frames.LINKEDIN
+    ),
+    "reddit_mentions": _Spec(
+        "reddit_mentions.ticker", "reddit-mentions", "data", "date", _frames.REDDIT_MENTIONS
+    ),
+    "corporate_lobbying": _Spec(
+        "corporate_lobbying.ticker", "lobbying", "filings", "date",
+        _frames.CORPORATE_LOBBYING,
+    ),
+    "house_trades": _Spec(
+        "house_trades.ticker", "congress/house", "trades", "date", _frames.CONGRESS_TRADES
+    ),
+    "senate_trades": _Spec(
+        "senate_trades.ticker", "congress/senate", "trades", "date", _frames.CONGRESS_TRADES
+    ),
+    "insider_transactions": _Spec(
+        "insider_transactions.ticker", "insider-trading", "transactions", "date",
+        _frames.INSIDER_TRANSACTIONS,
+    ),
+    "news": _Spec("news.ticker", "news", "articles", "date", _frames.NEWS),
+    "analyst_ratings": _Spec(
+        "analyst_ratings.ticker", "analyst-ratings", "ratings", "date",
+        _frames.ANALYST_RATINGS,
+    ),
+    "government_contracts": _Spec(
+        "government_contracts.ticker", "government-contracts", "contracts", "startDate",
+        _frames.GOVERNMENT_CONTRACTS,
+    ),
+    "patent_filings": _Spec(
+        "patent_filings.ticker", "patent-filings", "patents", "patentDate",
+        _frames.PATENT_FILINGS,
+    ),
+}
+_BY_PATH = {spec.path: name for name, spec in SYNC_ENDPOINTS.items()}
+
+
+def resolve_endpoint(endpoint: str) -> str:
+    """
+    Canonical :data:`SYNC_ENDPOINTS` key for *endpoint*.
+
+    Accepts the client attribute name (``"insider_transactions"``) or the
+    API path prefix (``"insider-trading"``, ``"congress/house"``).
+    """
+    if endpoint in SYNC_ENDPOINTS:
+        return endpoint
+    name = _BY_PATH.get(endpoint.strip("/"))
+    if name is None:
+        raise ValueError(
+            f"Unknown sync endpoint {endpoint!r}; expected one of "
+            + ", ".join(sorted(SYNC_ENDPOINTS))
+        )
+    return name
+
+
+class SyncResult:
+    """
+    Outcome of syncing one ``(endpoint, symbol)`` pair.
+
+    Attributes
+    ----------
+    since :
+        ``date_from`` sent to the API, or ``None`` for a full download.
+    high_water :
+        Newest row date after the merge (``None`` if there are no rows).
+    fetched :
+        Number of rows the API returned.
+    added, removed :
+        Rows that appeared in / disappeared from the re-read window,
+        compared with the local copy before the run.
+    total :
+        Rows in the local copy after the merge.
+    complete :
+        ``False`` when the response may have been cut off at ``limit``; local
+        rows missing from it were then kept and ``removed`` is empty. An
+        incomplete full download leaves the high-water mark unset.
+    """
+
+    __slots__ = ("endpoint", "symbol", "since", "high_water", "fetched",
+                 "added", "removed", "total", "complete")
+
+    def __init__(
+        self,
+        endpoint: str,
+        symbol: str,
+        since: str | None,
+        high_water: str | None,
+        fetched: int,
+        added: List[Dict[str, Any]],
+        removed: List[Dict[str, Any]],
+        total: int,
+        complete: bool = True,
+    ) -> None:
+        self.endpoint = endpoint
+        self.symbol = symbol
+        self.since = since
+        self.high_water = high_water
+        self.fetched = fetched
+        self.added = added
+        self.removed = removed
+        self.total = total
+        self.complete = complete
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed)
+
+    def __repr__(self) -> str:
+        return (
+            f"SyncResult({self.endpoint}/{self.symbol}: since={self.since!r}, "
+            f"fetched={self.fetched}, added={len(self.added)}, "
+            f"removed={len(self.removed)}, total={self.total}"
+            + ("" if self.complete else ", incomplete")
+            + ")"
+        )
+
+
+class SyncEngine:
+    """
+    Keep a local copy of per-ticker histories up to date.
+
+    Parameters
+    ----------
+    client :
+        The :class:`~finbrain.FinBrainClient` used for requests.
+    root :
+        Sync directory holding ``state.json`` and the per-symbol row files.
+        Created on first use.
+    overlap_days :
+        Days before the high-water mark that are re-requested and replaced
+        on every run, to catch late filings and revised rows.
+    """
+
+    def __init__(
+        self,
+        client: "FinBrainClient",
+        root: str | os.PathLike,
+        *,
+        overlap_days: int = 3,
+    ) -> None:
+        if overlap_days < 0:
+            raise ValueError("overlap_days must be >= 0")
+        self._c = client
+        self.root = Path(root).expanduser()
+        self.overlap_days = overlap_days
+        self._lock = threading.Lock()
+        self._marks: Dict[str, Dict[str, str]] = self._read_state()
+
+    # ---------- public API ----------
+    def high_water(self, endpoint: str, symbol: str) -> str | None:
+        """Newest synced row date for *endpoint* / *symbol*, if any."""
+        return self._marks.get(resolve_endpoint(endpoint), {}).get(symbol.upper())
+
+    def sync(
+        self,
+        endpoint: str,
+        symbols: Iterable[str],
+        *,
+        full: bool = False,
+        max_workers: int = 8,
+        **kwargs: Any,
+    ) -> BatchResult:
+        """
+        Fetch what changed since the last run and merge it into the local copy.
+
+        Parameters
+        ----------
+        endpoint :
+            One of :data:`SYNC_ENDPOINTS` (the client attribute name, e.g.
+            ``"house_trades"``) or its API path (``"congress/house"``).
+        symbols :
+            Tickers to sync; fetched in parallel like ``ticker_many``.
+        full :
+            Ignore the high-water marks and re-download everything.
+        max_workers :
+            Thread-pool size.
+        **kwargs :
+            Forwarded to the endpoint method (``date_to``, ``limit``, ...).
+            ``date_from`` is chosen by the engine; ``limit`` defaults to the
+            API maximum.
+
+        Returns
+        -------
+        BatchResult
+            ``{symbol: SyncResult}``; failed symbols are on ``.errors`` and
+            keep their previous mark.
+        """
+        endpoint = resolve_endpoint(endpoint)
+        spec = SYNC_ENDPOINTS[endpoint]
+        if "date_from" in kwargs:
+            raise TypeError("date_from is managed by SyncEngine; use full=True to refetch")
+        for key in ("as_dataframe", "output", "as_records"):
+            if kwargs.get(key):
+                raise TypeError(f"SyncEngine stores raw rows; {key} is not supported")
+        fetch = self._c
+        for part in spec.method.split("."):
+            fetch = getattr(fetch, part)
+
+        def _one(symbol: str) -> SyncResult:
+            return self._sync_one(endpoint, spec, fetch, symbol, full, kwargs)
+
+        batch = map_symbols(_one, symbols, max_workers=max_workers)
+        if batch:
+            self._write_state()
+        return batch
+
+    def load(
+        self,
+        endpoint: str,
+        symbol: str,
+        *,
+        as_dataframe: bool = False,
+    ) -> List[Dict[str, Any]] | pd.DataFrame:
+        """
+        Return the local rows for *endpoint* / *symbol* (newest first).
+
+        With ``as_dataframe=True`` the frame is built with the same schema
+        as the endpoint's own ``as_dataframe`` branch.
+        """
+        endpoint = resolve_endpoint(endpoint)
+        spec = SYNC_ENDPOINTS[endpoint]
+        rows = self._read_rows(endpoint, symbol.upper())
+        if as_dataframe:
+            return _frames.build_frame(rows, spec.schema)
+        return rows
+
+    # ---------- private helpers ----------
+    def _sync_one(
+        self,
+        endpoint: str,
+        spec: _Spec,
+        fetch: Any,
+        symbol: str,
+        full: bool,
+        kwargs: Dict[str, Any],
+    ) -> SyncResult:
+        mark = None if full else self.high_water(endpoint, symbol)
+        since = None
+        if mark:
+            start = _dt.date.fromisoformat(mark) - _dt.timedelta(days=self.overlap_days)
+            since = start.isoformat()
+
+        limit = kwargs.get("limit") or RANGE_LIMIT
+        kwargs = {**kwargs, "limit": limit}
+        if since:
+            kwargs["date_from"] = since
+        data = fetch(symbol, **kwargs)
+        fresh = data.get(spec.rows, []) if isinstance(data, dict) else []
+        complete = len(fresh) < limit
+        if not complete and since:
+            fresh, complete = self._refetch_window(spec, fetch, symbol, since, kwargs)
+        elif not complete:
+            fresh, complete = self._backfill(spec, fetch, symbol, fresh, kwargs)
+
+        local = self._read_rows(endpoint, symbol)
+        if since:
+            kept = [r for r in local if _day(r, spec.date) < since]
+            window = [r for r in local if _day(r, spec.date) >= since]
+        else:
+            kept, window = [], local
+
+        old_keys = {row_key(r) for r in window}
+        new_keys = {row_key(r) for r in fresh}
+        added = [r for r in fresh if row_key(r) not in old_keys]
+        if complete:
+            removed = [r for r in window if row_key(r) not in new_keys]
+            merged = dedupe_rows([fresh, kept])
+        else:
+            # a cut-off response says nothing about the rows it lacks
+            removed = []
+            merged = dedupe_rows([fresh, window + kept])
+        merged.sort(key=lambda r: _day(r, spec.date), reverse=True)
+        self._write_rows(endpoint, symbol, merged)
+
+        high = max((_day(r, spec.date) for r in merged), default="") or None
+        with self._lock:
+            if not high:
+                self._marks.get(endpoint, {}).pop(symbol, None)
+            elif complete or since:
+                self._marks.setdefault(endpoint, {})[symbol] = high
+            # an incomplete full download sets no mark, so the next run retries it
+        return SyncResult(endpoint, symbol, since, high, len(fresh),
+                          added, removed, len(merged), complete)
+
+    @staticmethod
+    def _backfill(
+        spec: _Spec,
+        fetch: Any,
+        symbol: str,
+        page: List[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Page back through a full download until a page comes back short.
+
+        The API cuts a response at ``limit`` keeping the newest rows, so each
+        request ends on the oldest day of the page before. That day is read
+        again in full and :func:`dedupe_rows` drops the overlap.
+        """
+        limit = kwargs["limit"]
+        pages = [page]
+        while len(page) >= limit:
+            oldest = min((d for d in (_day(r, spec.date) for r in page) if d), default="")
+            if not oldest:
+                return dedupe_rows(pages), False
+            data = fetch(symbol, **{**kwargs, "date_to": oldest})
+            page = data.get(spec.rows, []) if isinstance(data, dict) else []
+            pages.append(page)
+            if len(page) >= limit and all(_day(r, spec.date) == oldest for r in page):
+                # one day fills the page on its own
+                return dedupe_rows(pages), False
+        return dedupe_rows(pages), True
+
+    @staticmethod
+    def _refetch_window(
+        spec: _Spec, fetch: Any, symbol: str, since: str, kwargs: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Re-read ``[since, date_to]`` in windows that are split until none is full."""
+        rest = {k: v for k, v in kwargs.items() if k not in ("date_from", "date_to", "limit")}
+        try:
+            data = fetch_range(
+                functools.partial(fetch, **rest),
+                symbol,
+                spec.rows,
+                since,
+                kwargs.get("date_to"),
+                date_field=spec.date,
+                max_workers=1,
+                limit=kwargs["limit"],
+            )
+        except IncompleteRange as exc:
+            # a single day still fills the page
+            return exc.result.get(spec.rows, []), False
+        return data.get(spec.rows, []), True
+
+    def _read_state(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.root / "state.json", encoding="utf-8") as fh:
+                state = json.load(fh)
+        except FileNotFoundError:
+            return {}
+        if state.get("version") != _STATE_VERSION:
+            raise ValueError(f"Unsupported sync state version: {state.get('version')!r}")
+        return {ep: dict(marks) for ep, marks in state.get("marks", {}).items()}
+
+    def _write_state(self) -> None:
+        with self._lock:
+            state = {"version": _STATE_VERSION, "marks": self._marks}
+            _atomic_write(self.root / "state.json", state)
+
+    def _read_rows(self, endpoint: str, symbol: str) -> List[Dict[str, Any]]:
+        try:
+            with open(self.root / endpoint / f"{symbol}.json", encoding="utf-8") as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return []
+
+    def _write_rows(self, endpoint: str, symbol: str, rows: List[Dict[str, Any]]) -> None:
+        _atomic_write(self.root / endpoint / f"{symbol}.json", rows)
+
+
+def _day(row: Dict[str, Any], field: str) -> str:
+    """``YYYY-MM-DD`` part of *row*'s date field (``""`` when missing)."""
+    value = row.get(field)
+    return value[:10] if isinstance(value, str) else ""
+
+
+def _atomic_write(path: Path, obj: Any) -> None:
+    """Write *obj* as JSON via a temp file + rename, so readers never see half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(obj, fh, separators=(",", ":"))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
@@ -0,0 +1,160 @@
+"""
+finbrain.transfer
+~~~~~~~~~~~~~~~~~
+
+Content-encoding negotiation and transfer accounting for both clients.
+
+Response bodies are JSON and compress very well. ``requests`` (via urllib3)
+and ``httpx`` both decode ``gzip`` and ``deflate`` out of the box, and
+``br`` / ``zstd`` once the optional codecs are installed
+(``pip install finbrain-python[compression]``). :func:`resolve_accept_encoding`
+builds the ``Accept-Encoding`` header from what the HTTP library can
+actually decode, best ratio first.
+
+:class:`TransferStats` records, per request, how many bytes came over the
+wire and how many they decompressed to, so the saving can be measured.
+
+Example
+-------
+>>> fb = FinBrainClient(api_key="YOUR_KEY", accept_encoding="zstd, br, gzip")
+>>> fb.insider_transactions.ticker("AAPL")
+>>> fb.last_transfer
+Transfer(path='insider-trading/AAPL', encoding='zstd', wire_bytes=41230, body_bytes=402118)
+>>> fb.transfer_stats.ratio
+9.75...
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Sequence, Union
+
+__all__ = [
+    "Transfer",
+    "TransferStats",
+    "httpx_encodings",
+    "resolve_accept_encoding",
+    "urllib3_encodings",
+]
+
+# Best compression ratio on JSON first
+PREFERENCE = ("zstd", "br", "gzip", "deflate")
+
+AcceptEncoding = Union[str, Sequence[str], None]
+
+
+def urllib3_encodings() -> FrozenSet[str]:
+    """Content codings urllib3 (and so ``requests``) can decode here."""
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    return frozenset(c.strip() for c in ACCEPT_ENCODING.split(",")) | {"identity"}
+
+
+def httpx_encodings() -> FrozenSet[str]:
+    """Content codings httpx can decode here."""
+    try:
+        from httpx._decoders import SUPPORTED_DECODERS
+    except ImportError:  # private module moved; fall back to the always-present ones
+        return frozenset({"identity", "gzip", "deflate"})
+    return frozenset(SUPPORTED_DECODERS)
+
+
+def _codings(value: str | Sequence[str]) -> List[str]:
+    tokens = value.split(",") if isinstance(value, str) else list(value)
+    return [t.strip() for t in tokens if t.strip()]
+
+
+def resolve_accept_encoding(value: AcceptEncoding, supported: Iterable[str]) -> str | None:
+    """
+    Resolve the ``Accept-Encoding`` header value for a client.
+
+    Parameters
+    ----------
+    value :
+        ``"auto"`` for every supported coding in :data:`PREFERENCE` order,
+        an explicit header string (``"zstd, br;q=0.9, gzip;q=0.5"``) or
+        list of codings, or ``None`` to keep the HTTP library's default.
+    supported :
+        Codings the HTTP library can decode (:func:`urllib3_encodings` /
+        :func:`httpx_encodings`).
+
+    Raises
+    ------
+    ValueError
+        If an explicitly requested coding cannot be decoded, so a server
+        honouring it would hand back an unreadable body.
+    """
+    if value is None:
+        return None
+    available = set(supported)
+    if isinstance(value, str) and value.strip().lower() == "auto":
+        return ", ".join(c for c in PREFERENCE if c in available)
+
+    codings = _codings(value)
+    missing = [
+        c for c in codings
+        if c.split(";")[0].strip().lower() not in available | {"*"}
+    ]
+    if missing:
+        raise ValueError(
+            f"Cannot decode content coding(s) {', '.join(missing)}; install the "
+            "codec (pip install finbrain-python[compression]) or drop them"
+        )
+    return ", ".join(codings)
+
+
+class Transfer(NamedTuple):
+    """Bytes moved by one request."""
+
+    path: str
+    encoding: str
+    wire_bytes: int
+    body_bytes: int
+
+    @property
+    def ratio(self) -> float:
+        """Decompressed / on-the-wire size (``1.0`` when uncompressed)."""
+        return self.body_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+
+class TransferStats:
+    """
+    Thread-safe running totals of :class:`Transfer` records.
+
+    Responses served from the cache never touch the network and are not
+    counted; a ``304 Not Modified`` is counted with its (empty) body.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, transfer: Transfer) -> None:
+        with self._lock:
+            self.requests += 1
+            self.wire_bytes += transfer.wire_bytes
+            self.body_bytes += transfer.body_bytes
+            counts = self.by_encoding.setdefault(transfer.encoding, [0, 0, 0])
+            counts[0] += 1
+            counts[1] += transfer.wire_bytes
+            counts[2] += transfer.body_bytes
+
+    def reset(self) -> None:
+        """Zero every counter."""
+        with self._lock:
+            self.requests = 0
+            self.wire_bytes = 0
+            self.body_bytes = 0
+            # encoding -> [requests, wire_bytes, body_bytes]
+            self.by_encoding: Dict[str, List[int]] = {}
+
+    @property
+    def ratio(self) -> float:
+        """Overall decompressed / on-the-wire size."""
+        return self.body_bytes / self.wire_bytes if self.wire_bytes else 1.0
+
+    def __repr__(self) -> str:
+        return (
+            f"TransferStats(requests={self.requests}, wire_bytes={self.wire_bytes}, "
+            f"body_bytes={self.body_bytes}, ratio={self.ratio:.2f})"
+        )
@@ -0,0 +1,95 @@
+import asyncio
+
+import httpx
+import pandas as pd
+import pytest
+import pytest_asyncio
+
+from finbrain import BatchResult
+from finbrain.aio import AsyncFinBrainClient
+from finbrain.aio.endpoints._utils import iter_many
+from finbrain.exceptions import FinBrainError, NotFound
+from .conftest import wrap_v2
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    sym = request.url.path.rsplit("/", 1)[-1]
+    if sym == "NOPE":
+        return httpx.Response(404, json={"success": False, "error": {"code": "NOT_FOUND", "message": "nope"}})
+    return httpx.Response(200, json=wrap_v2({
+        "symbol": sym,
+        "predictions": [{"date": "2024-11-04", "mid": 1.0, "lower": 0.5, "upper": 1.5}],
+    }))
+
+
+@pytest_asyncio.fixture()
+async def fb():
+    client = AsyncFinBrainClient(api_key="dummy", retries=0)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_many_bounds_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def fetch(sym):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return sym.lower()
+
+    out = [item async for item in iter_many(fetch, [f"S{i}" for i in range(20)], concurrency=3)]
+    assert peak == 3
+    assert sorted(out) == sorted((f"S{i}", f"s{i}") for i in range(20))
+
+
+@pytest.mark.asyncio
+async def test_iter_many_streams_in_completion_order():
+    async def fetch(sym):
+        await asyncio.sleep(0.05 if sym == "SLOW" else 0)
+        return sym
+
+    order = [sym async for sym, _ in iter_many(fetch, ["SLOW", "FAST"], concurrency=2)]
+    assert order == ["FAST", "SLOW"]
+
+
+@pytest.mark.asyncio
+async def test_gather_tickers_yields_results_and_errors(fb):
+    results = {}
+    async for sym, value in fb.gather_tickers("predictions", ["aapl", "NOPE", "MSFT"], concurrency=2):
+        results[sym] = value
+
+    assert set(results) == {"AAPL", "NOPE", "MSFT"}
+    assert results["AAPL"]["symbol"] == "AAPL"
+    assert isinstance(results["NOPE"], NotFound)
+
+
+@pytest.mark.asyncio
+async def test_gather_tickers_accepts_endpoint_object(fb):
+    pairs = [pair async for pair in fb.gather_tickers(fb.predictions, ["AAPL"], prediction_type="monthly")]
+    assert pairs[0][0] == "AAPL"
+    assert not isinstance(pairs[0][1], FinBrainError)
+
+
+@pytest.mark.asyncio
+async def test_async_ticker_many_batch(fb):
+    batch = await fb.predictions.ticker_many(["MSFT", "NOPE", "AAPL"], concurrency=2)
+    assert isinstance(batch, BatchResult)
+    assert list(batch) == ["MSFT", "AAPL"]  # input order, failures removed
+    assert isinstance(batch.errors["NOPE"], NotFound)
+
+
+@pytest.mark.asyncio
+async def test_async_ticker_many_dataframe(fb):
+    df = await fb.predictions.ticker_many(["AAPL", "MSFT"], as_dataframe=True)
+    same = await fb.predictions.ticker_many(["AAPL", "MSFT"], output="pandas")
+    pd.testing.assert_frame_equal(same, df)
+    assert isinstance(df, pd.DataFrame)
+    assert df.index.names == ["symbol", "date"]
+    assert list(df.index.get_level_values("symbol")) == ["AAPL", "MSFT"]
+    assert df.attrs["errors"] == {}
@@ -75,3 +75,28 @@ async def test_async_endpoints_exist():
         assert hasattr(client, "reddit_mentions")
         assert hasattr(client, "government_contracts")
         assert hasattr(client, "patent_filings")
+
+
+@pytest.mark.asyncio
+async def test_async_client_pool_limits():
+    """Pool options are passed through to the underlying httpx client."""
+    client = AsyncFinBrainClient(
+        api_key="test_key", max_connections=64, max_keepalive_connections=32, keepalive_expiry=30
+    )
+    assert client.limits == httpx.Limits(
+        max_connections=64, max_keepalive_connections=32, keepalive_expiry=30
+    )
+    async with client:
+        pool = client._client._transport._pool
+        assert pool._max_connections == 64
+        assert pool._max_keepalive_connections == 32
+        assert pool._keepalive_expiry == 30
+        assert not pool._http2
+
+
+@pytest.mark.asyncio
+async def test_async_client_http2():
+    """http2=True enables HTTP/2 on the transport (needs the h2 package)."""
+    pytest.importorskip("h2")
+    async with AsyncFinBrainClient(api_key="test_key", http2=True) as client:
+        assert client._client._transport._pool._http2
@@ -0,0 +1,111 @@
+import pandas as pd
+import pytest
+
+from finbrain.endpoints._utils import BatchResult, fetch_many, map_symbols, normalize_symbols
+from finbrain.exceptions import NotFound
+from .conftest import stub_json, wrap_v2
+
+
+def _predictions(symbol):
+    return wrap_v2({
+        "symbol": symbol,
+        "predictions": [
+            {"date": "2024-11-04", "mid": 201.3, "lower": 198.2, "upper": 204.1},
+            {"date": "2024-11-05", "mid": 202.0, "lower": 199.0, "upper": 205.0},
+        ],
+    })
+
+
+def test_normalize_symbols_dedupes_and_uppercases():
+    assert normalize_symbols(["aapl", "MSFT", "AAPL", "msft", "amzn"]) == ["AAPL", "MSFT", "AMZN"]
+    assert normalize_symbols("aapl") == ["AAPL"]
+
+
+def test_ticker_many_returns_mapping(client, _activate_responses):
+    for sym in ("AAPL", "MSFT"):
+        stub_json(_activate_responses, "GET", f"predictions/daily/{sym}", _predictions(sym))
+
+    batch = client.predictions.ticker_many(["aapl", "MSFT", "AAPL"], max_workers=2)
+
+    assert isinstance(batch, BatchResult)
+    assert set(batch) == {"AAPL", "MSFT"}
+    assert batch["MSFT"]["symbol"] == "MSFT"
+    assert batch.errors == {}
+    assert len(_activate_responses.calls) == 2
+
+
+def test_ticker_many_collects_errors(client, _activate_responses):
+    path = "news/AAPL"
+    stub_json(_activate_responses, "GET", path, wrap_v2({"symbol": "AAPL", "articles": []}))
+    stub_json(
+        _activate_responses, "GET", "news/NOPE",
+        {"success": False, "error": {"code": "NOT_FOUND", "message": "Ticker not found"}},
+        status=404,
+    )
+
+    batch = client.news.ticker_many(["AAPL", "NOPE"])
+
+    assert list(batch) == ["AAPL"]
+    assert isinstance(batch.errors["NOPE"], NotFound)
+
+
+def test_ticker_many_dataframe_has_symbol_level(client, _activate_responses):
+    for sym in ("AAPL", "MSFT"):
+        stub_json(_activate_responses, "GET", f"predictions/daily/{sym}", _predictions(sym))
+    stub_json(
+        _activate_responses, "GET", "predictions/daily/NOPE",
+        {"success": False, "error": {"code": "NOT_FOUND", "message": "nope"}},
+        status=404,
+    )
+
+    df = client.predictions.ticker_many(["AAPL", "MSFT", "NOPE"], as_dataframe=True)
+
+    assert isinstance(df, pd.DataFrame)
+    assert df.index.names == ["symbol", "date"]
+    assert len(df) == 4
+    assert df.loc[("MSFT", pd.Timestamp("2024-11-05")), "mid"] == 202.0
+    assert set(df.attrs["errors"]) == {"NOPE"}
+
+    same = client.predictions.ticker_many(["AAPL", "MSFT", "NOPE"], output="pandas")
+    pd.testing.assert_frame_equal(same, df)
+
+
+def test_ticker_many_forwards_kwargs(client, _activate_responses):
+    payload = wrap_v2({"symbol": "AAPL", "transactions": []})
+    stub_json(
+        _activate_responses, "GET", "insider-trading/AAPL", payload,
+        params={"startDate": "2024-01-01", "limit": "5"},
+    )
+    batch = client.insider_transactions.ticker_many(["AAPL"], date_from="2024-01-01", limit=5)
+    assert batch["AAPL"]["symbol"] == "AAPL"
+
+
+def test_put_call_many(client, _activate_responses):
+    stub_json(_activate_responses, "GET", "put-call-ratio/AAPL", wrap_v2({"symbol": "AAPL", "data": []}))
+    batch = client.options.put_call_many(["AAPL"])
+    assert batch["AAPL"] == {"symbol": "AAPL", "data": []}
+
+
+def test_fetch_many_empty_and_validation():
+    assert fetch_many(lambda s, **kw: s, []) == {}
+    assert fetch_many(lambda s, **kw: s, [], as_dataframe=True).empty
+    with pytest.raises(ValueError, match="max_workers"):
+        fetch_many(lambda s, **kw: s, ["A"], max_workers=0)
+
+
+def test_map_symbols_takes_plain_callables():
+    def lookup(symbol):
+        if symbol == "NOPE":
+            raise NotFound("missing")
+        return len(symbol)
+
+    batch = map_symbols(lookup, ["aapl", "nope", "AAPL"], max_workers=2)
+    assert batch == {"AAPL": 4} and list(batch.errors) == ["NOPE"]
+
+
+def test_fetch_many_propagates_programming_errors():
+    def boom(symbol, **kwargs):
+        raise TypeError("bad kwarg")
+
+    with pytest.raises(TypeError):
+        fetch_many(boom, ["AAPL"])
@@ -0,0 +1,208 @@
+import time
+
+import httpx
+import pytest
+from urllib.parse import urljoin
+
+from finbrain import FinBrainClient
+from finbrain.aio import AsyncFinBrainClient
+from finbrain.cache import ResponseCache
+from .conftest import BASE, stub_json, wrap_v2
+
+
+@pytest.fixture()
+def cache(tmp_path):
+    c = ResponseCache(tmp_path / "cache.sqlite3", ttl=60)
+    yield c
+    c.close()
+
+
+# ── ResponseCache unit behaviour ──────────────────────────────────────
+def test_key_normalizes_params():
+    a = ResponseCache.key("get", BASE + "news/AAPL", {"limit": 10, "startDate": "2024-01-01"})
+    b = ResponseCache.key("GET", BASE + "news/AAPL", {"startDate": "2024-01-01", "limit": "10"})
+    c = ResponseCache.key("GET", BASE + "news/AAPL", {"limit": "10", "endDate": None, "startDate": "2024-01-01"})
+    assert a == b == c
+    assert a != ResponseCache.key("GET", BASE + "news/MSFT", {"limit": "10"})
+
+
+def test_ttl_longest_prefix_wins(tmp_path):
+    c = ResponseCache(
+        tmp_path / "c.sqlite3",
+        ttl=10,
+        ttl_by_prefix={"predictions/": 20, "predictions/daily/": 30, "/congress/house/": 0},
+    )
+    assert c.ttl_for("predictions/daily/AAPL") == 30
+    assert c.ttl_for("predictions/monthly/AAPL") == 20
+    assert c.ttl_for("congress/house/AAPL") == 0
+    assert c.ttl_for("news/AAPL") == 10
+    c.close()
+
+
+def test_zero_ttl_is_not_stored(tmp_path):
+    c = ResponseCache(tmp_path / "c.sqlite3", ttl_by_prefix={"congress/": 0})
+    c.set("k", "congress/house/AAPL", b"{}")
+    assert c.get("k") is None
+    assert len(c) == 0
+    c.close()
+
+
+def test_expired_entry_is_a_miss(cache, monkeypatch):
+    cache.set("k", "news/AAPL", b"{}")
+    assert cache.get("k") == b"{}"
+    real = time.time
+    monkeypatch.setattr("finbrain.cache.time.time", lambda: real() + 120)
+    assert cache.get("k") is None
+
+
+def test_lru_eviction_under_size_cap(tmp_path, monkeypatch):
+    clock = iter(range(1000, 2000))
+    monkeypatch.setattr("finbrain.cache.time.time", lambda: float(next(clock)))
+    c = ResponseCache(tmp_path / "c.sqlite3", ttl=1e6, max_bytes=20)
+    c.set("a", "x", b"0123456789")
+    c.set("b", "x", b"0123456789")
+    assert c.get("a") is not None  # touch "a" so "b" becomes least recently used
+    c.set("c", "x", b"0123456789")
+    assert c.get("b") is None
+    assert c.get("a") is not None
+    assert c.get("c") is not None
+    c.close()
+
+
+def test_max_entries_cap(tmp_path):
+    c = ResponseCache(tmp_path / "c.sqlite3", max_entries=2)
+    for k in "abc":
+        c.set(k, "x", b"{}")
+    assert len(c) == 2
+    c.close()
+
+
+def test_expired_entry_with_validators_is_kept_for_revalidation(cache, monkeypatch):
+    cache.set("k", "news/AAPL", b"[1]", etag='"v1"', last_modified="Wed, 01 May 2024 00:00:00 GMT")
+    cache.set("plain", "news/MSFT", b"[2]")
+    real = time.time
+    monkeypatch.setattr("finbrain.cache.time.time", lambda: real() + 120)
+
+    assert cache.get("k") is None
+    entry = cache.lookup("k")
+    assert entry is not None and not entry.fresh and entry.body == b"[1]"
+    assert entry.conditional_headers() == {
+        "If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 May 2024 00:00:00 GMT",
+    }
+    assert cache.lookup("plain") is None
+
+    cache.refresh("k", "news/AAPL")
+    assert cache.get("k") == b"[1]"
+
+
+def test_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "c.sqlite3"
+    c1 = ResponseCache(path)
+    c1.set("k", "x", b"[1]")
+    c1.close()
+    c2 = ResponseCache(path)
+    assert c2.get("k") == b"[1]"
+    c2.close()
+
+
+# ── sync client integration ───────────────────────────────────────────
+def test_sync_client_serves_repeat_get_from_cache(cache, _activate_responses):
+    client = FinBrainClient(api_key="dummy", retries=0, cache=cache)
+    payload = wrap_v2({"symbol": "AAPL", "predictions": []})
+    stub_json(_activate_responses, "GET", "predictions/daily/AAPL", payload)
+
+    first = client.predictions.ticker("AAPL")
+    client.last_meta = None
+    second = client.predictions.ticker("AAPL")
+
+    assert first == second == {"symbol": "AAPL", "predictions": []}
+    assert len(_activate_responses.calls) == 1
+    # meta is restored from the cached envelope as well
+    assert client.last_meta == {"timestamp": "2025-01-17T12:00:00.000Z"}
+
+
+def test_sync_client_keys_on_params(cache, _activate_responses):
+    client = FinBrainClient(api_key="dummy", retries=0, cache=cache)
+    payload = wrap_v2({"symbol": "AAPL", "articles": []})
+    stub_json(_activate_responses, "GET", "news/AAPL", payload, params={"limit": "1"})
+    stub_json(_activate_responses, "GET", "news/AAPL", payload, params={"limit": "2"})
+
+    client.news.ticker("AAPL", limit=1)
+    client.news.ticker("AAPL", limit=2)
+    client.news.ticker("AAPL", limit=1)
+    assert len(_activate_responses.calls) == 2
+
+
+def test_sync_client_does_not_cache_errors(cache, _activate_responses):
+    client = FinBrainClient(api_key="dummy", retries=0, cache=cache)
+    url = urljoin(BASE, "markets")
+    _activate_responses.add("GET", url, json={"error": {"message": "boom"}}, status=404)
+    with pytest.raises(Exception):
+        client._request("GET", "markets")
+    assert len(cache) == 0
+
+
+def test_sync_client_revalidates_with_etag(cache, _activate_responses, monkeypatch):
+    client = FinBrainClient(api_key="dummy", retries=0, cache=cache)
+    url = urljoin(BASE, "screener/sentiment")
+    _activate_responses.add("GET", url, json=wrap_v2({"data": [{"symbol": "AAPL"}]}),
+                            headers={"ETag": '"abc"'})
+    _activate_responses.add("GET", url, status=304, body=b"")
+
+    first = client._request("GET", "screener/sentiment")
+    real = time.time
+    monkeypatch.setattr("finbrain.cache.time.time", lambda: real() + 120)
+    second = client._request("GET", "screener/sentiment")
+    third = client._request("GET", "screener/sentiment")  # fresh again after the 304
+
+    assert first == second == third == {"data": [{"symbol": "AAPL"}]}
+    assert len(_activate_responses.calls) == 2
+    assert "If-None-Match" not in _activate_responses.calls[0].request.headers
+    assert _activate_responses.calls[1].request.headers["If-None-Match"] == '"abc"'
+
+
+# ── async client integration ──────────────────────────────────────────
+@pytest.mark.asyncio
+async def test_async_client_shares_cache(cache):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json=wrap_v2([{"name": "S&P 500", "region": "US"}]))
+
+    client = AsyncFinBrainClient(api_key="dummy", retries=0, cache=cache)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        first = await client.available.markets()
+        second = await client.available.markets()
+    finally:
+        await client.close()
+
+    assert first == second == [{"name": "S&P 500", "region": "US"}]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_revalidates_with_last_modified(cache, monkeypatch):
+    stamp = "Wed, 01 May 2024 00:00:00 GMT"
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-Modified-Since"))
+        if request.headers.get("If-Modified-Since") == stamp:
+            return httpx.Response(304)
+        return httpx.Response(200, json=wrap_v2([{"name": "S&P 500"}]),
+                              headers={"Last-Modified": stamp})
+
+    client = AsyncFinBrainClient(api_key="dummy", retries=0, cache=cache)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        first = await client.available.markets()
+        real = time.time
+        monkeypatch.setattr("finbrain.cache.time.time", lambda: real() + 120)
+        second = await client.available.markets()
+    finally:
+        await client.close()
+
+    assert first == second == [{"name": "S&P 500"}]
+    assert seen == [None, stamp]
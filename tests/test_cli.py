@@ -0,0 +1,192 @@
+import csv
+import json
+
+import pytest
+
+pytest.importorskip("typer")
+
+from typer.testing import CliRunner  # noqa: E402
+
+from finbrain.cli import app  # noqa: E402
+from .conftest import stub_json, wrap_v2  # noqa: E402
+
+runner = CliRunner()
+KEY = ["--api-key", "dummy"]
+
+
+def _stub_insider(rsps, symbol, dates=("2024-01-15",)):
+    stub_json(rsps, "GET", f"insider-trading/{symbol}", wrap_v2({
+        "symbol": symbol,
+        "transactions": [{"date": d, "insider": "X", "shares": 10} for d in dates],
+    }))
+
+
+def test_pull_ndjson_from_symbols(_activate_responses, tmp_path):
+    for sym in ("AAPL", "MSFT"):
+        _stub_insider(_activate_responses, sym)
+    out = tmp_path / "insider.ndjson"
+
+    result = runner.invoke(app, ["pull", "insider-trading", "-s", "aapl,MSFT",
+                                 "--out", str(out), "-q", *KEY])
+
+    assert result.exit_code == 0, result.output
+    rows = [json.loads(line) for line in out.read_text().splitlines()]
+    assert sorted(r["symbol"] for r in rows) == ["AAPL", "MSFT"]
+    assert rows[0]["shares"] == 10
+    assert set((tmp_path / "insider.ndjson.checkpoint").read_text().split()) == {"AAPL", "MSFT"}
+
+
+def test_pull_resumes_from_checkpoint(_activate_responses, tmp_path):
+    out = tmp_path / "insider.csv"
+    symbols = tmp_path / "symbols.txt"
+    symbols.write_text("AAPL  # done already\nMSFT\n")
+    out.write_text("symbol,date,insider,shares\nAAPL,2024-01-15,X,10\n")
+    (tmp_path / "insider.csv.checkpoint").write_text("AAPL\n")
+    _stub_insider(_activate_responses, "MSFT", dates=("2024-02-01", "2024-02-02"))
+
+    result = runner.invoke(app, ["pull", "insider_transactions", "-f", str(symbols),
+                                 "-o", str(out), "-q", *KEY])
+
+    assert result.exit_code == 0, result.output
+    assert "resuming: 1 of 2" in result.output
+    with open(out, newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    assert [r["symbol"] for r in rows] == ["AAPL", "MSFT", "MSFT"]
+
+
+@pytest.mark.parametrize("fmt, written", [
+    ("ndjson", '{"symbol":"AAPL","date":"2024-01-15"}\n'
+               '{"symbol":"MSFT","date":"2024-02-01"}\n{"symbol":"MS'),
+    ("csv", "symbol,date\nAAPL,2024-01-15\nMSFT,2024-02-01\nMSFT,20"),
+])
+def test_pull_resume_drops_rows_of_unfinished_symbols(
+    _activate_responses, tmp_path, fmt, written
+):
+    # MSFT's rows were written but the run stopped before it was checkpointed
+    out = tmp_path / f"insider.{fmt}"
+    out.write_text(written)
+    (tmp_path / f"insider.{fmt}.checkpoint").write_text("AAPL\n")
+    _stub_insider(_activate_responses, "MSFT", dates=("2024-02-01", "2024-02-02"))
+
+    result = runner.invoke(app, ["pull", "insider-trading", "-s", "AAPL,MSFT",
+                                 "-o", str(out), "-q", *KEY])
+
+    assert result.exit_code == 0, result.output
+    if fmt == "ndjson":
+        rows = [json.loads(line) for line in out.read_text().splitlines()]
+    else:
+        with open(out, newline="") as fh:
+            rows = list(csv.DictReader(fh))
+    assert [(r["symbol"], r["date"]) for r in rows] == [
+        ("AAPL", "2024-01-15"), ("MSFT", "2024-02-01"), ("MSFT", "2024-02-02"),
+    ]
+
+
+def test_pull_csv_widens_header_for_late_fields(_activate_responses, tmp_path):
+    _stub_insider(_activate_responses, "AAPL")
+    stub_json(_activate_responses, "GET", "insider-trading/MSFT", wrap_v2({
+        "symbol": "MSFT",
+        "transactions": [{"date": "2024-02-01", "insider": "Y", "shares": 5, "price": 410.5}],
+    }))
+    out = tmp_path / "insider.csv"
+
+    result = runner.invoke(app, ["pull", "insider-trading", "-s", "AAPL,MSFT", "-c", "1",
+                                 "-o", str(out), "-q", *KEY])
+
+    assert result.exit_code == 0, result.output
+    with open(out, newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    assert [(r["symbol"], r["price"]) for r in rows] == [("AAPL", ""), ("MSFT", "410.5")]
+
+
+def test_pull_restart_clears_parquet_output_and_closes_client(
+    _activate_responses, tmp_path, monkeypatch
+):
+    pytest.importorskip("pyarrow")
+    from finbrain import FinBrainClient
+    from finbrain.store import ParquetStore
+
+    closed = []
+    monkeypatch.setattr(FinBrainClient, "close", lambda self: closed.append(self))
+    for sym in ("AAPL", "MSFT"):
+        _stub_insider(_activate_responses, sym)
+    store = tmp_path / "store"
+    args = ["pull", "insider-trading", "-o", str(store), "-q", *KEY]
+
+    assert runner.invoke(app, [*args, "-s", "AAPL"]).exit_code == 0
+    result = runner.invoke(app, [*args, "-s", "MSFT", "--restart"])
+
+    assert result.exit_code == 0, result.output
+    assert ParquetStore(store).symbols("insider_transactions") == ["MSFT"]
+    assert len(closed) == 2
+
+
+def test_pull_market_universe_and_failures(_activate_responses, tmp_path):
+    stub_json(_activate_responses, "GET", "tickers",
+              wrap_v2({"tickers": [{"symbol": "AAPL"}, {"symbol": "NOPE"}]}),
+              params={"type": "daily", "market": "S&P 500"})
+    _stub_insider(_activate_responses, "AAPL")
+    stub_json(_activate_responses, "GET", "insider-trading/NOPE",
+              {"success": False, "error": "not found"}, status=404)
+    out = tmp_path / "out.ndjson"
+
+    result = runner.invoke(app, ["pull", "insider-trading", "--market", "S&P 500",
+                                 "-o", str(out), "-q", *KEY])
+
+    assert result.exit_code == 1
+    assert "failed NOPE" in result.output
+    assert (tmp_path / "out.ndjson.checkpoint").read_text().split() == ["AAPL"]
+
+
+def test_pull_parquet_store(_activate_responses, tmp_path):
+    pytest.importorskip("pyarrow")
+    from finbrain.store import ParquetStore
+
+    _stub_insider(_activate_responses, "AAPL", dates=("2023-05-01", "2024-01-15"))
+
+    result = runner.invoke(app, ["pull", "insider-trading", "-s", "AAPL",
+                                 "-o", str(tmp_path / "store"), "-q", *KEY])
+
+    assert result.exit_code == 0, result.output
+    df = ParquetStore(tmp_path / "store").read("insider_transactions")
+    assert len(df) == 2
+
+
+def test_screen_csv(_activate_responses, tmp_path):
+    stub_json(_activate_responses, "GET", "screener/analyst-ratings", wrap_v2({"data": [
+        {"symbol": "AAPL", "rating": "Buy"}, {"symbol": "MSFT", "rating": "Hold"},
+    ]}), params={"market": "S&P 500"})
+    out = tmp_path / "ratings.csv"
+
+    result = runner.invoke(app, ["screen", "analyst-ratings", "--market", "S&P 500",
+                                 "-o", str(out), *KEY])
+
+    assert result.exit_code == 0, result.output
+    assert out.read_text().splitlines() == ["symbol,rating", "AAPL,Buy", "MSFT,Hold"]
+
+
+def test_sync_command(_activate_responses, tmp_path):
+    _stub_insider(_activate_responses, "AAPL")
+
+    result = runner.invoke(app, ["sync", "insider-trading", "-s", "AAPL",
+                                 "--dir", str(tmp_path), *KEY])
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout.split() == ["AAPL", "+1", "-0", "1", "2024-01-15"]
+
+
+def test_unknown_endpoint_is_usage_error(tmp_path):
+    result = runner.invoke(app, ["pull", "nope", "-s", "AAPL", "-o", str(tmp_path / "x"), *KEY])
+    assert result.exit_code == 2
+
+
+@pytest.mark.parametrize("screener, option", [
+    ("insider-trading", "--market"), ("congress/house", "--region"), ("query", None),
+])
+def test_screen_rejects_unsupported_screener_options(tmp_path, screener, option):
+    args = [option, "US"] if option else []
+    result = runner.invoke(app, ["screen", screener, *args,
+                                 "-o", str(tmp_path / "x.csv"), *KEY])
+
+    assert result.exit_code == 2
+    assert (option or "SCREENER") in result.output
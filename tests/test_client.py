@@ -44,3 +44,30 @@ def test_missing_api_key_raises(monkeypatch):
     monkeypatch.delenv("FINBRAIN_API_KEY", raising=False)
     with pytest.raises(ValueError, match="API key missing"):
         FinBrainClient(api_key=None)
+
+
+def test_session_mounts_sized_pool_without_adapter_retries():
+    fb = FinBrainClient(api_key="test_key", pool_connections=4, pool_maxsize=64)
+    for prefix in ("https://", "http://"):
+        adapter = fb.session.get_adapter(prefix + "api.finbrain.tech/")
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 0
+
+
+def test_import_does_not_load_pandas_or_plotly():
+    """`import finbrain` stays light; pandas/plotly load only when used."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, finbrain, finbrain.aio\n"
+        "fb = finbrain.FinBrainClient(api_key='k')\n"
+        "print(sorted(m for m in ('pandas', 'numpy', 'plotly') if m in sys.modules))\n"
+        "fb.plot\n"
+        "print('plotly' in sys.modules)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout.split()
+    assert out == ["[]", "True"]
@@ -128,9 +128,9 @@ def test_transient_status_maps_to_dedicated_exception(client, _activate_response
     assert exc_info.value.status_code == status
 
 
-@pytest.mark.parametrize("status", [500, 502, 503, 504])
+@pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
 def test_retries_on_transient_status(monkeypatch, _activate_responses, status):
-    """Transient server/gateway errors are retried, then succeed."""
+    """Rate limiting and transient server/gateway errors are retried, then succeed."""
     monkeypatch.setattr("finbrain.client.time.sleep", lambda *_: None)
     client = FinBrainClient(api_key="dummy", retries=2)
     url = urljoin(BASE, "markets")
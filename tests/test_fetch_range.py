@@ -0,0 +1,142 @@
+import datetime as dt
+import json
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from finbrain.aio import AsyncFinBrainClient
+from finbrain.exceptions import IncompleteRange
+from finbrain.endpoints._utils import RANGE_LIMIT, date_windows, dedupe_rows, split_span
+from .conftest import BASE, wrap_v2
+
+D = dt.date
+
+
+def _trade(day):
+    return {"date": day, "politician": "A", "type": "Purchase"}
+
+
+# one trade every 10 days through 2024, and two identical trades on 2024-05-20
+ROWS = [_trade((D(2024, 1, 1) + dt.timedelta(days=n)).isoformat()) for n in range(0, 366, 10)]
+ROWS.insert(15, _trade("2024-05-20"))
+
+
+def _window_rows(params):
+    # the fake server also returns the day before startDate, so rows on a
+    # window boundary come back from both adjacent windows
+    start = (D.fromisoformat(params["startDate"]) - dt.timedelta(days=1)).isoformat()
+    rows = [r for r in ROWS if start <= r["date"] <= params["endDate"]]
+    rows.reverse()  # API returns newest first
+    if "limit" in params:
+        rows = rows[: int(params["limit"])]
+    return rows
+
+
+def _params(url):
+    return {k: v[0] for k, v in parse_qs(urlparse(str(url)).query).items()}
+
+
+def test_date_windows():
+    assert date_windows("2024-01-01", "2024-01-10", 4) == [
+        (D(2024, 1, 1), D(2024, 1, 4)),
+        (D(2024, 1, 5), D(2024, 1, 8)),
+        (D(2024, 1, 9), D(2024, 1, 10)),
+    ]
+    assert date_windows("2024-01-31", "2024-04-15", "1M") == [
+        (D(2024, 1, 31), D(2024, 2, 28)),
+        (D(2024, 2, 29), D(2024, 3, 28)),
+        (D(2024, 3, 29), D(2024, 4, 15)),
+    ]
+    assert len(date_windows(D(2020, 1, 1), "2024-12-31", "1Y")) == 5
+    assert date_windows("2024-01-01", "2024-01-01", "2W") == [(D(2024, 1, 1), D(2024, 1, 1))]
+    assert split_span((D(2024, 1, 1), D(2024, 1, 4))) == [
+        (D(2024, 1, 1), D(2024, 1, 2)), (D(2024, 1, 3), D(2024, 1, 4)),
+    ]
+    with pytest.raises(ValueError, match="after"):
+        date_windows("2024-02-01", "2024-01-01")
+    with pytest.raises(ValueError, match="invalid window"):
+        date_windows("2024-01-01", "2024-02-01", "3Q")
+
+
+def test_dedupe_rows_only_drops_rows_repeated_across_windows():
+    a, b = {"a": 1, "b": 2}, {"a": 1, "b": 3}
+    assert dedupe_rows([[a, b], [{"b": 2, "a": 1}]]) == [a, b]  # key order ignored
+    assert dedupe_rows([[a, a], [a]]) == [a, a]  # same trade twice in one window
+    assert dedupe_rows([[a], [a, a, b]]) == [a, a, b]
+
+
+def test_range_merges_dedupes_and_sorts(client, _activate_responses):
+    seen = []
+
+    def callback(request):
+        params = _params(request.url)
+        seen.append((params["startDate"], params["endDate"], params["limit"]))
+        return 200, {}, json.dumps(wrap_v2({"symbol": "AAPL", "trades": _window_rows(params)}))
+
+    _activate_responses.add_callback("GET", BASE + "congress/house/AAPL", callback=callback)
+
+    data = client.house_trades.fetch_range("aapl", "2024-01-01", "2024-12-31", window="3M")
+
+    assert sorted(seen) == [("2024-01-01", "2024-03-31", str(RANGE_LIMIT)),
+                            ("2024-04-01", "2024-06-30", str(RANGE_LIMIT)),
+                            ("2024-07-01", "2024-09-30", str(RANGE_LIMIT)),
+                            ("2024-10-01", "2024-12-31", str(RANGE_LIMIT))]
+    assert data["symbol"] == "AAPL"
+    # 2024-03-31 (both windows) once, both 2024-05-20 trades kept, oldest first
+    assert data["trades"] == ROWS
+
+
+def test_range_splits_full_windows(client, _activate_responses):
+    seen = []
+
+    def callback(request):
+        params = _params(request.url)
+        seen.append(params["startDate"])
+        return 200, {}, json.dumps(wrap_v2({"symbol": "AAPL", "trades": _window_rows(params)}))
+
+    _activate_responses.add_callback("GET", BASE + "congress/house/AAPL", callback=callback)
+
+    df = client.house_trades.fetch_range("AAPL", "2024-01-01", "2024-02-29", window="60D",
+                                         limit=3, as_dataframe=True)
+
+    # 6 trades in the range: the full window is halved until every piece fits
+    assert len(seen) > 1
+    assert df.index.strftime("%Y-%m-%d").tolist() == [r["date"] for r in ROWS[:6]]
+
+
+def test_range_raises_on_full_single_day(client, _activate_responses):
+    def callback(request):
+        params = _params(request.url)
+        rows = [r for r in ROWS if params["startDate"] <= r["date"] <= params["endDate"]]
+        rows = rows[::-1][: int(params["limit"])]
+        return 200, {}, json.dumps(wrap_v2({"symbol": "AAPL", "trades": rows}))
+
+    _activate_responses.add_callback("GET", BASE + "congress/house/AAPL", callback=callback)
+
+    # both 2024-05-20 trades fill a limit of 2, and a single day cannot be split
+    with pytest.raises(IncompleteRange) as info:
+        client.house_trades.fetch_range("AAPL", "2024-05-01", "2024-05-31", limit=2)
+
+    assert info.value.days == ["2024-05-20"]
+    assert [r["date"] for r in info.value.result["trades"]] == [
+        "2024-05-10", "2024-05-20", "2024-05-20", "2024-05-30",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_range():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        params = dict(request.url.params)
+        return httpx.Response(200, json=wrap_v2({"symbol": "AAPL",
+                                                 "trades": _window_rows(params)}))
+
+    fb = AsyncFinBrainClient(api_key="dummy", retries=0)
+    fb._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        data = await fb.house_trades.fetch_range("AAPL", "2024-01-01", "2024-12-31",
+                                                 window=45, concurrency=3, limit=4)
+    finally:
+        await fb.close()
+
+    assert data["trades"] == ROWS
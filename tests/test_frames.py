@@ -0,0 +1,111 @@
+import pandas as pd
+import pytest
+
+from finbrain.endpoints._frames import (
+    CONGRESS_TRADES,
+    SCREENER,
+    SENTIMENTS,
+    FrameSchema,
+    build_frame,
+)
+from .conftest import stub_json, wrap_v2
+
+TRADES = [
+    {"date": "2024-01-15", "politician": "A", "transactionType": "Purchase",
+     "amount": "$1,001 - $15,000", "owner": "SP"},
+    {"date": "2024-01-10", "politician": "B", "transactionType": "Sale",
+     "amount": "$1,001 - $15,000", "owner": None},
+]
+
+
+def test_build_frame_applies_schema_dtypes():
+    df = build_frame(TRADES, CONGRESS_TRADES)
+
+    assert df.index.name == "date"
+    assert df.index.dtype == "datetime64[ns]"
+    assert isinstance(df["transactionType"].dtype, pd.CategoricalDtype)
+    assert list(df["transactionType"].cat.categories) == ["Purchase", "Sale"]
+    assert df.loc["2024-01-15", "owner"] == "SP"
+    assert pd.isna(df.loc["2024-01-10", "owner"])
+    # undeclared columns pass through
+    assert df.loc["2024-01-10", "politician"] == "B"
+
+
+def test_build_frame_numeric_coercion_and_rename():
+    rows = [{"date": "2024-01-01", "score": "0.5"}, {"date": "2024-01-02", "score": "n/a"}]
+
+    df = build_frame(rows, SENTIMENTS)
+
+    assert list(df.columns) == ["sentiment"]
+    assert df["sentiment"].dtype == "float64"
+    assert df["sentiment"].iloc[0] == 0.5
+    assert pd.isna(df["sentiment"].iloc[1])
+
+
+def test_build_frame_keeps_integer_columns():
+    schema = FrameSchema(numeric=("shares",))
+    assert build_frame([{"shares": 5}, {"shares": 7}], schema)["shares"].dtype == "int64"
+
+
+def test_build_frame_iso_timestamps_fall_back():
+    schema = FrameSchema(index="date", dates=("date",))
+    df = build_frame([{"date": "2024-01-01T10:30:00", "x": 1}, {"date": None, "x": 2}], schema)
+
+    assert df.index[0] == pd.Timestamp("2024-01-01 10:30:00")
+    assert pd.isna(df.index[1])
+
+
+def test_build_frame_ragged_rows_and_columns_input():
+    schema = FrameSchema(categorical=("kind",))
+    rows = [{"a": 1}, {"a": 2, "kind": "x"}, {"kind": "y", "b": 3}]
+
+    df = build_frame(rows, schema)
+    assert list(df.columns) == ["a", "kind", "b"]
+    assert df["kind"].tolist()[1:] == ["x", "y"]
+
+    same = build_frame({"a": [1, 2, None], "kind": [None, "x", "y"], "b": [None, None, 3]}, schema)
+    assert df["kind"].equals(same["kind"])
+
+
+def test_build_frame_unhashable_categorical_falls_back():
+    df = build_frame([{"kind": ["a"]}, {"kind": "b"}], FrameSchema(categorical=("kind",)))
+    assert len(df) == 2
+
+
+@pytest.mark.parametrize("data", [[], {}, {"a": []}])
+def test_build_frame_empty(data):
+    df = build_frame(data, SCREENER)
+    assert df.empty and list(df.columns) == []
+
+
+def test_endpoint_dataframe_uses_schema(client, _activate_responses):
+    stub_json(_activate_responses, "GET", "insider-trading/AAPL", wrap_v2({
+        "symbol": "AAPL",
+        "transactions": [
+            {"date": "2024-01-15", "insider": "Tim Cook", "relationship": "CEO",
+             "transactionType": "Sale", "shares": 5000, "pricePerShare": 185.5,
+             "totalValue": 927500, "sharesOwned": None},
+        ],
+    }))
+
+    df = client.insider_transactions.ticker("AAPL", as_dataframe=True)
+
+    assert isinstance(df["relationship"].dtype, pd.CategoricalDtype)
+    assert df["sharesOwned"].dtype == "float64"
+    assert df.index.dtype == "datetime64[ns]"
+
+
+def test_screener_frame_is_symbol_indexed_with_categories(client, _activate_responses):
+    stub_json(_activate_responses, "GET", "screener/analyst-ratings", wrap_v2({
+        "data": [
+            {"symbol": "AAPL", "date": "2024-01-15", "rating": "Buy", "targetPrice": 210},
+            {"symbol": "MSFT", "date": "2024-01-15", "rating": "Hold", "targetPrice": None},
+        ],
+    }))
+
+    df = client.screener.analyst_ratings(market="S&P 500", as_dataframe=True)
+
+    assert df.index.name == "symbol"
+    assert isinstance(df["rating"].dtype, pd.CategoricalDtype)
+    assert df["targetPrice"].dtype == "float64"
+    assert df.loc["AAPL", "date"] == "2024-01-15"
@@ -0,0 +1,217 @@
+import httpx
+import pytest
+
+from finbrain import FinBrainClient
+from finbrain.aio import AsyncFinBrainClient
+from finbrain.exceptions import NotFound
+from finbrain.hooks import EVENTS, Hooks, RequestEvent, endpoint_label
+from .conftest import BASE, stub_json, wrap_v2
+
+TRADES = wrap_v2({"symbol": "AAPL", "trades": [{"date": "2024-01-15", "politician": "A"}]})
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def __getattr__(self, name):
+        if name not in EVENTS:
+            raise AttributeError(name)
+        return lambda event: self.events.append((name, event))
+
+    def names(self):
+        return [name for name, _ in self.events]
+
+
+def test_endpoint_label():
+    assert endpoint_label("insider-trading/AAPL") == "insider-trading/{symbol}"
+    assert endpoint_label("/predictions/daily/BRK.B") == "predictions/daily/{symbol}"
+    assert endpoint_label("screener/sentiment") == "screener/sentiment"
+    assert endpoint_label("markets") == "markets"
+
+
+def test_hooks_registry():
+    hooks = Hooks()
+    seen = []
+    hooks.on_response(seen.append)
+    assert hooks and hooks.wants("on_response") and not hooks.wants("on_retry")
+    with pytest.raises(ValueError, match="Unknown hook event"):
+        hooks.add("on_done", seen.append)
+    with pytest.raises(TypeError):
+        hooks.register(object())
+
+    @hooks.on_response
+    def broken(event):
+        raise RuntimeError("boom")
+
+    with pytest.warns(RuntimeWarning, match="boom"):
+        hooks.emit("on_response", RequestEvent("GET", "news/AAPL", 1))
+    assert len(seen) == 1
+
+
+def test_sync_events_for_retry_then_success(_activate_responses, monkeypatch):
+    monkeypatch.setattr("finbrain.client.time.sleep", lambda *_: None)
+    url = BASE + "congress/house/AAPL"
+    _activate_responses.add("GET", url, json={"error": "busy"}, status=503)
+    _activate_responses.add("GET", url, json=TRADES)
+    rec = Recorder()
+    fb = FinBrainClient(api_key="dummy", retries=1, hooks=rec)
+
+    fb.house_trades.ticker("AAPL")
+
+    assert rec.names() == ["on_request", "on_retry", "on_request", "on_response"]
+    retry, done = rec.events[1][1], rec.events[3][1]
+    assert (retry.attempt, retry.status, retry.delay > 0) == (1, 503, True)
+    assert (done.attempt, done.status, done.path) == (2, 200, "congress/house/AAPL")
+    assert done.endpoint == "congress/house/{symbol}"
+    assert done.request_id == retry.request_id
+    assert done.total >= done.ttfb >= 0 and done.decode >= 0
+    assert done.body_bytes == done.wire_bytes > 0
+
+
+def test_sync_error_event_and_cache_hits_are_silent(_activate_responses, tmp_path):
+    from finbrain.cache import ResponseCache
+
+    stub_json(_activate_responses, "GET", "insider-trading/NOPE",
+              {"success": False, "error": "not found"}, status=404)
+    stub_json(_activate_responses, "GET", "markets", wrap_v2([{"name": "S&P 500"}]))
+    rec = Recorder()
+    cache = ResponseCache(tmp_path / "c.sqlite3")
+    fb = FinBrainClient(api_key="dummy", retries=0, hooks=[rec], cache=cache)
+
+    with pytest.raises(NotFound):
+        fb.insider_transactions.ticker("NOPE")
+    fb.available.markets()
+    fb.available.markets()
+    cache.close()
+
+    assert rec.names() == ["on_request", "on_error", "on_request", "on_response"]
+    error = rec.events[1][1]
+    assert error.status == 404 and isinstance(error.error, NotFound)
+
+
+def test_sync_stream_reports_on_close(_activate_responses):
+    stub_json(_activate_responses, "GET", "recent/news",
+              wrap_v2({"data": [{"symbol": "AAPL"}] * 3}))
+    hooks = Hooks()
+    done = []
+    hooks.on_response(done.append)
+    fb = FinBrainClient(api_key="dummy", retries=0, hooks=hooks)
+
+    rows = fb.recent.news(stream=True)
+    assert done == []
+    assert len(list(rows)) == 3
+    assert done[0].path == "recent/news" and done[0].body_bytes > 0
+
+
+@pytest.mark.parametrize("read", [0, 1])
+@pytest.mark.parametrize("release", ["close", "drop"])
+def test_sync_stream_abandoned_early_is_finished(_activate_responses, read, release):
+    stub_json(_activate_responses, "GET", "recent/news",
+              wrap_v2({"data": [{"symbol": "AAPL"}] * 3}))
+    rec = Recorder()
+    fb = FinBrainClient(api_key="dummy", retries=0, hooks=rec)
+
+    rows = fb.recent.news(stream=True)
+    for _ in range(read):
+        next(rows)
+    if release == "close":
+        rows.close()
+        rows.close()
+    else:
+        del rows
+
+    assert rec.names() == ["on_request", "on_response"]
+    assert fb.last_transfer is not None
+
+
+@pytest.mark.asyncio
+async def test_async_stream_closed_early_is_finished():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=wrap_v2({"data": [{"symbol": "AAPL"}] * 3}))
+
+    rec = Recorder()
+    fb = AsyncFinBrainClient(api_key="dummy", retries=0, hooks=rec)
+    fb._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        unread = await fb.recent.news(stream=True)
+        await unread.aclose()
+        async with await fb.recent.news(stream=True) as rows:
+            async for _ in rows:
+                break
+    finally:
+        await fb.close()
+
+    assert rec.names() == ["on_request", "on_response"] * 2
+
+
+@pytest.mark.asyncio
+async def test_async_events_for_network_error_retry(monkeypatch):
+    async def no_sleep(_):
+        return None
+
+    monkeypatch.setattr("finbrain.aio.client.asyncio.sleep", no_sleep)
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json=TRADES)
+
+    rec = Recorder()
+    fb = AsyncFinBrainClient(api_key="dummy", retries=1, hooks=rec)
+    fb._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        await fb.house_trades.ticker("AAPL")
+    finally:
+        await fb.close()
+
+    assert rec.names() == ["on_request", "on_retry", "on_request", "on_response"]
+    retry, done = rec.events[1][1], rec.events[3][1]
+    assert isinstance(retry.error, httpx.ConnectError) and retry.status is None
+    assert done.status == 200 and done.attempt == 2 and done.decode is not None
+
+
+def test_prometheus_adapter(_activate_responses):
+    prom = pytest.importorskip("prometheus_client")
+    from finbrain.hooks import PrometheusHooks
+
+    registry = prom.CollectorRegistry()
+    stub_json(_activate_responses, "GET", "congress/house/AAPL", TRADES)
+    fb = FinBrainClient(api_key="dummy", retries=0, hooks=PrometheusHooks(registry))
+
+    fb.house_trades.ticker("AAPL")
+
+    labels = {"endpoint": "congress/house/{symbol}", "method": "GET", "status": "200"}
+    assert registry.get_sample_value("finbrain_requests_total", labels) == 1
+    assert registry.get_sample_value(
+        "finbrain_requests_in_flight", {"endpoint": "congress/house/{symbol}"}
+    ) == 0
+
+    stub_json(_activate_responses, "GET", "recent/news",
+              wrap_v2({"data": [{"symbol": "AAPL"}] * 3}))
+    fb.recent.news(stream=True).close()
+    assert registry.get_sample_value(
+        "finbrain_requests_in_flight", {"endpoint": "recent/news"}
+    ) == 0
+
+
+def test_opentelemetry_adapter(_activate_responses):
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+    from finbrain.hooks import OpenTelemetryHooks
+
+    reader = InMemoryMetricReader()
+    stub_json(_activate_responses, "GET", "congress/house/AAPL", TRADES)
+    otel = OpenTelemetryHooks(MeterProvider(metric_readers=[reader]), spans=False)
+    fb = FinBrainClient(api_key="dummy", retries=0, hooks=otel)
+
+    fb.house_trades.ticker("AAPL")
+
+    metrics = reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics
+    duration = next(m for m in metrics if m.name == "http.client.request.duration")
+    point = duration.data.data_points[0]
+    assert point.count == 1
+    assert point.attributes["url.template"] == "congress/house/{symbol}"
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from finbrain import FinBrainClient
+from finbrain._json import resolve_json_loads
+from finbrain.exceptions import InvalidResponse
+from .conftest import BASE, stub_json, wrap_v2
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "msgspec"])
+def test_backends_decode_bytes_and_raise_value_error(backend):
+    if backend != "json":
+        pytest.importorskip(backend)
+    loads = resolve_json_loads(backend)
+    assert loads(b'{"a": [1, 2.5, "\\u00e9"]}') == {"a": [1, 2.5, "é"]}
+    with pytest.raises(ValueError):
+        loads(b'{"a": ')
+
+
+def test_auto_prefers_installed_fast_backend(monkeypatch):
+    import builtins
+
+    real_import = builtins.__import__
+
+    def no_fast(name, *args, **kwargs):
+        if name in ("orjson", "msgspec"):
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_fast)
+    assert resolve_json_loads("auto") is json.loads
+    with pytest.raises(ImportError, match="pip install orjson"):
+        resolve_json_loads("orjson")
+
+
+@pytest.mark.parametrize("body", [
+    b'{"a": NaN, "b": [Infinity, -Infinity]}',
+    b'{"id": 18446744073709551617, "n": -99999999999999999999}',
+    b'{"a": [1, 2.5, "x"]}',
+])
+def test_auto_parses_what_the_stdlib_parses(body):
+    loads = resolve_json_loads("auto")
+    assert repr(loads(body)) == repr(json.loads(body))
+    with pytest.raises(ValueError):
+        loads(body[:-1])
+
+
+def test_auto_skips_backend_that_rounds_big_ints(monkeypatch):
+    from finbrain import _json
+
+    def lossy():
+        return lambda content: json.loads(content, parse_int=float)
+
+    monkeypatch.setitem(_json._FACTORIES, "orjson", lossy)
+    monkeypatch.setitem(_json._FACTORIES, "msgspec", lossy)
+    assert resolve_json_loads("auto") is json.loads
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        resolve_json_loads("ujson")
+
+
+def test_client_uses_custom_loads(_activate_responses):
+    seen = []
+
+    def loads(content):
+        seen.append(type(content))
+        return json.loads(content)
+
+    client = FinBrainClient(api_key="dummy", retries=0, json_loads=loads)
+    stub_json(_activate_responses, "GET", "markets", wrap_v2([{"name": "S&P 500"}]))
+    assert client.available.markets() == [{"name": "S&P 500"}]
+    assert seen == [bytes]
+
+
+def test_client_maps_backend_errors_to_invalid_response(_activate_responses):
+    pytest.importorskip("msgspec")
+    client = FinBrainClient(api_key="dummy", retries=0, json_loads="msgspec")
+    _activate_responses.add("GET", BASE + "markets", body=b"{not json")
+    with pytest.raises(InvalidResponse):
+        client.available.markets()
@@ -0,0 +1,131 @@
+import json
+import random
+
+import httpx
+import pandas as pd
+import pytest
+
+from finbrain.aio import AsyncFinBrainClient
+from finbrain._jsonstream import RowStream, iter_rows
+from finbrain.endpoints._utils import ColumnBuilder
+from finbrain.exceptions import InvalidResponse
+from .conftest import stub_json, wrap_v2
+
+ROWS = [
+    {"symbol": "AAPL", "name": 'Apple "]{', "score": 0.75, "tags": [1, {"data": [2]}]},
+    {"symbol": "MSFT", "name": "Microsoft ✓", "score": -0.2, "tags": []},
+    {"symbol": "AMZN", "name": "Amazon", "score": 1e-3},
+]
+DOC = {
+    "success": True,
+    "meta": {"warnings": [], "data": [9]},
+    "data": {"data": ROWS, "summary": {"count": 3}},
+}
+
+
+def _chunks(raw, rng):
+    i = 0
+    while i < len(raw):
+        j = i + rng.randint(1, 9)
+        yield raw[i:j]
+        i = j
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_row_stream_any_chunking(indent):
+    raw = json.dumps(DOC, indent=indent, ensure_ascii=False).encode()
+    rng = random.Random(0)
+    for _ in range(50):
+        gen = iter_rows(_chunks(raw, rng))
+        rows = []
+        try:
+            while True:
+                rows.append(next(gen))
+        except StopIteration as stop:
+            envelope = stop.value
+        assert rows == ROWS
+        assert envelope["data"] == {"data": [], "summary": {"count": 3}}
+        assert envelope["meta"] == DOC["meta"]
+
+
+def test_row_stream_bare_data_list_and_scalars():
+    stream = RowStream()
+    rows = stream.feed(b'{"success": true, "data": [1, 2.5')
+    assert rows == [1]  # 2.5 might still be growing
+    rows += stream.feed(b'5, null, "x"], "meta": {}}')
+    tail, envelope = stream.close()
+    assert rows + tail == [1, 2.55, None, "x"]
+    assert envelope == {"success": True, "data": [], "meta": {}}
+
+
+def test_row_stream_without_row_array():
+    stream = RowStream()
+    assert stream.feed(b'{"success": true, "data": {"total": 1}}') == []
+    rows, envelope = stream.close()
+    assert not stream.found
+    assert rows == [] and envelope["data"] == {"total": 1}
+
+
+@pytest.mark.parametrize("body", [b'{"data": [{"a": 1}, {"a": ', b'{"data": [{"a": }]}'])
+def test_row_stream_rejects_bad_json(body):
+    stream = RowStream()
+    stream.feed(body)
+    with pytest.raises(ValueError):
+        stream.close()
+
+
+def test_column_builder_fills_missing_keys():
+    cols = ColumnBuilder().extend([{"a": 1}, {"a": 2, "b": "x"}, {"b": "y"}]).columns
+    assert cols == {"a": [1, 2, None], "b": [None, "x", "y"]}
+
+
+# ── endpoint integration ──────────────────────────────────────────────
+def test_screener_stream_yields_rows(client, _activate_responses):
+    stub_json(_activate_responses, "GET", "screener/sentiment", wrap_v2(DOC["data"]),
+              params={"market": "S&P 500"})
+    rows = client.screener.sentiment(market="S&P 500", stream=True)
+    assert not isinstance(rows, list)
+    assert list(rows) == ROWS
+    assert client.last_meta == {"timestamp": "2025-01-17T12:00:00.000Z"}
+
+
+def test_screener_stream_dataframe_matches_eager(client, _activate_responses):
+    flat = [{k: v for k, v in row.items() if k != "tags"} for row in ROWS]
+    for _ in range(2):
+        stub_json(_activate_responses, "GET", "screener/sentiment", wrap_v2(flat),
+                  params={"market": "S&P 500"})
+    eager = client.screener.sentiment(market="S&P 500", as_dataframe=True)
+    streamed = client.screener.sentiment(market="S&P 500", as_dataframe=True, stream=True)
+    pd.testing.assert_frame_equal(streamed, eager)
+    assert streamed.index.name == "symbol"
+
+
+def test_recent_news_stream(client, _activate_responses):
+    payload = wrap_v2({"data": [{"symbol": "AAPL", "headline": "x"}], "summary": {}})
+    stub_json(_activate_responses, "GET", "recent/news", payload, params={"limit": "5000"})
+    df = client.recent.news(limit=5000, stream=True, as_dataframe=True)
+    assert df.to_dict("records") == [{"symbol": "AAPL", "headline": "x"}]
+
+
+def test_stream_invalid_body_raises(client, _activate_responses):
+    _activate_responses.add("GET", "https://api.finbrain.tech/v2/recent/news", body=b'{"data": [{"a"')
+    with pytest.raises(InvalidResponse):
+        list(client.recent.news(stream=True))
+
+
+@pytest.mark.asyncio
+async def test_async_screener_stream():
+    body = json.dumps(wrap_v2({"data": ROWS})).encode()
+
+    def handler(request):
+        return httpx.Response(200, content=body)
+
+    client = AsyncFinBrainClient(api_key="dummy", retries=0)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        rows = await client.screener.sentiment(market="S&P 500", stream=True)
+        assert [row async for row in rows] == ROWS
+        df = await client.recent.analyst_ratings(stream=True, as_dataframe=True)
+        assert list(df["symbol"]) == ["AAPL", "MSFT", "AMZN"]
+    finally:
+        await client.close()
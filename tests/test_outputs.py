@@ -0,0 +1,133 @@
+import httpx
+import pytest
+
+from finbrain.aio import AsyncFinBrainClient
+from finbrain.endpoints._frames import (
+    CONGRESS_TRADES,
+    SCREENER,
+    build_output,
+    resolve_output,
+)
+from .conftest import stub_json, wrap_v2
+
+TRADES = [
+    {"date": "2024-01-15", "politician": "A", "transactionType": "Purchase",
+     "amount": "$1,001 - $15,000", "owner": "SP"},
+    {"date": "2024-01-10", "politician": "B", "transactionType": "Sale",
+     "amount": "$1,001 - $15,000", "owner": None},
+]
+
+SCREEN_ROWS = [
+    {"symbol": "AAPL", "date": "2024-01-15", "rating": "Buy", "targetPrice": 210},
+    {"symbol": "MSFT", "date": "2024-01-15", "rating": "Hold", "targetPrice": None},
+]
+
+
+# ─────────── resolve_output ─────────────────────────────────────────────
+def test_resolve_output_defaults_and_errors():
+    assert resolve_output(None) == "raw"
+    assert resolve_output(None, as_dataframe=True) == "pandas"
+    assert resolve_output("pandas", as_dataframe=True) == "pandas"
+    with pytest.raises(ValueError, match="output"):
+        resolve_output("excel")
+    with pytest.raises(ValueError, match="conflicts"):
+        resolve_output("arrow", as_dataframe=True)
+
+
+def test_output_validated_before_request(client):
+    with pytest.raises(ValueError):
+        client.predictions.ticker("AAPL", output="csv")
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        client.house_trades.ticker("AAPL", as_records=True, output="polars")
+
+
+# ─────────── builders ───────────────────────────────────────────────────
+def test_build_arrow_uses_schema_types():
+    pa = pytest.importorskip("pyarrow")
+
+    tbl = build_output(TRADES, CONGRESS_TRADES, "arrow")
+
+    assert isinstance(tbl, pa.Table)
+    assert tbl.column_names[0] == "date"
+    assert tbl.schema.field("date").type == pa.date32()
+    assert pa.types.is_dictionary(tbl.schema.field("transactionType").type)
+    assert tbl.column("owner").to_pylist() == ["SP", None]
+
+
+def test_build_polars_uses_schema_types():
+    pl = pytest.importorskip("polars")
+
+    df = build_output(TRADES, CONGRESS_TRADES, "polars")
+
+    assert isinstance(df, pl.DataFrame)
+    assert df.columns[0] == "date"
+    assert df.schema["date"] == pl.Date
+    assert df.schema["transactionType"] == pl.Categorical
+    assert df["politician"].to_list() == ["A", "B"]
+
+
+@pytest.mark.parametrize("output", ["arrow", "polars"])
+def test_build_output_empty(output):
+    pytest.importorskip("pyarrow" if output == "arrow" else output)
+    assert len(build_output([], SCREENER, output)) == 0
+
+
+# ─────────── endpoint integration ───────────────────────────────────────
+def test_ticker_output_arrow(client, _activate_responses):
+    pa = pytest.importorskip("pyarrow")
+    stub_json(_activate_responses, "GET", "insider-trading/AAPL", wrap_v2({
+        "symbol": "AAPL",
+        "transactions": [
+            {"date": "2024-01-15", "insider": "Tim Cook", "relationship": "CEO",
+             "transactionType": "Sale", "shares": 5000, "pricePerShare": 185.5,
+             "totalValue": 927500, "sharesOwned": None},
+        ],
+    }))
+
+    tbl = client.insider_transactions.ticker("AAPL", output="arrow")
+
+    assert tbl.schema.field("shares").type == pa.int64()
+    assert tbl.column("pricePerShare").to_pylist() == [185.5]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_screener_output_polars(client, _activate_responses, stream):
+    pl = pytest.importorskip("polars")
+    stub_json(_activate_responses, "GET", "screener/analyst-ratings",
+              wrap_v2({"data": SCREEN_ROWS}))
+
+    df = client.screener.analyst_ratings(market="S&P 500", output="polars", stream=stream)
+
+    assert df.columns[0] == "symbol"
+    assert df.schema["rating"] == pl.Categorical
+    assert df["targetPrice"].to_list() == [210.0, None]
+
+
+def test_ticker_many_output_arrow(client, _activate_responses):
+    pa = pytest.importorskip("pyarrow")
+    for sym in ("AAPL", "MSFT"):
+        stub_json(_activate_responses, "GET", f"congress/house/{sym}",
+                  wrap_v2({"symbol": sym, "trades": TRADES}))
+
+    batch = client.house_trades.ticker_many(["AAPL", "MSFT"], output="arrow")
+
+    assert set(batch) == {"AAPL", "MSFT"}
+    assert all(isinstance(t, pa.Table) and t.num_rows == 2 for t in batch.values())
+
+
+@pytest.mark.asyncio
+async def test_async_recent_output_arrow():
+    pa = pytest.importorskip("pyarrow")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=wrap_v2({"data": SCREEN_ROWS}))
+
+    fb = AsyncFinBrainClient(api_key="dummy", retries=0)
+    fb._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        tbl = await fb.recent.analyst_ratings(output="arrow", stream=True)
+    finally:
+        await fb.close()
+
+    assert isinstance(tbl, pa.Table)
+    assert tbl.column("symbol").to_pylist() == ["AAPL", "MSFT"]
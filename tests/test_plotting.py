@@ -1,9 +1,14 @@
 """Tests for plotting module — validation + functional figure construction."""
 
+import base64
+import json
+
+import numpy as np
 import pytest
 import pandas as pd
 import plotly.graph_objects as go
-from finbrain.plotting import _PlotNamespace
+from finbrain.plotting import JSONFormat, _PlotNamespace, figure_to_json, lttb
+from .conftest import stub_json, wrap_v2
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -395,6 +400,30 @@ def test_house_trades_plot_with_data():
     assert "House" in fig.layout.title.text
 
 
+def test_transaction_markers_anchor_to_nearest_price():
+    plot = _PlotNamespace(MockClient())
+    tx = pd.DataFrame({
+        "transactionType": ["Purchase", "Sale", "Gift", "Buy"],
+        "date": pd.to_datetime(["2024-01-03", "2024-01-05", "2024-01-02", "2023-12-20"]),
+    }).set_index("date")
+    fig = plot._plot_transactions_on_price(PRICE_DF, "close", tx, "AAPL", "plotly_dark", "Insider")
+
+    buys, sells = fig.data[1], fig.data[2]
+    assert (buys.name, sells.name) == ("Buy", "Sell")
+    assert list(buys.y) == [149.8, 150.0]
+    assert list(sells.y) == [152.0]
+
+
+def test_anchor_prices_handles_unsorted_duplicate_index():
+    prices = pd.Series(
+        [3.0, 1.0, 2.0, 9.0],
+        index=pd.to_datetime(["2024-01-03", "2024-01-01", "2024-01-02", "2024-01-02"]),
+    )
+    when = pd.DatetimeIndex(["2024-01-02", "2024-01-10", None])
+    out = _PlotNamespace._anchor_prices(prices, when)
+    assert out[0] == 9.0 and out[1] == 3.0 and np.isnan(out[2])
+
+
 # ── senate_trades ─────────────────────────────────────────────────────────
 
 def test_senate_trades_plot_with_data():
@@ -687,3 +716,139 @@ def test_analyst_ratings_as_json():
     plot = _PlotNamespace(MockAnalystRatingsClient())
     result = plot.analyst_ratings("AAPL", price_data=PRICE_DF, show=False, as_json=True)
     assert isinstance(result, str)
+
+
+def test_analyst_ratings_marker_placement():
+    plot = _PlotNamespace(MockAnalystRatingsClient())
+    fig = plot.analyst_ratings("AAPL", price_data=PRICE_DF, show=False)
+    traces = {t.name: t for t in fig.data}
+
+    assert list(traces["Upgrade"].y) == [250.0]
+    assert list(traces["Upgrade"].marker.symbol) == ["diamond"]
+    # no target → drawn at the price on that date
+    assert list(traces["Downgrade"].y) == [151.5]
+    assert list(traces["Downgrade"].marker.symbol) == ["circle-open"]
+    assert traces["Downgrade"].hovertext[0] == (
+        "Institution: Goldman Sachs<br>Action: Downgrade<br>Rating: Sell<br>Target: n/a"
+    )
+
+
+# ── downsampling & WebGL ──────────────────────────────────────────────
+
+def test_lttb_keeps_extremes_and_endpoints():
+    x = np.arange(10.0)
+    y = np.array([0, 0, 0, 9, 0, 0, 0, -9, 0, 0.0])
+    assert list(lttb(x, y, 4)) == [0, 3, 7, 9]
+    assert list(lttb(x, y, 20)) == list(range(10))
+
+
+def test_downsampled_webgl_price_line_keeps_anchored_points():
+    idx = pd.date_range("2024-01-01", periods=5000, freq="h")
+    price = pd.DataFrame({"close": np.sin(np.arange(5000) / 50) + 100}, index=idx)
+    tx = pd.DataFrame({"transactionType": ["Purchase", "Sale"]},
+                      index=pd.DatetimeIndex(["2024-02-01 05:00", "2024-03-01 17:00"]))
+    plot = _PlotNamespace(MockClient())
+    fig = plot._plot_transactions_on_price(
+        price, "close", tx, "AAPL", "plotly_dark", "Insider",
+        max_points=200, renderer="webgl",
+    )
+
+    line = fig.data[0]
+    assert isinstance(line, go.Scattergl) and 200 <= len(line.x) <= 202
+    line_x = set(pd.DatetimeIndex(line.x))
+    assert all(ts in line_x for ts in tx.index)
+    assert all(isinstance(t, go.Scattergl) for t in fig.data[1:])
+
+
+def test_invalid_renderer_rejected():
+    plot = _PlotNamespace(MockInsiderClient())
+    with pytest.raises(ValueError, match="renderer"):
+        plot.insider_transactions("AAPL", price_data=PRICE_DF, renderer="canvas")
+
+
+# ── compact JSON ──────────────────────────────────────────────────────
+
+def _decode(arr):
+    return np.frombuffer(base64.b64decode(arr["bdata"]), dtype=arr["dtype"])
+
+
+def test_compact_json_is_smaller_and_lossless_at_precision():
+    plot = _PlotNamespace(MockInsiderClient())
+    full = plot.insider_transactions("AAPL", price_data=PRICE_DF, show=False, as_json=True)
+    compact = plot.insider_transactions("AAPL", price_data=PRICE_DF, show=False,
+                                        as_json="compact")
+    assert len(compact) < len(full) / 2
+
+    spec = json.loads(compact)
+    assert "template" not in spec["layout"]
+    price = spec["data"][0]
+    assert price["x"] == ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]
+    assert price["y"]["dtype"] == "f4"
+    assert np.allclose(_decode(price["y"]), PRICE_DF["close"], atol=1e-4)
+
+
+def test_json_format_options():
+    fig = go.Figure(layout=dict(template="plotly_dark"))
+    fig.add_bar(x=["a", "b"], y=np.array([3, 250]),
+                marker=dict(line=dict(width=np.array([1, 2]))))
+    fig.add_scatter(x=[1, 2], y=np.array([0.123456, 2.5]))
+    fig.add_pie(values=np.array([1, 2]), domain=dict(x=[0, 0.123456]))
+
+    spec = json.loads(figure_to_json(fig, JSONFormat(precision=2, template=True)))
+    bars, line, pie = spec["data"]
+    assert bars["x"] == ["a", "b"] and bars["y"]["dtype"] == "u1"
+    assert bars["marker"]["line"]["width"]["dtype"] == "i1"
+    assert list(_decode(line["y"])) == pytest.approx([0.12, 2.5], abs=1e-6)
+    assert pie["domain"] == {"x": [0, 0.123456]}  # settings lists are not data arrays
+    assert "template" in spec["layout"]
+
+    plain = json.loads(figure_to_json(fig, JSONFormat(precision=3, typed_arrays=False)))
+    assert plain["data"][1]["y"] == [0.123, 2.5]
+
+
+def test_invalid_as_json_rejected():
+    plot = _PlotNamespace(MockSentimentsClient())
+    with pytest.raises(ValueError, match="as_json"):
+        plot.sentiments("AMZN", show=False, as_json="tiny")
+
+
+# ── grid ──────────────────────────────────────────────────────────────
+
+def _sentiment_payload(symbol):
+    return wrap_v2({"symbol": symbol, "data": [
+        {"date": "2024-01-01", "score": 0.2}, {"date": "2024-01-02", "score": -0.1},
+    ]})
+
+
+def test_grid_fetches_every_symbol_into_one_figure(client, _activate_responses):
+    for sym in ("AAPL", "MSFT", "NVDA"):
+        stub_json(_activate_responses, "GET", f"sentiment/{sym}", _sentiment_payload(sym))
+    stub_json(_activate_responses, "GET", "sentiment/NOPE",
+              {"success": False, "error": "not found"}, status=404)
+
+    fig = client.plot.grid("sentiments", ["aapl", "MSFT", "NVDA", "NOPE"], cols=3,
+                           show=False)
+
+    assert [a.text for a in fig.layout.annotations] == ["AAPL", "MSFT", "NVDA", "NOPE · NotFound"]
+    assert [(t.xaxis, t.yaxis) for t in fig.data] == [("x", "y"), ("x2", "y2"), ("x3", "y3")]
+    assert list(fig.data[0].y) == [0.2, -0.1]
+    assert fig.layout.xaxis.matches == fig.layout.xaxis2.matches  # linked date axes
+
+
+def test_grid_predictions_forwards_kwargs(client, _activate_responses):
+    for sym in ("AAPL", "MSFT"):
+        stub_json(_activate_responses, "GET", f"predictions/monthly/{sym}", wrap_v2({
+            "symbol": sym,
+            "predictions": [{"date": "2024-11-04", "mid": 1.0, "lower": 0.5, "upper": 1.5}],
+        }))
+
+    fig = client.plot.grid("predictions", ["AAPL", "MSFT"], prediction_type="monthly",
+                           show=False)
+
+    assert len(fig.data) == 6 and fig.data[3].yaxis == "y2"
+
+
+def test_grid_invalid_kind():
+    plot = _PlotNamespace(MockClient())
+    with pytest.raises(ValueError, match="Unknown kind"):
+        plot.grid("linkedin", ["AAPL"])
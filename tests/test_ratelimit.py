@@ -0,0 +1,287 @@
+import threading
+
+import httpx
+import pytest
+import requests
+
+from finbrain import FinBrainClient
+from finbrain.aio import AsyncFinBrainClient
+from finbrain.exceptions import RateLimitError
+from finbrain.ratelimit import (
+    RateLimiter,
+    as_rate_limiter,
+    backoff_delay,
+    parse_quota_headers,
+    parse_retry_after,
+)
+from .conftest import BASE, stub_json, wrap_v2
+
+
+class FakeClock:
+    """Deterministic stand-in for ``time.monotonic`` / ``time.sleep``."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    c = FakeClock()
+    monkeypatch.setattr("finbrain.ratelimit.time.monotonic", c.monotonic)
+    monkeypatch.setattr("finbrain.ratelimit.time.sleep", c.sleep)
+    return c
+
+
+def test_burst_then_paced(clock):
+    limiter = RateLimiter(rate=2, burst=3)
+    waits = [limiter.acquire() for _ in range(5)]
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.5)
+    assert waits[4] == pytest.approx(0.5)
+    assert clock.now == pytest.approx(1.0)
+
+
+def test_refill_is_capped_at_burst(clock):
+    limiter = RateLimiter(rate=10, burst=2)
+    limiter.acquire()
+    limiter.acquire()
+    clock.now += 100  # long idle period must not bank more than `burst`
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+def test_default_burst_and_validation():
+    assert RateLimiter(rate=2.5).burst == 3
+    assert RateLimiter(rate=0.2).burst == 1
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, burst=0)
+    with pytest.raises(ValueError):
+        RateLimiter(reserve=-1)
+
+
+def test_as_rate_limiter():
+    limiter = RateLimiter(rate=1)
+    assert as_rate_limiter(limiter) is limiter
+    assert as_rate_limiter(None) is None
+    assert as_rate_limiter(5).rate == 5.0
+
+
+def test_shared_across_threads(clock):
+    """Concurrent reservations queue up instead of over-spending the bucket."""
+    limiter = RateLimiter(rate=4, burst=1)
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        w = limiter._reserve()
+        with lock:
+            waits.append(w)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(waits) == pytest.approx([i * 0.25 for i in range(8)])
+
+
+def test_sync_client_consults_limiter(_activate_responses):
+    calls = []
+
+    class CountingLimiter(RateLimiter):
+        def acquire(self):
+            calls.append(1)
+            return 0.0
+
+    client = FinBrainClient(api_key="dummy", retries=0, rate_limit=CountingLimiter(rate=100))
+    stub_json(_activate_responses, "GET", "markets", wrap_v2([]))
+    client.available.markets()
+    client.available.markets()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_client_consults_limiter():
+    calls = []
+
+    class CountingLimiter(RateLimiter):
+        async def acquire_async(self):
+            calls.append(1)
+            return 0.0
+
+    client = AsyncFinBrainClient(api_key="dummy", retries=0, rate_limit=CountingLimiter(rate=100))
+    client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda r: httpx.Response(200, json=wrap_v2([])))
+    )
+    try:
+        await client.available.markets()
+    finally:
+        await client.close()
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_acquire_async_sleeps_without_blocking(monkeypatch):
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr("finbrain.ratelimit.asyncio.sleep", fake_sleep)
+    limiter = RateLimiter(rate=1, burst=1)
+    assert await limiter.acquire_async() == 0.0
+    wait = await limiter.acquire_async()
+    assert wait > 0
+    assert slept == [wait]
+
+
+# ── server feedback ───────────────────────────────────────────────────
+def test_observe_exhausted_quota_pauses_until_reset(clock):
+    limiter = RateLimiter()
+    assert limiter.acquire() == 0.0
+    limiter.observe(remaining=0, reset_after=5)
+    assert not limiter.try_acquire()
+    assert limiter.acquire() == pytest.approx(5)
+    assert limiter.acquire() == 0.0
+
+
+def test_observe_spreads_remaining_quota(clock):
+    limiter = RateLimiter(rate=100, burst=10)
+    limiter.observe(remaining=2, reset_after=10)  # 0.2 req/s until reset
+    waits = [limiter.acquire() for _ in range(3)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(5.0)
+    clock.now += 20  # window over: back to the configured rate
+    assert limiter.acquire() == 0.0
+
+
+def test_observe_large_quota_keeps_configured_rate(clock):
+    unlimited = RateLimiter()
+    unlimited.observe(remaining=10000, reset_after=86400)
+    assert [unlimited.acquire() for _ in range(5)] == [0.0] * 5
+
+    limiter = RateLimiter(rate=20, burst=20)
+    limiter.observe(remaining=10000, reset_after=86400)
+    waits = [limiter.acquire() for _ in range(22)]
+    assert waits[:20] == [0.0] * 20
+    assert waits[20:] == pytest.approx([0.05, 0.05])
+
+
+def test_observe_healthy_quota_clears_slowdown(clock):
+    limiter = RateLimiter(rate=10, burst=1)
+    limiter.observe(remaining=2, reset_after=20)
+    limiter.acquire()
+    assert limiter.acquire() == pytest.approx(10)
+    limiter.observe(remaining=500, reset_after=3600)  # window reset
+    assert limiter.acquire() == pytest.approx(0.1)
+
+
+def test_pause_blocks_every_caller(clock):
+    limiter = RateLimiter()
+    limiter.pause(3)
+    assert limiter.acquire() == pytest.approx(3)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # in the past
+
+
+def test_parse_quota_headers(monkeypatch):
+    monkeypatch.setattr("finbrain.ratelimit.time.time", lambda: 1_700_000_000.0)
+    assert parse_quota_headers({"X-RateLimit-Remaining": "4", "X-RateLimit-Reset": "30"}) == (4, 30.0)
+    assert parse_quota_headers({"X-RateLimit-Reset": "1700000012"}) == (None, 12.0)
+    assert parse_quota_headers({"X-RateLimit-Remaining": "n/a"}) == (None, None)
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    delays = {backoff_delay(4, 1, 30) for _ in range(50)}
+    assert all(1 <= d <= 12 for d in delays)
+    assert len(delays) > 1
+    assert backoff_delay(100, 1, 30) <= 30
+
+
+def test_sync_client_honours_retry_after(clock, _activate_responses):
+    client = FinBrainClient(api_key="dummy", retries=2)
+    url = BASE + "markets"
+    _activate_responses.add("GET", url, json={"error": {"message": "slow down"}},
+                            status=429, headers={"Retry-After": "4"})
+    _activate_responses.add("GET", url, json=wrap_v2([]))
+
+    assert client._request("GET", "markets") == []
+    # one sleep: the client's own wait also satisfies the limiter's pause
+    assert len(clock.sleeps) == 1 and 4 <= clock.sleeps[0] <= 5
+
+
+def test_sync_client_gives_up_on_long_retry_after(monkeypatch, _activate_responses):
+    monkeypatch.setattr("finbrain.client.time.sleep", lambda *_: pytest.fail("slept"))
+    client = FinBrainClient(api_key="dummy", retries=3)
+    _activate_responses.add("GET", BASE + "markets", json={"error": {"message": "quota"}},
+                            status=429, headers={"Retry-After": "3600"})
+    with pytest.raises(RateLimitError):
+        client._request("GET", "markets")
+    assert len(_activate_responses.calls) == 1
+
+
+def test_sync_client_feeds_quota_headers_to_limiter(_activate_responses):
+    seen = []
+
+    class RecordingLimiter(RateLimiter):
+        def observe(self, remaining, reset_after):
+            seen.append((remaining, reset_after))
+
+    client = FinBrainClient(api_key="dummy", retries=0, rate_limit=RecordingLimiter())
+    _activate_responses.add("GET", BASE + "markets", json=wrap_v2([]),
+                            headers={"X-RateLimit-Remaining": "9", "X-RateLimit-Reset": "60"})
+    client.available.markets()
+    assert seen == [(9, 60.0)]
+
+
+@pytest.mark.asyncio
+async def test_async_client_honours_retry_after(clock, monkeypatch):
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr("finbrain.aio.client.asyncio.sleep", fake_sleep)
+    responses = iter([
+        httpx.Response(503, json={"error": {"message": "busy"}}, headers={"Retry-After": "2"}),
+        httpx.Response(200, json=wrap_v2([])),
+    ])
+    client = AsyncFinBrainClient(api_key="dummy", retries=1)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: next(responses)))
+    try:
+        assert await client.available.markets() == []
+    finally:
+        await client.close()
+    assert len(slept) == 1 and 2 <= slept[0] <= 3
+
+
+@pytest.mark.parametrize("retries, headers", [(3, {"Retry-After": "3600"}), (0, {})])
+def test_sync_client_keeps_streamed_error_body(monkeypatch, _activate_responses, retries, headers):
+    closed = []
+    close = requests.Response.close
+    monkeypatch.setattr(requests.Response, "close",
+                        lambda self: closed.append(self.status_code) or close(self))
+    client = FinBrainClient(api_key="dummy", retries=retries)
+    _activate_responses.add("GET", BASE + "recent/news", json={"error": {"message": "quota"}},
+                            status=429, headers=headers)
+
+    with pytest.raises(RateLimitError, match="quota"):
+        client.recent.news(stream=True)
+    assert closed == [429]
@@ -0,0 +1,192 @@
+import pickle
+import sys
+
+import httpx
+import pandas as pd
+import pytest
+
+from finbrain.aio import AsyncFinBrainClient
+from finbrain._jsonstream import RowStream
+from finbrain.records import (
+    AnalystRating,
+    CongressTrade,
+    GovernmentContract,
+    InsiderTransaction,
+    NewsArticle,
+    PatentFiling,
+    records_to_frame,
+)
+from .conftest import stub_json, wrap_v2
+
+TRADE = {
+    "date": "2024-01-15",
+    "politician": "Nancy Pelosi",
+    "transactionType": "Purchase",
+    "amount": "$15,001 - $50,000",
+    "owner": "JT",
+    "amountRaw": "$15,001 - $50,000 *",
+    "amountFlag": None,
+    "disclosureDate": "2024-02-05",
+}
+
+
+def _deep_size(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+# ─────────── record types ───────────────────────────────────────────────
+def test_from_dict_maps_fields_and_roundtrips():
+    trade = CongressTrade.from_dict(TRADE, symbol="AMZN")
+
+    assert trade.symbol == "AMZN"
+    assert trade.transaction_type == "Purchase"
+    assert trade.disclosure_date == "2024-02-05"
+    assert trade.extra is None
+    assert not hasattr(trade, "__dict__")
+    assert trade.to_dict() == {"symbol": "AMZN", **TRADE}
+    assert "politician='Nancy Pelosi'" in repr(trade)
+
+
+def test_unknown_fields_are_kept_in_extra():
+    trade = CongressTrade.from_dict({**TRADE, "state": "CA"})
+
+    assert trade.symbol is None
+    assert trade.extra == {"state": "CA"}
+    assert trade.to_dict()["state"] == "CA"
+
+
+def test_missing_fields_read_as_none():
+    rating = AnalystRating.from_dict({"date": "2024-01-10", "institution": "Goldman Sachs"})
+    assert rating.target_price is None
+    assert rating.action is None
+
+
+def test_record_smaller_than_dict():
+    trade = CongressTrade.from_dict(TRADE, symbol="AMZN")
+    assert _deep_size(trade) < sys.getsizeof({"symbol": "AMZN", **TRADE}) / 2
+
+
+def test_equality_and_pickle():
+    a = NewsArticle.from_dict({"date": "2024-01-01", "headline": "Up", "sentiment": 0.4})
+    b = pickle.loads(pickle.dumps(a))
+    assert a == b
+    b.sentiment = -0.1
+    assert a != b
+
+
+def test_constructor_with_keywords():
+    tx = InsiderTransaction(symbol="AAPL", date="2024-01-10", insider="Tim Cook", shares=10)
+    assert tx.shares == 10
+    assert tx.total_value is None
+    assert tx.extra is None
+
+
+def test_records_to_frame_matches_dataframe_branch():
+    records = CongressTrade.from_rows([TRADE, {**TRADE, "date": "2024-01-16"}], symbol="AMZN")
+
+    df = records_to_frame(records)
+
+    assert df.index.name == "date"
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert list(df.columns) == [
+        "symbol", "politician", "transactionType", "amount", "owner",
+        "amountRaw", "amountFlag", "disclosureDate",
+    ]
+    assert (df["symbol"] == "AMZN").all()
+
+
+def test_records_to_frame_custom_index_and_empty():
+    contracts = GovernmentContract.from_rows([
+        {"awardId": "A1", "awardAmount": 5.0, "startDate": "2024-01-01", "agencyCode": "DOD"},
+    ])
+    df = records_to_frame(contracts)
+    assert df.index.name == "startDate"
+    assert df["agencyCode"].tolist() == ["DOD"]
+    assert "symbol" not in df.columns
+
+    assert records_to_frame(contracts, index=None).index.tolist() == [0]
+    assert records_to_frame([]).empty
+
+
+# ─────────── endpoint integration ───────────────────────────────────────
+def test_as_records_on_endpoint(client, _activate_responses):
+    stub_json(_activate_responses, "GET", "congress/house/AMZN",
+              wrap_v2({"symbol": "AMZN", "trades": [TRADE]}))
+
+    data = client.house_trades.ticker("AMZN", as_records=True)
+
+    (trade,) = data["trades"]
+    assert isinstance(trade, CongressTrade)
+    assert trade.symbol == "AMZN"
+    assert trade.amount_raw == "$15,001 - $50,000 *"
+
+
+def test_as_records_converts_rows_while_the_body_is_read(client, _activate_responses, monkeypatch):
+    # ~150 KB: more than one streamed chunk
+    stub_json(_activate_responses, "GET", "congress/house/AMZN",
+              wrap_v2({"symbol": "AMZN", "trades": [TRADE] * 800}))
+    events = []
+    feed = RowStream.feed
+    monkeypatch.setattr(RowStream, "feed",
+                        lambda self, chunk: events.append("chunk") or feed(self, chunk))
+    convert = CongressTrade.converter("AMZN")
+
+    def spy(row):
+        events.append("row")
+        return convert(row)
+
+    data = client._request_records("GET", "congress/house/AMZN", None, "trades", spy)
+
+    assert events.index("row") < len(events) - 1 - events[::-1].index("chunk")
+    assert data["symbol"] == "AMZN" and len(data["trades"]) == 800
+    assert client.last_meta == {"timestamp": "2025-01-17T12:00:00.000Z"}
+
+
+def test_as_records_without_envelope(client, _activate_responses):
+    stub_json(_activate_responses, "GET", "congress/house/AMZN",
+              {"symbol": "AMZN", "trades": [TRADE]})
+
+    (trade,) = client.house_trades.ticker("AMZN", as_records=True)["trades"]
+
+    assert trade == CongressTrade.from_dict(TRADE, "AMZN")
+
+
+def test_as_records_patents(client, _activate_responses):
+    stub_json(_activate_responses, "GET", "patent-filings/AAPL", wrap_v2({
+        "symbol": "AAPL",
+        "patents": [{"patentId": "11000000", "patentDate": "2024-05-07", "numClaims": 20}],
+    }))
+
+    data = client.patent_filings.ticker("AAPL", as_records=True)
+
+    assert data["patents"][0].num_claims == 20
+    assert isinstance(data["patents"][0], PatentFiling)
+
+
+def test_as_records_excludes_dataframe(client):
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        client.news.ticker("AAPL", as_dataframe=True, as_records=True)
+
+
+@pytest.mark.asyncio
+async def test_async_as_records():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=wrap_v2({
+            "symbol": "AAPL",
+            "ratings": [{"date": "2024-01-10", "institution": "Goldman Sachs", "targetPrice": 250.0}],
+        }))
+
+    fb = AsyncFinBrainClient(api_key="dummy", retries=0)
+    fb._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        data = await fb.analyst_ratings.ticker("AAPL", as_records=True)
+    finally:
+        await fb.close()
+
+    (rating,) = data["ratings"]
+    assert isinstance(rating, AnalystRating)
+    assert rating.target_price == 250.0
+    assert rating.symbol == "AAPL"
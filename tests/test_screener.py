@@ -436,3 +436,75 @@ def test_screener_patent_filings_dataframe(client, _activate_responses):
     assert df.index.name == "symbol"
     assert "numClaims" in df.columns
     assert df.loc["AAPL", "numClaims"] == 20
+
+
+
+# ── multi-screener query ───────────────────────────────────────────────
+SENTIMENT_ROWS = [
+    {"symbol": "AAPL", "name": "Apple", "score": 0.6, "date": "2024-01-02"},
+    {"symbol": "MSFT", "name": "Microsoft", "score": 0.1, "date": "2024-01-02"},
+    {"symbol": "NVDA", "name": "NVIDIA", "score": 0.9, "date": "2024-01-02"},
+    {"symbol": "TSLA", "name": "Tesla", "score": 0.7, "date": "2024-01-02"},
+]
+PUT_CALL_ROWS = [
+    {"symbol": "AAPL", "name": "Apple", "ratio": 0.9, "date": "2024-01-01"},
+    {"symbol": "AAPL", "name": "Apple", "ratio": 0.4, "date": "2024-01-02"},
+    {"symbol": "NVDA", "name": "NVIDIA", "ratio": 0.5, "date": "2024-01-02"},
+    {"symbol": "MSFT", "name": "Microsoft", "ratio": 0.3, "date": "2024-01-02"},
+]
+
+
+def test_screener_query_joins_filters_and_ranks(client, _activate_responses):
+    sp = {"market": "S&P 500"}
+    stub_json(_activate_responses, "GET", "screener/sentiment", wrap_v2(SENTIMENT_ROWS), params=sp)
+    stub_json(_activate_responses, "GET", "screener/put-call-ratio", wrap_v2(PUT_CALL_ROWS), params=sp)
+
+    df = client.screener.query(["sentiment", "put_call_ratio"], market="S&P 500",
+                               where="score > 0.3 and ratio < 0.8", order_by="-score")
+
+    assert list(df.index) == ["NVDA", "AAPL"]  # TSLA has no put/call row
+    assert list(df.columns) == ["name", "score", "sentiment_date", "ratio",
+                                "put_call_ratio_date"]
+    assert df.loc["AAPL", "ratio"] == 0.4  # newest row per symbol wins
+
+
+def test_screener_query_per_source_kwargs_and_outer_join(client, _activate_responses):
+    stub_json(_activate_responses, "GET", "screener/sentiment", wrap_v2(SENTIMENT_ROWS),
+              params={"limit": "50", "market": "S&P 500"})
+    stub_json(_activate_responses, "GET", "screener/insider-trading", wrap_v2([
+        {"symbol": "MSFT", "name": "Microsoft", "transactionType": "Sale", "shares": 10},
+    ]), params={"limit": "50"})
+
+    df = client.screener.query(
+        {"sentiment": {"market": "S&P 500"}, "insider_trading": {}},
+        how="outer", limit=50, order_by=["transactionType", "-score"], top=2,
+    )
+
+    assert list(df.index) == ["MSFT", "NVDA"]
+    assert df.loc["MSFT", "name"] == "Microsoft"
+    assert pd.isna(df.loc["NVDA", "shares"])
+
+
+def test_screener_query_unknown_source(client):
+    with pytest.raises(ValueError, match="Unknown screener source"):
+        client.screener.query(["sentiment", "weather"], market="S&P 500")
+
+
+@pytest.mark.asyncio
+async def test_async_screener_query():
+    import httpx
+    from finbrain.aio import AsyncFinBrainClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        rows = SENTIMENT_ROWS if request.url.path.endswith("sentiment") else PUT_CALL_ROWS
+        return httpx.Response(200, json=wrap_v2(rows))
+
+    fb = AsyncFinBrainClient(api_key="dummy", retries=0)
+    fb._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        df = await fb.screener.query(["sentiment", "put_call_ratio"], region="US",
+                                     where=lambda t: t["ratio"] < 0.45, order_by="ratio")
+    finally:
+        await fb.close()
+
+    assert list(df.index) == ["MSFT", "AAPL"]
@@ -0,0 +1,149 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from finbrain import FinBrainClient
+from finbrain._singleflight import AsyncSingleFlight, SingleFlight, flight_key
+from finbrain.aio import AsyncFinBrainClient
+from finbrain.exceptions import NotFound
+from .conftest import BASE, wrap_v2
+
+TRADES = wrap_v2({"symbol": "AAPL", "trades": [{"date": "2024-01-15", "politician": "A"}]})
+
+
+def test_flight_key_normalises_params():
+    assert flight_key("get", "u", {"limit": 10, "x": None}) == flight_key("GET", "u", {"limit": "10"})
+    assert flight_key("GET", "u", {"limit": 10}) != flight_key("GET", "u", {"limit": 11})
+
+
+def test_single_flight_shares_result_and_error():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return "body"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+               for _ in range(6)]
+    for t in threads:
+        t.start()
+    while not calls:
+        time.sleep(0.001)
+    time.sleep(0.05)  # let the followers queue up behind the leader
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False] + [True] * 5
+    assert {value for value, _ in results} == {"body"}
+    assert len(flight) == 0
+
+    with pytest.raises(KeyError):
+        flight.do("k", lambda: {}["missing"])
+    assert flight.do("k", lambda: 1) == (1, False)  # key released after an error
+
+
+def _threaded(fn, n):
+    barrier = threading.Barrier(n)
+    out = [None] * n
+
+    def run(i):
+        barrier.wait()
+        out[i] = fn()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return out
+
+
+def test_client_coalesces_concurrent_gets(_activate_responses):
+    hits = []
+
+    def callback(request):
+        hits.append(request.url)
+        time.sleep(0.2)
+        return 200, {}, json.dumps(TRADES)
+
+    _activate_responses.add_callback("GET", BASE + "congress/house/AAPL", callback=callback)
+    fb = FinBrainClient(api_key="dummy", retries=0)
+
+    out = _threaded(lambda: fb.house_trades.ticker("AAPL"), 4)
+
+    assert len(hits) == 1
+    # each caller gets its own decoded body, so mutating one cannot leak across
+    assert len({id(d["trades"][0]) for d in out}) == 4
+    assert all(d["trades"][0]["politician"] == "A" for d in out)
+
+
+def test_client_coalesce_disabled(_activate_responses):
+    hits = []
+
+    def callback(request):
+        hits.append(1)
+        time.sleep(0.05)
+        return 200, {}, json.dumps(TRADES)
+
+    _activate_responses.add_callback("GET", BASE + "congress/house/AAPL", callback=callback)
+    fb = FinBrainClient(api_key="dummy", retries=0, coalesce=False)
+
+    _threaded(lambda: fb.house_trades.ticker("AAPL"), 3)
+
+    assert len(hits) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_single_flight_survives_cancelled_caller():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "body"
+
+    first = asyncio.ensure_future(flight.do("k", slow))
+    second = asyncio.ensure_future(flight.do("k", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == ("body", True)
+    assert len(calls) == 1
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_client_coalesces_and_shares_errors():
+    hits = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.url.path)
+        await asyncio.sleep(0.02)
+        if request.url.path.endswith("/NOPE"):
+            return httpx.Response(404, json={"success": False, "error": "not found"})
+        return httpx.Response(200, json=TRADES)
+
+    fb = AsyncFinBrainClient(api_key="dummy", retries=0)
+    fb._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        ok = await asyncio.gather(*(fb.house_trades.ticker("AAPL") for _ in range(10)))
+        assert len(hits) == 1
+        assert ok[0] == ok[9] and ok[0] is not ok[9]
+
+        bad = await asyncio.gather(*(fb.house_trades.ticker("NOPE") for _ in range(3)),
+                                   return_exceptions=True)
+        assert len(hits) == 2
+        assert all(isinstance(e, NotFound) for e in bad)
+    finally:
+        await fb.close()
@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from finbrain.store import ParquetStore  # noqa: E402
+from .conftest import stub_json, wrap_v2  # noqa: E402
+
+
+def _tx(date, shares=100, insider="Tim Cook"):
+    return {"date": date, "insider": insider, "relationship": "CEO",
+            "transactionType": "Sale", "shares": shares}
+
+
+HISTORY = [_tx(f"{y}-{m:02d}-10", shares=m) for y in (2022, 2023, 2024) for m in (1, 6)]
+
+
+def _files(root):
+    return sorted(p.relative_to(root).as_posix() for p in root.rglob("*.parquet"))
+
+
+def test_write_partitions_by_market_symbol_year(tmp_path):
+    store = ParquetStore(tmp_path)
+
+    assert store.write("insider-trading", "aapl", HISTORY, market="S&P 500") == 6
+
+    assert _files(tmp_path) == [
+        f"endpoint=insider_transactions/market=S%26P%20500/symbol=AAPL/year={y}/data.parquet"
+        for y in (2022, 2023, 2024)
+    ]
+    assert store.symbols("insider_transactions") == ["AAPL"]
+
+
+def test_read_prunes_partitions_and_filters_rows(tmp_path):
+    store = ParquetStore(tmp_path)
+    store.write("insider_transactions", "AAPL", HISTORY, market="S&P 500")
+    store.write("insider_transactions", "MSFT", HISTORY, market="S&P 500")
+    store.write("insider_transactions", "SAP", HISTORY, market="DAX")
+
+    files = store._files("insider_transactions", ["AAPL"], None, "2023-03-01", None)
+    assert [f.parent.name for f in files] == ["year=2023", "year=2024"]
+
+    df = store.read("insider-trading", symbols=["aapl"], date_from="2023-03-01",
+                    date_to="2024-01-10")
+
+    assert df.index.name == "date"
+    assert df.index.dtype == "datetime64[ns]"
+    assert df.index.strftime("%Y-%m-%d").tolist() == ["2023-06-10", "2024-01-10"]
+    assert set(df["symbol"]) == {"AAPL"}
+    assert isinstance(df["transactionType"].dtype, pd.CategoricalDtype)
+
+    dax = store.read("insider_transactions", markets=["DAX"], columns=["shares"],
+                     output="arrow")
+    assert dax.column_names == ["symbol", "market", "date", "shares"]
+    assert set(dax.column("symbol").to_pylist()) == {"SAP"}
+
+
+def test_incremental_write_replaces_from_earliest_date(tmp_path):
+    store = ParquetStore(tmp_path)
+    store.write("insider_transactions", "AAPL", HISTORY)
+
+    store.write("insider_transactions", "AAPL",
+                [_tx("2024-06-10", shares=7), _tx("2025-02-01", shares=1.5)])
+
+    df = store.read("insider_transactions", symbols=["AAPL"], date_from="2024-01-01")
+    assert df["shares"].tolist() == [1, 7, 1.5]
+    assert len(store.read("insider_transactions")) == 7
+
+
+def test_ingest_from_endpoint(client, _activate_responses, tmp_path):
+    for sym in ("AAPL", "MSFT"):
+        stub_json(_activate_responses, "GET", f"insider-trading/{sym}",
+                  wrap_v2({"symbol": sym, "transactions": HISTORY[:2]}))
+    stub_json(_activate_responses, "GET", "insider-trading/NOPE",
+              {"success": False, "error": "not found"}, status=404)
+    store = ParquetStore(tmp_path)
+
+    batch = store.ingest(client, "insider_transactions", ["AAPL", "MSFT", "NOPE"])
+
+    assert dict(batch) == {"AAPL": 2, "MSFT": 2}
+    assert "NOPE" in batch.errors
+    assert store.read("insider_transactions", output="arrow").num_rows == 4
+
+
+def test_read_empty_and_bad_output(tmp_path):
+    store = ParquetStore(tmp_path)
+    assert store.read("news", symbols=["AAPL"]).empty
+    with pytest.raises(ValueError, match="output"):
+        store.read("news", output="raw")
+    with pytest.raises(ValueError, match="Unknown sync endpoint"):
+        store.read("predictions")
@@ -0,0 +1,162 @@
+import json
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+
+from finbrain.sync import SyncEngine
+from .conftest import BASE, stub_json, wrap_v2
+
+
+def _trade(date, politician="A", amount="$1,001 - $15,000"):
+    return {"date": date, "politician": politician, "transactionType": "Purchase",
+            "amount": amount, "owner": "SELF"}
+
+
+def _stub_house(rsps, trades, params=None, symbol="NVDA"):
+    stub_json(rsps, "GET", f"congress/house/{symbol}",
+              wrap_v2({"symbol": symbol, "trades": trades}), params=params)
+
+
+def test_first_run_downloads_everything(client, _activate_responses, tmp_path):
+    _stub_house(_activate_responses, [_trade("2024-01-10"), _trade("2024-01-15")])
+    engine = SyncEngine(client, tmp_path)
+
+    report = engine.sync("house_trades", ["nvda"])
+
+    res = report["NVDA"]
+    assert res.since is None
+    assert res.high_water == "2024-01-15"
+    assert (res.fetched, len(res.added), res.total) == (2, 2, 2)
+    assert [r["date"] for r in engine.load("house_trades", "NVDA")] == ["2024-01-15", "2024-01-10"]
+    state = json.loads((tmp_path / "state.json").read_text())
+    assert state["marks"] == {"house_trades": {"NVDA": "2024-01-15"}}
+
+
+def test_incremental_run_requests_overlap_window_and_merges(client, _activate_responses, tmp_path):
+    _stub_house(_activate_responses, [_trade("2024-01-01"), _trade("2024-01-14"),
+                                      _trade("2024-01-15", "B")])
+    SyncEngine(client, tmp_path).sync("house_trades", ["NVDA"])
+
+    # 2024-01-14 was revised upstream; 2024-01-20 is new; 2024-01-15 unchanged
+    _stub_house(_activate_responses,
+                [_trade("2024-01-20"), _trade("2024-01-15", "B"),
+                 _trade("2024-01-14", amount="$15,001 - $50,000")],
+                params={"startDate": "2024-01-12", "limit": "500"})
+    engine = SyncEngine(client, tmp_path, overlap_days=3)
+
+    res = engine.sync("house_trades", ["NVDA"])["NVDA"]
+
+    assert res.since == "2024-01-12"
+    assert res.high_water == engine.high_water("house_trades", "NVDA") == "2024-01-20"
+    assert [r["date"] for r in res.added] == ["2024-01-20", "2024-01-14"]
+    assert [r["amount"] for r in res.removed] == ["$1,001 - $15,000"]
+    rows = engine.load("house_trades", "NVDA")
+    assert [r["date"] for r in rows] == ["2024-01-20", "2024-01-15", "2024-01-14", "2024-01-01"]
+    assert rows[2]["amount"] == "$15,001 - $50,000"
+
+
+def test_unchanged_run_reports_nothing(client, _activate_responses, tmp_path):
+    trades = [_trade("2024-01-15")]
+    _stub_house(_activate_responses, trades)
+    engine = SyncEngine(client, tmp_path, overlap_days=0)
+    engine.sync("house_trades", ["NVDA"])
+    _stub_house(_activate_responses, trades, params={"startDate": "2024-01-15", "limit": "500"})
+
+    res = engine.sync("house_trades", ["NVDA"])["NVDA"]
+
+    assert not res.changed
+    assert res.total == 1
+
+
+def _serve_house(rsps, server):
+    """Filter ``server`` rows like the API: date bounds, newest first, ``limit`` cut."""
+    def callback(request):
+        params = {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+        rows = [r for r in server
+                if params.get("startDate", "") <= r["date"] <= params.get("endDate", "9999")]
+        rows = sorted(rows, key=lambda r: r["date"], reverse=True)[: int(params["limit"])]
+        return 200, {}, json.dumps(wrap_v2({"symbol": "NVDA", "trades": rows}))
+
+    rsps.add_callback("GET", BASE + "congress/house/NVDA", callback=callback)
+
+
+@pytest.mark.parametrize("same_day_trades, complete", [(1, True), (2, False)])
+def test_full_page_is_refetched_before_dropping_rows(
+    client, _activate_responses, tmp_path, same_day_trades, complete
+):
+    server = [_trade("2024-01-13"), _trade("2024-01-14")]
+    _serve_house(_activate_responses, server)
+    engine = SyncEngine(client, tmp_path, overlap_days=3)
+    engine.sync("house_trades", ["NVDA"], date_to="2024-01-31", limit=2)
+
+    # 2024-01-13 was withdrawn upstream; new trades on 2024-01-20 fill the page
+    server[:] = [_trade("2024-01-14")] + [_trade("2024-01-20", p) for p in "AB"[:same_day_trades]]
+    res = engine.sync("house_trades", ["NVDA"], date_to="2024-01-31", limit=2)["NVDA"]
+
+    dates = [r["date"] for r in engine.load("house_trades", "NVDA")]
+    assert res.complete is complete
+    assert res.fetched == same_day_trades + 1
+    if complete:  # windows split until none was full: the withdrawal is real
+        assert [r["date"] for r in res.removed] == ["2024-01-13"]
+        assert dates == ["2024-01-20", "2024-01-14"]
+    else:  # 2024-01-20 alone fills the page, so 2024-01-13 may just be cut off
+        assert res.removed == []
+        assert dates == ["2024-01-20", "2024-01-20", "2024-01-14", "2024-01-13"]
+
+
+@pytest.mark.parametrize("same_day_trades, complete", [(2, True), (3, False)])
+def test_full_first_download_pages_back_through_history(
+    client, _activate_responses, tmp_path, same_day_trades, complete
+):
+    server = [_trade("2024-01-0%d" % d) for d in range(1, 6)]
+    server += [_trade("2024-01-03", p) for p in "BCD"[: same_day_trades - 1]]
+    _serve_house(_activate_responses, server)
+    engine = SyncEngine(client, tmp_path)
+
+    res = engine.sync("house_trades", ["NVDA"], limit=3)["NVDA"]
+
+    dates = [r["date"] for r in engine.load("house_trades", "NVDA")]
+    assert res.complete is complete
+    if complete:  # every row, the page boundaries kept once
+        assert sorted(dates) == sorted(r["date"] for r in server)
+        assert engine.high_water("house_trades", "NVDA") == "2024-01-05"
+    else:  # 2024-01-03 alone fills the page: no mark, so the next run starts over
+        assert dates[:2] == ["2024-01-05", "2024-01-04"]
+        assert engine.high_water("house_trades", "NVDA") is None
+
+
+def test_failed_symbol_keeps_its_mark(client, _activate_responses, tmp_path):
+    _stub_house(_activate_responses, [_trade("2024-01-15")])
+    stub_json(_activate_responses, "GET", "congress/house/NOPE",
+              {"success": False, "error": "not found"}, status=404)
+
+    report = SyncEngine(client, tmp_path).sync("house_trades", ["NVDA", "NOPE"])
+
+    assert set(report) == {"NVDA"}
+    assert "NOPE" in report.errors
+    assert SyncEngine(client, tmp_path).high_water("house_trades", "NOPE") is None
+
+
+def test_load_as_dataframe_uses_endpoint_schema(client, _activate_responses, tmp_path):
+    stub_json(_activate_responses, "GET", "patent-filings/AAPL", wrap_v2({
+        "symbol": "AAPL",
+        "patents": [{"patentId": "1", "patentDate": "2024-05-07", "numClaims": 20}],
+    }))
+    engine = SyncEngine(client, tmp_path)
+    assert engine.sync("patent_filings", ["AAPL"])["AAPL"].high_water == "2024-05-07"
+
+    df = engine.load("patent_filings", "AAPL", as_dataframe=True)
+
+    assert isinstance(df.index, pd.DatetimeIndex)
+    assert df.index.name == "patentDate"
+
+
+def test_rejects_unknown_endpoint_and_managed_kwargs(client, tmp_path):
+    engine = SyncEngine(client, tmp_path)
+    with pytest.raises(ValueError, match="Unknown sync endpoint"):
+        engine.sync("predictions", ["AAPL"])
+    with pytest.raises(TypeError, match="date_from"):
+        engine.sync("news", ["AAPL"], date_from="2024-01-01")
+    with pytest.raises(TypeError, match="as_dataframe"):
+        engine.sync("news", ["AAPL"], as_dataframe=True)
@@ -0,0 +1,95 @@
+import gzip
+import json
+
+import httpx
+import pytest
+
+from finbrain import FinBrainClient
+from finbrain.aio import AsyncFinBrainClient
+from finbrain.transfer import Transfer, TransferStats, resolve_accept_encoding
+from .conftest import BASE, wrap_v2
+
+BODY = json.dumps(wrap_v2({
+    "symbol": "AAPL",
+    "transactions": [{"date": "2024-01-15", "insider": "Tim Cook", "shares": 10}] * 300,
+})).encode()
+
+
+def test_resolve_accept_encoding():
+    supported = {"identity", "gzip", "deflate", "br"}
+    assert resolve_accept_encoding("auto", supported) == "br, gzip, deflate"
+    assert resolve_accept_encoding(None, supported) is None
+    assert resolve_accept_encoding(["gzip", "identity"], supported) == "gzip, identity"
+    assert resolve_accept_encoding("br;q=1.0, gzip;q=0.5", supported) == "br;q=1.0, gzip;q=0.5"
+    with pytest.raises(ValueError, match="zstd"):
+        resolve_accept_encoding("zstd, gzip", supported)
+
+
+def test_transfer_stats_totals():
+    stats = TransferStats()
+    stats.record(Transfer("news/AAPL", "gzip", 100, 900))
+    stats.record(Transfer("news/MSFT", "identity", 50, 50))
+
+    assert (stats.requests, stats.wire_bytes, stats.body_bytes) == (2, 150, 950)
+    assert stats.by_encoding == {"gzip": [1, 100, 900], "identity": [1, 50, 50]}
+    assert Transfer("x", "gzip", 100, 900).ratio == 9.0
+    stats.reset()
+    assert stats.requests == 0 and stats.ratio == 1.0
+
+
+def test_sync_client_advertises_and_counts_compressed_bytes(_activate_responses):
+    _activate_responses.add("GET", BASE + "insider-trading/AAPL", body=gzip.compress(BODY),
+                            headers={"Content-Encoding": "gzip"},
+                            content_type="application/json")
+    fb = FinBrainClient(api_key="dummy", retries=0, accept_encoding="gzip")
+
+    data = fb.insider_transactions.ticker("AAPL")
+
+    assert len(data["transactions"]) == 300
+    assert _activate_responses.calls[0].request.headers["Accept-Encoding"] == "gzip"
+    t = fb.last_transfer
+    assert (t.path, t.encoding, t.body_bytes) == ("insider-trading/AAPL", "gzip", len(BODY))
+    assert t.wire_bytes == len(gzip.compress(BODY))
+    assert fb.transfer_stats.ratio > 10
+
+
+def test_sync_stream_counts_bytes(_activate_responses):
+    body = json.dumps(wrap_v2({"data": [{"symbol": "AAPL", "headline": "x" * 40}] * 50}))
+    _activate_responses.add("GET", BASE + "recent/news", body=gzip.compress(body.encode()),
+                            headers={"Content-Encoding": "gzip"},
+                            content_type="application/json")
+    fb = FinBrainClient(api_key="dummy", retries=0)
+
+    rows = list(fb.recent.news(stream=True))
+
+    assert len(rows) == 50
+    assert fb.last_transfer.body_bytes == len(body)
+    assert fb.last_transfer.wire_bytes < len(body)
+
+
+def test_unsupported_coding_is_rejected():
+    with pytest.raises(ValueError, match="Cannot decode"):
+        FinBrainClient(api_key="dummy", accept_encoding="gzip, snappy")
+
+
+@pytest.mark.asyncio
+async def test_async_client_advertises_and_counts_compressed_bytes():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("Accept-Encoding"))
+        return httpx.Response(200, content=gzip.compress(BODY),
+                              headers={"Content-Encoding": "gzip",
+                                       "Content-Type": "application/json"})
+
+    fb = AsyncFinBrainClient(api_key="dummy", retries=0)
+    fb._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    try:
+        data = await fb.insider_transactions.ticker("AAPL")
+    finally:
+        await fb.close()
+
+    assert len(data["transactions"]) == 300
+    assert seen[0] == fb.accept_encoding and "gzip" in seen[0]
+    assert fb.last_transfer.wire_bytes == len(gzip.compress(BODY))
+    assert fb.last_transfer.body_bytes == len(BODY)